@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from aiwf.accel_transport import operator_url
+
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_OPEN_SECONDS = 30.0
+DEFAULT_HEALTH_TTL_SECONDS = 10.0
+DEFAULT_HEALTH_TIMEOUT_SECONDS = 1.0
+LATENCY_EWMA_ALPHA = 0.2
+
+
+def _env_float(key: str, default: float) -> float:
+    raw = str(os.getenv(key) or "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def breaker_enabled() -> bool:
+    return str(os.getenv("AIWF_ACCEL_BREAKER_ENABLED") or "true").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _probe_sidecar_health(base_url: str, timeout: float) -> Tuple[bool, str]:
+    import requests
+
+    try:
+        response = requests.get(operator_url(base_url, "/health"), timeout=timeout)
+    except Exception as exc:
+        return False, str(exc)
+    if response.status_code >= 400:
+        return False, f"{response.status_code} {response.text[:200]}"
+    return True, ""
+
+
+class SidecarBreaker:
+    """Availability tracking for one accel sidecar base URL.
+
+    Consecutive transport failures (connect/read errors, 429 and 5xx) trip the
+    breaker open, and while open, callers skip the sidecar instead of waiting on
+    timeouts. Once `open_seconds` have passed, a cached /health probe decides
+    whether a single trial call may go through (half-open); that call's outcome
+    closes or re-opens the breaker.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        failure_threshold: Optional[int] = None,
+        open_seconds: Optional[float] = None,
+        health_ttl_seconds: Optional[float] = None,
+        health_timeout_seconds: Optional[float] = None,
+        probe: Callable[[str, float], Tuple[bool, str]] = _probe_sidecar_health,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.base_url = base_url
+        self.failure_threshold = max(
+            1,
+            int(failure_threshold if failure_threshold is not None else _env_float("AIWF_ACCEL_BREAKER_FAILURES", DEFAULT_FAILURE_THRESHOLD)),
+        )
+        self.open_seconds = open_seconds if open_seconds is not None else _env_float("AIWF_ACCEL_BREAKER_OPEN_SECONDS", DEFAULT_OPEN_SECONDS)
+        self.health_ttl_seconds = (
+            health_ttl_seconds if health_ttl_seconds is not None else _env_float("AIWF_ACCEL_HEALTH_TTL_SECONDS", DEFAULT_HEALTH_TTL_SECONDS)
+        )
+        self.health_timeout_seconds = (
+            health_timeout_seconds
+            if health_timeout_seconds is not None
+            else _env_float("AIWF_ACCEL_HEALTH_TIMEOUT", DEFAULT_HEALTH_TIMEOUT_SECONDS)
+        )
+        self._probe = probe
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = BREAKER_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+        self._last_error = ""
+        self._times_opened = 0
+        self._health: Dict[str, Any] = {}
+        self._health_checked_at: Optional[float] = None
+        self._operators: Dict[str, Dict[str, Any]] = {}
+
+    def _operator_stats(self, operator: str) -> Dict[str, Any]:
+        return self._operators.setdefault(
+            operator or "unknown",
+            {"calls": 0, "failures": 0, "skipped": 0, "latency_ewma_ms": None, "last_latency_ms": None},
+        )
+
+    def health(self, *, force: bool = False) -> Dict[str, Any]:
+        """Return the /health probe result, reusing it for `health_ttl_seconds`."""
+        now = self._clock()
+        with self._lock:
+            if not force and self._health_checked_at is not None and now - self._health_checked_at < self.health_ttl_seconds:
+                return dict(self._health)
+        started = self._clock()
+        ok, error = self._probe(self.base_url, self.health_timeout_seconds)
+        finished = self._clock()
+        with self._lock:
+            self._health = {"ok": ok, "error": error, "latency_ms": round((finished - started) * 1000.0, 3)}
+            self._health_checked_at = finished
+            return dict(self._health)
+
+    def _skip(self, operator: str) -> Tuple[bool, str]:
+        self._operator_stats(operator)["skipped"] += 1
+        return False, "accel_breaker_open"
+
+    def _start_trial(self) -> Tuple[bool, str]:
+        self._trial_started_at = self._clock()
+        return True, ""
+
+    def _trial_available(self) -> bool:
+        # A trial whose caller never reported back stops blocking after one open window.
+        return self._trial_started_at is None or self._clock() - self._trial_started_at >= self.open_seconds
+
+    def allow(self, operator: str) -> Tuple[bool, str]:
+        """Decide whether a call to `operator` should go to the sidecar now."""
+        with self._lock:
+            if self._state == BREAKER_CLOSED:
+                return True, ""
+            if self._state == BREAKER_HALF_OPEN:
+                return self._start_trial() if self._trial_available() else self._skip(operator)
+            if self._clock() - float(self._opened_at or 0.0) < self.open_seconds:
+                return self._skip(operator)
+        healthy = bool(self.health().get("ok"))
+        with self._lock:
+            if self._state == BREAKER_CLOSED:
+                return True, ""
+            if not healthy:
+                self._opened_at = self._clock()
+                return self._skip(operator)
+            self._state = BREAKER_HALF_OPEN
+            return self._start_trial() if self._trial_available() else self._skip(operator)
+
+    def record_success(self, operator: str, latency_ms: float) -> None:
+        with self._lock:
+            stats = self._operator_stats(operator)
+            stats["calls"] += 1
+            stats["last_latency_ms"] = round(latency_ms, 3)
+            previous = stats["latency_ewma_ms"]
+            ewma = latency_ms if previous is None else LATENCY_EWMA_ALPHA * latency_ms + (1.0 - LATENCY_EWMA_ALPHA) * previous
+            stats["latency_ewma_ms"] = round(ewma, 3)
+            self._consecutive_failures = 0
+            self._state = BREAKER_CLOSED
+            self._opened_at = None
+            self._trial_started_at = None
+
+    def record_failure(self, operator: str, error: str) -> None:
+        with self._lock:
+            stats = self._operator_stats(operator)
+            stats["calls"] += 1
+            stats["failures"] += 1
+            self._consecutive_failures += 1
+            self._last_error = str(error or "")[:500]
+            if self._state == BREAKER_HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != BREAKER_OPEN:
+                    self._times_opened += 1
+                self._state = BREAKER_OPEN
+                self._opened_at = self._clock()
+            self._trial_started_at = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            return {
+                "base_url": self.base_url,
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "open_seconds": self.open_seconds,
+                "open_for_seconds": round(now - self._opened_at, 3) if self._opened_at is not None else None,
+                "times_opened": self._times_opened,
+                "last_error": self._last_error,
+                "health": {
+                    **self._health,
+                    "age_seconds": round(now - self._health_checked_at, 3) if self._health_checked_at is not None else None,
+                },
+                "operators": {name: dict(stats) for name, stats in sorted(self._operators.items())},
+            }
+
+
+_BREAKERS: Dict[str, SidecarBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def sidecar_breaker(base_url: str) -> SidecarBreaker:
+    key = str(base_url or "").rstrip("/")
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(key)
+        if breaker is None:
+            breaker = SidecarBreaker(key)
+            _BREAKERS[key] = breaker
+        return breaker
+
+
+def sidecar_breaker_stats() -> Dict[str, Any]:
+    with _BREAKERS_LOCK:
+        breakers = list(_BREAKERS.values())
+    return {
+        "enabled": breaker_enabled(),
+        "sidecars": {breaker.base_url: breaker.snapshot() for breaker in breakers},
+    }
+
+
+def reset_sidecar_breakers() -> None:
+    with _BREAKERS_LOCK:
+        _BREAKERS.clear()
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 import os
+import time
 from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from aiwf.accel_breaker import SidecarBreaker, breaker_enabled, sidecar_breaker
+from aiwf.accel_transform_dispatch import (
+    TransformDispatchPlan,
+    async_idempotency_key,
+    async_poll_settings,
+    chunk_gates,
+    merge_chunk_bodies,
+    plan_transform_dispatch,
+)
 from aiwf.accel_transport import DEFAULT_ACCEL_BASE_URL, operator_url
+from aiwf.metrics import observe_operator_response
 
 
 @dataclass(frozen=True)
@@ -197,10 +210,57 @@ def _success_result(url: str, body: Dict[str, Any]) -> Dict[str, Any]:
     ).to_dict()
 
 
-def _post_operator_payload(url: str, payload: Dict[str, Any], *, timeout: float) -> Dict[str, Any]:
+def _operator_breaker(base_url: str) -> Optional[SidecarBreaker]:
+    return sidecar_breaker(base_url) if breaker_enabled() else None
+
+
+def _breaker_skip_result(breaker: Optional[SidecarBreaker], url: str, operator: str) -> Optional[Dict[str, Any]]:
+    """A not-attempted result when the sidecar's breaker is open, so callers go straight to their local path."""
+    if breaker is None:
+        return None
+    allowed, reason = breaker.allow(operator)
+    if allowed:
+        return None
+    return OperatorCallResult(attempted=False, ok=False, url=url, error=reason).to_dict()
+
+
+def _record_transport_outcome(
+    breaker: Optional[SidecarBreaker],
+    operator: str,
+    started: float,
+    *,
+    status_code: Optional[int] = None,
+    error: str = "",
+) -> None:
+    if breaker is None:
+        return
+    # 4xx other than 429 means the sidecar answered and rejected the input; that says nothing about availability.
+    if error or status_code == 429 or (status_code is not None and status_code >= 500):
+        breaker.record_failure(operator, error or f"http {status_code}")
+    else:
+        breaker.record_success(operator, (time.perf_counter() - started) * 1000.0)
+
+
+def _post_operator_payload(
+    url: str,
+    payload: Dict[str, Any],
+    *,
+    timeout: float,
+    breaker: Optional[SidecarBreaker] = None,
+    operator: str = "",
+) -> Dict[str, Any]:
     import requests
 
-    response = requests.post(url, json=payload, timeout=timeout)
+    started = time.perf_counter()
+    endpoint = urlsplit(url).path
+    try:
+        response = requests.post(url, json=payload, timeout=timeout)
+    except Exception as exc:
+        _record_transport_outcome(breaker, operator, started, error=str(exc) or type(exc).__name__)
+        observe_operator_response(endpoint, started)
+        raise
+    _record_transport_outcome(breaker, operator, started, status_code=response.status_code)
+    observe_operator_response(endpoint, started, response)
     if response.status_code >= 400:
         return _error_result(url, f"{response.status_code} {response.text}")
     try:
@@ -228,6 +288,10 @@ def run_cleaning_operator(
         default=10.0,
     )
     url = operator_url(base_url, "/operators/cleaning")
+    breaker = _operator_breaker(base_url)
+    skipped = _breaker_skip_result(breaker, url, "cleaning")
+    if skipped is not None:
+        return skipped
     job_context = params.get("job_context") if isinstance(params.get("job_context"), dict) else {}
     request = CleaningOperatorRequest(
         job_id=job_id,
@@ -242,7 +306,7 @@ def run_cleaning_operator(
     )
 
     try:
-        result = _post_operator_payload(url, request.to_payload(), timeout=timeout)
+        result = _post_operator_payload(url, request.to_payload(), timeout=timeout, breaker=breaker, operator="cleaning")
         if result.get("ok") and isinstance(result.get("response"), dict):
             response = CleaningOperatorResponse.from_body(result["response"])
             result["response"] = response.to_dict()
@@ -267,6 +331,10 @@ def transform_rows_v2_operator(
         default=8.0,
     )
     url = operator_url(base_url, "/operators/transform_rows_v2")
+    breaker = _operator_breaker(base_url)
+    skipped = _breaker_skip_result(breaker, url, "transform_rows_v2")
+    if skipped is not None:
+        return skipped
     request = TransformRowsV2OperatorRequest(
         run_id=str(params.get("job_id") or ""),
         rows=raw_rows,
@@ -276,7 +344,9 @@ def transform_rows_v2_operator(
     )
 
     try:
-        result = _post_operator_payload(url, request.to_payload(), timeout=timeout)
+        result = _post_operator_payload(
+            url, request.to_payload(), timeout=timeout, breaker=breaker, operator="transform_rows_v2"
+        )
         if not result.get("ok"):
             return result
         body = result["response"]
@@ -302,6 +372,140 @@ def transform_rows_v2_operator(
         return _error_result(url, str(exc))
 
 
+def _transform_rows_v3_success(url: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        response = TransformRowsV2OperatorResponse.from_body(body)
+    except ValueError:
+        return _error_result(url, "transform_rows_v3 invalid response shape", response=body)
+    quality2 = dict(response.quality)
+    quality2["rust_transform_used"] = True
+    quality2["rust_transform_operator"] = str(body.get("operator") or "transform_rows_v3")
+    quality2["rust_v3_used"] = True
+    quality2["rust_v2_used"] = True
+    quality2["rust_v2_trace_id"] = response.trace_id
+    quality2["rust_v3_trace_id"] = response.trace_id
+    if response.audit:
+        quality2["rust_v3_audit"] = response.audit
+        quality2["rust_v2_audit"] = response.audit
+    return {
+        "attempted": True,
+        "ok": True,
+        "url": url,
+        "rows": response.rows,
+        "quality": quality2,
+        "audit": response.audit,
+        "response": response.raw,
+    }
+
+
+def _transform_rows_v3_chunked(
+    url: str,
+    request: TransformRowsV3OperatorRequest,
+    plan: TransformDispatchPlan,
+    *,
+    timeout: float,
+    breaker: Optional[SidecarBreaker],
+) -> Dict[str, Any]:
+    offsets = list(range(0, len(request.rows), plan.chunk_rows))
+    gates = chunk_gates(request.quality_gates)
+
+    def post_chunk(offset: int) -> Dict[str, Any]:
+        chunk = replace(request, rows=request.rows[offset : offset + plan.chunk_rows], quality_gates=gates)
+        return _post_operator_payload(url, chunk.to_payload(), timeout=timeout, breaker=breaker, operator="transform_rows_v3")
+
+    if plan.workers == 1:
+        results = [post_chunk(offset) for offset in offsets]
+    else:
+        with ThreadPoolExecutor(max_workers=plan.workers, thread_name_prefix="aiwf-accel-v3") as pool:
+            results = list(pool.map(post_chunk, offsets))
+    for index, result in enumerate(results):
+        if not result.get("ok"):
+            return _error_result(url, f"chunk {index + 1}/{len(results)} failed: {result.get('error') or ''}")
+    try:
+        body = merge_chunk_bodies([result["response"] for result in results], offsets, quality_gates=request.quality_gates)
+    except ValueError as exc:
+        return _error_result(url, str(exc))
+    return _transform_rows_v3_success(url, body)
+
+
+def _transform_rows_v3_async(
+    base_url: str,
+    request: TransformRowsV3OperatorRequest,
+    params: Dict[str, Any],
+    *,
+    timeout: float,
+    breaker: Optional[SidecarBreaker],
+) -> Dict[str, Any]:
+    """Run through the transform_rows_v2 task endpoint: submit and poll until done or the deadline.
+
+    The submit carries an idempotency key derived from the payload, so a retry
+    of the same run re-attaches to the task that is still queued, running or
+    already done instead of starting over. Hitting the poll deadline therefore
+    leaves the task running for that retry; only an unexpected failure while
+    polling cancels it.
+    """
+    import requests
+
+    url = operator_url(base_url, "/operators/transform_rows_v2/submit")
+    payload = TransformRowsV2OperatorRequest(
+        run_id=request.run_id,
+        rows=request.rows,
+        rules=request.rules,
+        quality_gates=request.quality_gates,
+        schema_hint=request.schema_hint,
+    ).to_payload()
+    payload["idempotency_key"] = async_idempotency_key(payload)
+    submitted = _post_operator_payload(url, payload, timeout=timeout, breaker=breaker, operator="transform_rows_v2_submit")
+    if not submitted.get("ok"):
+        return submitted
+    task_id = str((submitted.get("response") or {}).get("task_id") or "")
+    if not task_id:
+        return _error_result(url, "transform_rows_v2 submit returned no task_id", response=submitted.get("response"))
+    task_url = operator_url(base_url, f"/tasks/{task_id}")
+    task_timeout, poll_seconds = async_poll_settings(params)
+    deadline = time.monotonic() + task_timeout
+    finished = False
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                response = requests.get(task_url, timeout=timeout)
+            except Exception as exc:
+                _record_transport_outcome(breaker, "task_poll", started, error=str(exc) or type(exc).__name__)
+                raise
+            _record_transport_outcome(breaker, "task_poll", started, status_code=response.status_code)
+            if response.status_code >= 400:
+                return _error_result(task_url, f"{response.status_code} {response.text}")
+            task = response.json()
+            status = str(task.get("status") or "").lower()
+            if status == "done":
+                finished = True
+                body = task.get("result") if isinstance(task.get("result"), dict) else {}
+                # Same shape as a transform_rows_v3 response without computed fields or filter_expr.
+                body = {**body, "operator": "transform_rows_v3"}
+                body["quality"] = {**dict(body.get("quality") or {}), "filtered_by_expr_v3": 0}
+                body["audit"] = {**dict(body.get("audit") or {}), "lineage_v3": {}, "computed_fields_v3": 0}
+                result = _transform_rows_v3_success(url, body)
+                if result.get("ok"):
+                    result["task_id"] = task_id
+                return result
+            if status in {"failed", "cancelled"}:
+                finished = True
+                return _error_result(task_url, f"transform_rows_v2 task {status}: {task.get('error') or ''}", response=task)
+            if time.monotonic() >= deadline:
+                finished = True
+                result = _error_result(task_url, f"transform_rows_v2 task {task_id} timed out after {task_timeout:g}s", response=task)
+                result["task_id"] = task_id
+                return result
+            time.sleep(poll_seconds)
+    finally:
+        if not finished:
+            try:
+                requests.post(operator_url(base_url, f"/tasks/{task_id}/cancel"), timeout=timeout)
+            except Exception:
+                pass
+
+
 def transform_rows_v3_operator(
     *,
     raw_rows: list[dict[str, Any]],
@@ -329,37 +533,34 @@ def transform_rows_v3_operator(
         computed_fields_v3=computed_fields_v3 or [],
         filter_expr_v3=filter_expr_v3,
     )
-
+    breaker = _operator_breaker(base_url)
+    skipped = _breaker_skip_result(breaker, url, "transform_rows_v3")
+    if skipped is not None:
+        return skipped
+    plan: Optional[TransformDispatchPlan] = None
     try:
-        result = _post_operator_payload(url, request.to_payload(), timeout=timeout)
-        if not result.get("ok"):
-            return result
-        body = result["response"]
-        try:
-            response = TransformRowsV2OperatorResponse.from_body(body)
-        except ValueError:
-            return _error_result(url, "transform_rows_v3 invalid response shape", response=body)
-        quality2 = dict(response.quality)
-        quality2["rust_transform_used"] = True
-        quality2["rust_transform_operator"] = str(body.get("operator") or "transform_rows_v3")
-        quality2["rust_v3_used"] = True
-        quality2["rust_v2_used"] = True
-        quality2["rust_v2_trace_id"] = response.trace_id
-        quality2["rust_v3_trace_id"] = response.trace_id
-        if response.audit:
-            quality2["rust_v3_audit"] = response.audit
-            quality2["rust_v2_audit"] = response.audit
-        return {
-            "attempted": True,
-            "ok": True,
-            "url": url,
-            "rows": response.rows,
-            "quality": quality2,
-            "audit": response.audit,
-            "response": response.raw,
-        }
+        plan = plan_transform_dispatch(
+            raw_rows,
+            params,
+            rules=rules,
+            computed_fields_v3=computed_fields_v3,
+            filter_expr_v3=filter_expr_v3,
+        )
+        if plan.mode == "chunked":
+            result = _transform_rows_v3_chunked(url, request, plan, timeout=timeout, breaker=breaker)
+        elif plan.mode == "async_task":
+            result = _transform_rows_v3_async(base_url, request, params, timeout=timeout, breaker=breaker)
+        else:
+            result = _post_operator_payload(url, request.to_payload(), timeout=timeout, breaker=breaker, operator="transform_rows_v3")
+            if result.get("ok"):
+                result = _transform_rows_v3_success(url, result["response"])
     except Exception as exc:
-        return _error_result(url, str(exc))
+        result = _error_result(url, str(exc))
+    if plan is not None:
+        result["dispatch"] = plan.to_dict()
+        if result.get("ok"):
+            result["quality"]["rust_v3_dispatch"] = plan.mode
+    return result
 
 
 def postprocess_rows_v1_operator(
@@ -376,9 +577,13 @@ def postprocess_rows_v1_operator(
         default=8.0,
     )
     url = operator_url(base_url, "/operators/postprocess_rows_v1")
+    breaker = _operator_breaker(base_url)
+    skipped = _breaker_skip_result(breaker, url, "postprocess_rows_v1")
+    if skipped is not None:
+        return skipped
     body = {"run_id": str(params.get("job_id") or ""), "rows": rows, **payload}
     try:
-        result = _post_operator_payload(url, body, timeout=timeout)
+        result = _post_operator_payload(url, body, timeout=timeout, breaker=breaker, operator="postprocess_rows_v1")
         if not result.get("ok"):
             return result
         response = TransformRowsV2OperatorResponse.from_body(result["response"])
@@ -410,6 +615,10 @@ def quality_check_v2_operator(
         default=8.0,
     )
     url = operator_url(base_url, "/operators/quality_check_v2")
+    breaker = _operator_breaker(base_url)
+    skipped = _breaker_skip_result(breaker, url, "quality_check_v2")
+    if skipped is not None:
+        return skipped
     payload = {
         "run_id": str(params.get("job_id") or ""),
         "rows": rows,
@@ -417,7 +626,7 @@ def quality_check_v2_operator(
         "metrics": metrics or {},
     }
     try:
-        result = _post_operator_payload(url, payload, timeout=timeout)
+        result = _post_operator_payload(url, payload, timeout=timeout, breaker=breaker, operator="quality_check_v2")
         if not result.get("ok"):
             return result
         response = QualityCheckV2OperatorResponse.from_body(result["response"])
@@ -448,6 +657,10 @@ def quality_check_v4_operator(
         default=8.0,
     )
     url = operator_url(base_url, "/operators/quality_check_v4")
+    breaker = _operator_breaker(base_url)
+    skipped = _breaker_skip_result(breaker, url, "quality_check_v4")
+    if skipped is not None:
+        return skipped
     payload = {
         "run_id": str(params.get("job_id") or ""),
         "rows": rows,
@@ -455,7 +668,7 @@ def quality_check_v4_operator(
         "metrics": metrics or {},
     }
     try:
-        result = _post_operator_payload(url, payload, timeout=timeout)
+        result = _post_operator_payload(url, payload, timeout=timeout, breaker=breaker, operator="quality_check_v4")
         if not result.get("ok"):
             return result
         response = QualityCheckV2OperatorResponse.from_body(result["response"])
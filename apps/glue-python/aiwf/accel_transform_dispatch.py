@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+
+DISPATCH_MODES = ("auto", "inline", "chunked", "async_task")
+DEFAULT_INLINE_MAX_ROWS = 20000
+DEFAULT_CHUNK_ROWS = 10000
+DEFAULT_CHUNK_WORKERS = 4
+DEFAULT_ASYNC_MIN_ROWS = 200000
+DEFAULT_ASYNC_TIMEOUT_SECONDS = 600.0
+DEFAULT_ASYNC_POLL_SECONDS = 0.5
+
+# Rule keys whose effect on a row only depends on that row. A plan that uses
+# anything else (deduplicate_by, sort_by, aggregate, survivorship, or keys
+# this module does not know) cannot be split into chunks.
+_ROW_LOCAL_RULE_KEYS = frozenset(
+    {
+        "rename_map",
+        "casts",
+        "required_fields",
+        "default_values",
+        "include_fields",
+        "exclude_fields",
+        "filters",
+        "null_values",
+        "trim_strings",
+        "computed_fields",
+        "string_ops",
+        "date_ops",
+        "field_ops",
+        "deduplicate_keep",
+    }
+)
+
+# Quality counters that add up across chunks.
+_QUALITY_COUNT_KEYS = (
+    "input_rows",
+    "output_rows",
+    "invalid_rows",
+    "filtered_rows",
+    "duplicate_rows_removed",
+    "numeric_cells_total",
+    "numeric_cells_parsed",
+    "date_cells_total",
+    "date_cells_parsed",
+    "blank_output_rows",
+    "required_missing_cells",
+    "filtered_by_expr_v3",
+)
+_AUDIT_COUNT_KEYS = ("rule_hits", "reason_counts")
+
+
+@dataclass(frozen=True)
+class TransformDispatchPlan:
+    mode: str
+    reason: str
+    rows: int
+    row_local: bool
+    chunk_rows: int = 0
+    chunks: int = 0
+    workers: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "mode": self.mode,
+            "reason": self.reason,
+            "rows": self.rows,
+            "row_local": self.row_local,
+        }
+        if self.mode == "chunked":
+            payload.update({"chunk_rows": self.chunk_rows, "chunks": self.chunks, "workers": self.workers})
+        return payload
+
+
+def _resolve_setting(params: Dict[str, Any], param_key: str, env_key: str, default: Any) -> Any:
+    raw = params.get(param_key)
+    if raw is None or raw == "":
+        raw = os.getenv(env_key)
+    if raw is None or raw == "":
+        return default
+    try:
+        return type(default)(str(raw).strip())
+    except (TypeError, ValueError):
+        return default
+
+
+def _is_empty_rule(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def is_row_local_plan(rules: Dict[str, Any]) -> bool:
+    """True when no rule looks across rows, so chunk outputs concatenate to the one-shot output.
+
+    computed_fields_v3 and filter_expr_v3 are evaluated per row and never
+    affect this.
+    """
+    for key, value in (rules or {}).items():
+        if key not in _ROW_LOCAL_RULE_KEYS and not _is_empty_rule(value):
+            return False
+    return True
+
+
+def plan_transform_dispatch(
+    raw_rows: Sequence[Dict[str, Any]],
+    params: Dict[str, Any],
+    *,
+    rules: Dict[str, Any],
+    computed_fields_v3: Optional[Sequence[Dict[str, Any]]] = None,
+    filter_expr_v3: Optional[Dict[str, Any]] = None,
+) -> TransformDispatchPlan:
+    """Pick how a transform_rows_v3 call reaches the accel service, by input size.
+
+    Small inputs go inline. Larger row-local plans are split into concurrent
+    chunks. Very large inputs (and large plans that are not row-local) go
+    through the async task endpoint, which only exists for transform_rows_v2
+    and is therefore only used when the v3-only extras are empty.
+    """
+    rows = len(raw_rows)
+    requested = str(_resolve_setting(params, "rust_v3_dispatch", "AIWF_RUST_V3_DISPATCH", "auto")).strip().lower()
+    if requested not in DISPATCH_MODES:
+        requested = "auto"
+    inline_max_rows = _resolve_setting(params, "rust_v3_inline_max_rows", "AIWF_RUST_V3_INLINE_MAX_ROWS", DEFAULT_INLINE_MAX_ROWS)
+    chunk_rows = max(1, _resolve_setting(params, "rust_v3_chunk_rows", "AIWF_RUST_V3_CHUNK_ROWS", DEFAULT_CHUNK_ROWS))
+    workers = max(1, _resolve_setting(params, "rust_v3_chunk_workers", "AIWF_RUST_V3_CHUNK_WORKERS", DEFAULT_CHUNK_WORKERS))
+    async_min_rows = _resolve_setting(params, "rust_v3_async_min_rows", "AIWF_RUST_V3_ASYNC_MIN_ROWS", DEFAULT_ASYNC_MIN_ROWS)
+    row_local = is_row_local_plan(rules)
+    async_eligible = not computed_fields_v3 and filter_expr_v3 is None
+
+    def chunked(reason: str) -> TransformDispatchPlan:
+        chunks = (rows + chunk_rows - 1) // chunk_rows
+        return TransformDispatchPlan(
+            mode="chunked",
+            reason=reason,
+            rows=rows,
+            row_local=row_local,
+            chunk_rows=chunk_rows,
+            chunks=chunks,
+            workers=min(workers, max(1, chunks)),
+        )
+
+    if requested == "inline":
+        return TransformDispatchPlan(mode="inline", reason="requested", rows=rows, row_local=row_local)
+    if requested == "chunked":
+        if row_local:
+            return chunked("requested")
+        return TransformDispatchPlan(mode="inline", reason="chunked_requires_row_local_rules", rows=rows, row_local=row_local)
+    if requested == "async_task":
+        if async_eligible:
+            return TransformDispatchPlan(mode="async_task", reason="requested", rows=rows, row_local=row_local)
+        return TransformDispatchPlan(mode="inline", reason="async_task_unsupported_for_v3_extras", rows=rows, row_local=row_local)
+
+    if rows <= inline_max_rows:
+        return TransformDispatchPlan(mode="inline", reason="below_inline_max_rows", rows=rows, row_local=row_local)
+    if rows >= async_min_rows and async_eligible:
+        return TransformDispatchPlan(mode="async_task", reason="above_async_min_rows", rows=rows, row_local=row_local)
+    if row_local:
+        return chunked("row_local_above_inline_max_rows")
+    if async_eligible:
+        return TransformDispatchPlan(mode="async_task", reason="not_row_local_above_inline_max_rows", rows=rows, row_local=row_local)
+    return TransformDispatchPlan(mode="inline", reason="no_eligible_large_input_mode", rows=rows, row_local=row_local)
+
+
+def async_poll_settings(params: Dict[str, Any]) -> tuple[float, float]:
+    timeout = _resolve_setting(params, "rust_v3_async_timeout_seconds", "AIWF_RUST_V3_ASYNC_TIMEOUT", DEFAULT_ASYNC_TIMEOUT_SECONDS)
+    poll = _resolve_setting(params, "rust_v3_async_poll_seconds", "AIWF_RUST_V3_ASYNC_POLL", DEFAULT_ASYNC_POLL_SECONDS)
+    return float(timeout), max(0.01, float(poll))
+
+
+def async_idempotency_key(payload: Dict[str, Any]) -> str:
+    """Stable key for a submit payload, so a retried run re-attaches to the same accel task."""
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"glue-v3:{payload.get('run_id') or ''}:{digest[:32]}"
+
+
+def chunk_gates(quality_gates: Dict[str, Any]) -> Dict[str, Any]:
+    """Gates sent with each chunk: only the keys that shape quality counters, never the thresholds."""
+    return {"required_fields": list(quality_gates.get("required_fields") or [])} if "required_fields" in quality_gates else {}
+
+
+def _gate_uint(gates: Dict[str, Any], key: str) -> Optional[int]:
+    value = gates.get(key)
+    return value if isinstance(value, int) and not isinstance(value, bool) and value >= 0 else None
+
+
+def _gate_float(gates: Dict[str, Any], key: str) -> Optional[float]:
+    value = gates.get(key)
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def evaluate_quality_gates(quality: Dict[str, Any], gates: Dict[str, Any]) -> Dict[str, Any]:
+    """Mirror of the accel service's evaluate_quality_gates, applied to merged chunk quality."""
+    input_rows = float(quality.get("input_rows") or 0)
+    output_rows = int(quality.get("output_rows") or 0)
+    invalid_rows = int(quality.get("invalid_rows") or 0)
+    filtered_rows = int(quality.get("filtered_rows") or 0)
+    duplicate_rows_removed = int(quality.get("duplicate_rows_removed") or 0)
+    required_missing_ratio = float(quality.get("required_missing_ratio") or 0.0)
+    numeric_parse_rate = float(quality.get("numeric_parse_rate", 1.0))
+    date_parse_rate = float(quality.get("date_parse_rate", 1.0))
+    duplicate_key_ratio = float(quality.get("duplicate_key_ratio") or 0.0)
+    blank_row_ratio = float(quality.get("blank_row_ratio") or 0.0)
+    errors: List[str] = []
+
+    max_invalid_rows = _gate_uint(gates, "max_invalid_rows")
+    if max_invalid_rows is not None and invalid_rows > max_invalid_rows:
+        errors.append(f"invalid_rows={invalid_rows} exceeds max_invalid_rows={max_invalid_rows}")
+    min_output_rows = _gate_uint(gates, "min_output_rows")
+    if min_output_rows is not None and output_rows < min_output_rows:
+        errors.append(f"output_rows={output_rows} below min_output_rows={min_output_rows}")
+    max_invalid_ratio = _gate_float(gates, "max_invalid_ratio")
+    if max_invalid_ratio is not None:
+        ratio = invalid_rows / input_rows if input_rows > 0.0 else 0.0
+        if ratio > max_invalid_ratio:
+            errors.append(f"invalid_ratio={ratio:.6f} exceeds max_invalid_ratio={max_invalid_ratio:.6f}")
+    max_required_missing_ratio = _gate_float(gates, "max_required_missing_ratio")
+    if max_required_missing_ratio is not None and required_missing_ratio > max_required_missing_ratio:
+        errors.append(
+            f"required_missing_ratio={required_missing_ratio:.6f} exceeds max_required_missing_ratio={max_required_missing_ratio:.6f}"
+        )
+    max_filtered_rows = _gate_uint(gates, "max_filtered_rows")
+    if max_filtered_rows is not None and filtered_rows > max_filtered_rows:
+        errors.append(f"filtered_rows={filtered_rows} exceeds max_filtered_rows={max_filtered_rows}")
+    max_duplicate_rows_removed = _gate_uint(gates, "max_duplicate_rows_removed")
+    if max_duplicate_rows_removed is not None and duplicate_rows_removed > max_duplicate_rows_removed:
+        errors.append(
+            f"duplicate_rows_removed={duplicate_rows_removed} exceeds max_duplicate_rows_removed={max_duplicate_rows_removed}"
+        )
+    allow_empty_output = gates.get("allow_empty_output")
+    if isinstance(allow_empty_output, bool) and not allow_empty_output and output_rows == 0:
+        errors.append("output_rows=0 while allow_empty_output=false")
+    numeric_parse_rate_min = _gate_float(gates, "numeric_parse_rate_min")
+    if numeric_parse_rate_min is not None and numeric_parse_rate < numeric_parse_rate_min:
+        errors.append(f"numeric_parse_rate={numeric_parse_rate:.6f} below numeric_parse_rate_min={numeric_parse_rate_min:.6f}")
+    date_parse_rate_min = _gate_float(gates, "date_parse_rate_min")
+    if date_parse_rate_min is not None and date_parse_rate < date_parse_rate_min:
+        errors.append(f"date_parse_rate={date_parse_rate:.6f} below date_parse_rate_min={date_parse_rate_min:.6f}")
+    duplicate_key_ratio_max = _gate_float(gates, "duplicate_key_ratio_max")
+    if duplicate_key_ratio_max is not None and duplicate_key_ratio > duplicate_key_ratio_max:
+        errors.append(f"duplicate_key_ratio={duplicate_key_ratio:.6f} exceeds duplicate_key_ratio_max={duplicate_key_ratio_max:.6f}")
+    blank_row_ratio_max = _gate_float(gates, "blank_row_ratio_max")
+    if blank_row_ratio_max is not None and blank_row_ratio > blank_row_ratio_max:
+        errors.append(f"blank_row_ratio={blank_row_ratio:.6f} exceeds blank_row_ratio_max={blank_row_ratio_max:.6f}")
+    return {"passed": not errors, "errors": errors}
+
+
+def _merge_quality(qualities: List[Dict[str, Any]]) -> Dict[str, Any]:
+    merged = dict(qualities[0])
+    for key in _QUALITY_COUNT_KEYS:
+        if any(key in quality for quality in qualities):
+            merged[key] = sum(int(quality.get(key) or 0) for quality in qualities)
+    missing_by_field: Dict[str, int] = {}
+    for quality in qualities:
+        for field, count in dict(quality.get("required_missing_by_field") or {}).items():
+            missing_by_field[field] = missing_by_field.get(field, 0) + int(count or 0)
+    if "required_missing_by_field" in merged:
+        merged["required_missing_by_field"] = missing_by_field
+
+    # Ratios are recomputed from the summed counters with the service's own
+    # formulas; they are taken over the rows before any v3 filter_expr.
+    base_output_rows = int(merged.get("output_rows") or 0) + int(merged.get("filtered_by_expr_v3") or 0)
+    duplicate_rows_removed = int(merged.get("duplicate_rows_removed") or 0)
+    required_total_cells = base_output_rows * len(list(merged.get("required_fields") or []))
+    if "required_missing_ratio" in merged:
+        merged["required_missing_ratio"] = (
+            int(merged.get("required_missing_cells") or 0) / required_total_cells if required_total_cells > 0 else 0.0
+        )
+    if "numeric_parse_rate" in merged:
+        total = int(merged.get("numeric_cells_total") or 0)
+        merged["numeric_parse_rate"] = int(merged.get("numeric_cells_parsed") or 0) / total if total > 0 else 1.0
+    if "date_parse_rate" in merged:
+        total = int(merged.get("date_cells_total") or 0)
+        merged["date_parse_rate"] = int(merged.get("date_cells_parsed") or 0) / total if total > 0 else 1.0
+    if "duplicate_key_ratio" in merged:
+        denominator = base_output_rows + duplicate_rows_removed
+        merged["duplicate_key_ratio"] = duplicate_rows_removed / denominator if denominator > 0 else 0.0
+    if "blank_row_ratio" in merged:
+        merged["blank_row_ratio"] = int(merged.get("blank_output_rows") or 0) / base_output_rows if base_output_rows > 0 else 0.0
+    return merged
+
+
+def _merge_audit(audits: List[Dict[str, Any]], offsets: List[int]) -> Dict[str, Any]:
+    merged = dict(audits[0])
+    for key in _AUDIT_COUNT_KEYS:
+        if any(isinstance(audit.get(key), dict) for audit in audits):
+            totals: Dict[str, int] = {}
+            for audit in audits:
+                for name, value in dict(audit.get(key) or {}).items():
+                    totals[name] = totals.get(name, 0) + int(value or 0)
+            merged[key] = totals
+    limits = merged.get("limits") if isinstance(merged.get("limits"), dict) else {}
+    sample_limit = limits.get("sample_limit")
+    if any(isinstance(audit.get("reason_samples"), dict) for audit in audits):
+        samples: Dict[str, List[Any]] = {}
+        for audit, offset in zip(audits, offsets):
+            for reason, items in dict(audit.get("reason_samples") or {}).items():
+                bucket = samples.setdefault(reason, [])
+                for item in items if isinstance(items, list) else []:
+                    if sample_limit is not None and len(bucket) >= int(sample_limit):
+                        break
+                    if isinstance(item, dict) and isinstance(item.get("row_index"), int):
+                        item = {**item, "row_index": item["row_index"] + offset}
+                    bucket.append(item)
+        merged["reason_samples"] = samples
+    if any("estimated_input_bytes" in audit for audit in audits):
+        merged["estimated_input_bytes"] = sum(int(audit.get("estimated_input_bytes") or 0) for audit in audits)
+    if any(isinstance(audit.get("lineage_v3"), dict) for audit in audits):
+        lineage: Dict[str, List[Any]] = {}
+        for audit in audits:
+            for name, deps in dict(audit.get("lineage_v3") or {}).items():
+                bucket = lineage.setdefault(name, [])
+                bucket.extend(dep for dep in (deps or []) if dep not in bucket)
+        merged["lineage_v3"] = lineage
+    return merged
+
+
+def merge_chunk_bodies(
+    bodies: List[Dict[str, Any]],
+    offsets: List[int],
+    *,
+    quality_gates: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Combine per-chunk transform responses (in input order) into one response body.
+
+    Rows and reason samples are concatenated, counters summed, ratios
+    recomputed, and the quality gates evaluated once over the merged quality.
+    Raises ValueError with the service's message when a gate fails.
+    """
+    quality = _merge_quality([dict(body.get("quality") or {}) for body in bodies])
+    gate_result = evaluate_quality_gates(quality, quality_gates)
+    if not gate_result["passed"]:
+        raise ValueError("transform_rows_v2 quality gate failed: " + "; ".join(gate_result["errors"]))
+    rows: List[Any] = []
+    for body in bodies:
+        rows.extend(body.get("rows") or [])
+    audit = _merge_audit([dict(body.get("audit") or {}) for body in bodies], offsets)
+    audit["chunk_trace_ids"] = [str(body.get("trace_id") or "") for body in bodies]
+    merged = dict(bodies[0])
+    merged.update(
+        {
+            "rows": rows,
+            "quality": quality,
+            "gate_result": gate_result,
+            "audit": audit,
+        }
+    )
+    if isinstance(merged.get("stats"), dict):
+        stats = dict(merged["stats"])
+        for key in ("input_rows", "output_rows", "invalid_rows", "filtered_rows", "duplicate_rows_removed"):
+            stats[key] = sum(int(dict(body.get("stats") or {}).get(key) or 0) for body in bodies)
+        stats["latency_ms"] = max(int(dict(body.get("stats") or {}).get("latency_ms") or 0) for body in bodies)
+        merged["stats"] = stats
+    return merged
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import time
 from typing import Any, Dict
 
+from aiwf.metrics import observe_operator_response
+
 
 DEFAULT_ACCEL_BASE_URL = "http://127.0.0.1:18082"
 
@@ -29,7 +32,13 @@ def post_json(path: str, payload: Dict[str, Any], *, base_url: str = DEFAULT_ACC
     import requests
 
     url = operator_url(base_url, path)
-    response = requests.post(url, json=payload, timeout=timeout)
+    started = time.perf_counter()
+    try:
+        response = requests.post(url, json=payload, timeout=timeout)
+    except Exception:
+        observe_operator_response(path, started)
+        raise
+    observe_operator_response(path, started, response)
     if response.status_code >= 400:
         raise RuntimeError(f"POST {path} -> {response.status_code} {response.text}")
     return json_or_ok(response, f"POST {path}")
@@ -39,7 +48,13 @@ def get_json(path: str, *, base_url: str = DEFAULT_ACCEL_BASE_URL, timeout: floa
     import requests
 
     url = operator_url(base_url, path)
-    response = requests.get(url, timeout=timeout)
+    started = time.perf_counter()
+    try:
+        response = requests.get(url, timeout=timeout)
+    except Exception:
+        observe_operator_response(path, started)
+        raise
+    observe_operator_response(path, started, response)
     if response.status_code >= 400:
         raise RuntimeError(f"GET {path} -> {response.status_code} {response.text}")
     return json_or_ok(response, f"GET {path}")
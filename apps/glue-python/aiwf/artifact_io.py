@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import IO, Any, Optional
+
+
+_BUFFER_SIZE = 1024 * 1024
+_MAX_RECORDED_DIGESTS = 4096
+_DIGEST_LOCK = threading.Lock()
+_RECORDED_DIGESTS: "OrderedDict[str, tuple[tuple[int, int, int, int], str]]" = OrderedDict()
+# Timestamps that are whole milliseconds suggest a coarse-resolution filesystem
+# (FAT, HFS+, some network mounts), where a same-size rewrite within one tick
+# leaves the stat identity unchanged.
+_COARSE_MTIME_NS = 1_000_000
+
+
+@dataclass(frozen=True)
+class ArtifactDigest:
+    path: str
+    size: int
+    sha256: str
+
+
+def _digest_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _stat_identity(stat: os.stat_result) -> Optional[tuple[int, int, int, int]]:
+    """What a recorded digest is checked against, or None when the stat cannot vouch for the bytes.
+
+    ctime is included because on POSIX it cannot be set back: a rewrite that
+    pins mtime with os.utime still moves it.
+    """
+    if stat.st_mtime_ns % _COARSE_MTIME_NS == 0 or stat.st_ctime_ns % _COARSE_MTIME_NS == 0:
+        return None
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino)
+
+
+def _record_digest(path: str, size: int, sha256: str) -> None:
+    key = _digest_key(path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return
+    identity = _stat_identity(stat)
+    if stat.st_size != size or identity is None:
+        with _DIGEST_LOCK:
+            _RECORDED_DIGESTS.pop(key, None)
+        return
+    with _DIGEST_LOCK:
+        _RECORDED_DIGESTS[key] = (identity, sha256)
+        _RECORDED_DIGESTS.move_to_end(key)
+        while len(_RECORDED_DIGESTS) > _MAX_RECORDED_DIGESTS:
+            _RECORDED_DIGESTS.popitem(last=False)
+
+
+def recorded_artifact_digest(path: str) -> Optional[ArtifactDigest]:
+    """Return the digest captured while `path` was written, if the file is unchanged since."""
+    key = _digest_key(path)
+    with _DIGEST_LOCK:
+        recorded = _RECORDED_DIGESTS.get(key)
+    if recorded is None:
+        return None
+    identity, sha256 = recorded
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if _stat_identity(stat) != identity:
+        with _DIGEST_LOCK:
+            _RECORDED_DIGESTS.pop(key, None)
+        return None
+    return ArtifactDigest(path=path, size=identity[0], sha256=sha256)
+
+
+def forget_artifact_digests() -> None:
+    with _DIGEST_LOCK:
+        _RECORDED_DIGESTS.clear()
+
+
+class HashingSink(io.RawIOBase):
+    """Raw binary sink that feeds every written byte to sha256 before it reaches disk.
+
+    The sink is deliberately not seekable so writers (zipfile, pyarrow) never
+    rewrite bytes that have already been hashed.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._handle = open(path, "wb")
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self.size
+
+    def write(self, data: Any) -> int:
+        view = memoryview(data).cast("B")
+        written = self._handle.write(view)
+        written = len(view) if written is None else written
+        self._digest.update(view[:written])
+        self.size += written
+        return written
+
+    def flush(self) -> None:
+        if not self._handle.closed:
+            self._handle.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._handle.close()
+        finally:
+            super().close()
+        _record_digest(self.path, self.size, self._digest.hexdigest())
+
+    def digest(self) -> ArtifactDigest:
+        return ArtifactDigest(path=self.path, size=self.size, sha256=self._digest.hexdigest())
+
+
+def open_artifact_output(
+    path: str,
+    mode: str = "wb",
+    *,
+    encoding: Optional[str] = None,
+    newline: Optional[str] = None,
+) -> IO[Any]:
+    """Open an artifact for writing; its sha256 is known as soon as the stream is closed."""
+    if mode not in {"w", "wb", "wt"}:
+        raise ValueError(f"unsupported artifact output mode: {mode}")
+    buffered = io.BufferedWriter(HashingSink(path), buffer_size=_BUFFER_SIZE)
+    if mode == "wb":
+        return buffered
+    return io.TextIOWrapper(buffered, encoding=encoding or "utf-8", newline=newline, write_through=False)
+
+
+def write_artifact_bytes(path: str, payload: bytes) -> ArtifactDigest:
+    sink = HashingSink(path)
+    try:
+        sink.write(payload)
+    finally:
+        sink.close()
+    return sink.digest()
+
+
+def artifact_digest(path: str) -> ArtifactDigest:
+    """Path, size and sha256 of an artifact, hashing from disk only when no write-time digest exists."""
+    recorded = recorded_artifact_digest(path)
+    if recorded is not None:
+        return recorded
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_BUFFER_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return ArtifactDigest(path=path, size=size, sha256=digest.hexdigest())
@@ -1,6 +1,14 @@
 from __future__ import annotations
 import requests
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from aiwf.callback_outbox import (
+    KIND_ARTIFACT_UPSERT,
+    KIND_STEP_DONE,
+    KIND_STEP_START,
+    active_callback_outbox,
+)
 
 
 def _response_json_or_ok(response: requests.Response, context: str) -> Dict[str, Any]:
@@ -24,20 +32,43 @@ class BaseClient:
             h["X-API-Key"] = self.api_key
         return h
 
+    def _enqueue(self, job_id: str, kind: str, url: str, actor: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Hand the callback to the durable outbox when it is enabled; None means post it inline."""
+        outbox = active_callback_outbox()
+        if outbox is None:
+            return None
+        seq = outbox.enqueue(
+            job_id=job_id,
+            kind=kind,
+            urls=[f"{url}?{urlencode({'actor': actor})}"],
+            body=payload,
+            headers=self._headers(),
+        )
+        return {"ok": True, "queued": True, "seq": seq}
+
     def step_start(self, job_id: str, step_id: str, actor: str, payload: Dict[str, Any]):
         url = f"{self.base_url}/api/v1/jobs/{job_id}/steps/{step_id}/start"
+        queued = self._enqueue(job_id, KIND_STEP_START, url, actor, payload)
+        if queued is not None:
+            return queued
         r = requests.post(url, params={"actor": actor}, json=payload, headers=self._headers(), timeout=30)
         r.raise_for_status()
         return _response_json_or_ok(r, f"POST {url}")
 
     def step_done(self, job_id: str, step_id: str, actor: str, payload: Dict[str, Any]):
         url = f"{self.base_url}/api/v1/jobs/{job_id}/steps/{step_id}/done"
+        queued = self._enqueue(job_id, KIND_STEP_DONE, url, actor, payload)
+        if queued is not None:
+            return queued
         r = requests.post(url, params={"actor": actor}, json=payload, headers=self._headers(), timeout=30)
         r.raise_for_status()
         return _response_json_or_ok(r, f"POST {url}")
 
     def register_artifact(self, job_id: str, actor: str, artifact: Dict[str, Any]):
         url = f"{self.base_url}/api/v1/jobs/{job_id}/artifacts/register"
+        queued = self._enqueue(job_id, KIND_ARTIFACT_UPSERT, url, actor, artifact)
+        if queued is not None:
+            return queued
         r = requests.post(url, params={"actor": actor}, json=artifact, headers=self._headers(), timeout=30)
         r.raise_for_status()
         return _response_json_or_ok(r, f"POST {url}")
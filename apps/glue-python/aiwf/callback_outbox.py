@@ -0,0 +1,537 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from aiwf.paths import resolve_bus_root
+
+
+CALLBACK_OUTBOX_SCHEMA_VERSION = "callback_outbox.v1"
+KIND_STEP_START = "step_start"
+KIND_STEP_DONE = "step_done"
+KIND_STEP_FAIL = "step_fail"
+KIND_ARTIFACT_UPSERT = "artifact_upsert"
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_BACKOFF_BASE_SECONDS = 0.5
+DEFAULT_BACKOFF_MAX_SECONDS = 60.0
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_STALE_SEGMENT_SECONDS = 120.0
+DEFAULT_EXIT_FLUSH_SECONDS = 5.0
+HEARTBEAT_SECONDS = 30.0
+COMPACT_MIN_BYTES = 1024 * 1024
+
+_SEGMENT_PREFIX = "callbacks-"
+_SEGMENT_SUFFIX = ".jsonl"
+_DEAD_LETTER_FILE = "dead_letter.jsonl"
+# Headers are re-derived at send time so credentials never land on disk.
+_SECRET_HEADERS = {"x-api-key", "authorization"}
+_RETRYABLE_STATUS = {408, 425, 429}
+
+
+def _env_float(key: str, default: float) -> float:
+    raw = str(os.getenv(key) or "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def callback_outbox_enabled() -> bool:
+    return str(os.getenv("AIWF_BASE_CALLBACK_OUTBOX") or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def callback_outbox_root() -> str:
+    override = str(os.getenv("AIWF_BASE_OUTBOX_DIR") or "").strip()
+    if override:
+        return os.path.normpath(override)
+    return os.path.join(resolve_bus_root(), "outbox", "base_callbacks")
+
+
+def _send_headers(stored: Dict[str, str]) -> Dict[str, str]:
+    headers = {str(k): str(v) for k, v in (stored or {}).items()}
+    api_key = os.getenv("AIWF_API_KEY")
+    if api_key:
+        headers["X-API-Key"] = str(api_key)
+    return headers
+
+
+def _default_session_factory() -> Any:
+    import requests
+
+    return requests.Session()
+
+
+def _retry_delay(attempts: int, base: float, cap: float) -> float:
+    return min(cap, base * (2 ** max(0, attempts - 1)))
+
+
+class _Segment:
+    """Append-only JSONL log owned by one process.
+
+    Lines are either `enqueue` records carrying the callback, or `ack` records
+    (status "sent" or "dead") naming an enqueued seq. Replaying a segment keeps
+    the enqueue records without an ack, in seq order.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._handle = open(path, "a", encoding="utf-8")
+
+    def append(self, records: List[Dict[str, Any]], *, sync: bool) -> None:
+        if self._handle.closed:
+            return
+        for record in records:
+            self._handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        if sync:
+            os.fsync(self._handle.fileno())
+
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def truncate(self) -> None:
+        self._handle.close()
+        self._handle = open(self.path, "w", encoding="utf-8")
+
+    def touch(self) -> None:
+        try:
+            os.utime(self.path, None)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def _replay(path: str) -> List[Dict[str, Any]]:
+    pending: Dict[int, Dict[str, Any]] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-append; everything before it is intact.
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                seq = int(record.get("seq") or 0)
+                if record.get("op") == "enqueue":
+                    pending[seq] = record
+                elif record.get("op") == "ack":
+                    pending.pop(seq, None)
+    except OSError:
+        return []
+    return [pending[seq] for seq in sorted(pending)]
+
+
+class CallbackOutbox:
+    """Durable, asynchronous delivery of base-java job callbacks.
+
+    `enqueue` appends the callback to this process's segment under `root` and
+    returns without touching the network; a daemon sender thread delivers it
+    over one pooled session. Callbacks for the same job go out strictly in
+    enqueue order, and a job whose head callback is failing backs off without
+    holding up other jobs. Consecutive artifact upserts for a job are drained
+    as one batch (repeats of the same artifact_id collapse to the latest), and
+    the artifact endpoint that answered last time is tried first.
+
+    Callbacks that keep failing after `max_attempts`, or that base-java
+    rejects with a non-retryable 4xx, go to `dead_letter.jsonl`.
+
+    A heartbeat thread, independent of the sender, keeps this process's
+    segment fresh even while a delivery is blocked. The same thread adopts
+    segments left behind by a process that stopped heartbeating, so an
+    undelivered callback survives a restart and a sibling worker that dies
+    later is still drained.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        *,
+        max_attempts: Optional[int] = None,
+        backoff_base_seconds: Optional[float] = None,
+        backoff_max_seconds: Optional[float] = None,
+        request_timeout_seconds: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        stale_segment_seconds: Optional[float] = None,
+        fsync: bool = True,
+        session_factory: Callable[[], Any] = _default_session_factory,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.root = root
+        self.max_attempts = max(
+            1,
+            int(max_attempts if max_attempts is not None else _env_float("AIWF_BASE_OUTBOX_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)),
+        )
+        self.backoff_base_seconds = (
+            backoff_base_seconds
+            if backoff_base_seconds is not None
+            else _env_float("AIWF_BASE_OUTBOX_BACKOFF_SECONDS", DEFAULT_BACKOFF_BASE_SECONDS)
+        )
+        self.backoff_max_seconds = (
+            backoff_max_seconds
+            if backoff_max_seconds is not None
+            else _env_float("AIWF_BASE_OUTBOX_BACKOFF_MAX_SECONDS", DEFAULT_BACKOFF_MAX_SECONDS)
+        )
+        self.request_timeout_seconds = (
+            request_timeout_seconds
+            if request_timeout_seconds is not None
+            else _env_float("AIWF_BASE_OUTBOX_TIMEOUT", DEFAULT_REQUEST_TIMEOUT_SECONDS)
+        )
+        self.batch_size = max(1, int(batch_size))
+        self.stale_segment_seconds = (
+            stale_segment_seconds
+            if stale_segment_seconds is not None
+            else _env_float("AIWF_BASE_OUTBOX_STALE_SECONDS", DEFAULT_STALE_SEGMENT_SECONDS)
+        )
+        self._fsync = fsync
+        self._session_factory = session_factory
+        self._session: Any = None
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queues: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._attempts: Dict[int, int] = {}
+        self._in_flight: Set[str] = set()
+        self._artifact_route: Dict[str, int] = {}
+        self._next_seq = 1
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._stats = {"enqueued": 0, "sent": 0, "coalesced": 0, "retries": 0, "dead": 0, "adopted": 0}
+        self._last_error = ""
+        os.makedirs(root, exist_ok=True)
+        name = f"{_SEGMENT_PREFIX}{os.getpid()}-{uuid.uuid4().hex[:8]}{_SEGMENT_SUFFIX}"
+        self._segment = _Segment(os.path.join(root, name))
+        self._adopt_stale_segments()
+        self._start_heartbeat()
+
+    # -- producer side -------------------------------------------------
+
+    def enqueue(
+        self,
+        *,
+        job_id: str,
+        kind: str,
+        urls: List[str],
+        body: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """Persist one callback and hand it to the sender; returns its seq."""
+        stored_headers = {k: v for k, v in (headers or {}).items() if str(k).lower() not in _SECRET_HEADERS}
+        with self._cond:
+            record = {
+                "op": "enqueue",
+                "schema_version": CALLBACK_OUTBOX_SCHEMA_VERSION,
+                "seq": self._next_seq,
+                "job_id": str(job_id),
+                "kind": kind,
+                "urls": list(urls),
+                "body": body,
+                "headers": stored_headers,
+                "enqueued_at": time.time(),
+            }
+            self._segment.append([record], sync=self._fsync)
+            self._next_seq += 1
+            self._queues.setdefault(record["job_id"], deque()).append(record)
+            self._stats["enqueued"] += 1
+            self._ensure_sender()
+            self._cond.notify_all()
+            return int(record["seq"])
+
+    def _adopt_stale_segments(self) -> None:
+        try:
+            names = sorted(os.listdir(self.root))
+        except OSError:
+            return
+        now = time.time()
+        for name in names:
+            path = os.path.join(self.root, name)
+            if not (name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX)) or path == self._segment.path:
+                continue
+            try:
+                if now - os.path.getmtime(path) < self.stale_segment_seconds:
+                    continue
+                # The rename is the claim: if another process got there first, this fails and we move on.
+                claimed = f"{path}.adopting-{os.getpid()}"
+                os.replace(path, claimed)
+            except OSError:
+                continue
+            with self._cond:
+                records = []
+                for record in _replay(claimed):
+                    records.append({**record, "seq": self._next_seq})
+                    self._next_seq += 1
+                if records:
+                    self._segment.append(records, sync=self._fsync)
+                    for record in records:
+                        self._queues.setdefault(str(record.get("job_id") or ""), deque()).append(record)
+                    self._stats["adopted"] += len(records)
+                    self._ensure_sender()
+                    self._cond.notify_all()
+            try:
+                os.remove(claimed)
+            except OSError:
+                pass
+
+    # -- sender side ---------------------------------------------------
+
+    def _ensure_sender(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="aiwf-callback-outbox", daemon=True)
+        self._thread.start()
+
+    def _ready_batch(self, now: float) -> Tuple[Optional[str], List[Dict[str, Any]], Optional[float]]:
+        wake_at: Optional[float] = None
+        ready: List[Tuple[int, str]] = []
+        for job_id, queue in self._queues.items():
+            if not queue or job_id in self._in_flight:
+                continue
+            retry_at = self._retry_at.get(job_id, 0.0)
+            if retry_at > now:
+                wake_at = retry_at if wake_at is None else min(wake_at, retry_at)
+                continue
+            ready.append((int(queue[0]["seq"]), job_id))
+        if not ready:
+            return None, [], wake_at
+        _, job_id = min(ready)
+        queue = self._queues[job_id]
+        batch = [queue[0]]
+        if queue[0]["kind"] == KIND_ARTIFACT_UPSERT:
+            for record in list(queue)[1 : self.batch_size]:
+                if record["kind"] != KIND_ARTIFACT_UPSERT:
+                    break
+                batch.append(record)
+        self._in_flight.add(job_id)
+        return job_id, batch, wake_at
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    now = self._clock()
+                    job_id, batch, wake_at = self._ready_batch(now)
+                    if batch:
+                        break
+                    timeout = HEARTBEAT_SECONDS if wake_at is None else max(0.0, min(HEARTBEAT_SECONDS, wake_at - now))
+                    self._cond.wait(timeout)
+            delivered, failure = self._deliver(batch)
+            with self._cond:
+                self._settle(str(job_id), batch, delivered, failure)
+                self._in_flight.discard(str(job_id))
+                self._maybe_compact()
+                self._cond.notify_all()
+
+    def _start_heartbeat(self) -> None:
+        # Well inside the stale threshold, so a live owner is never mistaken for a dead one.
+        interval = max(0.01, min(HEARTBEAT_SECONDS, self.stale_segment_seconds / 4))
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat_loop, args=(interval,), name="aiwf-callback-outbox-heartbeat", daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self, interval: float) -> None:
+        while not self._heartbeat_stop.wait(interval):
+            self._segment.touch()
+            self._adopt_stale_segments()
+
+    def _deliver(self, batch: List[Dict[str, Any]]) -> Tuple[int, Optional[Tuple[bool, str]]]:
+        """Send `batch` in order; returns (records delivered, (retryable, error) of the first failure)."""
+        if self._session is None:
+            self._session = self._session_factory()
+        latest_by_artifact: Dict[str, int] = {}
+        for record in batch:
+            if record["kind"] == KIND_ARTIFACT_UPSERT:
+                latest_by_artifact[str(record["body"].get("artifact_id") or "")] = int(record["seq"])
+        for index, record in enumerate(batch):
+            if record["kind"] == KIND_ARTIFACT_UPSERT:
+                artifact_id = str(record["body"].get("artifact_id") or "")
+                if latest_by_artifact.get(artifact_id) != int(record["seq"]):
+                    # A later upsert of the same artifact in this batch supersedes this one.
+                    record["_coalesced"] = True
+                    continue
+            ok, retryable, error = self._send(record)
+            if not ok:
+                return index, (retryable, error)
+        return len(batch), None
+
+    def _send(self, record: Dict[str, Any]) -> Tuple[bool, bool, str]:
+        urls = [str(url) for url in record.get("urls") or []]
+        headers = _send_headers(record.get("headers") or {})
+        route_key = urls[0].split("/api/v1/", 1)[0] if urls else ""
+        order = list(range(len(urls)))
+        if record["kind"] == KIND_ARTIFACT_UPSERT and route_key in self._artifact_route:
+            preferred = self._artifact_route[route_key]
+            order = [preferred] + [i for i in order if i != preferred]
+        retryable = False
+        last_err = "no callback url"
+        for index in order:
+            url = urls[index]
+            try:
+                response = self._session.post(url, json=record.get("body"), headers=headers, timeout=self.request_timeout_seconds)
+            except Exception as exc:
+                retryable = True
+                last_err = str(exc)
+                continue
+            status = int(response.status_code)
+            if status < 400:
+                if record["kind"] == KIND_ARTIFACT_UPSERT:
+                    self._artifact_route[route_key] = index
+                return True, False, ""
+            retryable = retryable or status >= 500 or status in _RETRYABLE_STATUS
+            last_err = f"POST {url} -> {status} {str(getattr(response, 'text', '') or '')[:300]}"
+        return False, retryable, last_err
+
+    def _settle(
+        self,
+        job_id: str,
+        batch: List[Dict[str, Any]],
+        delivered: int,
+        failure: Optional[Tuple[bool, str]],
+    ) -> None:
+        queue = self._queues.get(job_id)
+        acks: List[Dict[str, Any]] = []
+        for record in batch[:delivered]:
+            if queue and queue[0] is record:
+                queue.popleft()
+            self._attempts.pop(int(record["seq"]), None)
+            acks.append({"op": "ack", "seq": int(record["seq"]), "status": "sent"})
+            self._stats["coalesced" if record.get("_coalesced") else "sent"] += 1
+        if failure is not None and queue:
+            head = queue[0]
+            retryable, error = failure
+            seq = int(head["seq"])
+            attempts = self._attempts.get(seq, 0) + 1
+            self._last_error = error[:500]
+            if retryable and attempts < self.max_attempts:
+                self._attempts[seq] = attempts
+                self._retry_at[job_id] = self._clock() + _retry_delay(attempts, self.backoff_base_seconds, self.backoff_max_seconds)
+                self._stats["retries"] += 1
+            else:
+                queue.popleft()
+                self._attempts.pop(seq, None)
+                self._retry_at.pop(job_id, None)
+                acks.append({"op": "ack", "seq": seq, "status": "dead", "error": error[:2000]})
+                self._dead_letter(head, attempts, error)
+                self._stats["dead"] += 1
+        elif failure is None:
+            self._retry_at.pop(job_id, None)
+        if queue is not None and not queue:
+            self._queues.pop(job_id, None)
+        if acks:
+            self._segment.append(acks, sync=False)
+
+    def _dead_letter(self, record: Dict[str, Any], attempts: int, error: str) -> None:
+        entry = {k: v for k, v in record.items() if k not in {"op", "_coalesced"}}
+        entry.update({"attempts": attempts, "error": error[:2000], "dead_at": time.time()})
+        with open(os.path.join(self.root, _DEAD_LETTER_FILE), "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def _maybe_compact(self) -> None:
+        if self._queues or self._segment.size() < COMPACT_MIN_BYTES:
+            return
+        self._segment.truncate()
+
+    # -- introspection -------------------------------------------------
+
+    def pending(self) -> int:
+        with self._cond:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every enqueued callback is delivered or dead-lettered.
+
+        Callbacks waiting out a retry backoff are not hurried. Returns False if
+        `timeout` expires first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queues:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        flushed = self.flush(timeout)
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=1.0)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        with self._cond:
+            self._segment.close()
+        return flushed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "root": self.root,
+                "segment": os.path.basename(self._segment.path),
+                "pending": sum(len(queue) for queue in self._queues.values()),
+                "jobs_pending": len(self._queues),
+                "jobs_backing_off": sum(1 for at in self._retry_at.values() if at > self._clock()),
+                "last_error": self._last_error,
+                **self._stats,
+            }
+
+
+_OUTBOX: Optional[CallbackOutbox] = None
+_OUTBOX_LOCK = threading.Lock()
+
+
+def _flush_on_exit() -> None:
+    outbox = _OUTBOX
+    if outbox is not None:
+        outbox.flush(_env_float("AIWF_BASE_OUTBOX_EXIT_FLUSH_SECONDS", DEFAULT_EXIT_FLUSH_SECONDS))
+
+
+def callback_outbox() -> CallbackOutbox:
+    global _OUTBOX
+    root = callback_outbox_root()
+    with _OUTBOX_LOCK:
+        if _OUTBOX is None or _OUTBOX.root != root:
+            if _OUTBOX is None:
+                atexit.register(_flush_on_exit)
+            _OUTBOX = CallbackOutbox(root)
+        return _OUTBOX
+
+
+def active_callback_outbox() -> Optional[CallbackOutbox]:
+    """The process outbox when AIWF_BASE_CALLBACK_OUTBOX is on, else None."""
+    return callback_outbox() if callback_outbox_enabled() else None
+
+
+def callback_outbox_stats() -> Dict[str, Any]:
+    with _OUTBOX_LOCK:
+        outbox = _OUTBOX
+    return {"enabled": callback_outbox_enabled(), **(outbox.stats() if outbox is not None else {})}
+
+
+def reset_callback_outbox() -> None:
+    global _OUTBOX
+    with _OUTBOX_LOCK:
+        outbox, _OUTBOX = _OUTBOX, None
+    if outbox is not None:
+        outbox.close(timeout=0)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 import re
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
 
 from aiwf.canonical_profiles import get_profile_registry, resolve_profile_name
+from aiwf.immutable import freeze
 
 
 CLEANING_SPEC_V2_VERSION = "cleaning_spec.v2"
@@ -59,6 +64,58 @@ _SUPPORTED_PREPROCESS_FIELD_OPS = {
 }
 
 
+# Every top-level params key compile_cleaning_params_to_spec reads. The memo
+# key covers only these, so bulky inputs such as params.rows never get hashed.
+_COMPILE_PARAM_KEYS = (
+    "rules",
+    "quality_rules",
+    "image_rules",
+    "xlsx_rules",
+    "sheet_profiles",
+    "canonical_profile",
+    "profile",
+    "advanced_rules",
+    "input_format",
+    "input_files",
+    "input_path",
+    "input_csv_path",
+    "header_mapping_mode",
+    "text_split_by_line",
+    "ocr_enabled",
+    "ocr_lang",
+    "ocr_config",
+    "ocr_preprocess",
+    "xlsx_all_sheets",
+    "include_hidden_sheets",
+    "sheet_allowlist",
+    "external_enrichment_mode",
+    "document_parse_backend",
+    "citation_parse_backend",
+    "url_metadata_enrichment",
+    "on_file_error",
+    "id_field",
+    "amount_field",
+    "amount_round_digits",
+    "drop_negative_amount",
+    "min_amount",
+    "max_amount",
+    "deduplicate_by_id",
+    "sort_by_id",
+    "template_expected_profile",
+    "output_format",
+    "generate_quality_report",
+    "quality_report_path",
+    "export_canonical_bundle",
+    "canonical_bundle_dir",
+    "audit_sample_limit",
+    *_QUALITY_GATE_KEYS,
+)
+_COMPILED_SPEC_CACHE_SIZE = 256
+_COMPILED_SPEC_LOCK = threading.Lock()
+_COMPILED_SPECS: "OrderedDict[str, Mapping[str, Any]]" = OrderedDict()
+_COMPILED_SPEC_STATS = {"hits": 0, "misses": 0}
+
+
 def _normalize_advanced_rules(value: Any) -> dict[str, Any]:
     source = _as_dict(value)
     out: dict[str, Any] = {}
@@ -315,6 +372,46 @@ def compile_cleaning_params_to_spec(params: Mapping[str, Any]) -> dict[str, Any]
     return spec
 
 
+def _compile_params_key(params: Mapping[str, Any]) -> str:
+    projected = {key: params[key] for key in _COMPILE_PARAM_KEYS if key in params}
+    canonical = json.dumps(projected, sort_keys=True, separators=(",", ":"), default=repr)
+    return hashlib.sha256(canonical.encode("ascii")).hexdigest()
+
+
+def compiled_cleaning_spec(params: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Memoized compile_cleaning_params_to_spec keyed by a canonical hash of the params it reads.
+
+    The returned spec is shared between callers and read-only (FrozenDict /
+    FrozenList); use compile_cleaning_params_to_spec or thaw() for a mutable copy.
+    """
+    key = _compile_params_key(params)
+    with _COMPILED_SPEC_LOCK:
+        cached = _COMPILED_SPECS.get(key)
+        if cached is not None:
+            _COMPILED_SPECS.move_to_end(key)
+            _COMPILED_SPEC_STATS["hits"] += 1
+            return cached
+        _COMPILED_SPEC_STATS["misses"] += 1
+    compiled = freeze(compile_cleaning_params_to_spec(params))
+    with _COMPILED_SPEC_LOCK:
+        _COMPILED_SPECS[key] = compiled
+        _COMPILED_SPECS.move_to_end(key)
+        while len(_COMPILED_SPECS) > _COMPILED_SPEC_CACHE_SIZE:
+            _COMPILED_SPECS.popitem(last=False)
+    return compiled
+
+
+def compiled_cleaning_spec_cache_stats() -> Dict[str, int]:
+    with _COMPILED_SPEC_LOCK:
+        return {**_COMPILED_SPEC_STATS, "entries": len(_COMPILED_SPECS)}
+
+
+def clear_compiled_cleaning_spec_cache() -> None:
+    with _COMPILED_SPEC_LOCK:
+        _COMPILED_SPECS.clear()
+        _COMPILED_SPEC_STATS.update({"hits": 0, "misses": 0})
+
+
 def _compile_preprocess_field_transform(item: Mapping[str, Any]) -> tuple[Optional[dict[str, Any]], Optional[str]]:
     field = str(item.get("field") or "").strip()
     op = str(item.get("op") or "").strip().lower()
@@ -566,11 +663,20 @@ def candidate_profiles_from_headers(
     signal_source: str = "headers",
     limit: int = 3,
 ) -> list[dict[str, Any]]:
-    from aiwf.quality_contract import analyze_header_mapping
+    from aiwf.quality_contract import analyze_header_mappings
 
     raw_headers = [str(item).strip() for item in headers if str(item).strip()]
     if not raw_headers:
         return []
+    # One batched pass: each header is normalized and scored for value affinity
+    # once, then matched against every profile's cached alias table.
+    details_by_profile = analyze_header_mappings(
+        raw_headers,
+        list(CANONICAL_PROFILE_REGISTRY),
+        sheet_profiles=sheet_profiles,
+        header_mapping_mode=header_mapping_mode,
+        sample_values_by_header=sample_values_by_header,
+    )
     candidates: list[dict[str, Any]] = []
     for profile_name, profile in CANONICAL_PROFILE_REGISTRY.items():
         field_universe = {
@@ -586,16 +692,7 @@ def candidate_profiles_from_headers(
         }
         matched_fields: dict[str, float] = {}
         unresolved_required_ambiguity = 0
-        for header in raw_headers:
-            details = analyze_header_mapping(
-                header,
-                {
-                    "canonical_profile": profile_name,
-                    "sheet_profiles": dict(sheet_profiles or {}),
-                    "header_mapping_mode": header_mapping_mode,
-                },
-                sample_values=list((sample_values_by_header or {}).get(header) or []),
-            )
+        for details in details_by_profile[profile_name]:
             field = str(details.get("canonical_field") or "")
             confidence = float(details.get("confidence") or 0.0)
             if field and field not in field_universe:
@@ -3,10 +3,18 @@ from __future__ import annotations
 import copy
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from aiwf.cleaning_spec_v2 import CLEANING_SPEC_V2_VERSION, compile_cleaning_params_to_spec
+from aiwf.immutable import freeze, thaw
+
+
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+# (templates_dir, template_id) -> (registry signature, template file, file signature, frozen payload)
+_TEMPLATE_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], Optional[Path], Optional[Tuple[int, int]], Mapping[str, Any]]] = {}
+_TEMPLATE_CACHE_STATS = {"hits": 0, "misses": 0, "invalidations": 0}
 
 
 def _repo_root() -> Path:
@@ -175,11 +183,62 @@ def _normalize_registry_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def load_cleaning_template(template_id: str) -> Dict[str, Any]:
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_cleaning_template(template_id: str) -> Mapping[str, Any]:
+    """Shared, read-only template payload; re-read only when the registry or template file changes."""
     normalized_id = str(template_id or "").strip().lower()
     if not normalized_id or normalized_id == "default":
-        return {}
+        return freeze({})
     templates_dir = _templates_dir()
+    cache_key = (str(templates_dir), normalized_id)
+    registry_signature = _file_signature(templates_dir / "cleaning_templates_desktop.json")
+    with _TEMPLATE_CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(cache_key)
+        if (
+            cached is not None
+            and registry_signature is not None
+            and cached[0] == registry_signature
+            and (cached[1] is None or _file_signature(cached[1]) == cached[2])
+        ):
+            _TEMPLATE_CACHE_STATS["hits"] += 1
+            return cached[3]
+        _TEMPLATE_CACHE_STATS["misses"] += 1
+        if cached is not None:
+            _TEMPLATE_CACHE_STATS["invalidations"] += 1
+    payload, template_path, template_signature = _load_cleaning_template_uncached(normalized_id, templates_dir)
+    frozen = freeze(payload)
+    if registry_signature is not None and (template_path is None or template_signature is not None):
+        with _TEMPLATE_CACHE_LOCK:
+            _TEMPLATE_CACHE[cache_key] = (registry_signature, template_path, template_signature, frozen)
+    return frozen
+
+
+def cleaning_template_cache_stats() -> Dict[str, int]:
+    with _TEMPLATE_CACHE_LOCK:
+        return {**_TEMPLATE_CACHE_STATS, "entries": len(_TEMPLATE_CACHE)}
+
+
+def clear_cleaning_template_cache() -> None:
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE.clear()
+        _TEMPLATE_CACHE_STATS.update({"hits": 0, "misses": 0, "invalidations": 0})
+
+
+def load_cleaning_template(template_id: str) -> Dict[str, Any]:
+    return thaw(_cached_cleaning_template(template_id))
+
+
+def _load_cleaning_template_uncached(
+    normalized_id: str,
+    templates_dir: Path,
+) -> Tuple[Dict[str, Any], Optional[Path], Optional[Tuple[int, int]]]:
     registry_path = templates_dir / "cleaning_templates_desktop.json"
     if not registry_path.exists():
         raise ValueError(f"cleaning template registry not found: {registry_path}")
@@ -199,10 +258,13 @@ def load_cleaning_template(template_id: str) -> Dict[str, Any]:
         raise ValueError(f"unknown cleaning_template: {normalized_id}")
 
     payload_source: Dict[str, Any]
+    template_path: Optional[Path] = None
+    template_signature: Optional[Tuple[int, int]] = None
     if matched["file"]:
         template_path = templates_dir / matched["file"]
         if not template_path.exists():
             raise ValueError(f"cleaning template file not found: {template_path}")
+        template_signature = _file_signature(template_path)
         payload_source = _read_json_file(template_path)
     elif matched["cleaning_spec_v2"]:
         payload_source = {"cleaning_spec_v2": matched["cleaning_spec_v2"]}
@@ -229,7 +291,7 @@ def load_cleaning_template(template_id: str) -> Dict[str, Any]:
         "file": matched["file"],
         **metadata,
     }
-    return payload
+    return payload, template_path, template_signature
 
 
 def apply_cleaning_spec_to_params(
@@ -318,8 +380,8 @@ def resolve_cleaning_template_params(params: Dict[str, Any]) -> Dict[str, Any]:
     if not template_id or template_id == "default":
         return next_params
 
-    payload = load_cleaning_template(template_id)
-    template_metadata = dict(payload.get("template") or {})
+    payload = _cached_cleaning_template(template_id)
+    template_metadata = thaw(payload.get("template") or {})
     next_params = apply_cleaning_spec_to_params(
         next_params,
         payload.get("cleaning_spec_v2"),
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from aiwf.artifact_io import artifact_digest, open_artifact_output
+from aiwf.cleaning_spec_v2 import DEFAULT_HEADER_MAPPING_MODE
+from aiwf.paths import resolve_path_within_root
+
+
+EXTRACT_HANDOFF_SCHEMA_VERSION = "extract_handoff.v1"
+EXTRACT_HANDOFF_DIRNAME = "extract_handoff"
+
+# Options that change what a reader extracts from a file. Anything else in the
+# merged ingest options (job ids, response modes, enrichment switches) does
+# not invalidate a handoff.
+_RELEVANT_OPTION_DEFAULTS: Dict[str, Any] = {
+    "text_by_line": False,
+    "ocr_enabled": True,
+    "ocr_lang": None,
+    "ocr_config": None,
+    "ocr_preprocess": None,
+    "xlsx_all_sheets": True,
+    "include_hidden_sheets": False,
+    "sheet_allowlist": None,
+    "sheet_profiles": None,
+    "header_map": None,
+    "header_mapping_mode": DEFAULT_HEADER_MAPPING_MODE,
+    "canonical_profile": None,
+    "quality_rules": None,
+    "image_rules": None,
+    "xlsx_rules": None,
+    "pdf_text_fast_path": None,
+    "pdf_text_fast_path_min_rows": None,
+    "pdf_text_fast_path_min_chars": None,
+}
+
+
+def extract_handoff_dir(stage_dir: str) -> str:
+    return os.path.join(stage_dir, EXTRACT_HANDOFF_DIRNAME)
+
+
+def resolve_extract_handoff_dir(job_root: str, value: Any) -> str:
+    """Resolve a spec-supplied handoff dir; like other spec paths it must stay inside the job root."""
+    return resolve_path_within_root(job_root, str(value or "").strip())
+
+
+def _normalized_option(key: str, value: Any) -> Any:
+    default = _RELEVANT_OPTION_DEFAULTS[key]
+    if value is None or value == "" or value == [] or value == {}:
+        return default
+    if isinstance(default, bool):
+        return bool(value)
+    if isinstance(value, str):
+        return value.strip().lower() if key in {"header_mapping_mode", "canonical_profile", "ocr_preprocess"} else value.strip()
+    return value
+
+
+def extract_options_digest(options: Dict[str, Any]) -> str:
+    relevant = {key: _normalized_option(key, options.get(key)) for key in _RELEVANT_OPTION_DEFAULTS}
+    canonical = json.dumps(relevant, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _handoff_path(handoff_dir: str, source_sha256: str, options_digest: str) -> str:
+    key = hashlib.sha256(f"{source_sha256}:{options_digest}".encode("utf-8")).hexdigest()
+    return os.path.join(handoff_dir, f"{key}.json")
+
+
+def write_extract_handoff(
+    handoff_dir: str,
+    source_path: str,
+    options: Dict[str, Any],
+    rows: Any,
+    meta: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Persist one file's extraction under a name derived from its content hash and the reader options."""
+    source_sha256 = artifact_digest(source_path).sha256
+    options_digest = extract_options_digest(options)
+    path = _handoff_path(handoff_dir, source_sha256, options_digest)
+    os.makedirs(handoff_dir, exist_ok=True)
+    payload = {
+        "schema_version": EXTRACT_HANDOFF_SCHEMA_VERSION,
+        "source_path": source_path,
+        "source_sha256": source_sha256,
+        "options_digest": options_digest,
+        "rows": rows,
+        "meta": meta,
+    }
+    tmp_path = f"{path}.tmp"
+    with open_artifact_output(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+    return {
+        "path": path,
+        "source_path": source_path,
+        "source_sha256": source_sha256,
+        "options_digest": options_digest,
+        "row_count": len(rows) if isinstance(rows, list) else 0,
+    }
+
+
+def load_extract_handoff(handoff_dir: str, source_path: str, options: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the persisted extraction for `source_path` if its content and reader options still match."""
+    if not handoff_dir or not os.path.isdir(handoff_dir):
+        return None
+    try:
+        source_sha256 = artifact_digest(source_path).sha256
+    except OSError:
+        return None
+    options_digest = extract_options_digest(options)
+    path = _handoff_path(handoff_dir, source_sha256, options_digest)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema_version") != EXTRACT_HANDOFF_SCHEMA_VERSION
+        or payload.get("source_sha256") != source_sha256
+        or payload.get("options_digest") != options_digest
+        or not isinstance(payload.get("rows"), list)
+        or not isinstance(payload.get("meta"), dict)
+    ):
+        return None
+    payload["path"] = path
+    return payload
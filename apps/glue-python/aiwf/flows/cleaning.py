@@ -9,7 +9,7 @@ from aiwf.cleaning_spec_v2 import (
     CLEANING_SPEC_V2_VERSION,
     build_header_mapping,
     candidate_profiles_from_headers,
-    compile_cleaning_params_to_spec,
+    compiled_cleaning_spec,
     resolve_canonical_profile_name,
 )
 from aiwf.cleaning_templates import resolve_cleaning_template_params
@@ -55,6 +55,8 @@ from aiwf.flows.cleaning_outputs import (
     write_deck_pptx_impl,
     write_fin_xlsx_impl,
     write_profile_json_impl,
+    parquet_write_options_impl,
+    active_parquet_write_params,
 )
 from aiwf.flows.cleaning_bank_semantics import evaluate_bank_statement_semantics
 from aiwf.flows.cleaning_profile import build_profile_impl
@@ -659,7 +661,7 @@ def _compare_python_and_rust_cleaning(
 
 def _clean_rows(raw_rows: List[Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
     params = _prepare_cleaning_params(params)
-    compiled_spec = compile_cleaning_params_to_spec(params)
+    compiled_spec = compiled_cleaning_spec(params)
     strategy = _cleaning_rust_v2_strategy(params)
     allow_python_legacy_fallback = _allow_python_legacy_fallback(params)
     verify_on_default = bool(params.get("local_standalone")) or _to_bool(os.getenv("AIWF_CLEANING_RUST_V2_VERIFY_ON_DEFAULT", "false"), default=False)
@@ -1015,8 +1017,30 @@ def _write_cleaned_csv(csv_path: str, rows: List[Dict[str, Any]]) -> Dict[str, i
     return write_cleaned_csv_impl(csv_path, rows)
 
 
-def _write_cleaned_parquet(parquet_path: str, rows: List[Dict[str, Any]]) -> None:
-    return write_cleaned_parquet_impl(parquet_path, rows)
+def _parquet_write_options(params: Dict[str, Any]) -> Dict[str, Any]:
+    compiled_spec = compiled_cleaning_spec(params)
+    transform = compiled_spec.get("transform") if isinstance(compiled_spec.get("transform"), dict) else {}
+    return parquet_write_options_impl(
+        params,
+        casts=transform.get("casts") if isinstance(transform.get("casts"), dict) else {},
+        rule_param=_rule_param,
+        to_bool=_to_bool,
+        to_int=_to_int,
+    )
+
+
+def _write_cleaned_parquet(
+    parquet_path: str,
+    rows: List[Dict[str, Any]],
+    params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    params = params if params is not None else active_parquet_write_params()
+    return write_cleaned_parquet_impl(
+        parquet_path,
+        rows,
+        options=_parquet_write_options(params),
+        strict=_local_parquet_strict_enabled(params),
+    )
 
 
 def _write_fin_xlsx(
@@ -1024,6 +1048,8 @@ def _write_fin_xlsx(
     rows: List[Dict[str, Any]],
     image_path: Optional[str] = None,
     params: Optional[Dict[str, Any]] = None,
+    *,
+    profile: Optional[Dict[str, Any]] = None,
 ) -> None:
     return write_fin_xlsx_impl(
         xlsx_path,
@@ -1034,6 +1060,7 @@ def _write_fin_xlsx(
         to_decimal=_to_decimal,
         build_profile=_build_profile,
         utc_now_str=_utc_now_str,
+        profile=profile,
     )
 
 
@@ -5,7 +5,9 @@ import json
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Mapping, Optional
 
+from aiwf.artifact_io import open_artifact_output
 from aiwf.flows.artifact_selection import normalize_artifact_selection
+from aiwf.flows.cleaning_outputs import parquet_write_params
 from aiwf.registry_domains import normalize_registry_domain, summarize_registry_domains
 from aiwf.registry_events import record_registry_event
 from aiwf.registry_policy import default_conflict_policy, normalize_conflict_policy
@@ -13,7 +15,7 @@ from aiwf.runtime_state import get_runtime_state
 from aiwf.registry_utils import infer_caller_module
 
 
-LocalArtifactWriter = Callable[["CleaningArtifactContext", str], None]
+LocalArtifactWriter = Callable[["CleaningArtifactContext", str], Optional[Dict[str, Any]]]
 LocalArtifactPathResolver = Callable[["CleaningArtifactContext"], str]
 
 
@@ -312,8 +314,9 @@ def _write_csv_artifact(context: CleaningArtifactContext, output_path: str) -> N
     context.write_cleaned_csv(output_path, context.rows)
 
 
-def _write_parquet_artifact(context: CleaningArtifactContext, output_path: str) -> None:
-    context.write_cleaned_parquet(output_path, context.rows)
+def _write_parquet_artifact(context: CleaningArtifactContext, output_path: str) -> Optional[Dict[str, Any]]:
+    with parquet_write_params(context.params_effective):
+        return context.write_cleaned_parquet(output_path, context.rows)
 
 
 def _write_profile_artifact(context: CleaningArtifactContext, output_path: str) -> None:
@@ -321,17 +324,34 @@ def _write_profile_artifact(context: CleaningArtifactContext, output_path: str)
 
 
 def _write_quality_summary_artifact(context: CleaningArtifactContext, output_path: str) -> None:
-    with open(output_path, "w", encoding="utf-8") as handle:
+    with open_artifact_output(output_path, "w", encoding="utf-8") as handle:
         json.dump(context.quality_summary, handle, ensure_ascii=False, indent=2)
         handle.write("\n")
 
 
 def _write_rejections_artifact(context: CleaningArtifactContext, output_path: str) -> None:
-    with open(output_path, "w", encoding="utf-8", newline="\n") as handle:
+    with open_artifact_output(output_path, "w", encoding="utf-8", newline="\n") as handle:
         for item in context.rejections:
             handle.write(json.dumps(item, ensure_ascii=False) + "\n")
 
 
+def _artifact_entry(
+    registration: CleaningArtifactRegistration,
+    path: str,
+    sha: str,
+    metadata: Any = None,
+) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {
+        "artifact_id": registration.artifact_id,
+        "kind": registration.kind,
+        "path": path,
+        "sha256": sha,
+    }
+    if isinstance(metadata, dict) and metadata:
+        entry["metadata"] = metadata
+    return entry
+
+
 def materialize_local_cleaning_artifacts(context: CleaningArtifactContext) -> Dict[str, Any]:
     out: Dict[str, Any] = {"core_artifacts": []}
     for registration in select_cleaning_artifact_registrations(context.params_effective):
@@ -339,17 +359,12 @@ def materialize_local_cleaning_artifacts(context: CleaningArtifactContext) -> Di
             continue
         output_path = registration.local_path_resolver(context)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        registration.local_writer(context, output_path)
+        metadata = registration.local_writer(context, output_path)
         sha = context.sha256_file(output_path)
         out[registration.path_key] = output_path
         out[registration.sha_key] = sha
         out["core_artifacts"].append(
-            {
-                "artifact_id": registration.artifact_id,
-                "kind": registration.kind,
-                "path": output_path,
-                "sha256": sha,
-            }
+            _artifact_entry(registration, output_path, sha, metadata)
         )
     return out
 
@@ -368,17 +383,12 @@ def materialize_accel_cleaning_artifacts(
                 continue
             output_path = registration.local_path_resolver(local_context)
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            registration.local_writer(local_context, output_path)
+            metadata = registration.local_writer(local_context, output_path)
             sha = local_context.sha256_file(output_path)
             out[registration.path_key] = output_path
             out[registration.sha_key] = sha
             out["core_artifacts"].append(
-                {
-                    "artifact_id": registration.artifact_id,
-                    "kind": registration.kind,
-                    "path": output_path,
-                    "sha256": sha,
-                }
+                _artifact_entry(registration, output_path, sha, metadata)
             )
             continue
         obj = accel_outputs.get(registration.accel_output_key) or {}
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import contextvars
+import dataclasses
+import inspect
 import os
-from typing import Any, Callable, Dict, List, Optional
+import pickle
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from aiwf.flows.cleaning_artifacts import (
     CleaningArtifactContext,
@@ -14,6 +20,7 @@ from aiwf.flows.office_artifacts import (
     select_office_artifact_registrations,
 )
 from aiwf.flows.cleaning_errors import CleaningGuardrailError, guardrail_template_expected_profile, guardrail_template_id
+from aiwf.flows.cleaning_profile import reuse_profile_impl
 from aiwf.flows.cleaning_advanced_quality import evaluate_advanced_quality
 from aiwf.flows.cleaning_reporting import build_quality_summary, flatten_rejection_records
 
@@ -32,6 +39,58 @@ def _advanced_quality_blocking_codes(advanced_quality: Dict[str, Any]) -> list[s
     return codes
 
 
+DEFAULT_OFFICE_MAX_WORKERS = 4
+
+
+def _office_max_workers(params_effective: Dict[str, Any]) -> int:
+    raw = params_effective.get("office_max_workers")
+    if raw is None or raw == "":
+        raw = os.getenv("AIWF_OFFICE_MAX_WORKERS")
+    if raw is None or str(raw).strip() == "":
+        return DEFAULT_OFFICE_MAX_WORKERS
+    try:
+        return max(1, min(int(str(raw).strip()), 16))
+    except (TypeError, ValueError):
+        return DEFAULT_OFFICE_MAX_WORKERS
+
+
+def _render_office_artifact(writer: Callable[..., Any], context: OfficeArtifactContext, output_path: str) -> Tuple[float, str]:
+    """Run one writer; returns (seconds, error). The error is a string so it always crosses a process boundary."""
+    started = time.perf_counter()
+    try:
+        writer(context, output_path)
+    except Exception as exc:
+        return time.perf_counter() - started, f"{type(exc).__name__}: {exc}"
+    return time.perf_counter() - started, ""
+
+
+def _process_context(context: OfficeArtifactContext, writers: List[Callable[..., Any]]) -> Optional[OfficeArtifactContext]:
+    """`context` with stage-timing wrappers peeled off its writer hooks, or None when a hook cannot reach a worker process.
+
+    Only the callables are test-pickled; the rows and profile are plain data.
+    """
+    unwrapped = dataclasses.replace(
+        context,
+        write_fin_xlsx=inspect.unwrap(context.write_fin_xlsx),
+        write_audit_docx=inspect.unwrap(context.write_audit_docx),
+        write_deck_pptx=inspect.unwrap(context.write_deck_pptx),
+        sha256_file=inspect.unwrap(context.sha256_file),
+    )
+    try:
+        pickle.dumps(
+            (
+                writers,
+                unwrapped.write_fin_xlsx,
+                unwrapped.write_audit_docx,
+                unwrapped.write_deck_pptx,
+                unwrapped.sha256_file,
+            )
+        )
+    except Exception:
+        return None
+    return unwrapped
+
+
 def materialize_office_outputs(
     *,
     job_id: str,
@@ -47,6 +106,7 @@ def materialize_office_outputs(
     write_audit_docx: Callable[..., Any],
     write_deck_pptx: Callable[..., Any],
     sha256_file: Callable[..., str],
+    profile: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     registrations = select_office_artifact_registrations(params_effective)
     if not registrations:
@@ -58,11 +118,16 @@ def materialize_office_outputs(
     illustration_path = os.path.join(artifacts_dir, "summary_visual.png")
 
     office_rows, office_truncated = office_rows_subset(rows, params_effective)
-    office_profile = build_profile(office_rows, quality, profile_source)
+    if isinstance(profile, dict) and not office_truncated:
+        office_profile = reuse_profile_impl(profile, quality, profile_source)
+    else:
+        office_profile = build_profile(office_rows, quality, profile_source)
     office_profile["office_rows_truncated"] = office_truncated
     office_profile["office_rows_used"] = len(office_rows)
 
+    illustration_started = time.perf_counter()
     write_profile_illustration_png(illustration_path, office_profile, params_effective)
+    illustration_seconds = time.perf_counter() - illustration_started
     context = OfficeArtifactContext(
         job_id=job_id,
         artifacts_dir=artifacts_dir,
@@ -82,22 +147,73 @@ def materialize_office_outputs(
     out: Dict[str, Any] = {
         "office_profile": office_profile,
         "office_artifacts": [],
-    }
-    for registration in registrations:
-        output_path = os.path.join(artifacts_dir, registration.filename)
-        registration.writer(context, output_path)
-        sha = sha256_file(output_path)
-        out[registration.path_key] = output_path
-        out[registration.sha_key] = sha
-        out["office_artifacts"].append(
+        "office_timings": [
             {
-                "artifact_id": registration.artifact_id,
-                "kind": registration.kind,
-                "path": output_path,
-                "sha256": sha,
+                "name": "summary_visual",
+                "artifact_id": "",
+                "seconds": round(illustration_seconds, 6),
+                "ok": True,
             }
-        )
+        ],
+    }
+    # Writers are CPU-bound, so they go to worker processes when their hooks
+    # can be pickled; patched or closure hooks fall back to threads.
+    workers = min(_office_max_workers(params_effective), len(registrations))
+    writers = [registration.writer for registration in registrations]
+    process_context = _process_context(context, writers) if workers > 1 else None
+    paths = [os.path.join(artifacts_dir, registration.filename) for registration in registrations]
+    pool: Optional[Executor] = None
+    if process_context is not None:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        futures = [pool.submit(_render_office_artifact, writer, process_context, path) for writer, path in zip(writers, paths)]
+    elif workers > 1:
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aiwf-office")
+        futures = [
+            pool.submit(contextvars.copy_context().run, _render_office_artifact, writer, context, path)
+            for writer, path in zip(writers, paths)
+        ]
+    else:
+        futures = []
+    out["office_executor"] = "process" if process_context is not None else "thread" if workers > 1 else "inline"
 
+    errors: Dict[str, str] = {}
+    try:
+        # Collected in registration order so office_artifacts stays deterministic.
+        for index, (registration, output_path) in enumerate(zip(registrations, paths)):
+            try:
+                if futures:
+                    seconds, error = futures[index].result()
+                else:
+                    seconds, error = _render_office_artifact(registration.writer, context, output_path)
+                sha = "" if error else sha256_file(output_path)
+            except Exception as exc:
+                # A worker process that died, or a failure hashing the output.
+                seconds, error = 0.0, f"{type(exc).__name__}: {exc}"
+            out["office_timings"].append(
+                {
+                    "name": registration.name,
+                    "artifact_id": registration.artifact_id,
+                    "seconds": round(seconds, 6),
+                    "ok": not error,
+                }
+            )
+            if error:
+                errors[registration.name] = error
+                continue
+            out[registration.path_key] = output_path
+            out[registration.sha_key] = sha
+            out["office_artifacts"].append(
+                {
+                    "artifact_id": registration.artifact_id,
+                    "kind": registration.kind,
+                    "path": output_path,
+                    "sha256": sha,
+                }
+            )
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+    out["office_artifact_errors"] = errors
     return out
 
 
@@ -398,6 +514,7 @@ def materialize_local_outputs(
             rows=rows,
             quality=quality,
             profile_source=source,
+            profile=profile,
         )
     )
     return out
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Callable, Dict, List, Tuple
-
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiwf.flows.cleaning_incremental import (
+    IncrementalCheckpointStore,
+    RowDigestChain,
+    incremental_checkpoint_root,
+    rules_fingerprint,
+)
 from aiwf.quality_contract import normalize_value_for_field
 
 
@@ -584,8 +591,78 @@ def clean_rows_generic(raw_rows: List[Dict[str, Any]], params: Dict[str, Any], h
         "filter_rejected": [],
         "duplicate_removed": [],
     }
+    survivorship_keys = _survivorship_keys(survivorship, deduplicate_by)
+    duplicate_review_required_count = 0
 
-    for row_index, raw in enumerate(raw_rows, start=1):
+    # Incremental mode: when the input starts with exactly the rows of the
+    # last checkpointed run and the rules are unchanged, restore the per-row
+    # counters, samples and the dedup fold state and only clean the new tail.
+    incremental_cfg = params.get("incremental") if isinstance(params.get("incremental"), dict) else {}
+    checkpoint_key = str(incremental_cfg.get("checkpoint_key") or "").strip()
+    incremental_enabled = to_bool(incremental_cfg.get("enabled"), default=False)
+    incremental: Dict[str, Any] = {"enabled": incremental_enabled, "mode": "full"}
+    checkpoint_store: Optional[IncrementalCheckpointStore] = None
+    row_chain: Optional[RowDigestChain] = None
+    fingerprint = ""
+    start_index = 0
+    prior_passed_rows = 0
+    survivors: List[Dict[str, Any]] = []
+    if incremental_enabled and not checkpoint_key:
+        incremental["reason"] = "checkpoint_key_missing"
+    elif incremental_enabled:
+        template = params.get("_resolved_cleaning_template") if isinstance(params.get("_resolved_cleaning_template"), dict) else {}
+        fingerprint = rules_fingerprint(
+            {
+                "rules": rules,
+                "gate_required_fields": gate_required_fields,
+                "sample_limit": sample_limit,
+                "template": template,
+            }
+        )
+        checkpoint_store = IncrementalCheckpointStore(incremental_checkpoint_root())
+        row_chain = RowDigestChain()
+        incremental["checkpoint_key"] = checkpoint_key
+        checkpoint = checkpoint_store.load(checkpoint_key)
+        prefix_rows = int((checkpoint or {}).get("row_count") or 0)
+        if checkpoint is None:
+            incremental["reason"] = "no_checkpoint"
+        elif checkpoint.get("rules_fingerprint") != fingerprint:
+            incremental["reason"] = "rules_changed"
+        elif prefix_rows > len(raw_rows):
+            incremental["reason"] = "prefix_changed"
+        else:
+            for raw in islice(raw_rows, prefix_rows):
+                row_chain.update(raw)
+            if row_chain.hexdigest() != checkpoint.get("row_digest"):
+                incremental["reason"] = "prefix_changed"
+                row_chain = RowDigestChain()
+            else:
+                state = checkpoint["state"]
+                counters = dict(state.get("counters") or {})
+                invalid_rows = int(counters.get("invalid_rows") or 0)
+                filtered_rows = int(counters.get("filtered_rows") or 0)
+                cast_failed_rows = int(counters.get("cast_failed_rows") or 0)
+                required_failed_rows = int(counters.get("required_failed_rows") or 0)
+                filter_rejected_rows = int(counters.get("filter_rejected_rows") or 0)
+                string_ops_applied = int(counters.get("string_ops_applied") or 0)
+                date_ops_applied = int(counters.get("date_ops_applied") or 0)
+                field_ops_applied = int(counters.get("field_ops_applied") or 0)
+                duplicate_review_required_count = int(counters.get("duplicate_review_required_count") or 0)
+                reason_samples = {key: list(items) for key, items in dict(state.get("reason_samples") or {}).items()}
+                if survivorship_keys:
+                    survivors = list(state.get("rows") or [])
+                    prior_passed_rows = int(state.get("passed_rows") or 0)
+                else:
+                    out = list(state.get("rows") or [])
+                start_index = prefix_rows
+                incremental["mode"] = "incremental"
+                incremental["reason"] = "prefix_matched"
+        incremental["reused_rows"] = start_index
+        incremental["processed_rows"] = len(raw_rows) - start_index
+
+    for row_index, raw in enumerate(islice(raw_rows, start_index, None), start=start_index + 1):
+        if row_chain is not None:
+            row_chain.update(raw)
         if not isinstance(raw, dict):
             invalid_rows += 1
             add_reason_sample(
@@ -755,12 +832,14 @@ def clean_rows_generic(raw_rows: List[Dict[str, Any]], params: Dict[str, Any], h
         out.append(row)
 
     duplicate_rows_removed = 0
-    duplicate_review_required_count = 0
-    survivorship_keys = _survivorship_keys(survivorship, deduplicate_by)
     if survivorship_keys:
         key_fields = [str(x) for x in survivorship_keys]
         d: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
         d_index: Dict[Tuple[Any, ...], int] = {}
+        for r in survivors:
+            key = tuple(r.get(k) for k in key_fields)
+            d[key] = r
+            d_index[key] = int(r.get("_row_index") or 0)
         use_survivorship = bool(survivorship)
         if deduplicate_keep == "first" and not use_survivorship:
             for r in out:
@@ -842,9 +921,39 @@ def clean_rows_generic(raw_rows: List[Dict[str, Any]], params: Dict[str, Any], h
                     },
                 )
         deduped = list(d.values())
-        duplicate_rows_removed = len(out) - len(deduped)
+        prior_passed_rows += len(out)
+        duplicate_rows_removed = prior_passed_rows - len(deduped)
         out = deduped
 
+    if checkpoint_store is not None and row_chain is not None:
+        saved, save_error = checkpoint_store.save(
+            checkpoint_key,
+            {
+                "rules_fingerprint": fingerprint,
+                "row_count": row_chain.count,
+                "row_digest": row_chain.hexdigest(),
+                "state": {
+                    "counters": {
+                        "invalid_rows": invalid_rows,
+                        "filtered_rows": filtered_rows,
+                        "cast_failed_rows": cast_failed_rows,
+                        "required_failed_rows": required_failed_rows,
+                        "filter_rejected_rows": filter_rejected_rows,
+                        "string_ops_applied": string_ops_applied,
+                        "date_ops_applied": date_ops_applied,
+                        "field_ops_applied": field_ops_applied,
+                        "duplicate_review_required_count": duplicate_review_required_count,
+                    },
+                    "reason_samples": reason_samples,
+                    "rows": list(out),
+                    "passed_rows": prior_passed_rows if survivorship_keys else len(out),
+                },
+            },
+        )
+        incremental["checkpoint_saved"] = saved
+        if save_error:
+            incremental["checkpoint_error"] = save_error
+
     if sort_by:
         for spec in reversed(sort_by):
             if isinstance(spec, dict):
@@ -901,4 +1010,7 @@ def clean_rows_generic(raw_rows: List[Dict[str, Any]], params: Dict[str, Any], h
         {key: value for key, value in row.items() if not str(key).startswith("_")}
         for row in out
     ]
-    return {"rows": cleaned_rows, "quality": quality, "reason_samples": reason_samples}
+    result = {"rows": cleaned_rows, "quality": quality, "reason_samples": reason_samples}
+    if incremental_enabled:
+        result["incremental"] = incremental
+    return result
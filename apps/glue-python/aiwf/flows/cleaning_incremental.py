@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+from aiwf.paths import resolve_bus_root
+
+
+INCREMENTAL_CHECKPOINT_SCHEMA_VERSION = "cleaning_incremental.v1"
+# Bump when clean_rows_generic changes how a single row or the dedup fold is
+# computed; existing checkpoints then trigger a full rebuild.
+INCREMENTAL_ENGINE_VERSION = "clean_rows_generic.v1"
+
+
+def incremental_checkpoint_root() -> str:
+    override = str(os.getenv("AIWF_INCREMENTAL_CHECKPOINT_DIR") or "").strip()
+    if override:
+        return os.path.normpath(override)
+    return os.path.join(resolve_bus_root(), "cache", "incremental_cleaning")
+
+
+def _tagged_value(value: Any) -> str:
+    return f"{type(value).__name__}:{value!r}"
+
+
+class RowDigestChain:
+    """Running sha256 over input rows in order, including key order, so a prefix can be recognised later."""
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self.count = 0
+
+    def update(self, row: Any) -> None:
+        # Key order is part of the fingerprint: it decides the column order of cleaned rows.
+        self._hash.update(json.dumps(row, ensure_ascii=False, default=_tagged_value).encode("utf-8"))
+        self._hash.update(b"\n")
+        self.count += 1
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def rules_fingerprint(components: Dict[str, Any]) -> str:
+    payload = {"engine_version": INCREMENTAL_ENGINE_VERSION, **components}
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=_tagged_value)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class IncrementalCheckpointStore:
+    """One JSON checkpoint per caller-supplied key, replaced atomically after each run."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def _path(self, checkpoint_key: str) -> str:
+        digest = hashlib.sha256(checkpoint_key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], f"{digest}.json")
+
+    def load(self, checkpoint_key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(checkpoint_key), "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(checkpoint, dict)
+            or checkpoint.get("schema_version") != INCREMENTAL_CHECKPOINT_SCHEMA_VERSION
+            or checkpoint.get("checkpoint_key") != checkpoint_key
+            or not isinstance(checkpoint.get("state"), dict)
+        ):
+            return None
+        return checkpoint
+
+    def save(self, checkpoint_key: str, checkpoint: Dict[str, Any]) -> Tuple[bool, str]:
+        """Persist a checkpoint; refuses state that would not survive a JSON round trip unchanged."""
+        payload = {
+            **checkpoint,
+            "schema_version": INCREMENTAL_CHECKPOINT_SCHEMA_VERSION,
+            "checkpoint_key": checkpoint_key,
+        }
+        try:
+            text = json.dumps(payload, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return False, "checkpoint_not_serializable"
+        if json.loads(text)["state"] != payload["state"]:
+            return False, "checkpoint_not_serializable"
+        path = self._path(checkpoint_key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            return False, f"checkpoint_write_failed: {exc}"
+        return True, ""
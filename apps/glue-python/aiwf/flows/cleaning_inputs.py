@@ -5,6 +5,7 @@ import io
 import os
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from aiwf.extract_handoff import extract_handoff_dir, resolve_extract_handoff_dir
 from aiwf.paths import resolve_path_within_root
 
 
@@ -164,6 +165,10 @@ def maybe_preprocess_input_impl(
         spec.pop("enabled", None)
         spec.pop("input_path", None)
         spec.pop("output_path", None)
+        if spec.get("extract_handoff_dir"):
+            spec["extract_handoff_dir"] = resolve_extract_handoff_dir(job_root, spec["extract_handoff_dir"])
+        elif spec.get("input_files"):
+            spec["extract_handoff_dir"] = extract_handoff_dir(stage_dir)
         validation = validate_preprocess_spec(spec)
         if not validation.get("ok"):
             raise RuntimeError(f"preprocess config invalid: {validation.get('errors')}")
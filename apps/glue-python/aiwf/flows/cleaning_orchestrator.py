@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import os
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from aiwf.flows.cleaning_flow_helpers import (
     materialize_accel_outputs,
@@ -18,8 +19,97 @@ from aiwf.flows.cleaning_orchestrator_support import (
     collect_materialized_artifacts,
     register_artifacts,
 )
+from aiwf.flows.cleaning_result_cache import (
+    FlowResultCache,
+    flow_result_cache_key,
+    flow_result_cache_max_bytes,
+    flow_result_cache_root,
+)
 from aiwf.governance_manual_reviews import enqueue_manual_reviews
 from aiwf.governance_quality_rule_sets import apply_quality_rule_set_to_params
+from aiwf.metrics import FLOW_RESULT_CACHE_TOTAL, metrics_enabled, timed_stage
+from aiwf.stage_profile import STAGE_PROFILE_TOP_N, RunProfiler, StageProfile, file_size, row_count
+
+
+# Hooks timed as flow stages, by the stage name they report under.
+STAGE_HOOKS = {
+    "_load_raw_rows": "load",
+    "_maybe_preprocess_input": "preprocess",
+    "_clean_rows": "clean",
+    "_try_accel_cleaning": "accel_cleaning",
+    "_apply_quality_gates": "quality_gate",
+    "_build_profile": "profile",
+    "_write_cleaned_csv": "write_csv",
+    "_write_cleaned_parquet": "write_parquet",
+    "_write_profile_json": "write_profile_json",
+    "_write_profile_illustration_png": "write_profile_png",
+    "_write_fin_xlsx": "write_xlsx",
+    "_write_audit_docx": "write_docx",
+    "_write_deck_pptx": "write_pptx",
+    "_base_step_start": "callback_step_start",
+    "_base_artifact_upsert": "callback_artifact_upsert",
+    "_base_step_done": "callback_step_done",
+    "_base_step_fail": "callback_step_fail",
+}
+
+
+def _load_sizes(args: Tuple[Any, ...], kwargs: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    return {"rows_out": row_count(result[0])}
+
+
+def _clean_sizes(args: Tuple[Any, ...], kwargs: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    return {"rows_in": row_count(args[0]), "rows_out": row_count(result.get("rows"))}
+
+
+def _profile_sizes(args: Tuple[Any, ...], kwargs: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    return {"rows_in": row_count(args[0])}
+
+
+def _writer_sizes(args: Tuple[Any, ...], kwargs: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    # Writers take the output path first and, for tabular outputs, the rows second.
+    return {"rows_in": row_count(args[1]) if len(args) > 1 else None, "bytes_serialized": file_size(args[0])}
+
+
+STAGE_SIZERS = {
+    "load": _load_sizes,
+    "clean": _clean_sizes,
+    "profile": _profile_sizes,
+    **{stage: _writer_sizes for stage in STAGE_HOOKS.values() if stage.startswith("write_")},
+}
+
+
+def instrument_stage_hooks(
+    flow: str,
+    hooks: Dict[str, Callable[..., Any]],
+    stage_profile: Optional[StageProfile] = None,
+) -> Dict[str, Callable[..., Any]]:
+    instrumented = dict(hooks)
+    for name, stage in STAGE_HOOKS.items():
+        if name not in hooks:
+            continue
+        fn = hooks[name]
+        if metrics_enabled():
+            fn = timed_stage(flow, stage, fn)
+        if stage_profile is not None:
+            fn = stage_profile.wrap(stage, fn, sizer=STAGE_SIZERS.get(stage))
+        instrumented[name] = fn
+    return instrumented
+
+
+def attach_stage_profile(result: Dict[str, Any], stage_profile: StageProfile) -> None:
+    """Append the flow's per-stage measurements to the result's stage provenance.
+
+    Flow stages are appended rather than merged: engine entries such as
+    `quality_gate` name work done inside `clean`, not the flow-level gate hook.
+    """
+    records = stage_profile.records()
+    execution = result.get("execution")
+    if isinstance(execution, dict):
+        execution["stage_provenance"] = list(execution.get("stage_provenance") or []) + records
+    quality_summary = result.get("quality_summary")
+    engine_path = quality_summary.get("engine_path") if isinstance(quality_summary, dict) else None
+    if isinstance(engine_path, dict):
+        engine_path["stage_provenance"] = list(engine_path.get("stage_provenance") or []) + [dict(item) for item in records]
 
 
 def run_cleaning_flow(
@@ -32,6 +122,8 @@ def run_cleaning_flow(
     base: Optional[Any],
     hooks: Dict[str, Callable[..., Any]],
 ) -> Dict[str, Any]:
+    stage_profile = StageProfile()
+    hooks = instrument_stage_hooks("cleaning", hooks, stage_profile)
     ensure_dirs = hooks["_ensure_dirs"]
     prepare_cleaning_params = hooks["_prepare_cleaning_params"]
     load_raw_rows = hooks["_load_raw_rows"]
@@ -74,6 +166,11 @@ def run_cleaning_flow(
     headers = headers_from_params(params)
     layout = prepare_job_layout(job_id, params, ensure_dirs=ensure_dirs)
     local_standalone = bool(params.get("local_standalone"))
+    result_cache = (
+        FlowResultCache(flow_result_cache_root(), flow_result_cache_max_bytes())
+        if to_bool(params.get("flow_result_cache"), default=False)
+        else None
+    )
 
     def _template_driven_run(params_obj: Dict[str, Any]) -> bool:
         template_meta = params_obj.get("_resolved_cleaning_template") if isinstance(params_obj.get("_resolved_cleaning_template"), dict) else {}
@@ -97,6 +194,12 @@ def run_cleaning_flow(
             )
         return payload
 
+    run_profiler = (
+        RunProfiler(int(params.get("stage_profile_top_n") or STAGE_PROFILE_TOP_N)).start()
+        if to_bool(params.get("stage_profile"), default=False)
+        else None
+    )
+
     step_id = "cleaning"
     try:
         if not local_standalone:
@@ -112,6 +215,37 @@ def run_cleaning_flow(
                 headers=headers,
             )
 
+        cache_key = flow_result_cache_key(params, layout["job_root"]) if result_cache is not None else None
+        if cache_key is not None:
+            cached = result_cache.restore(
+                cache_key["key"],
+                job_id=job_id,
+                job_root=layout["job_root"],
+                artifacts_dir=layout["artifacts_dir"],
+            )
+            if metrics_enabled():
+                FLOW_RESULT_CACHE_TOTAL.inc(1.0, "cleaning", "miss" if cached is None else "hit")
+            if cached is not None:
+                if not local_standalone:
+                    register_artifacts(
+                        base_artifact_upsert=base_artifact_upsert,
+                        base_url=base_url,
+                        job_id=job_id,
+                        actor=actor,
+                        artifacts=list(cached.get("artifacts") or []),
+                        headers=headers,
+                    )
+                    base_step_done(
+                        base_url=base_url,
+                        job_id=job_id,
+                        step_id=step_id,
+                        actor=actor,
+                        output_hash=cached.get("output_hash"),
+                        headers=headers,
+                    )
+                cached["seconds"] = round(time.time() - t0, 3)
+                return cached
+
         params_effective, preprocess_result = maybe_preprocess_input(params, layout["job_root"], layout["stage_dir"])
         params_effective = prepare_cleaning_params(params_effective)
         local_cache = prepare_local_clean_cache(
@@ -260,6 +394,15 @@ def run_cleaning_flow(
             )
 
         artifacts = collect_materialized_artifacts(materialized)
+        run_profile: Dict[str, Any] = {}
+        if run_profiler is not None:
+            run_profile = run_profiler.finish(
+                os.path.join(layout["artifacts_dir"], "stage_profile.json"),
+                sha256_file,
+                stage_profile.records(),
+            )
+            if run_profile["artifact"] is not None:
+                artifacts.append(run_profile["artifact"])
 
         if not local_standalone:
             register_artifacts(
@@ -281,13 +424,29 @@ def run_cleaning_flow(
                 headers=headers,
             )
 
-        return build_success_result(
+        result = build_success_result(
             job_id=job_id,
             materialized=materialized,
             artifacts=artifacts,
             accel_result=accel_result,
             started_at=t0,
         )
+        attach_stage_profile(result, stage_profile)
+        if run_profile.get("error"):
+            result["stage_profile_error"] = run_profile["error"]
+        if result_cache is not None:
+            result["flow_cache"] = {"enabled": True, "hit": False, "key": "", "stored": False, "evicted": 0}
+            if cache_key is None:
+                result["flow_cache"]["reason"] = "inputs_not_hashable"
+            else:
+                result["flow_cache"]["key"] = cache_key["key"]
+                try:
+                    result["flow_cache"].update(
+                        result_cache.store(cache_key, result, job_id=job_id, job_root=layout["job_root"])
+                    )
+                except OSError as exc:
+                    result["flow_cache"]["error"] = str(exc)
+        return result
     except Exception as e:
         if not local_standalone:
             try:
@@ -302,3 +461,6 @@ def run_cleaning_flow(
             except Exception:
                 pass
         raise
+    finally:
+        if run_profiler is not None:
+            run_profiler.stop()
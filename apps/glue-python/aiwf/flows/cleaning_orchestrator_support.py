@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import time
 from typing import Any, Callable, Dict, List
 
@@ -55,7 +56,11 @@ def register_artifacts(
             kind=artifact["kind"],
             path=artifact["path"],
             sha256=artifact["sha256"],
-            extra_json=None,
+            extra_json=(
+                json.dumps({"metadata": artifact["metadata"]}, ensure_ascii=False, sort_keys=True)
+                if isinstance(artifact.get("metadata"), dict)
+                else None
+            ),
             headers=headers,
         )
 
@@ -78,6 +83,8 @@ def build_success_result(
         "profile": materialized["profile"],
         "execution": materialized.get("execution"),
         "quality_summary": materialized.get("quality_summary"),
+        "office_timings": list(materialized.get("office_timings") or []),
+        "office_artifact_errors": dict(materialized.get("office_artifact_errors") or {}),
         "accel": {
             "attempted": accel_result["accel"].get("attempted", False),
             "ok": accel_result["accel"].get("ok", False),
@@ -2,22 +2,32 @@ from __future__ import annotations
 
 import csv
 import json
-from typing import Any, Callable, Dict, List, Optional
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from aiwf.artifact_io import open_artifact_output, write_artifact_bytes
+
+
+def _ordered_columns(rows: List[Dict[str, Any]]) -> List[str]:
+    if not rows:
+        return ["id", "amount"]
+    columns = list(rows[0].keys())
+    seen = set(columns)
+    for row in rows[1:]:
+        for key in row.keys():
+            if key not in seen:
+                columns.append(key)
+                seen.add(key)
+    return columns
 
 
 def write_cleaned_csv_impl(csv_path: str, rows: List[Dict[str, Any]]) -> Dict[str, int]:
-    if rows:
-        columns = list(rows[0].keys())
-        seen = set(columns)
-        for row in rows[1:]:
-            for key in row.keys():
-                if key not in seen:
-                    columns.append(key)
-                    seen.add(key)
-    else:
-        columns = ["id", "amount"]
+    columns = _ordered_columns(rows)
 
-    with open(csv_path, "w", encoding="utf-8", newline="\n") as file:
+    with open_artifact_output(csv_path, "w", encoding="utf-8", newline="\n") as file:
         writer = csv.DictWriter(file, fieldnames=columns, lineterminator="\n")
         writer.writeheader()
         for row in rows:
@@ -25,15 +35,224 @@ def write_cleaned_csv_impl(csv_path: str, rows: List[Dict[str, Any]]) -> Dict[st
     return {"rows": len(rows), "cols": len(columns)}
 
 
-def write_cleaned_parquet_impl(parquet_path: str, rows: List[Dict[str, Any]]) -> None:
+_PARQUET_CAST_TYPES = {
+    "int": "int64",
+    "integer": "int64",
+    "float": "float64",
+    "double": "float64",
+    "number": "float64",
+    "decimal": "float64",
+    "bool": "bool",
+    "boolean": "bool",
+    "str": "string",
+    "string": "string",
+}
+_PARQUET_TYPE_KINDS = {
+    "int64": {int},
+    "float64": {int, float},
+    "bool": {bool},
+}
+_PARQUET_COMPRESSIONS = {"none", "snappy", "gzip", "brotli", "zstd", "lz4"}
+
+# Params of the flow whose parquet artifact is being written. Writer hooks keep
+# the (path, rows) contract and read their compression/row-group settings here.
+_PARQUET_WRITE_PARAMS: ContextVar[Optional[Dict[str, Any]]] = ContextVar("aiwf_parquet_write_params", default=None)
+
+
+@contextmanager
+def parquet_write_params(params: Optional[Dict[str, Any]]) -> Iterator[None]:
+    token = _PARQUET_WRITE_PARAMS.set(params)
     try:
-        import pandas as pd  # type: ignore
+        yield
+    finally:
+        _PARQUET_WRITE_PARAMS.reset(token)
+
+
+def active_parquet_write_params() -> Dict[str, Any]:
+    return dict(_PARQUET_WRITE_PARAMS.get() or {})
+
+
+def parquet_write_options_impl(
+    params: Optional[Dict[str, Any]],
+    *,
+    casts: Optional[Dict[str, Any]] = None,
+    rule_param: Callable[[Dict[str, Any], str, Any], Any],
+    to_bool: Callable[..., bool],
+    to_int: Callable[[Any], Optional[int]],
+) -> Dict[str, Any]:
+    params = params or {}
+    compression = str(rule_param(params, "parquet_compression", "snappy") or "snappy").strip().lower()
+    raw_dictionary = rule_param(params, "parquet_dictionary", True)
+    if isinstance(raw_dictionary, list):
+        use_dictionary: Any = [str(item) for item in raw_dictionary if str(item).strip()]
+    else:
+        use_dictionary = to_bool(raw_dictionary, default=True)
+    row_group_size = to_int(rule_param(params, "parquet_row_group_size", 65536)) or 65536
+    return {
+        "casts": {str(key): str(value) for key, value in (casts or {}).items()},
+        "compression": compression,
+        "use_dictionary": use_dictionary,
+        "row_group_size": max(1, row_group_size),
+    }
+
+
+def _parquet_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return str(value)
+
 
-        dataframe = pd.DataFrame(rows)
-        dataframe.to_parquet(parquet_path, index=False)
-    except Exception:
-        with open(parquet_path, "wb") as file:
-            file.write(b"PARQUET_PLACEHOLDER\n")
+def _parquet_column_type(pa: Any, values: Iterable[Any], declared: Optional[str]) -> Any:
+    kinds = {type(value) for value in values if value is not None}
+    declared_type = _PARQUET_CAST_TYPES.get(str(declared or "").strip().lower())
+    if declared_type == "string":
+        return pa.string()
+    if declared_type and kinds <= _PARQUET_TYPE_KINDS[declared_type]:
+        return pa.bool_() if declared_type == "bool" else getattr(pa, declared_type)()
+    if not kinds:
+        return pa.string()
+    if kinds <= {bool}:
+        return pa.bool_()
+    if kinds <= {int}:
+        return pa.int64()
+    if kinds <= {int, float}:
+        return pa.float64()
+    return pa.string()
+
+
+def build_parquet_schema(rows: List[Dict[str, Any]], casts: Optional[Dict[str, Any]] = None) -> Any:
+    import pyarrow as pa  # type: ignore
+
+    casts = casts or {}
+    fields = []
+    for column in _ordered_columns(rows):
+        values = (row.get(column) for row in rows)
+        fields.append(pa.field(str(column), _parquet_column_type(pa, values, casts.get(column))))
+    return pa.schema(fields)
+
+
+class ParquetRowGroupWriter:
+    """Writes dict rows into a Parquet file one row group per batch against a fixed schema."""
+
+    def __init__(
+        self,
+        parquet_path: str,
+        schema: Any,
+        *,
+        compression: str = "snappy",
+        use_dictionary: Any = True,
+    ) -> None:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+
+        self._pa = pa
+        self.path = parquet_path
+        self.schema = schema
+        self.compression = compression
+        self.use_dictionary = use_dictionary
+        self.rows_written = 0
+        self.row_groups = 0
+        self._started_at = time.perf_counter()
+        self._stream = open_artifact_output(parquet_path, "wb")
+        try:
+            self._writer = pq.ParquetWriter(
+                self._stream,
+                schema,
+                compression=None if compression == "none" else compression,
+                use_dictionary=use_dictionary,
+            )
+        except Exception:
+            self._stream.close()
+            raise
+
+    def _column(self, values: List[Any], arrow_type: Any) -> Any:
+        pa = self._pa
+        if arrow_type == pa.string():
+            values = [_parquet_text(value) for value in values]
+        return pa.array(values, type=arrow_type)
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        arrays = [
+            self._column([row.get(field.name) for row in rows], field.type)
+            for field in self.schema
+        ]
+        batch = self._pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        self._writer.write_batch(batch, row_group_size=len(rows))
+        self.rows_written += len(rows)
+        self.row_groups += 1
+
+    def close(self) -> Dict[str, Any]:
+        try:
+            self._writer.close()
+        finally:
+            self._stream.close()
+        seconds = max(time.perf_counter() - self._started_at, 1e-9)
+        size = os.path.getsize(self.path)
+        return {
+            "writer": "pyarrow",
+            "rows": self.rows_written,
+            "cols": len(self.schema),
+            "row_groups": self.row_groups,
+            "bytes": size,
+            "seconds": round(seconds, 6),
+            "rows_per_second": round(self.rows_written / seconds, 2),
+            "bytes_per_second": round(size / seconds, 2),
+            "compression": self.compression,
+            "dictionary": self.use_dictionary,
+            "schema": [{"name": field.name, "type": str(field.type)} for field in self.schema],
+        }
+
+    def abort(self) -> None:
+        try:
+            self._writer.close()
+        finally:
+            self._stream.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def write_cleaned_parquet_impl(
+    parquet_path: str,
+    rows: List[Dict[str, Any]],
+    *,
+    options: Optional[Dict[str, Any]] = None,
+    strict: bool = True,
+) -> Dict[str, Any]:
+    options = options or {}
+    row_group_size = max(1, int(options.get("row_group_size") or 65536))
+    compression = str(options.get("compression") or "snappy")
+    writer: Optional[ParquetRowGroupWriter] = None
+    try:
+        if compression not in _PARQUET_COMPRESSIONS:
+            raise ValueError(f"unsupported parquet_compression: {compression}")
+        writer = ParquetRowGroupWriter(
+            parquet_path,
+            build_parquet_schema(rows, options.get("casts")),
+            compression=compression,
+            use_dictionary=options.get("use_dictionary", True),
+        )
+        for start in range(0, len(rows), row_group_size):
+            writer.write_rows(rows[start : start + row_group_size])
+        return writer.close()
+    except Exception as exc:
+        if writer is not None:
+            try:
+                writer.abort()
+            except Exception:
+                pass
+        if strict:
+            raise RuntimeError(f"local parquet write failed: {exc}") from exc
+        write_artifact_bytes(parquet_path, b"PARQUET_PLACEHOLDER\n")
+        return {
+            "writer": "placeholder",
+            "rows": len(rows),
+            "bytes": os.path.getsize(parquet_path),
+            "error": str(exc),
+        }
 
 
 def write_fin_xlsx_impl(
@@ -46,6 +265,7 @@ def write_fin_xlsx_impl(
     to_decimal: Callable[[Any], Any],
     build_profile: Callable[[List[Dict[str, Any]], Dict[str, Any], str], Dict[str, Any]],
     utc_now_str: Callable[[], str],
+    profile: Optional[Dict[str, Any]] = None,
 ) -> None:
     office_write_fin_xlsx(
         xlsx_path,
@@ -55,6 +275,7 @@ def write_fin_xlsx_impl(
         to_decimal=to_decimal,
         build_profile=build_profile,
         utc_now_str=utc_now_str,
+        profile=profile,
     )
 
 
@@ -94,5 +315,5 @@ def write_profile_json_impl(profile_path: str, profile: Dict[str, Any], params:
         "profile": profile,
         "params": public_params,
     }
-    with open(profile_path, "w", encoding="utf-8") as file:
+    with open_artifact_output(profile_path, "w", encoding="utf-8") as file:
         json.dump(payload, file, ensure_ascii=False, indent=2)
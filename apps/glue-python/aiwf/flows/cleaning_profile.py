@@ -1,20 +1,111 @@
 from __future__ import annotations
 
+from collections import Counter
 from decimal import Decimal
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
-def _update_numeric_summary(summary: Dict[str, Any], value: Decimal) -> None:
-    if summary["count"] == 0:
-        summary["min"] = value
-        summary["max"] = value
-    else:
-        if value < summary["min"]:
-            summary["min"] = value
-        if value > summary["max"]:
-            summary["max"] = value
-    summary["count"] += 1
-    summary["sum"] += value
+def _load_numpy():
+    try:
+        import numpy as np  # type: ignore
+
+        return np
+    except Exception:
+        return None
+
+
+def _collect_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    columns: Dict[str, List[Any]] = {}
+    for row in rows:
+        for field, value in row.items():
+            column = columns.get(field)
+            if column is None:
+                column = []
+                columns[field] = column
+            column.append(value)
+    return columns
+
+
+def _split_column_values(
+    values: List[Any],
+    *,
+    to_decimal: Callable[[Any], Decimal | None],
+) -> Tuple[List[Any], Counter]:
+    # Native int/float cells are aggregated in bulk; every other distinct value
+    # goes through to_decimal exactly once per column.
+    native: List[Any] = []
+    pending: Counter = Counter()
+    parsed: Counter = Counter()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            native.append(value)
+            continue
+        try:
+            pending[(type(value), value)] += 1
+        except TypeError:
+            numeric_value = to_decimal(value)
+            if numeric_value is not None:
+                parsed[numeric_value] += 1
+    for (_kind, value), count in pending.items():
+        numeric_value = to_decimal(value)
+        if numeric_value is not None:
+            parsed[numeric_value] += count
+    return native, parsed
+
+
+def _native_float_counts(native: List[Any], np: Any) -> Optional[List[Tuple[float, int]]]:
+    if np is not None:
+        try:
+            uniques, counts = np.unique(np.asarray(native, dtype=np.float64), return_counts=True)
+        except (OverflowError, TypeError, ValueError):
+            return None
+        return list(zip(uniques.tolist(), counts.tolist()))
+    try:
+        return sorted(Counter(float(value) for value in native).items())
+    except OverflowError:
+        return None
+
+
+def _column_summary(
+    values: List[Any],
+    *,
+    to_decimal: Callable[[Any], Decimal | None],
+    np: Any,
+) -> Optional[Dict[str, Any]]:
+    native, parsed = _split_column_values(values, to_decimal=to_decimal)
+    native_counts = _native_float_counts(native, np) if native else []
+    if native_counts is None:
+        for value in native:
+            numeric_value = to_decimal(value)
+            if numeric_value is not None:
+                parsed[numeric_value] += 1
+        native_counts = []
+
+    # to_decimal maps native numbers to Decimal(str(float(value))), so the
+    # exact Decimal aggregate is rebuilt from distinct floats and their counts.
+    decimals = [(Decimal(repr(value)), count) for value, count in native_counts]
+    decimals.extend(parsed.items())
+    if not decimals:
+        return None
+    count_total = 0
+    total = Decimal("0")
+    minimum = decimals[0][0]
+    maximum = decimals[0][0]
+    for value, count in decimals:
+        count_total += count
+        total += value * count
+        if value < minimum:
+            minimum = value
+        if value > maximum:
+            maximum = value
+    return {
+        "count": count_total,
+        "sum": total,
+        "min": minimum,
+        "max": maximum,
+    }
 
 
 def _finalize_numeric_summary(
@@ -39,47 +130,25 @@ def build_profile_impl(
     to_decimal: Callable[[Any], Decimal | None],
     quantize_decimal: Callable[[Decimal, int], Decimal],
 ) -> Dict[str, Any]:
-    field_set = set()
+    np = _load_numpy()
+    columns = _collect_columns(rows)
     numeric_summaries: Dict[str, Dict[str, Any]] = {}
-    amount_summary = {
-        "count": 0,
-        "sum": Decimal("0"),
-        "min": Decimal("0"),
-        "max": Decimal("0"),
-    }
-
-    for row in rows:
-        amount_value = to_decimal(row.get("amount"))
-        if amount_value is not None:
-            _update_numeric_summary(amount_summary, amount_value)
-
-        for field, raw_value in row.items():
-            field_set.add(field)
-            numeric_value = to_decimal(raw_value)
-            if numeric_value is None:
-                continue
-            summary = numeric_summaries.setdefault(
-                field,
-                {
-                    "count": 0,
-                    "sum": Decimal("0"),
-                    "min": Decimal("0"),
-                    "max": Decimal("0"),
-                },
-            )
-            _update_numeric_summary(summary, numeric_value)
+    for field, values in columns.items():
+        summary = _column_summary(values, to_decimal=to_decimal, np=np)
+        if summary is not None:
+            numeric_summaries[field] = summary
 
     numeric_stats = {
         field: _finalize_numeric_summary(summary, quantize_decimal=quantize_decimal)
         for field, summary in sorted(numeric_summaries.items())
-        if summary["count"] > 0
     }
 
-    if amount_summary["count"] > 0:
-        sum_amount = float(quantize_decimal(amount_summary["sum"], 2))
-        min_amount = float(quantize_decimal(amount_summary["min"], 2))
-        max_amount = float(quantize_decimal(amount_summary["max"], 2))
-        avg_amount = float(quantize_decimal(amount_summary["sum"] / Decimal(amount_summary["count"]), 2))
+    amount_summary = numeric_stats.get("amount")
+    if amount_summary is not None:
+        sum_amount = amount_summary["sum"]
+        min_amount = amount_summary["min"]
+        max_amount = amount_summary["max"]
+        avg_amount = amount_summary["avg"]
     else:
         sum_amount = 0.0
         min_amount = 0.0
@@ -88,13 +157,32 @@ def build_profile_impl(
 
     return {
         "rows": len(rows),
-        "cols": len(field_set),
+        "cols": len(columns),
         "sum_amount": sum_amount,
         "min_amount": min_amount,
         "max_amount": max_amount,
         "avg_amount": avg_amount,
         "quality": quality,
-        "fields": sorted(field_set),
+        "fields": sorted(columns),
         "numeric_stats": numeric_stats,
         "source": source,
     }
+
+
+def reuse_profile_impl(profile: Dict[str, Any], quality: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Copy the row statistics of an already built profile under a new quality/source."""
+    return {
+        "rows": profile.get("rows", 0),
+        "cols": profile.get("cols", 0),
+        "sum_amount": profile.get("sum_amount", 0.0),
+        "min_amount": profile.get("min_amount", 0.0),
+        "max_amount": profile.get("max_amount", 0.0),
+        "avg_amount": profile.get("avg_amount", 0.0),
+        "quality": quality,
+        "fields": list(profile.get("fields") or []),
+        "numeric_stats": {
+            field: dict(stats)
+            for field, stats in dict(profile.get("numeric_stats") or {}).items()
+        },
+        "source": source,
+    }
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiwf.artifact_io import artifact_digest
+from aiwf.cleaning_spec_v2 import compiled_cleaning_spec
+from aiwf.paths import is_within_root, resolve_bus_root, resolve_path
+
+
+FLOW_RESULT_CACHE_SCHEMA_VERSION = "flow_result_cache.v2"
+# Bump whenever cleaning or artifact materialization changes what a run
+# produces for the same inputs; every existing entry then misses.
+CLEANING_ENGINE_VERSION = "cleaning_flow.v1"
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+_JOB_ROOT_PLACEHOLDER = "${job_root}"
+_INPUT_PATH_KEYS = ("input_csv_path", "source_csv_path", "csv_path", "input_uri")
+# Keys that identify the job or its transport rather than what gets computed.
+_NON_KEY_PARAMS = {
+    "flow_result_cache",
+    "job_context",
+    "job_root",
+    "output_uri",
+    "trace_id",
+    "rows",
+    "csv_text",
+}
+
+
+def flow_result_cache_root() -> str:
+    override = str(os.getenv("AIWF_FLOW_RESULT_CACHE_DIR") or "").strip()
+    if override:
+        return os.path.normpath(override)
+    return os.path.join(resolve_bus_root(), "cache", "flow_results")
+
+
+def flow_result_cache_max_bytes() -> int:
+    raw = str(os.getenv("AIWF_FLOW_RESULT_CACHE_MAX_BYTES") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else DEFAULT_MAX_BYTES
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def _sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _canonical(value: Any, job_root: str) -> str:
+    text = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return _replace_root(text, job_root, _JOB_ROOT_PLACEHOLDER)
+
+
+def _json_fragment(text: str) -> str:
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
+def _replace_root(text: str, old_root: str, new_root: str) -> str:
+    """Swap a job root inside JSON text, covering both raw and JSON-escaped spellings."""
+    if not old_root:
+        return text
+    old_norm = os.path.normpath(old_root)
+    new_fragment = new_root if new_root == _JOB_ROOT_PLACEHOLDER else _json_fragment(os.path.normpath(new_root))
+    return text.replace(_json_fragment(old_norm), new_fragment)
+
+
+def _input_fingerprints(params: Dict[str, Any], job_root: str) -> Optional[List[Dict[str, Any]]]:
+    """Content hashes for everything the run reads, or None when an input cannot be hashed."""
+    out: List[Dict[str, Any]] = []
+    if isinstance(params.get("rows"), list):
+        out.append({"source": "params.rows", "sha256": _sha256_text(_canonical(params["rows"], job_root))})
+    if isinstance(params.get("csv_text"), str):
+        out.append({"source": "params.csv_text", "sha256": _sha256_text(params["csv_text"])})
+
+    preprocess = params.get("preprocess") if isinstance(params.get("preprocess"), dict) else {}
+    candidates: List[Tuple[str, Any]] = [(key, params.get(key)) for key in _INPUT_PATH_KEYS if key != "input_uri"]
+    if not out:
+        candidates.append(("input_uri", params.get("input_uri")))
+    candidates.append(("preprocess.input_path", preprocess.get("input_path")))
+    for index, item in enumerate(preprocess.get("input_files") or []):
+        candidates.append((f"preprocess.input_files[{index}]", item))
+
+    for source, raw in candidates:
+        path_text = str(raw or "").strip()
+        if not path_text:
+            continue
+        try:
+            path = resolve_path(job_root, path_text, allow_absolute=True)
+            digest = artifact_digest(path)
+        except (OSError, ValueError):
+            return None
+        out.append({"source": source, "sha256": digest.sha256, "size": digest.size})
+    return out or None
+
+
+def _template_identity(params: Dict[str, Any]) -> Dict[str, Any]:
+    template = params.get("_resolved_cleaning_template") if isinstance(params.get("_resolved_cleaning_template"), dict) else {}
+    return {
+        "id": str(template.get("id") or params.get("cleaning_template") or "default").strip().lower(),
+        "version": str(template.get("version") or template.get("template_version") or "").strip(),
+        "sha256": _sha256_text(_canonical(template, "")),
+    }
+
+
+def _quality_rule_set_identity(params: Dict[str, Any]) -> Dict[str, Any]:
+    provenance = params.get("_quality_rule_set_provenance") if isinstance(params.get("_quality_rule_set_provenance"), dict) else {}
+    return {
+        "id": str(provenance.get("resolved_id") or params.get("quality_rule_set_id") or "").strip(),
+        "version": str(provenance.get("version") or "").strip(),
+    }
+
+
+def flow_result_cache_key(params: Dict[str, Any], job_root: str) -> Optional[Dict[str, Any]]:
+    """Build the cache key for prepared cleaning params, or None when the run is not cacheable."""
+    inputs = _input_fingerprints(params, job_root)
+    if inputs is None:
+        return None
+    keyed_params = {
+        key: value
+        for key, value in params.items()
+        if not str(key).startswith("_") and key not in _NON_KEY_PARAMS
+    }
+    components = {
+        "schema_version": FLOW_RESULT_CACHE_SCHEMA_VERSION,
+        "engine_version": CLEANING_ENGINE_VERSION,
+        "inputs": inputs,
+        "spec_sha256": _sha256_text(_canonical(compiled_cleaning_spec(params), job_root)),
+        "params_sha256": _sha256_text(_canonical(keyed_params, job_root)),
+        "template": _template_identity(params),
+        "quality_rule_set": _quality_rule_set_identity(params),
+    }
+    return {"key": _sha256_text(_canonical(components, "")), "components": components}
+
+
+_COPY_CHUNK_BYTES = 1024 * 1024
+
+
+def _copy_file(source: str, target: str) -> str:
+    """Copy `source` to a fresh inode at `target` and return the sha256 of the bytes copied.
+
+    Cache entries never share an inode with job outputs: writers truncate and
+    rewrite artifacts in place, which would otherwise change every linked copy.
+    """
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    digest = hashlib.sha256()
+    tmp_target = f"{target}.{os.getpid()}.tmp"
+    try:
+        with open(source, "rb") as src, open(tmp_target, "wb") as dst:
+            for chunk in iter(lambda: src.read(_COPY_CHUNK_BYTES), b""):
+                digest.update(chunk)
+                dst.write(chunk)
+        os.replace(tmp_target, target)
+    except BaseException:
+        if os.path.exists(tmp_target):
+            os.remove(tmp_target)
+        raise
+    return digest.hexdigest()
+
+
+class FlowResultCache:
+    """Completed cleaning results plus their artifact files, evicted least-recently-used by total size."""
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.root, "entries", key[:2], key)
+
+    def _load_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, "entry.json"), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(entry, dict)
+            or entry.get("schema_version") != FLOW_RESULT_CACHE_SCHEMA_VERSION
+            or entry.get("key") != key
+            or not isinstance(entry.get("result_json"), str)
+            or not isinstance(entry.get("files"), list)
+        ):
+            return None
+        for item in entry["files"]:
+            # Cheap pre-check; content is re-hashed while restoring.
+            try:
+                stat = os.stat(os.path.join(entry_dir, "files", str(item.get("name") or "")))
+            except OSError:
+                return None
+            if stat.st_size != item.get("size") or not isinstance(item.get("sha256"), str):
+                return None
+        return entry
+
+    def restore(self, key: str, *, job_id: str, job_root: str, artifacts_dir: str) -> Optional[Dict[str, Any]]:
+        """Materialize a cached run into `job_root` and return its result, or None on a miss."""
+        entry = self._load_entry(key)
+        if entry is None:
+            self.discard(key)
+            return None
+        entry_dir = self._entry_dir(key)
+        for item in entry["files"]:
+            relative = str(item.get("relative_path") or "")
+            target = (
+                os.path.join(job_root, relative)
+                if relative
+                else os.path.join(artifacts_dir, os.path.basename(str(item.get("original_path") or item["name"])))
+            )
+            if _copy_file(os.path.join(entry_dir, "files", item["name"]), target) != item["sha256"]:
+                self.discard(key)
+                return None
+        result = json.loads(_replace_root(entry["result_json"], _JOB_ROOT_PLACEHOLDER, job_root))
+        result["job_id"] = job_id
+        try:
+            os.utime(os.path.join(entry_dir, "entry.json"))
+        except OSError:
+            pass
+        result["flow_cache"] = {
+            "enabled": True,
+            "hit": True,
+            "key": key,
+            "source_job_id": str(entry.get("source_job_id") or ""),
+            "cached_at": entry.get("created_at"),
+            "engine_version": str(entry.get("components", {}).get("engine_version") or ""),
+            "link_mode": "copy",
+            "file_count": len(entry["files"]),
+            "size_bytes": int(entry.get("size_bytes") or 0),
+        }
+        return result
+
+    def store(
+        self,
+        key_info: Dict[str, Any],
+        result: Dict[str, Any],
+        *,
+        job_id: str,
+        job_root: str,
+    ) -> Dict[str, Any]:
+        """Copy a finished run into the cache and evict old entries; returns store stats."""
+        key = key_info["key"]
+        entry_dir = self._entry_dir(key)
+        if os.path.isdir(entry_dir):
+            return {"stored": False, "evicted": 0}
+        staging_root = os.path.join(self.root, "tmp")
+        os.makedirs(staging_root, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=staging_root, prefix=f"{key[:12]}-")
+        try:
+            files: List[Dict[str, Any]] = []
+            total = 0
+            seen: Dict[str, str] = {}
+            for index, artifact in enumerate(result.get("artifacts") or []):
+                path = os.path.normpath(str(artifact.get("path") or ""))
+                if not path or path in seen or not os.path.isfile(path):
+                    continue
+                name = f"{index:03d}_{os.path.basename(path)}"
+                seen[path] = name
+                target = os.path.join(staging, "files", name)
+                sha256 = _copy_file(path, target)
+                registered = str(artifact.get("sha256") or "")
+                if registered and registered != sha256:
+                    # The artifact changed after it was registered; caching it would
+                    # replay a sha256 that no longer matches the bytes.
+                    shutil.rmtree(staging, ignore_errors=True)
+                    return {"stored": False, "evicted": 0, "reason": "artifact_changed"}
+                size = os.path.getsize(target)
+                total += size
+                files.append(
+                    {
+                        "name": name,
+                        "relative_path": os.path.relpath(path, job_root) if is_within_root(path, job_root) else "",
+                        "original_path": path,
+                        "size": size,
+                        "sha256": sha256,
+                    }
+                )
+            cached_result = {key_name: value for key_name, value in result.items() if key_name != "flow_cache"}
+            entry = {
+                "schema_version": FLOW_RESULT_CACHE_SCHEMA_VERSION,
+                "key": key,
+                "components": key_info.get("components") or {},
+                "source_job_id": job_id,
+                "created_at": time.time(),
+                "size_bytes": total,
+                "files": files,
+                "result_json": _canonical(cached_result, job_root),
+            }
+            with open(os.path.join(staging, "entry.json"), "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.makedirs(os.path.dirname(entry_dir), exist_ok=True)
+            try:
+                os.rename(staging, entry_dir)
+            except OSError:
+                # Another run stored the same key first.
+                shutil.rmtree(staging, ignore_errors=True)
+                return {"stored": False, "evicted": 0}
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return {"stored": True, "evicted": self.evict(keep=key)}
+
+    def discard(self, key: str) -> None:
+        shutil.rmtree(self._entry_dir(key), ignore_errors=True)
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries_root = os.path.join(self.root, "entries")
+        out: List[Tuple[float, int, str]] = []
+        try:
+            shards = list(os.scandir(entries_root))
+        except OSError:
+            return out
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                manifest = os.path.join(item.path, "entry.json")
+                try:
+                    last_used = os.stat(manifest).st_mtime
+                    with open(manifest, "r", encoding="utf-8") as f:
+                        size = int(json.load(f).get("size_bytes") or 0)
+                except (OSError, ValueError, AttributeError):
+                    last_used, size = 0.0, 0
+                out.append((last_used, size, item.name))
+        return out
+
+    def evict(self, keep: str = "") -> int:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.discard(key)
+            total -= size
+            evicted += 1
+        return evicted
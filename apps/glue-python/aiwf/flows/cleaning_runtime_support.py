@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import hashlib
 import os
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional
 
+from aiwf.artifact_io import artifact_digest
 from aiwf.accel_client import run_cleaning_operator, transform_rows_v3_operator
 from aiwf.cleaning_spec_v2 import (
     cleaning_spec_to_transform_components,
-    compile_cleaning_params_to_spec,
+    compiled_cleaning_spec,
 )
 from aiwf.flows.cleaning_transport import (
     base_artifact_upsert_impl,
@@ -42,11 +42,7 @@ def _quality_gate_value(
 
 
 def sha256_file(path: str) -> str:
-    digest = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    return artifact_digest(path).sha256
 
 
 def ensure_dirs(*paths: str) -> None:
@@ -110,7 +106,7 @@ def try_rust_transform_rows_v3(
     rule_param: Callable[[Dict[str, Any], str, Any], Any],
 ) -> Dict[str, Any]:
     del rules_dict, rule_param
-    compiled_spec = compile_cleaning_params_to_spec(params)
+    compiled_spec = compiled_cleaning_spec(params)
     rules, quality_gates, schema_hint = cleaning_spec_to_transform_components(
         compiled_spec,
         input_rows=raw_rows,
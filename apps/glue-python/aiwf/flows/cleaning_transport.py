@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from aiwf.callback_outbox import (
+    KIND_ARTIFACT_UPSERT,
+    KIND_STEP_DONE,
+    KIND_STEP_FAIL,
+    KIND_STEP_START,
+    active_callback_outbox,
+)
 
 
 def headers_from_params_impl(params: Dict[str, Any], *, env_api_key: Optional[str]) -> Dict[str, str]:
@@ -18,6 +26,15 @@ def post_json_impl(url: str, body: Dict[str, Any], headers: Dict[str, str]) -> N
         raise RuntimeError(f"POST {url} -> {response.status_code} {response.text}")
 
 
+def _enqueue_callback(job_id: str, kind: str, urls: List[str], body: Dict[str, Any], headers: Dict[str, str]) -> bool:
+    """Hand the callback to the durable outbox when it is enabled; False means post it inline."""
+    outbox = active_callback_outbox()
+    if outbox is None:
+        return False
+    outbox.enqueue(job_id=job_id, kind=kind, urls=urls, body=body, headers=headers)
+    return True
+
+
 def base_step_start_impl(
     *,
     base_url: str,
@@ -38,6 +55,8 @@ def base_step_start_impl(
         "output_uri": output_uri,
         "params": params or {},
     }
+    if _enqueue_callback(job_id, KIND_STEP_START, [url], body, headers):
+        return
     post_json(url, body, headers)
 
 
@@ -53,6 +72,8 @@ def base_step_done_impl(
 ) -> None:
     url = f"{base_url}/api/v1/jobs/{job_id}/steps/{step_id}/done?actor={actor}"
     body = {"output_hash": output_hash}
+    if _enqueue_callback(job_id, KIND_STEP_DONE, [url], body, headers):
+        return
     post_json(url, body, headers)
 
 
@@ -68,6 +89,8 @@ def base_step_fail_impl(
 ) -> None:
     url = f"{base_url}/api/v1/jobs/{job_id}/steps/{step_id}/fail?actor={actor}"
     body = {"error": error}
+    if _enqueue_callback(job_id, KIND_STEP_FAIL, [url], body, headers):
+        return
     post_json(url, body, headers)
 
 
@@ -97,6 +120,8 @@ def base_artifact_upsert_impl(
         "sha256": sha256,
         "extra_json": extra_json,
     }
+    if _enqueue_callback(job_id, KIND_ARTIFACT_UPSERT, candidates, body, headers):
+        return
 
     last_err = None
     for url in candidates:
@@ -283,6 +283,7 @@ def _write_xlsx_artifact(context: OfficeArtifactContext, output_path: str) -> No
         context.office_rows,
         context.illustration_path,
         context.params_effective,
+        profile=context.office_profile,
     )
 
 
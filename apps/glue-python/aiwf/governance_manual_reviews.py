@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from aiwf.governance_store import SqliteGovernanceStore, governance_sqlite_store
+from aiwf.jsonl_history import JsonlHistoryStore, history_store
 from aiwf.paths import resolve_bus_root
 
 
@@ -14,6 +17,10 @@ MANUAL_REVIEW_QUEUE_STORE_SCHEMA_VERSION = "manual_review_queue_store.v1"
 MANUAL_REVIEW_HISTORY_STORE_SCHEMA_VERSION = "manual_review_history_store.v1"
 MANUAL_REVIEW_OWNER = "glue-python"
 MANUAL_REVIEW_SOURCE = "glue-python.governance.manual_reviews"
+MANUAL_REVIEW_HISTORY_INDEX_VERSION = "manual_review_history_index.v1"
+MANUAL_REVIEW_QUEUE_COLLECTION = "manual_review_queue"
+MANUAL_REVIEW_HISTORY_COLLECTION = "manual_review_history"
+SQLITE_HISTORY_COLLECTIONS = (MANUAL_REVIEW_HISTORY_COLLECTION,)
 
 
 def now_iso() -> str:
@@ -108,10 +115,54 @@ def _write_queue_store(items: List[Dict[str, Any]]) -> Dict[str, Any]:
     return payload
 
 
+def _queue_key(item: Dict[str, Any]) -> str:
+    return f"{item['run_id']}::{item['review_key']}"
+
+
+def _upsert_queue_sqlite(store: SqliteGovernanceStore, item: Dict[str, Any]) -> None:
+    store.upsert_item(MANUAL_REVIEW_QUEUE_COLLECTION, _queue_key(item), item, sort_key=str(item.get("created_at") or ""))
+
+
+def _append_history_sqlite(store: SqliteGovernanceStore, item: Dict[str, Any]) -> None:
+    store.append_history(
+        MANUAL_REVIEW_HISTORY_COLLECTION,
+        item,
+        record_key=str(item.get("run_id") or ""),
+        actor=str(item.get("reviewer") or "").lower(),
+        status=str(item.get("status") or "").lower(),
+        ts=str(item.get("decided_at") or ""),
+    )
+
+
+def import_json_store_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    items = []
+    for raw in _read_queue_store()["items"]:
+        if not isinstance(raw, dict):
+            continue
+        try:
+            normalized = normalize_manual_review_item(raw, existing=raw)
+        except ValueError:
+            continue
+        if str(normalized.get("status") or "") == "pending":
+            items.append(normalized)
+    for item in items:
+        _upsert_queue_sqlite(store, item)
+    return {MANUAL_REVIEW_QUEUE_COLLECTION: len(items)}
+
+
+def import_json_history_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    # newest() reads newest first; history rows must be appended oldest first.
+    items = _history_store().newest(sys.maxsize, parse=_normalized_history_item)
+    for item in reversed(items):
+        _append_history_sqlite(store, item)
+    return {MANUAL_REVIEW_HISTORY_COLLECTION: len(items)}
+
+
 def list_manual_reviews(limit: int = 200) -> List[Dict[str, Any]]:
     safe_limit = max(1, min(5000, int(limit or 200)))
+    store = governance_sqlite_store()
     items: List[Dict[str, Any]] = []
-    for raw in _read_queue_store()["items"]:
+    for raw in store.list_items(MANUAL_REVIEW_QUEUE_COLLECTION, safe_limit) if store is not None else _read_queue_store()["items"]:
         if not isinstance(raw, dict):
             continue
         try:
@@ -125,77 +176,160 @@ def list_manual_reviews(limit: int = 200) -> List[Dict[str, Any]]:
     return items[:safe_limit]
 
 
+def _normalized_history_item(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    try:
+        return normalize_manual_review_item(raw, existing=raw)
+    except ValueError:
+        return None
+
+
+def _history_index_fields(raw: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    item = _normalized_history_item(raw)
+    if item is None:
+        return None
+    return {
+        "run_id": str(item.get("run_id") or ""),
+        "reviewer": str(item.get("reviewer") or "").lower(),
+        "status": str(item.get("status") or "").lower(),
+        "date": str(item.get("decided_at") or "")[:10],
+    }
+
+
+def _history_store() -> JsonlHistoryStore:
+    return history_store(
+        manual_review_history_store_path(),
+        index_fields=_history_index_fields,
+        index_version=MANUAL_REVIEW_HISTORY_INDEX_VERSION,
+    )
+
+
 def _append_manual_review_history(item: Dict[str, Any]) -> None:
-    file_path = manual_review_history_store_path()
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "a", encoding="utf-8") as handle:
-        handle.write(json.dumps(item, ensure_ascii=False))
-        handle.write("\n")
+    store = governance_sqlite_store()
+    if store is not None:
+        _append_history_sqlite(store, item)
+        return
+    _history_store().append(item)
 
 
 def list_manual_review_history(limit: int = 200) -> List[Dict[str, Any]]:
-    file_path = manual_review_history_store_path()
-    if not os.path.exists(file_path):
-        return []
-    with open(file_path, "r", encoding="utf-8") as handle:
-        lines = [line.strip() for line in handle.readlines() if line.strip()]
-    items: List[Dict[str, Any]] = []
-    for line in reversed(lines):
-        try:
-            raw = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(raw, dict):
-            continue
-        try:
-            normalized = normalize_manual_review_item(raw, existing=raw)
-        except ValueError:
-            continue
-        items.append(normalized)
-        if len(items) >= max(1, min(5000, int(limit or 200))):
-            break
-    return items
+    safe_limit = max(1, min(5000, int(limit or 200)))
+    store = governance_sqlite_store()
+    if store is not None:
+        rows = store.history(MANUAL_REVIEW_HISTORY_COLLECTION, safe_limit)
+        return [item for item in (_normalized_history_item(raw) for raw in rows) if item is not None]
+    return _history_store().newest(safe_limit, parse=_normalized_history_item)
 
 
-def filter_manual_review_history(items: List[Dict[str, Any]], filter_obj: Dict[str, Any] | None) -> List[Dict[str, Any]]:
+def _history_filter_values(filter_obj: Dict[str, Any] | None) -> Dict[str, str]:
     filter_src = filter_obj if isinstance(filter_obj, dict) else {}
-    run_id = str(filter_src.get("run_id") or "").strip()
-    reviewer = str(filter_src.get("reviewer") or "").strip().lower()
-    status = str(filter_src.get("status") or "").strip().lower()
-    date_from = str(filter_src.get("date_from") or "").strip()
-    date_to = str(filter_src.get("date_to") or "").strip()
-    filtered = []
-    for item in items or []:
-        if run_id and str(item.get("run_id") or "") != run_id:
-            continue
-        if reviewer and reviewer not in str(item.get("reviewer") or "").lower():
-            continue
-        if status and str(item.get("status") or "").lower() != status:
-            continue
-        decided_at = str(item.get("decided_at") or "")
-        if date_from and decided_at < date_from:
-            continue
-        if date_to and decided_at > date_to:
-            continue
-        filtered.append(item)
-    return filtered
+    return {
+        "run_id": str(filter_src.get("run_id") or "").strip(),
+        "reviewer": str(filter_src.get("reviewer") or "").strip().lower(),
+        "status": str(filter_src.get("status") or "").strip().lower(),
+        "date_from": str(filter_src.get("date_from") or "").strip(),
+        "date_to": str(filter_src.get("date_to") or "").strip(),
+    }
+
+
+def _history_item_matches(item: Dict[str, Any], values: Dict[str, str]) -> bool:
+    if values["run_id"] and str(item.get("run_id") or "") != values["run_id"]:
+        return False
+    if values["reviewer"] and values["reviewer"] not in str(item.get("reviewer") or "").lower():
+        return False
+    if values["status"] and str(item.get("status") or "").lower() != values["status"]:
+        return False
+    decided_at = str(item.get("decided_at") or "")
+    if values["date_from"] and decided_at < values["date_from"]:
+        return False
+    if values["date_to"] and decided_at > values["date_to"]:
+        return False
+    return True
+
+
+def filter_manual_review_history(items: List[Dict[str, Any]], filter_obj: Dict[str, Any] | None) -> List[Dict[str, Any]]:
+    values = _history_filter_values(filter_obj)
+    return [item for item in items or [] if _history_item_matches(item, values)]
+
+
+def query_manual_review_history(limit: int = 200, filter_obj: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
+    """Newest history items matching `filter_obj`, read through the history index.
+
+    Unlike filtering the output of list_manual_review_history, `limit` counts
+    matching items, so older matches are not hidden behind newer non-matches.
+    """
+    safe_limit = max(1, min(5000, int(limit or 200)))
+    values = _history_filter_values(filter_obj)
+    store = governance_sqlite_store()
+    if store is not None:
+        rows = store.history(
+            MANUAL_REVIEW_HISTORY_COLLECTION,
+            safe_limit,
+            record_key=values["run_id"],
+            actor_contains=values["reviewer"],
+            status=values["status"],
+            ts_from=values["date_from"],
+            ts_to=values["date_to"],
+        )
+        items = [_normalized_history_item(raw) for raw in rows]
+        return [item for item in items if item is not None and _history_item_matches(item, values)]
+    where: Dict[str, Any] = {}
+    if values["run_id"]:
+        where["run_id"] = lambda value: value == values["run_id"]
+    if values["reviewer"]:
+        where["reviewer"] = lambda value: values["reviewer"] in value
+    if values["status"]:
+        where["status"] = lambda value: value == values["status"]
+    if values["date_from"] or values["date_to"]:
+        # Day buckets narrow the scan; the exact timestamp bounds are checked per item.
+        low, high = values["date_from"][:10], values["date_to"][:10]
+        where["date"] = lambda value: (not low or value >= low) and (not high or value <= high)
+
+    def parse(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        item = _normalized_history_item(raw)
+        return item if item is not None and _history_item_matches(item, values) else None
+
+    return _history_store().newest(safe_limit, where=where or None, parse=parse)
 
 
 def enqueue_manual_reviews(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     incoming = items if isinstance(items, list) else []
+    store = governance_sqlite_store()
+    if store is not None:
+        with store.transaction():
+            by_key = {_queue_key(item): item for item in list_manual_reviews(5000)}
+            for item in incoming:
+                normalized = normalize_manual_review_item(item)
+                normalized["status"] = "pending"
+                by_key[_queue_key(normalized)] = normalized
+                _upsert_queue_sqlite(store, normalized)
+        return list(by_key.values())
     current = list_manual_reviews(5000)
     by_key: Dict[str, Dict[str, Any]] = {}
     for item in current:
-        by_key[f"{item['run_id']}::{item['review_key']}"] = item
+        by_key[_queue_key(item)] = item
     for item in incoming:
         normalized = normalize_manual_review_item(item)
         normalized["status"] = "pending"
-        by_key[f"{normalized['run_id']}::{normalized['review_key']}"] = normalized
+        by_key[_queue_key(normalized)] = normalized
     next_items = list(by_key.values())
     _write_queue_store(next_items)
     return next_items
 
 
+def _decided_history_item(target: Dict[str, Any], *, approved: bool, reviewer: str, comment: str) -> Dict[str, Any]:
+    return normalize_manual_review_item(
+        {
+            **target,
+            "approved": bool(approved),
+            "reviewer": str(reviewer or "").strip(),
+            "comment": str(comment or "").strip(),
+            "status": "approved" if approved else "rejected",
+            "decided_at": now_iso(),
+        },
+        existing=target,
+    )
+
+
 def submit_manual_review(
     run_id: str,
     review_key: str,
@@ -211,6 +345,23 @@ def submit_manual_review(
     if not normalized_review_key:
         raise ValueError("manual review review_key is required")
 
+    store = governance_sqlite_store()
+    if store is not None:
+        with store.transaction():
+            key = f"{normalized_run_id}::{normalized_review_key}"
+            raw = store.get_item(MANUAL_REVIEW_QUEUE_COLLECTION, key)
+            if raw is None:
+                raise ValueError("review task not found")
+            target = normalize_manual_review_item(raw, existing=raw)
+            store.remove_item(MANUAL_REVIEW_QUEUE_COLLECTION, key)
+            history_item = _decided_history_item(target, approved=approved, reviewer=reviewer, comment=comment)
+            _append_history_sqlite(store, history_item)
+            remaining_count = store.count_items(MANUAL_REVIEW_QUEUE_COLLECTION)
+        return {
+            "item": history_item,
+            "remaining": remaining_count,
+        }
+
     queue = list_manual_reviews(5000)
     target = None
     remaining = []
@@ -222,17 +373,7 @@ def submit_manual_review(
     if target is None:
         raise ValueError("review task not found")
     _write_queue_store(remaining)
-    history_item = normalize_manual_review_item(
-        {
-            **target,
-            "approved": bool(approved),
-            "reviewer": str(reviewer or "").strip(),
-            "comment": str(comment or "").strip(),
-            "status": "approved" if approved else "rejected",
-            "decided_at": now_iso(),
-        },
-        existing=target,
-    )
+    history_item = _decided_history_item(target, approved=approved, reviewer=reviewer, comment=comment)
     _append_manual_review_history(history_item)
     return {
         "item": history_item,
@@ -7,6 +7,7 @@ from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from aiwf.governance_store import SqliteGovernanceStore, governance_sqlite_store
 from aiwf.paths import resolve_bus_root
 
 
@@ -14,6 +15,7 @@ QUALITY_RULE_SET_SCHEMA_VERSION = "quality_rule_set.v1"
 QUALITY_RULE_SET_STORE_SCHEMA_VERSION = "quality_rule_set_store.v1"
 QUALITY_RULE_SET_OWNER = "glue-python"
 QUALITY_RULE_SET_SOURCE = "glue-python.governance.quality_rule_sets"
+QUALITY_RULE_SET_COLLECTION = "quality_rule_sets"
 
 _ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$")
 
@@ -113,10 +115,29 @@ def normalize_quality_rule_set_payload(
     }
 
 
+def _upsert_sqlite(store: SqliteGovernanceStore, item: Dict[str, Any]) -> None:
+    store.upsert_item(QUALITY_RULE_SET_COLLECTION, item["id"], item, sort_key=str(item.get("updated_at") or ""))
+
+
+def import_json_store_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    items = []
+    for raw in _read_store()["sets"]:
+        if not isinstance(raw, dict):
+            continue
+        try:
+            items.append(normalize_quality_rule_set_payload(raw, existing=raw))
+        except ValueError:
+            continue
+    for item in items:
+        _upsert_sqlite(store, item)
+    return {QUALITY_RULE_SET_COLLECTION: len(items)}
+
+
 def list_quality_rule_sets(limit: int = 500) -> List[Dict[str, Any]]:
     safe_limit = max(1, min(5000, int(limit or 500)))
+    store = governance_sqlite_store()
     items = []
-    for raw in _read_store()["sets"]:
+    for raw in store.list_items(QUALITY_RULE_SET_COLLECTION, safe_limit) if store is not None else _read_store()["sets"]:
         if not isinstance(raw, dict):
             continue
         try:
@@ -129,6 +150,10 @@ def list_quality_rule_sets(limit: int = 500) -> List[Dict[str, Any]]:
 
 def get_quality_rule_set(set_id: str) -> Optional[Dict[str, Any]]:
     normalized_id = validate_quality_rule_set_id(set_id)
+    store = governance_sqlite_store()
+    if store is not None:
+        raw = store.get_item(QUALITY_RULE_SET_COLLECTION, normalized_id)
+        return normalize_quality_rule_set_payload(raw, existing=raw) if raw is not None else None
     for item in list_quality_rule_sets(5000):
         if str(item.get("id") or "") == normalized_id:
             return item
@@ -136,6 +161,14 @@ def get_quality_rule_set(set_id: str) -> Optional[Dict[str, Any]]:
 
 
 def save_quality_rule_set(payload: Dict[str, Any]) -> Dict[str, Any]:
+    store = governance_sqlite_store()
+    if store is not None:
+        desired_id = validate_quality_rule_set_id(payload.get("id") or "")
+        with store.transaction():
+            existing = store.get_item(QUALITY_RULE_SET_COLLECTION, desired_id)
+            normalized = normalize_quality_rule_set_payload(payload, existing=existing)
+            _upsert_sqlite(store, normalized)
+        return normalized
     current_store = list_quality_rule_sets(5000)
     existing = None
     desired_id = validate_quality_rule_set_id(payload.get("id") or "")
@@ -152,6 +185,10 @@ def save_quality_rule_set(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 def remove_quality_rule_set(set_id: str) -> bool:
     normalized_id = validate_quality_rule_set_id(set_id)
+    store = governance_sqlite_store()
+    if store is not None:
+        with store.transaction():
+            return store.remove_item(QUALITY_RULE_SET_COLLECTION, normalized_id)
     current_store = list_quality_rule_sets(5000)
     next_items = [item for item in current_store if str(item.get("id") or "") != normalized_id]
     removed = len(next_items) != len(current_store)
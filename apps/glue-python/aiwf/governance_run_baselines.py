@@ -5,6 +5,7 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from aiwf.governance_store import SqliteGovernanceStore, governance_sqlite_store
 from aiwf.paths import resolve_bus_root
 
 
@@ -12,6 +13,7 @@ RUN_BASELINE_SCHEMA_VERSION = "run_baseline_entry.v1"
 RUN_BASELINE_STORE_SCHEMA_VERSION = "run_baseline_store.v1"
 RUN_BASELINE_OWNER = "glue-python"
 RUN_BASELINE_SOURCE = "glue-python.governance.run_baselines"
+RUN_BASELINE_COLLECTION = "run_baselines"
 
 
 def now_iso() -> str:
@@ -90,9 +92,29 @@ def _write_store(items: List[Dict[str, Any]]) -> Dict[str, Any]:
     return payload
 
 
+def _upsert_sqlite(store: SqliteGovernanceStore, item: Dict[str, Any]) -> None:
+    store.upsert_item(RUN_BASELINE_COLLECTION, item["baseline_id"], item, sort_key=str(item.get("created_at") or ""))
+
+
+def import_json_store_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    items = []
+    for raw in _read_store()["items"]:
+        if not isinstance(raw, dict):
+            continue
+        try:
+            items.append(normalize_run_baseline_payload(raw, existing=raw))
+        except ValueError:
+            continue
+    for item in items:
+        _upsert_sqlite(store, item)
+    return {RUN_BASELINE_COLLECTION: len(items)}
+
+
 def list_run_baselines(limit: int = 200) -> List[Dict[str, Any]]:
+    safe_limit = max(1, min(5000, int(limit or 200)))
+    store = governance_sqlite_store()
     items: List[Dict[str, Any]] = []
-    for raw in _read_store()["items"]:
+    for raw in store.list_items(RUN_BASELINE_COLLECTION, safe_limit) if store is not None else _read_store()["items"]:
         if not isinstance(raw, dict):
             continue
         try:
@@ -100,13 +122,17 @@ def list_run_baselines(limit: int = 200) -> List[Dict[str, Any]]:
         except ValueError:
             continue
     items.sort(key=lambda item: (str(item.get("created_at") or ""), str(item.get("baseline_id") or "")), reverse=True)
-    return items[:max(1, min(5000, int(limit or 200)))]
+    return items[:safe_limit]
 
 
 def get_run_baseline(baseline_id: str) -> Optional[Dict[str, Any]]:
     target = str(baseline_id or "").strip()
     if not target:
         raise ValueError("baseline_id is required")
+    store = governance_sqlite_store()
+    if store is not None:
+        raw = store.get_item(RUN_BASELINE_COLLECTION, target)
+        return normalize_run_baseline_payload(raw, existing=raw) if raw is not None else None
     for item in list_run_baselines(5000):
         if str(item.get("baseline_id") or "") == target:
             return item
@@ -114,10 +140,17 @@ def get_run_baseline(baseline_id: str) -> Optional[Dict[str, Any]]:
 
 
 def save_run_baseline(payload: Dict[str, Any]) -> Dict[str, Any]:
-    current_items = list_run_baselines(5000)
     desired_id = str(payload.get("baseline_id") or "").strip()
     if not desired_id:
         raise ValueError("baseline_id is required")
+    store = governance_sqlite_store()
+    if store is not None:
+        with store.transaction():
+            existing = store.get_item(RUN_BASELINE_COLLECTION, desired_id)
+            normalized = normalize_run_baseline_payload(payload, existing=existing)
+            _upsert_sqlite(store, normalized)
+        return normalized
+    current_items = list_run_baselines(5000)
     existing = None
     for item in current_items:
         if str(item.get("baseline_id") or "") == desired_id:
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from aiwf.paths import resolve_bus_root
+
+
+GOVERNANCE_SQLITE_SCHEMA_VERSION = "governance_sqlite_store.v1"
+GOVERNANCE_BACKEND_JSON = "json"
+GOVERNANCE_BACKEND_SQLITE = "sqlite"
+SQLITE_BUSY_TIMEOUT_MS = 10000
+_MIGRATION_MARKER = "migrated_from_files"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS governance_items (
+        collection TEXT NOT NULL,
+        item_key TEXT NOT NULL,
+        sort_key TEXT NOT NULL DEFAULT '',
+        group_key TEXT NOT NULL DEFAULT '',
+        payload TEXT NOT NULL,
+        PRIMARY KEY (collection, item_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS governance_items_by_sort ON governance_items (collection, sort_key DESC, item_key DESC)",
+    "CREATE INDEX IF NOT EXISTS governance_items_by_group ON governance_items (collection, group_key, sort_key DESC, item_key DESC)",
+    """
+    CREATE TABLE IF NOT EXISTS governance_history (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        collection TEXT NOT NULL,
+        record_key TEXT NOT NULL DEFAULT '',
+        actor TEXT NOT NULL DEFAULT '',
+        status TEXT NOT NULL DEFAULT '',
+        ts TEXT NOT NULL DEFAULT '',
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS governance_history_by_seq ON governance_history (collection, seq DESC)",
+    "CREATE INDEX IF NOT EXISTS governance_history_by_key ON governance_history (collection, record_key, seq DESC)",
+    "CREATE INDEX IF NOT EXISTS governance_history_by_status ON governance_history (collection, status, seq DESC)",
+    "CREATE INDEX IF NOT EXISTS governance_history_by_ts ON governance_history (collection, ts)",
+    """
+    CREATE TABLE IF NOT EXISTS governance_documents (
+        name TEXT PRIMARY KEY,
+        payload TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS governance_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def resolve_governance_root() -> str:
+    configured = str(os.getenv("AIWF_GOVERNANCE_ROOT") or "").strip()
+    if configured:
+        return os.path.normpath(configured)
+    return os.path.join(resolve_bus_root(), "governance")
+
+
+def governance_backend() -> str:
+    value = str(os.getenv("AIWF_GOVERNANCE_BACKEND") or GOVERNANCE_BACKEND_JSON).strip().lower()
+    return GOVERNANCE_BACKEND_SQLITE if value == GOVERNANCE_BACKEND_SQLITE else GOVERNANCE_BACKEND_JSON
+
+
+def governance_sqlite_path() -> str:
+    configured = str(os.getenv("AIWF_GOVERNANCE_SQLITE_PATH") or "").strip()
+    if configured:
+        return os.path.normpath(configured)
+    return os.path.join(resolve_governance_root(), "governance.v1.sqlite3")
+
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+class SqliteGovernanceStore:
+    """Governance state in one SQLite database in WAL mode.
+
+    Keyed collections (rule sets, apps, versions, baselines, the review
+    queue) live in `governance_items` with a sort key and an optional group
+    key, both indexed. Append-only histories live in `governance_history`
+    with indexed key, actor, status and timestamp columns, and singleton
+    documents in `governance_documents`. Payloads are the same normalized
+    dicts the JSON files hold, so callers see identical shapes.
+
+    Each thread gets its own connection. `transaction()` takes the write lock
+    up front (BEGIN IMMEDIATE), so read-modify-write upserts from concurrent
+    processes serialize instead of overwriting each other.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000.0, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        with self._schema_lock:
+            if not self._schema_ready:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(
+                    "INSERT OR IGNORE INTO governance_meta (key, value) VALUES ('schema_version', ?)",
+                    (GOVERNANCE_SQLITE_SCHEMA_VERSION,),
+                )
+                self._schema_ready = True
+        self._local.conn = conn
+        self._local.depth = 0
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed reads and writes atomically; nested uses join the outer one."""
+        conn = self._connection()
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # -- keyed collections ----------------------------------------------
+
+    def list_items(self, collection: str, limit: int, *, group_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        conn = self._connection()
+        if group_key is None:
+            rows = conn.execute(
+                "SELECT payload FROM governance_items WHERE collection = ? ORDER BY sort_key DESC, item_key DESC LIMIT ?",
+                (collection, int(limit)),
+            )
+        else:
+            rows = conn.execute(
+                "SELECT payload FROM governance_items WHERE collection = ? AND group_key = ? "
+                "ORDER BY sort_key DESC, item_key DESC LIMIT ?",
+                (collection, group_key, int(limit)),
+            )
+        return [json.loads(row[0]) for row in rows]
+
+    def count_items(self, collection: str) -> int:
+        row = self._connection().execute("SELECT COUNT(*) FROM governance_items WHERE collection = ?", (collection,)).fetchone()
+        return int(row[0] if row else 0)
+
+    def get_item(self, collection: str, item_key: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT payload FROM governance_items WHERE collection = ? AND item_key = ?",
+            (collection, item_key),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def upsert_item(
+        self,
+        collection: str,
+        item_key: str,
+        payload: Dict[str, Any],
+        *,
+        sort_key: str = "",
+        group_key: str = "",
+    ) -> None:
+        self._connection().execute(
+            "INSERT INTO governance_items (collection, item_key, sort_key, group_key, payload) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (collection, item_key) DO UPDATE SET "
+            "sort_key = excluded.sort_key, group_key = excluded.group_key, payload = excluded.payload",
+            (collection, item_key, sort_key, group_key, _dumps(payload)),
+        )
+
+    def remove_item(self, collection: str, item_key: str) -> bool:
+        cursor = self._connection().execute(
+            "DELETE FROM governance_items WHERE collection = ? AND item_key = ?",
+            (collection, item_key),
+        )
+        return cursor.rowcount > 0
+
+    # -- append-only histories ------------------------------------------
+
+    def append_history(
+        self,
+        collection: str,
+        payload: Dict[str, Any],
+        *,
+        record_key: str = "",
+        actor: str = "",
+        status: str = "",
+        ts: str = "",
+    ) -> None:
+        self._connection().execute(
+            "INSERT INTO governance_history (collection, record_key, actor, status, ts, payload) VALUES (?, ?, ?, ?, ?, ?)",
+            (collection, record_key, actor, status, ts, _dumps(payload)),
+        )
+
+    def history(
+        self,
+        collection: str,
+        limit: int,
+        *,
+        record_key: str = "",
+        actor_contains: str = "",
+        status: str = "",
+        ts_from: str = "",
+        ts_to: str = "",
+    ) -> List[Dict[str, Any]]:
+        """Newest-first history rows; empty filter values are ignored."""
+        clauses = ["collection = ?"]
+        params: List[Any] = [collection]
+        if record_key:
+            clauses.append("record_key = ?")
+            params.append(record_key)
+        if actor_contains:
+            clauses.append("instr(actor, ?) > 0")
+            params.append(actor_contains)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if ts_from:
+            clauses.append("ts >= ?")
+            params.append(ts_from)
+        if ts_to:
+            clauses.append("ts <= ?")
+            params.append(ts_to)
+        params.append(int(limit))
+        rows = self._connection().execute(
+            f"SELECT payload FROM governance_history WHERE {' AND '.join(clauses)} ORDER BY seq DESC LIMIT ?",
+            params,
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    # -- singleton documents --------------------------------------------
+
+    def get_document(self, name: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute("SELECT payload FROM governance_documents WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_document(self, name: str, payload: Dict[str, Any]) -> None:
+        self._connection().execute(
+            "INSERT INTO governance_documents (name, payload, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET payload = excluded.payload, updated_at = excluded.updated_at",
+            (name, _dumps(payload), now_iso()),
+        )
+
+    # -- metadata --------------------------------------------------------
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._connection().execute("SELECT value FROM governance_meta WHERE key = ?", (key,)).fetchone()
+        return str(row[0]) if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        self._connection().execute(
+            "INSERT INTO governance_meta (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+
+_STORES: Dict[str, SqliteGovernanceStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def sqlite_governance_store(path: Optional[str] = None) -> SqliteGovernanceStore:
+    target = os.path.normpath(path or governance_sqlite_path())
+    with _STORES_LOCK:
+        store = _STORES.get(target)
+        if store is None:
+            store = SqliteGovernanceStore(target)
+            _STORES[target] = store
+        return store
+
+
+def governance_sqlite_store() -> Optional[SqliteGovernanceStore]:
+    """The SQLite store when AIWF_GOVERNANCE_BACKEND=sqlite, else None (JSON files)."""
+    if governance_backend() != GOVERNANCE_BACKEND_SQLITE:
+        return None
+    return sqlite_governance_store()
+
+
+def migrate_governance_files_to_sqlite(*, path: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+    """Copy every governance JSON/JSONL store into the SQLite database in one transaction.
+
+    Reads the files regardless of AIWF_GOVERNANCE_BACKEND and leaves them in
+    place. A second run is a no-op unless `force` is set, in which case items
+    are upserted again and histories are re-imported from scratch.
+    """
+    from aiwf import (
+        governance_manual_reviews,
+        governance_quality_rule_sets,
+        governance_run_baselines,
+        governance_workflow_apps,
+        governance_workflow_sandbox_autofix,
+        governance_workflow_sandbox_rules,
+        governance_workflow_versions,
+    )
+
+    store = sqlite_governance_store(path)
+    counts: Dict[str, int] = {}
+    with store.transaction() as conn:
+        if store.get_meta(_MIGRATION_MARKER) and not force:
+            return {"ok": True, "migrated": False, "reason": "already_migrated", "path": store.path, "counts": counts}
+        for module in (
+            governance_quality_rule_sets,
+            governance_workflow_versions,
+            governance_workflow_apps,
+            governance_run_baselines,
+            governance_manual_reviews,
+        ):
+            for collection, count in module.import_json_store_into(store).items():
+                counts[collection] = count
+        for module in (governance_manual_reviews, governance_workflow_sandbox_rules):
+            for collection in module.SQLITE_HISTORY_COLLECTIONS:
+                conn.execute("DELETE FROM governance_history WHERE collection = ?", (collection,))
+            counts.update(module.import_json_history_into(store))
+        counts.update(governance_workflow_sandbox_rules.import_json_documents_into(store))
+        counts.update(governance_workflow_sandbox_autofix.import_json_documents_into(store))
+        store.set_meta(_MIGRATION_MARKER, now_iso())
+    return {"ok": True, "migrated": True, "path": store.path, "counts": counts}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="AIWF governance store migration")
+    parser.add_argument("command", choices=["migrate"], help="migrate the JSON/JSONL governance files into SQLite")
+    parser.add_argument("--path", default=None, help="SQLite database path (default: AIWF_GOVERNANCE_SQLITE_PATH or <governance root>/governance.v1.sqlite3)")
+    parser.add_argument("--force", action="store_true", help="re-import even if a migration already ran")
+    args = parser.parse_args(argv)
+    result = migrate_governance_files_to_sqlite(path=args.path, force=args.force)
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from aiwf.governance_store import SqliteGovernanceStore, governance_sqlite_store
 from aiwf.paths import resolve_bus_root
 from aiwf.governance_workflow_versions import (
     get_workflow_version,
@@ -16,6 +17,7 @@ WORKFLOW_APP_SCHEMA_VERSION = "workflow_app_registry_entry.v1"
 WORKFLOW_APP_STORE_SCHEMA_VERSION = "workflow_app_registry_store.v1"
 WORKFLOW_APP_OWNER = "glue-python"
 WORKFLOW_APP_SOURCE = "glue-python.governance.workflow_apps"
+WORKFLOW_APP_COLLECTION = "workflow_apps"
 
 
 def now_iso() -> str:
@@ -145,10 +147,29 @@ def _write_store(items: List[Dict[str, Any]]) -> Dict[str, Any]:
     return payload
 
 
+def _upsert_sqlite(store: SqliteGovernanceStore, item: Dict[str, Any]) -> None:
+    store.upsert_item(WORKFLOW_APP_COLLECTION, item["app_id"], item, sort_key=str(item.get("updated_at") or ""))
+
+
+def import_json_store_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    items = []
+    for raw in _read_store()["items"]:
+        if not isinstance(raw, dict):
+            continue
+        try:
+            items.append(normalize_workflow_app_payload(raw, existing=raw))
+        except ValueError:
+            continue
+    for item in items:
+        _upsert_sqlite(store, item)
+    return {WORKFLOW_APP_COLLECTION: len(items)}
+
+
 def list_workflow_apps(limit: int = 200) -> List[Dict[str, Any]]:
     safe_limit = max(1, min(5000, int(limit or 200)))
+    store = governance_sqlite_store()
     items = []
-    for raw in _read_store()["items"]:
+    for raw in store.list_items(WORKFLOW_APP_COLLECTION, safe_limit) if store is not None else _read_store()["items"]:
         if not isinstance(raw, dict):
             continue
         try:
@@ -161,6 +182,15 @@ def list_workflow_apps(limit: int = 200) -> List[Dict[str, Any]]:
 
 def get_workflow_app(app_id: str) -> Optional[Dict[str, Any]]:
     normalized_id = validate_workflow_app_id(app_id)
+    store = governance_sqlite_store()
+    if store is not None:
+        raw = store.get_item(WORKFLOW_APP_COLLECTION, normalized_id)
+        if raw is None:
+            return None
+        try:
+            return normalize_workflow_app_payload(raw, existing=raw)
+        except ValueError:
+            return None
     for item in list_workflow_apps(5000):
         if str(item.get("app_id") or "") == normalized_id:
             return item
@@ -168,6 +198,14 @@ def get_workflow_app(app_id: str) -> Optional[Dict[str, Any]]:
 
 
 def save_workflow_app(payload: Dict[str, Any]) -> Dict[str, Any]:
+    store = governance_sqlite_store()
+    if store is not None:
+        desired_id = validate_workflow_app_id(payload.get("app_id") or "")
+        with store.transaction():
+            existing = store.get_item(WORKFLOW_APP_COLLECTION, desired_id)
+            normalized = normalize_workflow_app_payload(payload, existing=existing)
+            _upsert_sqlite(store, normalized)
+        return normalized
     current_items = list_workflow_apps(5000)
     desired_id = validate_workflow_app_id(payload.get("app_id") or "")
     existing = None
@@ -4,14 +4,16 @@ import json
 import os
 from copy import deepcopy
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from aiwf.governance_store import SqliteGovernanceStore, governance_sqlite_store
 from aiwf.paths import resolve_bus_root
 
 
 WORKFLOW_SANDBOX_AUTOFIX_SCHEMA_VERSION = "workflow_sandbox_autofix_state.v1"
 WORKFLOW_SANDBOX_AUTOFIX_OWNER = "glue-python"
 WORKFLOW_SANDBOX_AUTOFIX_SOURCE = "glue-python.governance.workflow_sandbox_autofix"
+WORKFLOW_SANDBOX_AUTOFIX_DOCUMENT = "workflow_sandbox_autofix_state"
 
 
 def now_iso() -> str:
@@ -47,17 +49,35 @@ def normalize_workflow_sandbox_autofix_state(value: Dict[str, Any] | None) -> Di
     }
 
 
-def get_workflow_sandbox_autofix_state() -> Dict[str, Any]:
+def _read_state_file() -> Optional[Dict[str, Any]]:
     file_path = workflow_sandbox_autofix_store_path()
     if not os.path.exists(file_path):
-        return normalize_workflow_sandbox_autofix_state({})
+        return None
     with open(file_path, "r", encoding="utf-8") as handle:
         payload = json.load(handle)
-    return normalize_workflow_sandbox_autofix_state(payload if isinstance(payload, dict) else {})
+    return payload if isinstance(payload, dict) else {}
+
+
+def import_json_documents_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    payload = _read_state_file()
+    if payload is None:
+        return {WORKFLOW_SANDBOX_AUTOFIX_DOCUMENT: 0}
+    store.put_document(WORKFLOW_SANDBOX_AUTOFIX_DOCUMENT, normalize_workflow_sandbox_autofix_state(payload))
+    return {WORKFLOW_SANDBOX_AUTOFIX_DOCUMENT: 1}
+
+
+def get_workflow_sandbox_autofix_state() -> Dict[str, Any]:
+    store = governance_sqlite_store()
+    payload = store.get_document(WORKFLOW_SANDBOX_AUTOFIX_DOCUMENT) if store is not None else _read_state_file()
+    return normalize_workflow_sandbox_autofix_state(payload or {})
 
 
 def save_workflow_sandbox_autofix_state(state: Dict[str, Any]) -> Dict[str, Any]:
     normalized = normalize_workflow_sandbox_autofix_state(state)
+    store = governance_sqlite_store()
+    if store is not None:
+        store.put_document(WORKFLOW_SANDBOX_AUTOFIX_DOCUMENT, normalized)
+        return normalized
     file_path = workflow_sandbox_autofix_store_path()
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
     with open(file_path, "w", encoding="utf-8") as handle:
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import json
 import os
+import sys
+from contextlib import nullcontext
 from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from aiwf.governance_store import SqliteGovernanceStore, governance_sqlite_store
+from aiwf.jsonl_history import JsonlHistoryStore, history_store
 from aiwf.paths import resolve_bus_root
 
 
@@ -13,6 +17,10 @@ WORKFLOW_SANDBOX_RULE_SCHEMA_VERSION = "workflow_sandbox_alert_rules.v1"
 WORKFLOW_SANDBOX_RULE_STORE_SCHEMA_VERSION = "workflow_sandbox_alert_rule_store.v1"
 WORKFLOW_SANDBOX_RULE_OWNER = "glue-python"
 WORKFLOW_SANDBOX_RULE_SOURCE = "glue-python.governance.workflow_sandbox_rules"
+WORKFLOW_SANDBOX_RULE_VERSION_INDEX_VERSION = "workflow_sandbox_rule_version_index.v1"
+WORKFLOW_SANDBOX_RULE_DOCUMENT = "workflow_sandbox_rules"
+WORKFLOW_SANDBOX_RULE_VERSION_COLLECTION = "workflow_sandbox_rule_versions"
+SQLITE_HISTORY_COLLECTIONS = (WORKFLOW_SANDBOX_RULE_VERSION_COLLECTION,)
 
 
 def now_iso() -> str:
@@ -88,16 +96,24 @@ def normalize_workflow_sandbox_rules(rules: Dict[str, Any] | None) -> Dict[str,
     }
 
 
-def _read_rules_store() -> Dict[str, Any]:
+def _read_rules_file() -> Optional[Dict[str, Any]]:
     file_path = workflow_sandbox_rules_path()
     if not os.path.exists(file_path):
+        return None
+    with open(file_path, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return payload if isinstance(payload, dict) else {}
+
+
+def _read_rules_store() -> Dict[str, Any]:
+    store = governance_sqlite_store()
+    payload = store.get_document(WORKFLOW_SANDBOX_RULE_DOCUMENT) if store is not None else _read_rules_file()
+    if payload is None:
         return {
             "schema_version": WORKFLOW_SANDBOX_RULE_STORE_SCHEMA_VERSION,
             "updated_at": None,
             "rules": normalize_workflow_sandbox_rules({}),
         }
-    with open(file_path, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
     rules = payload.get("rules")
     return {
         "schema_version": str(payload.get("schema_version") or WORKFLOW_SANDBOX_RULE_STORE_SCHEMA_VERSION),
@@ -107,12 +123,16 @@ def _read_rules_store() -> Dict[str, Any]:
 
 
 def _write_rules_store(rules: Dict[str, Any]) -> Dict[str, Any]:
-    file_path = workflow_sandbox_rules_path()
     payload = {
         "schema_version": WORKFLOW_SANDBOX_RULE_STORE_SCHEMA_VERSION,
         "updated_at": now_iso(),
         "rules": normalize_workflow_sandbox_rules(rules),
     }
+    store = governance_sqlite_store()
+    if store is not None:
+        store.put_document(WORKFLOW_SANDBOX_RULE_DOCUMENT, payload)
+        return payload
+    file_path = workflow_sandbox_rules_path()
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
     with open(file_path, "w", encoding="utf-8") as handle:
         json.dump(payload, handle, ensure_ascii=False, indent=2)
@@ -124,6 +144,60 @@ def get_workflow_sandbox_rules() -> Dict[str, Any]:
     return _read_rules_store()["rules"]
 
 
+def _rule_version_index_fields(payload: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    return {"version_id": str(payload.get("version_id") or "")}
+
+
+def _rule_version_store() -> JsonlHistoryStore:
+    return history_store(
+        workflow_sandbox_rule_versions_path(),
+        index_fields=_rule_version_index_fields,
+        index_version=WORKFLOW_SANDBOX_RULE_VERSION_INDEX_VERSION,
+    )
+
+
+def _rule_version_item(payload: Dict[str, Any]) -> Dict[str, Any]:
+    rules = payload.get("rules")
+    return {
+        "version_id": str(payload.get("version_id") or ""),
+        "ts": str(payload.get("ts") or ""),
+        "rules": normalize_workflow_sandbox_rules(rules if isinstance(rules, dict) else {}),
+        "meta": payload.get("meta") if isinstance(payload.get("meta"), dict) else {},
+    }
+
+
+def _append_version_sqlite(store: SqliteGovernanceStore, item: Dict[str, Any]) -> None:
+    store.append_history(
+        WORKFLOW_SANDBOX_RULE_VERSION_COLLECTION,
+        item,
+        record_key=str(item.get("version_id") or ""),
+        ts=str(item.get("ts") or ""),
+    )
+
+
+def import_json_history_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    items = _rule_version_store().newest(sys.maxsize, parse=_rule_version_item)
+    for item in reversed(items):
+        _append_version_sqlite(store, item)
+    return {WORKFLOW_SANDBOX_RULE_VERSION_COLLECTION: len(items)}
+
+
+def import_json_documents_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    payload = _read_rules_file()
+    if payload is None:
+        return {WORKFLOW_SANDBOX_RULE_DOCUMENT: 0}
+    rules = payload.get("rules")
+    store.put_document(
+        WORKFLOW_SANDBOX_RULE_DOCUMENT,
+        {
+            "schema_version": str(payload.get("schema_version") or WORKFLOW_SANDBOX_RULE_STORE_SCHEMA_VERSION),
+            "updated_at": payload.get("updated_at"),
+            "rules": rules if isinstance(rules, dict) else {},
+        },
+    )
+    return {WORKFLOW_SANDBOX_RULE_DOCUMENT: 1}
+
+
 def append_workflow_sandbox_rule_version(rules: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     item = {
         "version_id": f"{int(datetime.now(timezone.utc).timestamp() * 1000)}_{os.urandom(4).hex()}",
@@ -131,21 +205,27 @@ def append_workflow_sandbox_rule_version(rules: Dict[str, Any], meta: Optional[D
         "rules": normalize_workflow_sandbox_rules(rules),
         "meta": meta if isinstance(meta, dict) else {},
     }
-    file_path = workflow_sandbox_rule_versions_path()
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, "a", encoding="utf-8") as handle:
-        handle.write(json.dumps(item, ensure_ascii=False))
-        handle.write("\n")
+    store = governance_sqlite_store()
+    if store is not None:
+        _append_version_sqlite(store, item)
+        return item
+    _rule_version_store().append(item)
     return item
 
 
+def _rules_transaction() -> Any:
+    store = governance_sqlite_store()
+    return store.transaction() if store is not None else nullcontext()
+
+
 def set_workflow_sandbox_rules(rules: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     normalized = normalize_workflow_sandbox_rules(rules)
-    _write_rules_store(normalized)
-    version = append_workflow_sandbox_rule_version(
-        normalized,
-        meta if isinstance(meta, dict) and meta else {"reason": "set_rules"},
-    )
+    with _rules_transaction():
+        _write_rules_store(normalized)
+        version = append_workflow_sandbox_rule_version(
+            normalized,
+            meta if isinstance(meta, dict) and meta else {"reason": "set_rules"},
+        )
     return {
         "rules": normalized,
         "version": version,
@@ -153,39 +233,23 @@ def set_workflow_sandbox_rules(rules: Dict[str, Any], meta: Optional[Dict[str, A
 
 
 def list_workflow_sandbox_rule_versions(limit: int = 200) -> List[Dict[str, Any]]:
-    file_path = workflow_sandbox_rule_versions_path()
-    if not os.path.exists(file_path):
-        return []
-    with open(file_path, "r", encoding="utf-8") as handle:
-        lines = [line.strip() for line in handle.readlines() if line.strip()]
-    items: List[Dict[str, Any]] = []
-    for line in reversed(lines):
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(payload, dict):
-            continue
-        rules = payload.get("rules")
-        items.append({
-            "version_id": str(payload.get("version_id") or ""),
-            "ts": str(payload.get("ts") or ""),
-            "rules": normalize_workflow_sandbox_rules(rules if isinstance(rules, dict) else {}),
-            "meta": payload.get("meta") if isinstance(payload.get("meta"), dict) else {},
-        })
-        if len(items) >= max(1, min(5000, int(limit or 200))):
-            break
-    return items
+    safe_limit = max(1, min(5000, int(limit or 200)))
+    store = governance_sqlite_store()
+    if store is not None:
+        return [_rule_version_item(raw) for raw in store.history(WORKFLOW_SANDBOX_RULE_VERSION_COLLECTION, safe_limit)]
+    return _rule_version_store().newest(safe_limit, parse=_rule_version_item)
 
 
 def get_workflow_sandbox_rule_version(version_id: str) -> Optional[Dict[str, Any]]:
     target = str(version_id or "").strip()
     if not target:
         return None
-    for item in list_workflow_sandbox_rule_versions(5000):
-        if str(item.get("version_id") or "") == target:
-            return item
-    return None
+    store = governance_sqlite_store()
+    if store is not None:
+        rows = store.history(WORKFLOW_SANDBOX_RULE_VERSION_COLLECTION, 1, record_key=target)
+        return _rule_version_item(rows[0]) if rows else None
+    hits = _rule_version_store().newest(1, where={"version_id": lambda value: value == target}, parse=_rule_version_item)
+    return hits[0] if hits else None
 
 
 def rollback_workflow_sandbox_rule_version(version_id: str) -> Optional[Dict[str, Any]]:
@@ -193,11 +257,12 @@ def rollback_workflow_sandbox_rule_version(version_id: str) -> Optional[Dict[str
     if hit is None:
         return None
     normalized = normalize_workflow_sandbox_rules(hit.get("rules"))
-    _write_rules_store(normalized)
-    version = append_workflow_sandbox_rule_version(
-        normalized,
-        {"reason": "rollback", "from_version_id": str(version_id or "")},
-    )
+    with _rules_transaction():
+        _write_rules_store(normalized)
+        version = append_workflow_sandbox_rule_version(
+            normalized,
+            {"reason": "rollback", "from_version_id": str(version_id or "")},
+        )
     return {
         "rules": normalized,
         "version": version,
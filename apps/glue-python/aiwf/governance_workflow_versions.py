@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import threading
 from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from aiwf.governance_store import SqliteGovernanceStore, governance_sqlite_store
 from aiwf.paths import resolve_bus_root
 
 
@@ -13,6 +16,7 @@ WORKFLOW_VERSION_SCHEMA_VERSION = "workflow_version_snapshot.v1"
 WORKFLOW_VERSION_STORE_SCHEMA_VERSION = "workflow_version_store.v1"
 WORKFLOW_VERSION_OWNER = "glue-python"
 WORKFLOW_VERSION_SOURCE = "glue-python.governance.workflow_versions"
+WORKFLOW_VERSION_COLLECTION = "workflow_versions"
 
 
 def now_iso() -> str:
@@ -120,9 +124,133 @@ def _write_store(items: List[Dict[str, Any]]) -> Dict[str, Any]:
     return payload
 
 
-def list_workflow_versions(limit: int = 200, workflow_name: str = "") -> List[Dict[str, Any]]:
-    safe_limit = max(1, min(5000, int(limit or 200)))
-    items: List[Dict[str, Any]] = []
+def node_config_digests(workflow_definition: Dict[str, Any]) -> Dict[str, str]:
+    """sha256 of each node's canonical config JSON, keyed by node id."""
+    nodes = workflow_definition.get("nodes") if isinstance(workflow_definition.get("nodes"), list) else []
+    digests: Dict[str, str] = {}
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        canonical = json.dumps(node.get("config") or {}, sort_keys=True, ensure_ascii=False)
+        digests[str(node.get("id") or "")] = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return digests
+
+
+class _IndexedVersion:
+    __slots__ = ("item", "digests")
+
+    def __init__(self, item: Dict[str, Any], digests: Dict[str, str]) -> None:
+        self.item = item
+        self.digests = digests
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "_IndexedVersion":
+        item = normalize_workflow_version_payload(raw, existing=raw)
+        digests = raw.get("node_config_digests")
+        if not isinstance(digests, dict):
+            digests = node_config_digests(item["workflow_definition"])
+        return cls(item, digests)
+
+    def stored(self) -> Dict[str, Any]:
+        return {**self.item, "node_config_digests": self.digests}
+
+
+def _sort_key(entry: _IndexedVersion) -> Any:
+    return (str(entry.item.get("ts") or ""), str(entry.item.get("version_id") or ""))
+
+
+def _file_signature(path: str) -> Optional[tuple]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class WorkflowVersionIndex:
+    """In-memory index over the JSON version store.
+
+    Versions are normalized once per store file revision (detected by mtime
+    and size, so writes from other processes are picked up) and kept newest
+    first, with lookups by version_id and by workflow_name. Each entry carries
+    per-node config digests, persisted next to the version by
+    save_workflow_version, so comparisons never re-serialize configs.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._path: Optional[str] = None
+        self._signature: Optional[tuple] = None
+        self._ordered: List[_IndexedVersion] = []
+        self._by_id: Dict[str, _IndexedVersion] = {}
+        self._by_name: Dict[str, List[_IndexedVersion]] = {}
+
+    def _rebuild(self, entries: List[_IndexedVersion]) -> None:
+        entries.sort(key=_sort_key, reverse=True)
+        by_id: Dict[str, _IndexedVersion] = {}
+        by_name: Dict[str, List[_IndexedVersion]] = {}
+        for entry in entries:
+            by_id.setdefault(str(entry.item.get("version_id") or ""), entry)
+            by_name.setdefault(str(entry.item.get("workflow_name") or ""), []).append(entry)
+        self._ordered, self._by_id, self._by_name = entries, by_id, by_name
+
+    def _refresh(self) -> None:
+        path = workflow_version_store_path()
+        signature = _file_signature(path)
+        if path == self._path and signature == self._signature:
+            return
+        entries: List[_IndexedVersion] = []
+        for raw in _read_store()["items"]:
+            if not isinstance(raw, dict):
+                continue
+            try:
+                entries.append(_IndexedVersion.from_raw(raw))
+            except ValueError:
+                continue
+        self._rebuild(entries)
+        self._path, self._signature = path, signature
+
+    def list(self, limit: int, workflow_name: str = "") -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            entries = self._by_name.get(workflow_name, []) if workflow_name else self._ordered
+            return [deepcopy(entry.item) for entry in entries[:limit]]
+
+    def get(self, version_id: str) -> Optional[_IndexedVersion]:
+        with self._lock:
+            self._refresh()
+            return self._by_id.get(version_id)
+
+    def save(self, payload: Dict[str, Any], version_id: str) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            current = self._by_id.get(version_id)
+            normalized = normalize_workflow_version_payload(payload, existing=current.item if current else None)
+            entry = _IndexedVersion(normalized, node_config_digests(normalized["workflow_definition"]))
+            next_entries = [item for item in self._ordered[:5000] if str(item.item.get("version_id") or "") != version_id]
+            next_entries.insert(0, entry)
+            _write_store([item.stored() for item in next_entries])
+            self._rebuild(next_entries)
+            self._path = workflow_version_store_path()
+            self._signature = _file_signature(self._path)
+            return deepcopy(normalized)
+
+
+_VERSION_INDEX = WorkflowVersionIndex()
+
+
+def _upsert_sqlite(store: SqliteGovernanceStore, item: Dict[str, Any]) -> None:
+    store.upsert_item(
+        WORKFLOW_VERSION_COLLECTION,
+        item["version_id"],
+        _IndexedVersion(item, node_config_digests(item["workflow_definition"])).stored(),
+        sort_key=str(item.get("ts") or ""),
+        group_key=str(item.get("workflow_name") or ""),
+    )
+
+
+def import_json_store_into(store: SqliteGovernanceStore) -> Dict[str, int]:
+    items = []
     for raw in _read_store()["items"]:
         if not isinstance(raw, dict):
             continue
@@ -130,41 +258,63 @@ def list_workflow_versions(limit: int = 200, workflow_name: str = "") -> List[Di
             items.append(normalize_workflow_version_payload(raw, existing=raw))
         except ValueError:
             continue
+    for item in items:
+        _upsert_sqlite(store, item)
+    return {WORKFLOW_VERSION_COLLECTION: len(items)}
+
+
+def list_workflow_versions(limit: int = 200, workflow_name: str = "") -> List[Dict[str, Any]]:
+    safe_limit = max(1, min(5000, int(limit or 200)))
     key = str(workflow_name or "").strip()
-    if key:
-        items = [item for item in items if str(item.get("workflow_name") or "") == key]
-    items.sort(key=lambda item: (str(item.get("ts") or ""), str(item.get("version_id") or "")), reverse=True)
-    return items[:safe_limit]
+    store = governance_sqlite_store()
+    if store is None:
+        return _VERSION_INDEX.list(safe_limit, key)
+    items: List[Dict[str, Any]] = []
+    for raw in store.list_items(WORKFLOW_VERSION_COLLECTION, safe_limit, group_key=key or None):
+        try:
+            items.append(normalize_workflow_version_payload(raw, existing=raw))
+        except ValueError:
+            continue
+    return items
 
 
-def get_workflow_version(version_id: str) -> Optional[Dict[str, Any]]:
+def _indexed_version(version_id: str) -> Optional[_IndexedVersion]:
     target = validate_version_id(version_id)
-    for item in list_workflow_versions(5000):
-        if str(item.get("version_id") or "") == target:
-            return item
-    return None
+    store = governance_sqlite_store()
+    if store is None:
+        return _VERSION_INDEX.get(target)
+    raw = store.get_item(WORKFLOW_VERSION_COLLECTION, target)
+    if raw is None:
+        return None
+    try:
+        return _IndexedVersion.from_raw(raw)
+    except ValueError:
+        return None
+
+
+def get_workflow_version(version_id: str) -> Optional[Dict[str, Any]]:
+    entry = _indexed_version(version_id)
+    return deepcopy(entry.item) if entry is not None else None
 
 
 def save_workflow_version(payload: Dict[str, Any]) -> Dict[str, Any]:
-    current_items = list_workflow_versions(5000)
     desired_id = validate_version_id(payload.get("version_id") or "")
-    existing = None
-    for item in current_items:
-        if str(item.get("version_id") or "") == desired_id:
-            existing = item
-            break
-    normalized = normalize_workflow_version_payload(payload, existing=existing)
-    next_items = [item for item in current_items if str(item.get("version_id") or "") != desired_id]
-    next_items.insert(0, normalized)
-    _write_store(next_items)
+    store = governance_sqlite_store()
+    if store is None:
+        return _VERSION_INDEX.save(payload, desired_id)
+    with store.transaction():
+        existing = store.get_item(WORKFLOW_VERSION_COLLECTION, desired_id)
+        normalized = normalize_workflow_version_payload(payload, existing=existing)
+        _upsert_sqlite(store, normalized)
     return normalized
 
 
 def compare_workflow_versions(version_a: str, version_b: str) -> Dict[str, Any]:
-    a = get_workflow_version(version_a)
-    b = get_workflow_version(version_b)
-    if not a or not b:
+    entry_a = _indexed_version(version_a)
+    entry_b = _indexed_version(version_b)
+    if entry_a is None or entry_b is None:
         raise ValueError("version not found")
+    a, b = entry_a.item, entry_b.item
     workflow_definition_a = a.get("workflow_definition") if isinstance(a.get("workflow_definition"), dict) else {}
     workflow_definition_b = b.get("workflow_definition") if isinstance(b.get("workflow_definition"), dict) else {}
     nodes_a = workflow_definition_a.get("nodes") if isinstance(workflow_definition_a.get("nodes"), list) else []
@@ -186,7 +336,7 @@ def compare_workflow_versions(version_a: str, version_b: str) -> Dict[str, Any]:
             node_diff.append({"id": node_id, "change": "removed", "type_a": str(node_a.get("type") or ""), "type_b": ""})
             continue
         type_changed = str(node_a.get("type") or "") != str(node_b.get("type") or "")
-        config_changed = json.dumps(node_a.get("config") or {}, sort_keys=True, ensure_ascii=False) != json.dumps(node_b.get("config") or {}, sort_keys=True, ensure_ascii=False)
+        config_changed = entry_a.digests.get(node_id) != entry_b.digests.get(node_id)
         node_diff.append({
             "id": node_id,
             "change": "updated" if (type_changed or config_changed) else "same",
@@ -6,6 +6,7 @@ from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
+from aiwf.extract_handoff import load_extract_handoff
 from aiwf.registry_domains import normalize_registry_domain, summarize_registry_domains
 from aiwf.registry_events import record_registry_event
 from aiwf.registry_policy import default_conflict_policy, normalize_conflict_policy
@@ -419,8 +420,7 @@ def _load_xlsx_input(path: str, options: Dict[str, Any]) -> Tuple[List[Dict[str,
     return _load_xlsx_input_impl(path, options)
 
 
-def load_rows_from_file(
-    path: str,
+def effective_load_options(
     *,
     text_by_line: bool = False,
     ocr_enabled: bool = True,
@@ -429,9 +429,7 @@ def load_rows_from_file(
     ocr_preprocess: Optional[str] = None,
     xlsx_all_sheets: bool = True,
     extra_options: Optional[Dict[str, Any]] = None,
-) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-    _ensure_builtin_input_readers()
-    registration = get_input_reader(path)
+) -> Dict[str, Any]:
     options = {
         "text_by_line": text_by_line,
         "ocr_enabled": ocr_enabled,
@@ -442,6 +440,38 @@ def load_rows_from_file(
     }
     if isinstance(extra_options, dict):
         options.update(extra_options)
+    return options
+
+
+def load_rows_from_file(
+    path: str,
+    *,
+    text_by_line: bool = False,
+    ocr_enabled: bool = True,
+    ocr_lang: Optional[str] = None,
+    ocr_config: Optional[str] = None,
+    ocr_preprocess: Optional[str] = None,
+    xlsx_all_sheets: bool = True,
+    extra_options: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    options = effective_load_options(
+        text_by_line=text_by_line,
+        ocr_enabled=ocr_enabled,
+        ocr_lang=ocr_lang,
+        ocr_config=ocr_config,
+        ocr_preprocess=ocr_preprocess,
+        xlsx_all_sheets=xlsx_all_sheets,
+        extra_options=extra_options,
+    )
+    handoff_dir = str(options.get("extract_handoff_dir") or "").strip()
+    if handoff_dir:
+        handoff = load_extract_handoff(handoff_dir, path, options)
+        if handoff is not None:
+            meta = dict(handoff["meta"])
+            meta["extract_handoff"] = {"reused": True, "path": handoff["path"], "source_sha256": handoff["source_sha256"]}
+            return handoff["rows"], meta
+    _ensure_builtin_input_readers()
+    registration = get_input_reader(path)
     return registration.loader(path, options)
 
 
@@ -0,0 +1,444 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+
+HISTORY_INDEX_SCHEMA_VERSION = "jsonl_history_index.v1"
+DEFAULT_SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+READ_BLOCK_BYTES = 64 * 1024
+
+IndexFields = Callable[[Dict[str, Any]], Optional[Dict[str, str]]]
+Where = Dict[str, Callable[[str], bool]]
+
+
+def history_segment_max_bytes() -> int:
+    raw = str(os.getenv("AIWF_HISTORY_SEGMENT_MAX_BYTES") or "").strip()
+    try:
+        return max(4096, int(raw)) if raw else DEFAULT_SEGMENT_MAX_BYTES
+    except ValueError:
+        return DEFAULT_SEGMENT_MAX_BYTES
+
+
+def history_max_segments() -> int:
+    raw = str(os.getenv("AIWF_HISTORY_MAX_SEGMENTS") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else 0
+    except ValueError:
+        return 0
+
+
+def _write_json_atomic(path: str, payload: Dict[str, Any]) -> None:
+    fd, tmp_path = tempfile.mkstemp(prefix=".idx-", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def reverse_lines(path: str, end: Optional[int] = None, *, block_bytes: int = READ_BLOCK_BYTES) -> Iterator[bytes]:
+    """Yield the complete lines of `path` before byte `end`, last line first.
+
+    Reads fixed-size blocks backwards from the end, so taking the newest N
+    lines costs about N lines of I/O however long the file is. A trailing
+    fragment without a newline (a write still in progress) is skipped.
+    """
+    try:
+        handle = open(path, "rb")
+    except OSError:
+        return
+    with handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell() if end is None else min(end, handle.tell())
+        pending = b""
+        seen_newline = False
+        while position > 0:
+            step = min(block_bytes, position)
+            position -= step
+            handle.seek(position)
+            chunk = handle.read(step)
+            if not seen_newline:
+                cut = chunk.rfind(b"\n")
+                if cut < 0:
+                    continue
+                chunk = chunk[:cut]
+                seen_newline = True
+            else:
+                chunk += pending
+            lines = chunk.split(b"\n")
+            pending = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if seen_newline and pending.strip():
+            yield pending
+
+
+class _SegmentIndex:
+    """Byte offsets of every indexed record in one segment plus field postings.
+
+    `postings[field][value]` lists record ordinals in file order. The index
+    covers the first `size` bytes; appends past that are picked up by
+    `extend`, so one index serves a segment for as long as it only grows.
+    """
+
+    __slots__ = ("size", "offsets", "lengths", "postings", "skipped")
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.offsets: List[int] = []
+        self.lengths: List[int] = []
+        self.postings: Dict[str, Dict[str, List[int]]] = {}
+        self.skipped = 0
+
+    def extend(self, path: str, index_fields: IndexFields) -> bool:
+        try:
+            handle = open(path, "rb")
+        except OSError:
+            return False
+        changed = False
+        with handle:
+            handle.seek(self.size)
+            offset = self.size
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                record_offset, offset = offset, offset + len(line)
+                changed = True
+                fields = None
+                try:
+                    record = json.loads(line)
+                    fields = index_fields(record) if isinstance(record, dict) else None
+                except ValueError:
+                    pass
+                if fields is None:
+                    self.skipped += 1
+                    continue
+                ordinal = len(self.offsets)
+                self.offsets.append(record_offset)
+                self.lengths.append(len(line))
+                for field, value in fields.items():
+                    self.postings.setdefault(field, {}).setdefault(str(value or ""), []).append(ordinal)
+            self.size = offset
+        return changed
+
+    def ordinals(self, where: Optional[Where]) -> List[int]:
+        """Ordinals matching every field predicate in `where`, newest first."""
+        if not where:
+            return list(range(len(self.offsets) - 1, -1, -1))
+        selected: Optional[Set[int]] = None
+        for field, predicate in where.items():
+            hits: Set[int] = set()
+            for value, ordinals in self.postings.get(field, {}).items():
+                if predicate(value):
+                    hits.update(ordinals)
+            selected = hits if selected is None else selected & hits
+            if not selected:
+                return []
+        return sorted(selected or (), reverse=True)
+
+    def to_json(self, index_version: str) -> Dict[str, Any]:
+        return {
+            "schema_version": HISTORY_INDEX_SCHEMA_VERSION,
+            "index_version": index_version,
+            "size": self.size,
+            "offsets": self.offsets,
+            "lengths": self.lengths,
+            "postings": self.postings,
+            "skipped": self.skipped,
+        }
+
+    @classmethod
+    def from_json(cls, payload: Dict[str, Any], index_version: str) -> Optional["_SegmentIndex"]:
+        if payload.get("schema_version") != HISTORY_INDEX_SCHEMA_VERSION or payload.get("index_version") != index_version:
+            return None
+        index = cls()
+        index.size = int(payload.get("size") or 0)
+        index.offsets = [int(item) for item in payload.get("offsets") or []]
+        index.lengths = [int(item) for item in payload.get("lengths") or []]
+        index.postings = payload.get("postings") if isinstance(payload.get("postings"), dict) else {}
+        index.skipped = int(payload.get("skipped") or 0)
+        if len(index.offsets) != len(index.lengths):
+            return None
+        return index
+
+
+class JsonlHistoryStore:
+    """Append-only JSONL history split into an active file and sealed segments.
+
+    New records go to `path`. Once it reaches `segment_max_bytes` it is
+    sealed by renaming it to `<stem>.<first>-<last><ext>` (a range of segment
+    numbers) and a compact sidecar index (`<segment>.idx.json`) is written
+    for it. Newest-first listing reads blocks backwards from the tail;
+    filtered listing walks the postings of the fields produced by
+    `index_fields`, touching only the matching lines.
+
+    Compaction merges runs of adjacent small sealed segments into one whose
+    range covers them, so a crash mid-merge leaves the covered originals to be
+    discarded on the next listing rather than duplicated. With
+    AIWF_HISTORY_MAX_SEGMENTS set, the oldest sealed segments beyond that
+    count are dropped.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        index_fields: IndexFields,
+        index_version: str,
+        segment_max_bytes: Optional[int] = None,
+        max_segments: Optional[int] = None,
+    ) -> None:
+        self.path = path
+        self.index_fields = index_fields
+        self.index_version = index_version
+        self.segment_max_bytes = segment_max_bytes if segment_max_bytes is not None else history_segment_max_bytes()
+        self.max_segments = max_segments if max_segments is not None else history_max_segments()
+        stem, ext = os.path.splitext(os.path.basename(path))
+        self._ext = ext or ".jsonl"
+        self._segment_re = re.compile(re.escape(stem) + r"\.(\d{6})-(\d{6})" + re.escape(self._ext) + "$")
+        self._stem = stem
+        self._lock = threading.RLock()
+        self._indexes: Dict[str, Tuple[Tuple[int, int], _SegmentIndex]] = {}
+
+    # -- layout ----------------------------------------------------------
+
+    def _directory(self) -> str:
+        return os.path.dirname(self.path) or "."
+
+    def _segment_name(self, first: int, last: int) -> str:
+        return os.path.join(self._directory(), f"{self._stem}.{first:06d}-{last:06d}{self._ext}")
+
+    def sealed_segments(self) -> List[Tuple[int, int, str]]:
+        """Sealed segments as (first, last, path), oldest first, minus any covered by a merge."""
+        try:
+            names = os.listdir(self._directory())
+        except OSError:
+            return []
+        found = []
+        for name in names:
+            match = self._segment_re.match(name)
+            if match:
+                found.append((int(match.group(1)), int(match.group(2)), os.path.join(self._directory(), name)))
+        found.sort(key=lambda item: (item[0], -item[1]))
+        kept: List[Tuple[int, int, str]] = []
+        for first, last, path in found:
+            if kept and last <= kept[-1][1]:
+                # Left behind by an interrupted compaction; the merged segment already holds it.
+                self._remove_segment(path)
+                continue
+            kept.append((first, last, path))
+        return kept
+
+    def _remove_segment(self, path: str) -> None:
+        for target in (path, path + ".idx.json"):
+            try:
+                os.remove(target)
+            except OSError:
+                pass
+        self._indexes.pop(path, None)
+
+    def segments(self) -> List[str]:
+        """Every segment path, newest first (the active file leads)."""
+        return [self.path] + [path for _, _, path in reversed(self.sealed_segments())]
+
+    # -- index -----------------------------------------------------------
+
+    def _index(self, path: str, *, persist: bool) -> Optional[_SegmentIndex]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._indexes.pop(path, None)
+            return None
+        identity = (stat.st_ino, stat.st_dev)
+        cached = self._indexes.get(path)
+        index = cached[1] if cached is not None and cached[0] == identity and cached[1].size <= stat.st_size else None
+        if index is None and persist:
+            try:
+                with open(path + ".idx.json", "r", encoding="utf-8") as handle:
+                    loaded = _SegmentIndex.from_json(json.load(handle), self.index_version)
+            except (OSError, ValueError):
+                loaded = None
+            if loaded is not None and loaded.size <= stat.st_size:
+                index = loaded
+        if index is None:
+            index = _SegmentIndex()
+        if index.size < stat.st_size and index.extend(path, self.index_fields) and persist:
+            _write_json_atomic(path + ".idx.json", index.to_json(self.index_version))
+        self._indexes[path] = (identity, index)
+        return index
+
+    # -- writes ----------------------------------------------------------
+
+    def append(self, record: Dict[str, Any]) -> None:
+        os.makedirs(self._directory(), exist_ok=True)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(record, ensure_ascii=False))
+                handle.write("\n")
+                handle.flush()
+                size = os.fstat(handle.fileno()).st_size
+            if size >= self.segment_max_bytes:
+                self.rotate()
+
+    def rotate(self) -> Optional[str]:
+        """Seal the active file as the next segment and compact; returns the sealed path."""
+        with self._lock:
+            try:
+                if os.path.getsize(self.path) == 0:
+                    return None
+            except OSError:
+                return None
+            sealed = self.sealed_segments()
+            number = (sealed[-1][1] if sealed else 0) + 1
+            # Claim the segment name before moving the active file onto it, so
+            # two processes rotating at once never seal onto the same number.
+            while True:
+                target = self._segment_name(number, number)
+                try:
+                    os.close(os.open(target, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    break
+                except FileExistsError:
+                    number += 1
+                except OSError:
+                    return None
+            try:
+                os.replace(self.path, target)
+            except OSError:
+                # Another process sealed it first; release the claimed name.
+                self._remove_segment(target)
+                return None
+            self._indexes.pop(self.path, None)
+            self._index(target, persist=True)
+            self.compact()
+            return target
+
+    def compact(self) -> int:
+        """Merge adjacent small sealed segments and apply retention; returns segments removed."""
+        removed = 0
+        with self._lock:
+            sealed = self.sealed_segments()
+            if self.max_segments and len(sealed) > self.max_segments:
+                for _, _, path in sealed[: len(sealed) - self.max_segments]:
+                    self._remove_segment(path)
+                    removed += 1
+                sealed = sealed[len(sealed) - self.max_segments :]
+            groups: List[List[Tuple[int, int, str]]] = []
+            group_bytes = 0
+            for item in sealed:
+                try:
+                    size = os.path.getsize(item[2])
+                except OSError:
+                    continue
+                if groups and group_bytes + size <= self.segment_max_bytes:
+                    groups[-1].append(item)
+                    group_bytes += size
+                else:
+                    groups.append([item])
+                    group_bytes = size
+            for group in groups:
+                if len(group) > 1:
+                    self._merge(group)
+                    removed += len(group) - 1
+        return removed
+
+    def _merge(self, run: List[Tuple[int, int, str]]) -> None:
+        target = self._segment_name(run[0][0], run[-1][1])
+        fd, tmp_path = tempfile.mkstemp(prefix=".merge-", suffix=".tmp", dir=self._directory())
+        with os.fdopen(fd, "wb") as out:
+            for _, _, path in run:
+                with open(path, "rb") as handle:
+                    for line in handle:
+                        if line.endswith(b"\n") and line.strip():
+                            out.write(line)
+        os.replace(tmp_path, target)
+        self._index(target, persist=True)
+        for _, _, path in run:
+            if path != target:
+                self._remove_segment(path)
+
+    # -- reads -----------------------------------------------------------
+
+    def newest(
+        self,
+        limit: int,
+        *,
+        where: Optional[Where] = None,
+        parse: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Up to `limit` records, newest first.
+
+        `where` maps indexed fields to predicates over their indexed values and
+        narrows the lines read. `parse` turns each record into the item to
+        return, or None to skip it.
+        """
+        items: List[Dict[str, Any]] = []
+        if limit <= 0:
+            return items
+        with self._lock:
+            try:
+                oversized = os.path.getsize(self.path) >= self.segment_max_bytes
+            except OSError:
+                oversized = False
+            if oversized:
+                # A history file from before segmentation, or one grown by another writer.
+                self.rotate()
+            for path in self.segments():
+                for record in self._segment_records(path, where):
+                    item = parse(record) if parse is not None else record
+                    if item is None:
+                        continue
+                    items.append(item)
+                    if len(items) >= limit:
+                        return items
+        return items
+
+    def _segment_records(self, path: str, where: Optional[Where]) -> Iterator[Dict[str, Any]]:
+        if not where:
+            for line in reverse_lines(path):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+            return
+        index = self._index(path, persist=path != self.path)
+        if index is None:
+            return
+        ordinals = index.ordinals(where)
+        if not ordinals:
+            return
+        with open(path, "rb") as handle:
+            for ordinal in ordinals:
+                handle.seek(index.offsets[ordinal])
+                try:
+                    record = json.loads(handle.read(index.lengths[ordinal]))
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+
+_STORES: Dict[Tuple[str, str], JsonlHistoryStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def history_store(path: str, *, index_fields: IndexFields, index_version: str) -> JsonlHistoryStore:
+    key = (os.path.normpath(path), index_version)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = JsonlHistoryStore(key[0], index_fields=index_fields, index_version=index_version)
+            _STORES[key] = store
+        return store
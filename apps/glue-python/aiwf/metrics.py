@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+BYTES_BUCKETS = tuple(float(1024 * 4**power) for power in range(10))  # 1 KiB .. 256 MiB
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def metrics_enabled() -> bool:
+    return str(os.getenv("AIWF_METRICS_ENABLED") or "true").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+    rendered = ",".join(f'{key}="{_escape_label(str(val))}"' for key, val in labels.items())
+    return f"{name}{{{rendered}}} {_format_value(value)}"
+
+
+class _HistogramChild:
+    __slots__ = ("lock", "counts", "total", "count")
+
+    def __init__(self, size: int) -> None:
+        self.lock = threading.Lock()
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+
+class Histogram:
+    """A labelled Prometheus histogram.
+
+    `observe` does one bisect and three additions under a per-label-set lock,
+    so it is cheap enough for per-call recording on hot paths.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DURATION_BUCKETS) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets))
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], _HistogramChild] = {}
+
+    def _child(self, labelvalues: Tuple[str, ...]) -> _HistogramChild:
+        child = self._children.get(labelvalues)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(labelvalues, _HistogramChild(len(self.buckets) + 1))
+        return child
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        child = self._child(labelvalues)
+        # Buckets are cumulative on output; here each observation lands in exactly one slot.
+        slot = bisect_left(self.buckets, value)
+        with child.lock:
+            child.counts[slot] += 1
+            child.total += value
+            child.count += 1
+
+    @contextmanager
+    def time(self, *labelvalues: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labelvalues)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            children = list(self._children.items())
+        out: List[Sample] = []
+        for labelvalues, child in sorted(children):
+            labels = dict(zip(self.labelnames, labelvalues))
+            with child.lock:
+                counts, total, count = list(child.counts), child.total, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                out.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, float(cumulative)))
+            out.append((f"{self.name}_sum", labels, total))
+            out.append((f"{self.name}_count", labels, float(count)))
+        return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+
+class _ScalarMetric:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, *labelvalues: str) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [(self.name, dict(zip(self.labelnames, labelvalues)), value) for labelvalues, value in values]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_ScalarMetric):
+    kind = "counter"
+
+
+class Gauge(_ScalarMetric):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, *labelvalues: str) -> None:
+        self.inc(-amount, *labelvalues)
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        with self._lock:
+            self._values[labelvalues] = float(value)
+
+
+class CollectorMetric:
+    """A metric whose samples are read from existing subsystem stats at scrape time."""
+
+    def __init__(self, name: str, documentation: str, kind: str, collect: Callable[[], List[Tuple[Dict[str, str], float]]]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self._collect = collect
+
+    def samples(self) -> List[Sample]:
+        try:
+            return [(self.name, labels, float(value)) for labels, value in self._collect()]
+        except Exception:
+            return []
+
+    def reset(self) -> None:
+        pass
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Any] = {}
+
+    def register(self, metric: Any) -> Any:
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(_format_sample(name, labels, value) for name, labels, value in metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.register(
+    Histogram("aiwf_glue_http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route", "status"))
+)
+FLOW_SECONDS = REGISTRY.register(
+    Histogram("aiwf_glue_flow_duration_seconds", "End-to-end flow run duration.", ("flow", "outcome"))
+)
+FLOW_STAGE_SECONDS = REGISTRY.register(
+    Histogram("aiwf_glue_flow_stage_duration_seconds", "Duration of one flow stage.", ("flow", "stage", "outcome"))
+)
+OPERATOR_CALL_SECONDS = REGISTRY.register(
+    Histogram("aiwf_glue_operator_call_duration_seconds", "Accel/Rust sidecar call latency by endpoint.", ("endpoint", "outcome"))
+)
+OPERATOR_REQUEST_BYTES = REGISTRY.register(
+    Histogram("aiwf_glue_operator_request_bytes", "Accel/Rust sidecar request body size.", ("endpoint",), BYTES_BUCKETS)
+)
+OPERATOR_RESPONSE_BYTES = REGISTRY.register(
+    Histogram("aiwf_glue_operator_response_bytes", "Accel/Rust sidecar response body size.", ("endpoint",), BYTES_BUCKETS)
+)
+FLOW_RESULT_CACHE_TOTAL = REGISTRY.register(
+    Counter("aiwf_glue_flow_result_cache_total", "Flow result cache lookups by result.", ("flow", "result"))
+)
+JOBS_IN_FLIGHT = REGISTRY.register(Gauge("aiwf_glue_jobs_in_flight", "Flow runs currently executing.", ("flow",)))
+
+
+def observe_http_request(method: str, route: str, status: int, seconds: float) -> None:
+    if metrics_enabled():
+        HTTP_REQUEST_SECONDS.observe(seconds, method, route, f"{int(status) // 100}xx")
+
+
+def observe_operator_call(endpoint: str, seconds: float, *, outcome: str, request_bytes: int = 0, response_bytes: int = 0) -> None:
+    if not metrics_enabled():
+        return
+    OPERATOR_CALL_SECONDS.observe(seconds, endpoint, outcome)
+    if request_bytes:
+        OPERATOR_REQUEST_BYTES.observe(float(request_bytes), endpoint)
+    if response_bytes:
+        OPERATOR_RESPONSE_BYTES.observe(float(response_bytes), endpoint)
+
+
+def observe_operator_response(endpoint: str, started: float, response: Any = None, *, error: bool = False) -> None:
+    """Record a sidecar call from its `requests` response; sizes come from bytes already on hand."""
+    if not metrics_enabled():
+        return
+    seconds = time.perf_counter() - started
+    if response is None:
+        observe_operator_call(endpoint, seconds, outcome="error")
+        return
+    status = getattr(response, "status_code", 0)
+    body = getattr(getattr(response, "request", None), "body", None)
+    content = getattr(response, "content", None)
+    observe_operator_call(
+        endpoint,
+        seconds,
+        outcome="error" if error or (isinstance(status, int) and status >= 400) else "ok",
+        request_bytes=len(body) if isinstance(body, (bytes, str)) else 0,
+        response_bytes=len(content) if isinstance(content, (bytes, str)) else 0,
+    )
+
+
+@contextmanager
+def flow_run(flow: str) -> Iterator[None]:
+    """Time a whole flow run and count it as in flight while it executes."""
+    if not metrics_enabled():
+        yield
+        return
+    JOBS_IN_FLIGHT.inc(1.0, flow)
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        JOBS_IN_FLIGHT.dec(1.0, flow)
+        FLOW_SECONDS.observe(time.perf_counter() - started, flow, outcome)
+
+
+def timed_stage(flow: str, stage: str, fn: Callable[..., Any], *, on_finish: Optional[Callable[[str, float, bool], None]] = None) -> Callable[..., Any]:
+    """Wrap a flow hook so each call records into the per-stage histogram.
+
+    `on_finish(stage, seconds, ok)` lets callers collect the same timings
+    for their own reporting.
+    """
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            seconds = time.perf_counter() - started
+            if metrics_enabled():
+                FLOW_STAGE_SECONDS.observe(seconds, flow, stage, "ok" if ok else "error")
+            if on_finish is not None:
+                on_finish(stage, seconds, ok)
+
+    wrapper.__wrapped__ = fn  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _hits_and_misses(stats: Dict[str, Any], hit_keys: Sequence[str], miss_keys: Sequence[str]) -> Tuple[float, float]:
+    hits = float(sum(int(stats.get(key) or 0) for key in hit_keys))
+    misses = float(sum(int(stats.get(key) or 0) for key in miss_keys))
+    return hits, misses
+
+
+def _cache_stats() -> List[Tuple[str, float, float]]:
+    from aiwf.office_resources import office_resource_cache_stats
+    from aiwf.workflow_validation_client import workflow_validation_cache_stats
+
+    rows: List[Tuple[str, float, float]] = []
+    validation = workflow_validation_cache_stats()
+    rows.append(("workflow_validation", *_hits_and_misses(validation, ("hits", "negative_hits"), ("misses",))))
+    for name, values in sorted(office_resource_cache_stats().items()):
+        rows.append((f"office_{name}", *_hits_and_misses(values, ("hits",), ("misses",))))
+    return rows
+
+
+def _cache_requests() -> List[Tuple[Dict[str, str], float]]:
+    out: List[Tuple[Dict[str, str], float]] = []
+    for cache, hits, misses in _cache_stats():
+        out.append(({"cache": cache, "result": "hit"}, hits))
+        out.append(({"cache": cache, "result": "miss"}, misses))
+    return out
+
+
+def _cache_hit_ratio() -> List[Tuple[Dict[str, str], float]]:
+    return [({"cache": cache}, hits / (hits + misses)) for cache, hits, misses in _cache_stats() if hits + misses > 0]
+
+
+def _callback_outbox_depth() -> List[Tuple[Dict[str, str], float]]:
+    from aiwf.callback_outbox import callback_outbox_stats
+
+    return [({"queue": "base_callback_outbox"}, float(callback_outbox_stats().get("pending") or 0))]
+
+
+REGISTRY.register(CollectorMetric("aiwf_glue_cache_requests_total", "In-process cache lookups by result.", "counter", _cache_requests))
+REGISTRY.register(CollectorMetric("aiwf_glue_cache_hit_ratio", "In-process cache hit ratio since start.", "gauge", _cache_hit_ratio))
+REGISTRY.register(CollectorMetric("aiwf_glue_queue_depth", "Entries waiting in glue-side queues.", "gauge", _callback_outbox_depth))
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
+
+
+def reset_metrics() -> None:
+    REGISTRY.reset()
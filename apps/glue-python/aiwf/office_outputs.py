@@ -38,6 +38,7 @@ def write_fin_xlsx(
     to_decimal,
     build_profile,
     utc_now_str,
+    profile: Optional[Dict[str, Any]] = None,
 ) -> None:
     _write_fin_xlsx_impl(
         xlsx_path,
@@ -47,6 +48,7 @@ def write_fin_xlsx(
         to_decimal=to_decimal,
         build_profile=build_profile,
         utc_now_str=utc_now_str,
+        profile=profile,
     )
 
 
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+_MAX_FONTS = 64
+
+_LOCK = threading.RLock()
+_PRESETS: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_FONT_PATHS: Dict[Tuple[str, ...], Optional[str]] = {}
+_FONTS: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+_STATS: Dict[str, Dict[str, int]] = {
+    "presets": {"hits": 0, "misses": 0, "invalidations": 0},
+    "font_paths": {"hits": 0, "misses": 0},
+    "fonts": {"hits": 0, "misses": 0, "evictions": 0},
+}
+
+
+def _count(cache: str, key: str) -> None:
+    _STATS[cache][key] += 1
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def cached_json_file(path: str, validate: Callable[[Any], bool]) -> Optional[Any]:
+    """Parsed JSON content of `path`, re-read only when its mtime or size changes.
+
+    Returns None when the file is missing, unreadable or rejected by `validate`;
+    that outcome is cached against the same signature. Callers must treat the
+    returned object as read-only.
+    """
+    signature = _file_signature(path)
+    if signature is None:
+        return None
+    with _LOCK:
+        cached = _PRESETS.get(path)
+        if cached is not None and cached[0] == signature:
+            _count("presets", "hits")
+            return cached[1]
+        _count("presets", "misses")
+        if cached is not None:
+            _count("presets", "invalidations")
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            obj = json.load(f)
+    except Exception:
+        obj = None
+    if obj is not None and not validate(obj):
+        obj = None
+    with _LOCK:
+        _PRESETS[path] = (signature, obj)
+    return obj
+
+
+def resolve_font_path(candidates: Sequence[str]) -> Optional[str]:
+    key = tuple(candidates)
+    with _LOCK:
+        if key in _FONT_PATHS:
+            _count("font_paths", "hits")
+            return _FONT_PATHS[key]
+        _count("font_paths", "misses")
+    resolved = next((p for p in key if os.path.isfile(p)), None)
+    with _LOCK:
+        _FONT_PATHS[key] = resolved
+    return resolved
+
+
+def cached_truetype_font(path: str, size: int) -> Any:
+    """Loaded PIL font for (path, size); load failures are not cached."""
+    key = (path, int(size))
+    with _LOCK:
+        font = _FONTS.get(key)
+        if font is not None:
+            _FONTS.move_to_end(key)
+            _count("fonts", "hits")
+            return font
+        _count("fonts", "misses")
+    from PIL import ImageFont  # type: ignore
+
+    font = ImageFont.truetype(path, size=int(size))
+    with _LOCK:
+        _FONTS[key] = font
+        _FONTS.move_to_end(key)
+        while len(_FONTS) > _MAX_FONTS:
+            _FONTS.popitem(last=False)
+            _count("fonts", "evictions")
+    return font
+
+
+def office_resource_cache_stats() -> Dict[str, Any]:
+    with _LOCK:
+        stats = {name: dict(values) for name, values in _STATS.items()}
+        stats["presets"]["entries"] = len(_PRESETS)
+        stats["font_paths"]["entries"] = len(_FONT_PATHS)
+        stats["fonts"]["entries"] = len(_FONTS)
+    return stats
+
+
+def clear_office_resource_caches() -> None:
+    with _LOCK:
+        _PRESETS.clear()
+        _FONT_PATHS.clear()
+        _FONTS.clear()
+        for values in _STATS.values():
+            for key in values:
+                values[key] = 0
@@ -1,10 +1,13 @@
 ﻿from __future__ import annotations
 
+import copy
 import json
 import os
 import platform
 from typing import Any, Dict, List, Optional, Tuple
 
+from aiwf.office_resources import cached_json_file, cached_truetype_font, resolve_font_path
+
 
 def office_lang(params: Optional[Dict[str, Any]] = None) -> str:
     p = params or {}
@@ -34,7 +37,7 @@ def office_layout_file_path() -> str:
     return os.path.normpath(os.path.join(here, "..", "..", "..", "rules", "templates", "office_layouts.json"))
 
 
-def load_theme_presets() -> Dict[str, Dict[str, Dict[str, Any]]]:
+def _theme_presets() -> Dict[str, Dict[str, Dict[str, Any]]]:
     defaults = {
         "zh": {
             "professional": {
@@ -149,20 +152,11 @@ def load_theme_presets() -> Dict[str, Dict[str, Dict[str, Any]]]:
             },
         },
     }
-    cfg_path = office_theme_file_path()
-    if not os.path.isfile(cfg_path):
-        return defaults
-    try:
-        with open(cfg_path, "r", encoding="utf-8-sig") as f:
-            obj = json.load(f)
-        if isinstance(obj, dict) and isinstance(obj.get("zh"), dict) and isinstance(obj.get("en"), dict):
-            return obj  # type: ignore[return-value]
-    except Exception:
-        pass
-    return defaults
+    obj = cached_json_file(office_theme_file_path(), _valid_presets)
+    return obj if obj is not None else defaults
 
 
-def load_layout_presets() -> Dict[str, Dict[str, Dict[str, Any]]]:
+def _layout_presets() -> Dict[str, Dict[str, Dict[str, Any]]]:
     defaults = {
         "zh": {
             "default": {"docx_max_table_rows": 20, "pptx_max_items": 6},
@@ -173,33 +167,33 @@ def load_layout_presets() -> Dict[str, Dict[str, Dict[str, Any]]]:
             "assignment": {"docx_max_table_rows": 24, "pptx_max_items": 8},
         },
     }
-    cfg_path = office_layout_file_path()
-    if not os.path.isfile(cfg_path):
-        return defaults
-    try:
-        with open(cfg_path, "r", encoding="utf-8-sig") as f:
-            obj = json.load(f)
-        if isinstance(obj, dict) and isinstance(obj.get("zh"), dict) and isinstance(obj.get("en"), dict):
-            return obj  # type: ignore[return-value]
-    except Exception:
-        pass
-    return defaults
+    obj = cached_json_file(office_layout_file_path(), _valid_presets)
+    return obj if obj is not None else defaults
+
+
+def load_theme_presets() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    return copy.deepcopy(_theme_presets())
+
+
+def load_layout_presets() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    return copy.deepcopy(_layout_presets())
 
 
 def office_font_name(params: Optional[Dict[str, Any]] = None) -> str:
     return "Microsoft YaHei" if office_lang(params) == "zh" else "Calibri"
 
 
+def _valid_presets(obj: Any) -> bool:
+    return isinstance(obj, dict) and isinstance(obj.get("zh"), dict) and isinstance(obj.get("en"), dict)
+
+
 def _find_font_file(candidates: List[str]) -> Optional[str]:
-    for p in candidates:
-        if os.path.isfile(p):
-            return p
-    return None
+    return resolve_font_path(candidates)
 
 
 def pil_font(size: int, params: Optional[Dict[str, Any]] = None, bold: bool = False) -> Any:
     try:
-        from PIL import ImageFont  # type: ignore
+        from PIL import ImageFont  # type: ignore  # noqa: F401
     except Exception:
         return None
     sys_name = platform.system().lower()
@@ -241,7 +235,7 @@ def pil_font(size: int, params: Optional[Dict[str, Any]] = None, bold: bool = Fa
     font_path = _find_font_file(cands)
     if font_path:
         try:
-            return ImageFont.truetype(font_path, size=size)
+            return cached_truetype_font(font_path, size)
         except Exception:
             return None
     return None
@@ -348,7 +342,7 @@ def office_theme_settings(params: Optional[Dict[str, Any]] = None) -> Dict[str,
     p = params or {}
     lang = office_lang(p)
     theme = str(p.get("office_theme") or "professional").strip().lower()
-    presets = load_theme_presets()
+    presets = _theme_presets()
     lang_map = presets.get(lang) if isinstance(presets.get(lang), dict) else {}
     prof = lang_map.get("professional") if isinstance(lang_map.get("professional"), dict) else {}
     cfg = (lang_map.get(theme) if isinstance(lang_map.get(theme), dict) else prof).copy()
@@ -372,7 +366,7 @@ def office_layout_settings(params: Optional[Dict[str, Any]] = None) -> Dict[str,
     p = params or {}
     lang = office_lang(p)
     theme = str(p.get("office_theme") or "professional").strip().lower()
-    presets = load_layout_presets()
+    presets = _layout_presets()
     lang_map = presets.get(lang) if isinstance(presets.get(lang), dict) else {}
     base = lang_map.get("default") if isinstance(lang_map.get("default"), dict) else {}
     ext = lang_map.get(theme) if isinstance(lang_map.get(theme), dict) else {}
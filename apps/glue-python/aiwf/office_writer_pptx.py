@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from typing import Any, Dict, Optional
 
+from aiwf.artifact_io import open_artifact_output
 from aiwf.office_style import (
     add_picture_fit,
     hex_to_rgb,
@@ -167,6 +168,7 @@ def write_deck_pptx(
             except Exception:
                 pass
 
-        prs.save(pptx_path)
+        with open_artifact_output(pptx_path, "wb") as handle:
+            prs.save(handle)
     except Exception as exc:
         raise RuntimeError("python-pptx unavailable; cannot generate deck.pptx") from exc
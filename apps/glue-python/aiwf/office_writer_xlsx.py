@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from aiwf.artifact_io import open_artifact_output
 from aiwf.office_style import (
     office_font_name,
     office_is_high_quality,
@@ -13,6 +14,123 @@ from aiwf.office_style import (
 )
 
 
+NUMERIC_COLUMN_NAMES = {"amount", "sum", "min", "max", "avg"}
+NUMERIC_FORMAT = "#,##0.00"
+NUMERIC_SAMPLE_ROWS = 100
+WIDTH_SAMPLE_ROWS = 500
+MAX_COLUMN_WIDTH = 48
+
+
+def _detail_columns(rows: List[Dict[str, Any]]) -> List[str]:
+    if not rows:
+        return ["id", "amount"]
+    columns = list(rows[0].keys())
+    seen = set(columns)
+    for row in rows[1:]:
+        for key in row.keys():
+            if key not in seen:
+                columns.append(key)
+                seen.add(key)
+    return columns
+
+
+def _numeric_columns(columns: List[str], rows: List[Dict[str, Any]], *, to_decimal) -> set[str]:
+    numeric = set()
+    sample = rows[:NUMERIC_SAMPLE_ROWS]
+    for column in columns:
+        if column.lower() in NUMERIC_COLUMN_NAMES:
+            numeric.add(column)
+            continue
+        for row in sample:
+            if to_decimal(row.get(column)) is not None:
+                numeric.add(column)
+                break
+    return numeric
+
+
+def _column_widths(columns: List[str], rows: List[Dict[str, Any]]) -> List[int]:
+    widths = []
+    sample = rows[:WIDTH_SAMPLE_ROWS]
+    for column in columns:
+        max_len = len(str(column))
+        for row in sample:
+            value = row.get(column)
+            max_len = max(max_len, len(str(value if value is not None else "")))
+        widths.append(min(max_len + 2, MAX_COLUMN_WIDTH))
+    return widths
+
+
+class _XlsxStyles:
+    """Named styles shared by every cell of the workbook.
+
+    Cells reference a registered NamedStyle by name instead of carrying their
+    own Font/Alignment/PatternFill objects, which keeps write-only exports flat
+    in memory regardless of row count.
+    """
+
+    def __init__(self, workbook: Any, worksheet: Any, params: Optional[Dict[str, Any]]) -> None:
+        from openpyxl.cell import WriteOnlyCell  # type: ignore
+        from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill  # type: ignore
+
+        theme = office_theme_settings(params)
+        primary_hex = str(theme.get("primary_hex", "1F4E78"))
+        font_name = office_font_name(params)
+        header_fill = PatternFill(fill_type="solid", fgColor=primary_hex)
+        alt_fill = PatternFill(fill_type="solid", fgColor="F4F7FB")
+        header_font = Font(name=font_name, color="FFFFFF", bold=True)
+        body_font = Font(name=font_name)
+        center = Alignment(horizontal="center", vertical="center")
+        left = Alignment(horizontal="left", vertical="center")
+
+        definitions = {
+            "aiwf_title": NamedStyle(
+                name="aiwf_title",
+                font=Font(name=font_name, bold=True, color=primary_hex, size=14),
+                alignment=left,
+            ),
+            "aiwf_header": NamedStyle(name="aiwf_header", font=header_font, fill=header_fill, alignment=center),
+            "aiwf_body": NamedStyle(name="aiwf_body", font=body_font, alignment=left),
+            "aiwf_body_alt": NamedStyle(name="aiwf_body_alt", font=body_font, fill=alt_fill, alignment=left),
+            "aiwf_number": NamedStyle(
+                name="aiwf_number", font=body_font, alignment=left, number_format=NUMERIC_FORMAT
+            ),
+            "aiwf_number_alt": NamedStyle(
+                name="aiwf_number_alt",
+                font=body_font,
+                fill=alt_fill,
+                alignment=left,
+                number_format=NUMERIC_FORMAT,
+            ),
+        }
+        self._cell_type = WriteOnlyCell
+        self._worksheet = worksheet
+        for style in definitions.values():
+            workbook.add_named_style(style)
+
+    def cell(self, value: Any, style: str) -> Any:
+        cell = self._cell_type(self._worksheet, value=value)
+        cell.style = style
+        return cell
+
+
+def _detail_rows(
+    rows: Iterable[Dict[str, Any]],
+    columns: List[str],
+    styles: _XlsxStyles,
+    *,
+    numeric_columns: set[str],
+    high_quality: bool,
+    first_row: int,
+) -> Iterator[List[Any]]:
+    plain = [("aiwf_number" if column in numeric_columns else "aiwf_body") for column in columns]
+    alternate = [
+        ("aiwf_number_alt" if column in numeric_columns else "aiwf_body_alt") for column in columns
+    ]
+    for row_idx, row in enumerate(rows, start=first_row):
+        names = alternate if high_quality and row_idx % 2 == 1 else plain
+        yield [styles.cell(row.get(column), name) for column, name in zip(columns, names)]
+
+
 def write_fin_xlsx(
     xlsx_path: str,
     rows: List[Dict[str, Any]],
@@ -22,92 +140,67 @@ def write_fin_xlsx(
     to_decimal,
     build_profile,
     utc_now_str,
+    profile: Optional[Dict[str, Any]] = None,
 ) -> None:
     from openpyxl import Workbook  # type: ignore
-    from openpyxl.styles import Alignment, Font, PatternFill  # type: ignore
     from openpyxl.utils import get_column_letter  # type: ignore
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "detail"
-    if rows:
-        columns = list(rows[0].keys())
-        seen = set(columns)
-        for row in rows[1:]:
-            for key in row.keys():
-                if key not in seen:
-                    columns.append(key)
-                    seen.add(key)
-    else:
-        columns = ["id", "amount"]
-
+    columns = _detail_columns(rows)
     theme = office_theme_settings(params)
     layout = office_layout_settings(params)
     high_quality = office_is_high_quality(params)
-    font_name = office_font_name(params)
-    header_fill = PatternFill(fill_type="solid", fgColor=str(theme.get("primary_hex", "1F4E78")))
-    alt_fill = PatternFill(fill_type="solid", fgColor="F4F7FB")
-    header_font = Font(name=font_name, color="FFFFFF", bold=True)
-    body_font = Font(name=font_name)
-    title_font = Font(name=font_name, bold=True, color=str(theme.get("primary_hex", "1F4E78")), size=14)
-    center = Alignment(horizontal="center", vertical="center")
-    left = Alignment(horizontal="left", vertical="center")
-
-    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=max(2, len(columns)))
-    ws.cell(row=1, column=1, value=str(theme.get("report_title"))).font = title_font
-    ws.cell(row=1, column=1).alignment = left
-    ws.row_dimensions[1].height = 24
 
-    header_row = 2
-    for col_idx, column in enumerate(columns, start=1):
-        cell = ws.cell(row=header_row, column=col_idx, value=column)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = center
-    for row_idx, row in enumerate(rows, start=header_row + 1):
-        for col_idx, column in enumerate(columns, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=row.get(column))
-            cell.font = body_font
-            cell.alignment = left
-            if high_quality and row_idx % 2 == 1:
-                cell.fill = alt_fill
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("detail")
+    styles = _XlsxStyles(wb, ws, params)
 
+    # Write-only sheets need every dimension, merge and filter declared before
+    # the first row is streamed out.
+    header_row = 2
+    last_column = get_column_letter(max(2, len(columns)))
+    ws.merged_cells.add(f"A1:{last_column}1")
+    ws.row_dimensions[1].height = 24
+    for col_idx, width in enumerate(_column_widths(columns, rows), start=1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
     ws.freeze_panes = "A3"
     if columns:
         ws.auto_filter.ref = (
             f"A{header_row}:{get_column_letter(len(columns))}{max(header_row + 1, len(rows) + header_row)}"
         )
 
-    numeric_fields = []
-    for column in columns:
-        if column.lower() in {"amount", "sum", "min", "max", "avg"}:
-            numeric_fields.append(column)
-            continue
-        for row in rows[:100]:
-            if to_decimal(row.get(column)) is not None:
-                numeric_fields.append(column)
-                break
-    for column in numeric_fields:
-        col_idx = columns.index(column) + 1
-        for row_idx in range(header_row + 1, len(rows) + header_row + 1):
-            ws.cell(row=row_idx, column=col_idx).number_format = "#,##0.00"
-
-    for col_idx, column in enumerate(columns, start=1):
-        max_len = len(str(column))
-        for row in rows[:500]:
-            max_len = max(max_len, len(str(row.get(column) if row.get(column) is not None else "")))
-        ws.column_dimensions[get_column_letter(col_idx)].width = min(max_len + 2, 48)
+    ws.append([styles.cell(str(theme.get("report_title")), "aiwf_title")])
+    ws.append([styles.cell(column, "aiwf_header") for column in columns])
+    for cells in _detail_rows(
+        rows,
+        columns,
+        styles,
+        numeric_columns=_numeric_columns(columns, rows, to_decimal=to_decimal),
+        high_quality=high_quality,
+        first_row=header_row + 1,
+    ):
+        ws.append(cells)
 
-    profile_like = build_profile(rows, {"input_rows": len(rows), "output_rows": len(rows)}, "xlsx.export")
+    profile_like = (
+        profile
+        if isinstance(profile, dict)
+        else build_profile(rows, {"input_rows": len(rows), "output_rows": len(rows)}, "xlsx.export")
+    )
     summary = wb.create_sheet("summary")
-    summary["A1"] = office_text("指标", "Metric", params)
-    summary["B1"] = office_text("数值", "Value", params)
-    summary["A1"].fill = header_fill
-    summary["B1"].fill = header_fill
-    summary["A1"].font = header_font
-    summary["B1"].font = header_font
-    summary["A1"].alignment = center
-    summary["B1"].alignment = center
+    summary.column_dimensions["A"].width = 24
+    summary.column_dimensions["B"].width = 28
+    if image_path and os.path.isfile(image_path):
+        try:
+            from openpyxl.drawing.image import Image as XLImage  # type: ignore
+
+            summary.add_image(XLImage(image_path), "D2")
+        except Exception:
+            pass
+    summary.append(
+        [
+            styles.cell(office_text("指标", "Metric", params), "aiwf_header"),
+            styles.cell(office_text("数值", "Value", params), "aiwf_header"),
+        ]
+    )
     metrics = [
         (office_text("主题", "Theme", params), theme.get("display_name", theme.get("name"))),
         (office_text("质量模式", "Quality Mode", params), office_quality_mode(params)),
@@ -120,24 +213,9 @@ def write_fin_xlsx(
         (office_text("生成时间", "Generated At", params), utc_now_str()),
     ]
     for i, (key, value) in enumerate(metrics, start=2):
-        left_cell = summary.cell(row=i, column=1, value=key)
-        right_cell = summary.cell(row=i, column=2, value=value)
-        left_cell.font = body_font
-        right_cell.font = body_font
-        left_cell.alignment = left
-        right_cell.alignment = left
-        if high_quality and i % 2 == 0:
-            left_cell.fill = alt_fill
-            right_cell.fill = alt_fill
-    summary.column_dimensions["A"].width = 24
-    summary.column_dimensions["B"].width = 28
-    if image_path and os.path.isfile(image_path):
-        try:
-            from openpyxl.drawing.image import Image as XLImage  # type: ignore
-
-            summary.add_image(XLImage(image_path), "D2")
-        except Exception:
-            pass
+        name = "aiwf_body_alt" if high_quality and i % 2 == 0 else "aiwf_body"
+        summary.append([styles.cell(key, name), styles.cell(value, name)])
 
     _ = layout
-    wb.save(xlsx_path)
+    with open_artifact_output(xlsx_path, "wb") as handle:
+        wb.save(handle)
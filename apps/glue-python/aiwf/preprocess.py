@@ -53,6 +53,7 @@ from aiwf.preprocess_validation import (
     validate_preprocess_pipeline_impl,
     validate_preprocess_spec_impl,
 )
+from aiwf.stage_profile import StageProfile, file_size, row_count
 
 
 from aiwf.preprocess_registry import (
@@ -379,6 +380,25 @@ def _preprocess_stage_plan(
     }
 
 
+def _operator_row_sizes(rows_key: str) -> Callable[[Tuple[Any, ...], Dict[str, Any], Any], Dict[str, Any]]:
+    def sizes(_args: Tuple[Any, ...], kwargs: Dict[str, Any], result: Any) -> Dict[str, Any]:
+        return {"rows_in": row_count(kwargs.get(rows_key)), "rows_out": row_count(result.get("rows"))}
+
+    return sizes
+
+
+def _python_preprocess_sizes(args: Tuple[Any, ...], _kwargs: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    return {"rows_in": row_count(args[0]), "rows_out": row_count(result[0])}
+
+
+def _read_rows_sizes(_args: Tuple[Any, ...], _kwargs: Dict[str, Any], result: Any) -> Dict[str, Any]:
+    return {"rows_out": row_count(result[0])}
+
+
+def _write_rows_sizes(args: Tuple[Any, ...], _kwargs: Dict[str, Any], _result: Any) -> Dict[str, Any]:
+    return {"rows_in": row_count(args[1]), "bytes_serialized": file_size(args[0])}
+
+
 def _preprocess_quality_check_rules(compiled_spec: Dict[str, Any]) -> Dict[str, Any]:
     quality = compiled_spec.get("quality") if isinstance(compiled_spec.get("quality"), dict) else {}
     schema = compiled_spec.get("schema") if isinstance(compiled_spec.get("schema"), dict) else {}
@@ -421,6 +441,7 @@ def run_preprocess_pipeline(
 def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     compiled_spec = compile_preprocess_spec_to_spec(spec)
     capability_report = _preprocess_rust_v2_capability_report(spec, compiled_spec)
+    stage_profile = StageProfile(scope="preprocess")
     rust_v2_error = ""
     if capability_report["eligible"]:
         rules, quality_gates, schema_hint = cleaning_spec_to_transform_components(
@@ -428,7 +449,10 @@ def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[L
             input_rows=rows,
         )
         postprocess_stages = list(capability_report.get("postprocess_stages") or [])
-        rust_v3 = transform_rows_v3_operator(
+        rust_v3 = stage_profile.measure(
+            "row_transform",
+            transform_rows_v3_operator,
+            sizer=_operator_row_sizes("raw_rows"),
             raw_rows=rows,
             params=spec,
             rules=rules,
@@ -466,7 +490,10 @@ def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[L
                     "conflict_negative_words": [str(item) for item in (spec.get("conflict_negative_words") or [])],
                     "schema_hint": {"schema_version": CLEANING_SPEC_V2_VERSION, "source": "glue-python.preprocess.postprocess"},
                 }
-                postprocess_result = postprocess_rows_v1_operator(
+                postprocess_result = stage_profile.measure(
+                    "postprocess",
+                    postprocess_rows_v1_operator,
+                    sizer=_operator_row_sizes("rows"),
                     rows=transform_rows,
                     params=spec,
                     payload=postprocess_payload,
@@ -495,7 +522,10 @@ def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[L
                     "duplicate_key_ratio": transform_quality.get("duplicate_key_ratio"),
                     "blank_row_ratio": transform_quality.get("blank_row_ratio"),
                 }
-                quality_check = quality_check_v2_operator(
+                quality_check = stage_profile.measure(
+                    "quality_check",
+                    quality_check_v2_operator,
+                    sizer=_operator_row_sizes("rows"),
                     rows=final_rows,
                     params=spec,
                     rules=quality_check_rules,
@@ -523,11 +553,13 @@ def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[L
                         raise RuntimeError(message)
 
             if not rust_v2_error:
-                stage_provenance = _preprocess_stage_provenance(
-                    row_transform_engine=row_transform_engine,
-                    postprocess_engine=postprocess_engine,
-                    quality_gate_engine=quality_gate_engine,
-                    postprocess_stages=postprocess_stages,
+                stage_provenance = stage_profile.merge_into(
+                    _preprocess_stage_provenance(
+                        row_transform_engine=row_transform_engine,
+                        postprocess_engine=postprocess_engine,
+                        quality_gate_engine=quality_gate_engine,
+                        postprocess_stages=postprocess_stages,
+                    )
                 )
                 execution_audit["stage_provenance"] = stage_provenance
                 execution_audit["stage_plan"] = _preprocess_stage_plan(
@@ -560,7 +592,9 @@ def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[L
             "eligibility_reason": "rust_v3_error",
         }
 
-    rows_out, summary = preprocess_rows_impl(
+    rows_out, summary = stage_profile.measure(
+        "row_transform",
+        preprocess_rows_impl,
         rows,
         spec,
         normalize_header=_normalize_header,
@@ -571,6 +605,7 @@ def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[L
         chunk_text=_chunk_text,
         to_canonical_evidence_row=_to_canonical_evidence_row,
         apply_conflict_detection=_apply_conflict_detection,
+        sizer=_python_preprocess_sizes,
     )
     summary.update(
         _preprocess_execution_report(
@@ -589,11 +624,13 @@ def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[L
             row_transform_engine="python",
             postprocess_engine="python" if capability_report.get("postprocess_required") else "none",
             quality_gate_engine="none",
-            stage_provenance=_preprocess_stage_provenance(
-                row_transform_engine="python",
-                postprocess_engine="python" if capability_report.get("postprocess_required") else "none",
-                quality_gate_engine="none",
-                postprocess_stages=list(capability_report.get("postprocess_stages") or []),
+            stage_provenance=stage_profile.merge_into(
+                _preprocess_stage_provenance(
+                    row_transform_engine="python",
+                    postprocess_engine="python" if capability_report.get("postprocess_required") else "none",
+                    quality_gate_engine="none",
+                    postprocess_stages=list(capability_report.get("postprocess_stages") or []),
+                )
             ),
         )
     )
@@ -608,13 +645,14 @@ def preprocess_rows(rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Tuple[L
 
 def preprocess_file(input_path: str, output_path: str, spec: Dict[str, Any]) -> Dict[str, Any]:
     compiled_spec = compile_preprocess_spec_to_spec(spec)
+    stage_profile = StageProfile(scope="preprocess")
     result = preprocess_file_impl(
         input_path,
         output_path,
         spec,
-        read_rows=_read_rows,
+        read_rows=stage_profile.wrap("read", _read_rows, sizer=_read_rows_sizes),
         preprocess_rows=preprocess_rows,
-        write_rows=_write_rows,
+        write_rows=stage_profile.wrap("materialize", _write_rows, sizer=_write_rows_sizes),
         build_quality_report=_build_quality_report,
         write_json=_write_json,
         export_canonical_bundle=export_canonical_bundle,
@@ -622,6 +660,11 @@ def preprocess_file(input_path: str, output_path: str, spec: Dict[str, Any]) ->
     result["cleaning_spec_version"] = CLEANING_SPEC_V2_VERSION
     result["cleaning_spec"] = compiled_spec
     summary = result.get("summary") if isinstance(result.get("summary"), dict) else {}
+    if isinstance(summary.get("stage_provenance"), list):
+        summary["stage_provenance"] = stage_profile.merge_into(summary["stage_provenance"])
+    audit = summary.get("execution_audit")
+    if isinstance(audit, dict) and isinstance(audit.get("stage_provenance"), list):
+        audit["stage_provenance"] = stage_profile.merge_into(audit["stage_provenance"])
     result["execution_mode"] = str(summary.get("execution_mode") or "")
     result["execution_audit"] = dict(summary.get("execution_audit") or {})
     result["eligibility_reason"] = str(summary.get("eligibility_reason") or "")
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiwf.artifact_io import artifact_digest
+from aiwf.paths import resolve_bus_root
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def document_backend_cache_root() -> str:
+    override = str(os.getenv("AIWF_DOCUMENT_BACKEND_CACHE_DIR") or "").strip()
+    if override:
+        return os.path.normpath(override)
+    return os.path.join(resolve_bus_root(), "cache", "document_backends")
+
+
+class DocumentBackendCache:
+    """Successful backend responses keyed by source file sha256 under one backend version."""
+
+    def __init__(self, root: str, backend: str, version: str) -> None:
+        self.backend = backend
+        self.version = version
+        version_key = hashlib.sha256(version.encode("utf-8")).hexdigest()[:16]
+        self.root = os.path.join(root, backend, version_key)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}.json")
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(digest), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != self.version or not isinstance(entry.get("result"), dict):
+            return None
+        return entry["result"]
+
+    def put(self, digest: str, result: Dict[str, Any]) -> None:
+        path = self._path(digest)
+        entry = {"backend": self.backend, "version": self.version, "sha256": digest, "result": result}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+
+def _source_digest(path: str) -> Optional[str]:
+    try:
+        return artifact_digest(path).sha256
+    except OSError:
+        return None
+
+
+def run_document_backend(
+    source_paths: List[str],
+    submit: Callable[[str], Dict[str, Any]],
+    *,
+    poll: Optional[Callable[[Dict[str, Dict[str, Any]]], Dict[str, Dict[str, Any]]]] = None,
+    cache: Optional[DocumentBackendCache] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """Run one backend over distinct source files and return (results by path, stats).
+
+    `submit` is called concurrently, once per distinct file content. Results
+    flagged `pending` are handed to `poll` together, keyed by source path.
+    Successful results are cached by file hash; files that cannot be hashed
+    are always submitted.
+    """
+    workers = max(1, int(max_concurrency))
+    stats = {"cache_hits": 0, "submitted": 0, "polled": 0, "failed": 0}
+    results: Dict[str, Dict[str, Any]] = {}
+    if not source_paths:
+        return results, stats
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(source_paths)), thread_name_prefix="aiwf-doc-backend") as pool:
+        digests = dict(zip(source_paths, pool.map(_source_digest, source_paths))) if cache is not None else {}
+        leaders: Dict[str, str] = {}
+        followers: Dict[str, List[str]] = {}
+        to_submit: List[str] = []
+        for path in source_paths:
+            digest = digests.get(path)
+            if digest is None:
+                to_submit.append(path)
+                continue
+            if digest in leaders:
+                followers.setdefault(leaders[digest], []).append(path)
+                continue
+            cached = cache.get(digest) if cache is not None else None
+            if cached is not None:
+                results[path] = cached
+                stats["cache_hits"] += 1
+                leaders[digest] = path
+                continue
+            leaders[digest] = path
+            to_submit.append(path)
+
+        stats["submitted"] = len(to_submit)
+        submitted = dict(zip(to_submit, pool.map(_safe_call(submit), to_submit)))
+
+    pending = {path: result for path, result in submitted.items() if result.get("pending")}
+    if pending:
+        stats["polled"] = len(pending)
+        if poll is None:
+            polled = {path: {"ok": False, "error": "backend returned a pending operation without a poller"} for path in pending}
+        else:
+            polled = poll(pending)
+        for path in pending:
+            submitted[path] = polled.get(path) or {"ok": False, "error": "backend operation result missing"}
+
+    for path, result in submitted.items():
+        results[path] = result
+        if not result.get("ok"):
+            stats["failed"] += 1
+            continue
+        digest = digests.get(path)
+        if cache is not None and digest is not None:
+            cache.put(digest, result)
+    for leader, paths in followers.items():
+        for path in paths:
+            results[path] = results[leader]
+    return results, stats
+
+
+def _safe_call(fn: Callable[[str], Dict[str, Any]]) -> Callable[[str], Dict[str, Any]]:
+    def _call(path: str) -> Dict[str, Any]:
+        try:
+            result = fn(path)
+        except Exception as exc:
+            return {"ok": False, "error": str(exc)}
+        return result if isinstance(result, dict) else {"ok": False, "error": "backend returned non-object"}
+
+    return _call
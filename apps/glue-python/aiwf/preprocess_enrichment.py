@@ -5,16 +5,37 @@ import importlib.util
 import hashlib
 import os
 import re
+import time
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import unquote, urlparse, urlunparse
 from xml.etree import ElementTree
 
 import requests
 
+from aiwf.preprocess_document_backends import (
+    DEFAULT_MAX_CONCURRENCY,
+    DocumentBackendCache,
+    document_backend_cache_root,
+    run_document_backend,
+)
+from aiwf.preprocess_url_metadata import (
+    DEFAULT_CACHE_TTL_SECONDS,
+    DEFAULT_DOMAIN_INTERVAL_SECONDS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_NEGATIVE_CACHE_TTL_SECONDS,
+    UrlMetadataCache,
+    fetch_url_metadata_batch,
+    url_metadata_cache_root,
+)
 
 _CONTROL_CHAR_RE = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_CLAIM_KEY_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_CLAIM_KEY_BRACKET_RE = re.compile(r"\[[^\]]{1,40}\]")
+_CLAIM_KEY_PUNCT_RE = re.compile(r"[^0-9a-z\u4e00-\u9fff\s]+")
 _URL_RE = re.compile(r"https?://\S+|www\.\S+", flags=re.I)
 _CJK_RADICAL_SUPPLEMENT_MAP = str.maketrans(
     {
@@ -58,6 +79,11 @@ _STRUCTURAL_ROLES = {"metadata", "section"}
 _NON_CLAIM_ROLES = {"quote", "evidence", "citation", "moderation", "question", "metadata", "section"}
 _AZURE_FILE_SUFFIXES = {".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".docx"}
 _GROBID_FILE_SUFFIXES = {".pdf", ".docx"}
+_GROBID_REQUEST_PROFILE = "processFulltextDocument;includeRawCitations=1;consolidateCitations=0;consolidateHeader=0"
+_AZURE_LAYOUT_MODEL = "prebuilt-layout"
+_AZURE_LAYOUT_API_VERSION = "2024-11-30"
+_AZURE_POLL_INTERVAL_SECONDS = 1.0
+_AZURE_PENDING_STATUSES = {"notstarted", "running"}
 _REFERENCE_SECTION_RE = re.compile(
     r"^(?:references?|bibliography|works cited|footnotes?|endnotes?|sources?|citations?|"
     r"\u53c2\u8003\u6587\u732e|\u53c2\u8003\u8d44\u6599|\u5f15\u7528|\u811a\u6ce8|\u5c3e\u6ce8|"
@@ -193,7 +219,7 @@ def _normalize_text(value: Any) -> str:
 
 
 def _collapse_ws(value: Any) -> str:
-    return re.sub(r"\s+", " ", _normalize_text(value)).strip()
+    return _WHITESPACE_RE.sub(" ", _normalize_text(value)).strip()
 
 
 def _looks_source_list_marker_only(value: Any) -> bool:
@@ -462,6 +488,35 @@ def _url_metadata_enabled(spec: Dict[str, Any], rows: List[Dict[str, Any]]) -> b
     return _profile_name(spec) == "debate_evidence"
 
 
+def _spec_number(spec: Dict[str, Any], key: str, default: float, minimum: float) -> float:
+    try:
+        value = float(spec.get(key, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value >= minimum else default
+
+
+def _url_metadata_fetch_options(spec: Dict[str, Any]) -> Dict[str, Any]:
+    cache: Optional[UrlMetadataCache] = None
+    if bool(spec.get("url_metadata_cache", True)):
+        cache = UrlMetadataCache(
+            url_metadata_cache_root(),
+            ttl_seconds=_spec_number(spec, "url_metadata_cache_ttl_hours", DEFAULT_CACHE_TTL_SECONDS / 3600, 0) * 3600,
+            negative_ttl_seconds=_spec_number(
+                spec, "url_metadata_negative_cache_ttl_minutes", DEFAULT_NEGATIVE_CACHE_TTL_SECONDS / 60, 0
+            )
+            * 60,
+        )
+    return {
+        "cache": cache,
+        "max_workers": int(_spec_number(spec, "url_metadata_max_workers", DEFAULT_MAX_WORKERS, 1)),
+        "domain_interval_seconds": _spec_number(
+            spec, "url_metadata_domain_interval_ms", DEFAULT_DOMAIN_INTERVAL_SECONDS * 1000, 0
+        )
+        / 1000,
+    }
+
+
 def _looks_citation_entry_text(text: Any) -> bool:
     normalized = _collapse_ws(text)
     if not normalized:
@@ -510,10 +565,10 @@ def _extract_source_attribution_signature(text: Any) -> Dict[str, str]:
 
 def _normalize_claim_key(text: Any) -> str:
     value = str(text or "").lower()
-    value = re.sub(r"https?://\S+|www\.\S+", " ", value)
-    value = re.sub(r"\[[^\]]{1,40}\]", " ", value)
-    value = re.sub(r"[^0-9a-z\u4e00-\u9fff\s]+", " ", value)
-    value = re.sub(r"\s+", " ", value).strip()
+    value = _CLAIM_KEY_URL_RE.sub(" ", value)
+    value = _CLAIM_KEY_BRACKET_RE.sub(" ", value)
+    value = _CLAIM_KEY_PUNCT_RE.sub(" ", value)
+    value = _WHITESPACE_RE.sub(" ", value).strip()
     return value
 
 
@@ -732,12 +787,7 @@ def _extract_source_signature(text: Any) -> Dict[str, str]:
 def _group_rows_by_source(rows: List[Dict[str, Any]]) -> Dict[Tuple[str, str, str], List[int]]:
     groups: Dict[Tuple[str, str, str], List[int]] = {}
     for index, row in enumerate(rows):
-        key = (
-            _normalize_text(row.get("source_path")),
-            _normalize_text(row.get("page")),
-            _normalize_text(row.get("sheet_name")),
-        )
-        groups.setdefault(key, []).append(index)
+        groups.setdefault(_row_source_group_key(row), []).append(index)
     return groups
 
 
@@ -753,6 +803,108 @@ def _row_is_claim_like(row: Dict[str, Any]) -> bool:
     return role not in _NON_CLAIM_ROLES
 
 
+def _row_citation_tokens(row: Dict[str, Any]) -> Tuple[str, ...]:
+    return tuple(_citation_tokens_from_text(row.get("citation_text")) or _citation_tokens_from_text(row.get("claim_text")))
+
+
+def _row_source_group_key(row: Dict[str, Any]) -> Tuple[str, str, str]:
+    return (
+        _normalize_text(row.get("source_path")),
+        _normalize_text(row.get("page")),
+        _normalize_text(row.get("sheet_name")),
+    )
+
+
+_ROW_FEATURES: Dict[str, Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], Any]]] = {
+    "role": (("argument_role",), lambda row: _normalize_text(row.get("argument_role")).lower()),
+    "claim_like": (("claim_text", "argument_role"), lambda row: _row_is_claim_like(row)),
+    "has_source_ref": (
+        ("source_title", "source_url", "citation_text"),
+        lambda row: _row_has_source_ref(row),
+    ),
+    "citation_tokens": (("citation_text", "claim_text"), lambda row: _row_citation_tokens(row)),
+    "source_context": (
+        ("source_title", "source_url", "source_domain", "published_at", "citation_text"),
+        lambda row: _source_context_for_row(row),
+    ),
+    "source_group_key": (("source_path", "page", "sheet_name"), lambda row: _row_source_group_key(row)),
+    "document_group_key": (("source_path", "sheet_name"), lambda row: _document_group_key(row)),
+}
+
+
+def _row_feature_dependents() -> Dict[str, Tuple[str, ...]]:
+    dependents: Dict[str, Tuple[str, ...]] = {}
+    for name, (fields, _compute) in _ROW_FEATURES.items():
+        for field in fields:
+            dependents[field] = dependents.get(field, ()) + (name,)
+    return dependents
+
+
+_ROW_FEATURE_DEPENDENTS = _row_feature_dependents()
+
+
+class _RowFeatures:
+    """Derived per-row features shared by the source-context enrichment passes.
+
+    Features are computed once per row and dropped only when a pass writes one
+    of the fields they derive from through `set`. Cached values (including
+    source-context dicts) are shared and must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _values(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        entry = self._rows.get(id(row))
+        if entry is None or entry[0] is not row:
+            entry = (row, {})
+            self._rows[id(row)] = entry
+        return entry[1]
+
+    def get(self, row: Dict[str, Any], name: str) -> Any:
+        values = self._values(row)
+        if name in values:
+            self.hits += 1
+            return values[name]
+        self.misses += 1
+        value = _ROW_FEATURES[name][1](row)
+        values[name] = value
+        return value
+
+    def set(self, row: Dict[str, Any], field: str, value: Any) -> None:
+        row[field] = value
+        entry = self._rows.get(id(row))
+        if entry is not None and entry[0] is row:
+            for name in _ROW_FEATURE_DEPENDENTS.get(field, ()):
+                entry[1].pop(name, None)
+
+    def role(self, row: Dict[str, Any]) -> str:
+        return self.get(row, "role")
+
+    def claim_like(self, row: Dict[str, Any]) -> bool:
+        return self.get(row, "claim_like")
+
+    def has_source_ref(self, row: Dict[str, Any]) -> bool:
+        return self.get(row, "has_source_ref")
+
+    def citation_tokens(self, row: Dict[str, Any]) -> Tuple[str, ...]:
+        return self.get(row, "citation_tokens")
+
+    def source_context(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return self.get(row, "source_context")
+
+    def document_group_key(self, row: Dict[str, Any]) -> Tuple[str, str]:
+        return self.get(row, "document_group_key")
+
+    def group_rows_by_source(self, rows: List[Dict[str, Any]]) -> Dict[Tuple[str, str, str], List[int]]:
+        groups: Dict[Tuple[str, str, str], List[int]] = {}
+        for index, row in enumerate(rows):
+            groups.setdefault(self.get(row, "source_group_key"), []).append(index)
+        return groups
+
+
 def _same_row_location(left: Dict[str, Any], right: Dict[str, Any]) -> bool:
     return (
         _normalize_text(left.get("source_path")) == _normalize_text(right.get("source_path"))
@@ -857,14 +1009,15 @@ def _context_can_extend_claim_citations(context: Dict[str, Any]) -> bool:
     return role == "citation" or (not speaker and speaker_role in {"", "source"})
 
 
-def _append_citation_text(row: Dict[str, Any], citation_text: str) -> bool:
+def _append_citation_text(row: Dict[str, Any], citation_text: str, features: Optional[_RowFeatures] = None) -> bool:
+    features = features or _RowFeatures()
     value = _normalize_text(citation_text)
     if not value:
         return False
     existing = _normalize_text(row.get("citation_text"))
     if value in existing:
         return False
-    row["citation_text"] = f"{existing} | {value}" if existing else value
+    features.set(row, "citation_text", f"{existing} | {value}" if existing else value)
     if existing:
         row["_multi_source_citation_appended"] = True
     return True
@@ -878,31 +1031,36 @@ def _consume_internal_flag_count(rows: List[Dict[str, Any]], field: str) -> int:
     return count
 
 
-def _merge_source_context(row: Dict[str, Any], context: Dict[str, Any]) -> bool:
+def _merge_source_context(
+    row: Dict[str, Any],
+    context: Dict[str, Any],
+    features: Optional[_RowFeatures] = None,
+) -> bool:
+    features = features or _RowFeatures()
     row_title = _normalize_text(row.get("source_title"))
     context_title = _normalize_text(context.get("source_title"))
     if row_title and context_title and _normalize_claim_key(row_title) != _normalize_claim_key(context_title):
         if (
-            _row_is_claim_like(row)
+            features.claim_like(row)
             and _normalize_text(row.get("source_url"))
             and _normalize_text(context.get("source_url"))
             and _context_can_extend_claim_citations(context)
         ):
-            return _append_citation_text(row, _source_context_citation_text(context))
+            return _append_citation_text(row, _source_context_citation_text(context), features)
         return False
     row_url = _normalize_text(row.get("source_url")).rstrip("/")
     context_url = _normalize_text(context.get("source_url")).rstrip("/")
     if row_url and context_url and row_url.lower() != context_url.lower():
         return (
-            _append_citation_text(row, _source_context_citation_text(context))
-            if _row_is_claim_like(row) and _context_can_extend_claim_citations(context)
+            _append_citation_text(row, _source_context_citation_text(context), features)
+            if features.claim_like(row) and _context_can_extend_claim_citations(context)
             else False
         )
     changed = False
     for field in ("source_title", "source_url", "source_domain", "published_at", "citation_text"):
         value = _normalize_text(context.get(field))
         if value and not _normalize_text(row.get(field)):
-            row[field] = value
+            features.set(row, field, value)
             changed = True
     return changed
 
@@ -914,38 +1072,36 @@ def _document_group_key(row: Dict[str, Any]) -> Tuple[str, str]:
     )
 
 
-def _is_document_level_source_row(row: Dict[str, Any]) -> bool:
-    role = _normalize_text(row.get("argument_role")).lower()
+def _is_document_level_source_row(row: Dict[str, Any], features: Optional[_RowFeatures] = None) -> bool:
+    features = features or _RowFeatures()
+    role = features.role(row)
     return (
         role in {"citation", "evidence"}
-        and _row_has_source_ref(row)
+        and features.has_source_ref(row)
         and not _normalize_text(row.get("page"))
         and not _normalize_text(row.get("sheet_name"))
     )
 
 
-def _backfill_document_level_source_context(rows: List[Dict[str, Any]]) -> int:
+def _backfill_document_level_source_context(rows: List[Dict[str, Any]], features: Optional[_RowFeatures] = None) -> int:
+    features = features or _RowFeatures()
     updated = 0
     pending_claims: Dict[Tuple[str, str], List[int]] = {}
     for index, row in enumerate(rows):
-        key = _document_group_key(row)
+        key = features.document_group_key(row)
         if not key[0]:
             continue
-        role = _normalize_text(row.get("argument_role")).lower()
+        role = features.role(row)
         if role in _STRUCTURAL_ROLES:
             pending_claims[key] = []
             continue
-        if _row_is_claim_like(row):
-            if not _row_has_source_ref(row):
+        if features.claim_like(row):
+            if not features.has_source_ref(row):
                 pending_claims.setdefault(key, []).append(index)
             continue
-        if not _is_document_level_source_row(row):
+        if not _is_document_level_source_row(row, features):
             continue
-        context = {
-            field: row.get(field)
-            for field in ("source_title", "source_url", "source_domain", "published_at", "citation_text")
-            if _normalize_text(row.get(field))
-        }
+        context = dict(features.source_context(row))
         context["_argument_role"] = row.get("argument_role")
         context["_speaker"] = row.get("speaker")
         context["_speaker_role"] = row.get("speaker_role")
@@ -953,14 +1109,15 @@ def _backfill_document_level_source_context(rows: List[Dict[str, Any]]) -> int:
             continue
         targets = pending_claims.get(key, [])
         for target in targets:
-            if _merge_source_context(rows[target], context):
+            if _merge_source_context(rows[target], context, features):
                 updated += 1
         pending_claims[key] = []
     return updated
 
 
-def _backfill_source_context_by_block(rows: List[Dict[str, Any]]) -> int:
-    groups = _group_rows_by_source(rows)
+def _backfill_source_context_by_block(rows: List[Dict[str, Any]], features: Optional[_RowFeatures] = None) -> int:
+    features = features or _RowFeatures()
+    groups = features.group_rows_by_source(rows)
     updated = 0
     for indexes in groups.values():
         claim_block: List[int] = []
@@ -969,18 +1126,18 @@ def _backfill_source_context_by_block(rows: List[Dict[str, Any]]) -> int:
         source_block_open = False
         for index in indexes:
             row = rows[index]
-            role = _normalize_text(row.get("argument_role")).lower()
+            role = features.role(row)
             if role in _STRUCTURAL_ROLES:
                 claim_block = []
                 source_block = []
                 context = {}
                 source_block_open = False
                 continue
-            if _row_has_source_ref(row) or role == "citation":
+            if features.has_source_ref(row) or role == "citation":
                 if role == "citation" and not _normalize_text(row.get("citation_text")):
-                    row["citation_text"] = _normalize_text(row.get("claim_text"))
+                    features.set(row, "citation_text", _normalize_text(row.get("claim_text")))
                 if role == "citation" and not _normalize_text(row.get("speaker_role")):
-                    row["speaker_role"] = "source"
+                    features.set(row, "speaker_role", "source")
                 if not source_block_open:
                     source_block = []
                     context = {}
@@ -992,14 +1149,14 @@ def _backfill_source_context_by_block(rows: List[Dict[str, Any]]) -> int:
                 context["_argument_role"] = row.get("argument_role")
                 context["_speaker"] = row.get("speaker")
                 context["_speaker_role"] = row.get("speaker_role")
-                if _merge_source_context(row, context):
+                if _merge_source_context(row, context, features):
                     updated += 1
                 for target in claim_block + source_block[:-1]:
-                    if _merge_source_context(rows[target], context):
+                    if _merge_source_context(rows[target], context, features):
                         updated += 1
                 source_block_open = True
                 continue
-            if _row_is_claim_like(row):
+            if features.claim_like(row):
                 if source_block_open:
                     claim_block = []
                     source_block = []
@@ -1008,7 +1165,7 @@ def _backfill_source_context_by_block(rows: List[Dict[str, Any]]) -> int:
                 source_block_open = False
                 continue
             source_block_open = False
-    updated += _backfill_document_level_source_context(rows)
+    updated += _backfill_document_level_source_context(rows, features)
     return updated
 
 
@@ -1069,17 +1226,19 @@ def _index_source_context_by_citation_token(
     rows: List[Dict[str, Any]],
     *,
     include_page: bool,
+    features: Optional[_RowFeatures] = None,
 ) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
+    features = features or _RowFeatures()
     contexts: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
     ambiguous: set[Tuple[str, str, str, str]] = set()
     for row in rows:
-        role = _normalize_text(row.get("argument_role")).lower()
-        if role not in {"citation", "evidence"} or not _row_has_source_ref(row):
+        role = features.role(row)
+        if role not in {"citation", "evidence"} or not features.has_source_ref(row):
             continue
-        tokens = _citation_tokens_from_text(row.get("citation_text")) or _citation_tokens_from_text(row.get("claim_text"))
+        tokens = features.citation_tokens(row)
         if not tokens:
             continue
-        context = _source_context_for_row(row)
+        context = features.source_context(row)
         if not context:
             continue
         scope = _citation_token_scope_key(row, include_page=include_page)
@@ -1100,14 +1259,15 @@ def _index_source_context_by_citation_token(
     return contexts
 
 
-def _backfill_source_context_by_citation_token(rows: List[Dict[str, Any]]) -> int:
-    by_page = _index_source_context_by_citation_token(rows, include_page=True)
-    by_document = _index_source_context_by_citation_token(rows, include_page=False)
+def _backfill_source_context_by_citation_token(rows: List[Dict[str, Any]], features: Optional[_RowFeatures] = None) -> int:
+    features = features or _RowFeatures()
+    by_page = _index_source_context_by_citation_token(rows, include_page=True, features=features)
+    by_document = _index_source_context_by_citation_token(rows, include_page=False, features=features)
     updated = 0
     for row in rows:
-        if not _row_is_claim_like(row):
+        if not features.claim_like(row):
             continue
-        tokens = _citation_tokens_from_text(row.get("citation_text")) or _citation_tokens_from_text(row.get("claim_text"))
+        tokens = features.citation_tokens(row)
         if not tokens:
             continue
         changed = False
@@ -1116,7 +1276,7 @@ def _backfill_source_context_by_citation_token(rows: List[Dict[str, Any]]) -> in
         for token in tokens:
             normalized = _normalize_citation_token(token)
             context = by_page.get((*page_scope, normalized)) or by_document.get((*doc_scope, normalized))
-            if context and _merge_source_context(row, context):
+            if context and _merge_source_context(row, context, features):
                 changed = True
         if changed:
             updated += 1
@@ -1124,31 +1284,35 @@ def _backfill_source_context_by_citation_token(rows: List[Dict[str, Any]]) -> in
 
 
 def _row_has_citation_token(row: Dict[str, Any]) -> bool:
-    return bool(_citation_tokens_from_text(row.get("citation_text")) or _citation_tokens_from_text(row.get("claim_text")))
+    return bool(_row_citation_tokens(row))
 
 
-def _backfill_source_context_from_leading_source_cards(rows: List[Dict[str, Any]]) -> int:
-    groups = _group_rows_by_source(rows)
+def _backfill_source_context_from_leading_source_cards(
+    rows: List[Dict[str, Any]],
+    features: Optional[_RowFeatures] = None,
+) -> int:
+    features = features or _RowFeatures()
+    groups = features.group_rows_by_source(rows)
     updated = 0
     for indexes in groups.values():
         active_context: Dict[str, Any] = {}
         claims_seen_since_boundary = False
         for index in indexes:
             row = rows[index]
-            role = _normalize_text(row.get("argument_role")).lower()
+            role = features.role(row)
             if role in _STRUCTURAL_ROLES:
                 active_context = {}
                 claims_seen_since_boundary = False
                 continue
-            if _row_is_claim_like(row):
+            if features.claim_like(row):
                 claims_seen_since_boundary = True
-                if active_context and not _row_has_source_ref(row):
-                    if _merge_source_context(row, active_context):
+                if active_context and not features.has_source_ref(row):
+                    if _merge_source_context(row, active_context, features):
                         updated += 1
                 continue
-            if role == "citation" and _row_has_source_ref(row):
-                context = _source_context_for_row(row)
-                if claims_seen_since_boundary or _row_has_citation_token(row):
+            if role == "citation" and features.has_source_ref(row):
+                context = features.source_context(row)
+                if claims_seen_since_boundary or features.citation_tokens(row):
                     active_context = {}
                     continue
                 active_context = context
@@ -1184,41 +1348,46 @@ def _section_should_update_active_topic(row: Dict[str, Any]) -> bool:
     return False
 
 
-def _backfill_source_context_from_structural_attributions(rows: List[Dict[str, Any]]) -> int:
-    groups = _group_rows_by_source(rows)
+def _backfill_source_context_from_structural_attributions(
+    rows: List[Dict[str, Any]],
+    features: Optional[_RowFeatures] = None,
+) -> int:
+    features = features or _RowFeatures()
+    groups = features.group_rows_by_source(rows)
     updated = 0
     for indexes in groups.values():
         active_context: Dict[str, Any] = {}
         for index in indexes:
             row = rows[index]
-            role = _normalize_text(row.get("argument_role")).lower()
+            role = features.role(row)
             if role in _STRUCTURAL_ROLES:
-                if _row_has_source_ref(row) and _extract_source_attribution_signature(row.get("claim_text")):
-                    active_context = _source_context_for_row(row)
+                if features.has_source_ref(row) and _extract_source_attribution_signature(row.get("claim_text")):
+                    active_context = features.source_context(row)
                     continue
                 if active_context and not _is_major_structural_boundary(row):
-                    if not _row_has_source_ref(row) and _merge_source_context(row, active_context):
+                    if not features.has_source_ref(row) and _merge_source_context(row, active_context, features):
                         updated += 1
                     continue
                 active_context = {}
                 continue
-            if _row_is_claim_like(row):
-                if active_context and not _row_has_source_ref(row):
-                    if _merge_source_context(row, active_context):
+            if features.claim_like(row):
+                if active_context and not features.has_source_ref(row):
+                    if _merge_source_context(row, active_context, features):
                         updated += 1
                 continue
-            if role in {"citation", "evidence"} and _row_has_source_ref(row):
+            if role in {"citation", "evidence"} and features.has_source_ref(row):
                 active_context = {}
                 continue
     return updated
 
 
-def _source_row_can_backfill_previous_claim(row: Dict[str, Any]) -> bool:
-    if not _row_has_source_ref(row):
+def _source_row_can_backfill_previous_claim(row: Dict[str, Any], features: Optional[_RowFeatures] = None) -> bool:
+    features = features or _RowFeatures()
+    if not features.has_source_ref(row):
         return False
     if _normalize_text(row.get("speaker")):
         return False
-    role = _normalize_text(row.get("argument_role")).lower()
+    role = features.role(row)
     if role in {"citation", "evidence"}:
         return True
     text = _collapse_ws(row.get("claim_text"))
@@ -1232,24 +1401,32 @@ def _source_row_can_backfill_previous_claim(row: Dict[str, Any]) -> bool:
     return bool(source_url and len(text) <= 180 and re.match(r"^\s*(?:[-\u2014\u2e3a]{1,3}|\d{4}\b)", text))
 
 
-def _backfill_source_context_across_adjacent_page_breaks(rows: List[Dict[str, Any]]) -> int:
+def _backfill_source_context_across_adjacent_page_breaks(
+    rows: List[Dict[str, Any]],
+    features: Optional[_RowFeatures] = None,
+) -> int:
+    features = features or _RowFeatures()
     updated = 0
     for index in range(1, len(rows)):
         previous = rows[index - 1]
         row = rows[index]
-        if not _row_is_claim_like(previous) or _row_has_source_ref(previous):
+        if not features.claim_like(previous) or features.has_source_ref(previous):
             continue
-        if not _source_row_can_backfill_previous_claim(row):
+        if not _source_row_can_backfill_previous_claim(row, features):
             continue
         if not _same_document_sheet(previous, row) or not _adjacent_page_break(previous, row):
             continue
-        context = _source_context_for_row(row)
-        if context and _merge_source_context(previous, context):
+        context = features.source_context(row)
+        if context and _merge_source_context(previous, context, features):
             updated += 1
     return updated
 
 
-def _propagate_debate_context(rows: List[Dict[str, Any]]) -> Tuple[int, int, int, int, int]:
+def _propagate_debate_context(
+    rows: List[Dict[str, Any]],
+    features: Optional[_RowFeatures] = None,
+) -> Tuple[int, int, int, int, int]:
+    features = features or _RowFeatures()
     base_topic_by_doc: Dict[Tuple[str, str], str] = {}
     active_section_topic_by_doc: Dict[Tuple[str, str], str] = {}
     active_argument_role_by_doc: Dict[Tuple[str, str], str] = {}
@@ -1261,8 +1438,8 @@ def _propagate_debate_context(rows: List[Dict[str, Any]]) -> Tuple[int, int, int
     speaker_role_updated = 0
     argument_role_updated = 0
     for row in rows:
-        key = _document_group_key(row)
-        role = _normalize_text(row.get("argument_role")).lower()
+        key = features.document_group_key(row)
+        role = features.role(row)
         if role == "metadata":
             metadata_topic = _metadata_topic_from_row(row)
             if metadata_topic:
@@ -1292,10 +1469,10 @@ def _propagate_debate_context(rows: List[Dict[str, Any]]) -> Tuple[int, int, int
         section_topic = active_section_topic_by_doc.get(key, "")
         metadata_topic = base_topic_by_doc.get(key, "")
         topic = section_topic or metadata_topic
-        if not _row_is_claim_like(row):
+        if not features.claim_like(row):
             continue
         if topic and _normalize_text(row.get("debate_topic")) != topic:
-            row["debate_topic"] = topic
+            features.set(row, "debate_topic", topic)
             if section_topic:
                 section_updated += 1
             else:
@@ -1303,16 +1480,16 @@ def _propagate_debate_context(rows: List[Dict[str, Any]]) -> Tuple[int, int, int
         metadata_stance = base_stance_by_doc.get(key, "")
         current_stance = _normalize_text(row.get("stance")).lower()
         if metadata_stance and current_stance in {"", "unknown"}:
-            row["stance"] = metadata_stance
+            features.set(row, "stance", metadata_stance)
             stance_updated += 1
         metadata_speaker_role = base_speaker_role_by_doc.get(key, "")
         if metadata_speaker_role and not _normalize_text(row.get("speaker")) and not _normalize_text(row.get("speaker_role")):
-            row["speaker_role"] = metadata_speaker_role
+            features.set(row, "speaker_role", metadata_speaker_role)
             speaker_role_updated += 1
         active_argument_role = active_argument_role_by_doc.get(key, "")
         current_argument_role = _normalize_text(row.get("argument_role")).lower()
         if active_argument_role and current_argument_role in {"", "claim"}:
-            row["argument_role"] = active_argument_role
+            features.set(row, "argument_role", active_argument_role)
             argument_role_updated += 1
     return section_updated, metadata_updated, stance_updated, speaker_role_updated, argument_role_updated
 
@@ -1377,7 +1554,11 @@ def _is_url_only_citation_row(row: Dict[str, Any]) -> bool:
     return claim_text in url_values or citation_text in url_values
 
 
-def _collapse_adjacent_citation_url_rows(rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+def _collapse_adjacent_citation_url_rows(
+    rows: List[Dict[str, Any]],
+    features: Optional[_RowFeatures] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    features = features or _RowFeatures()
     out: List[Dict[str, Any]] = []
     removed = 0
     for row in rows:
@@ -1391,11 +1572,15 @@ def _collapse_adjacent_citation_url_rows(rows: List[Dict[str, Any]]) -> Tuple[Li
             previous = out[-1]
             for field in ("source_url", "source_domain", "published_at"):
                 if not _normalize_text(previous.get(field)) and _normalize_text(row.get(field)):
-                    previous[field] = row.get(field)
+                    features.set(previous, field, row.get(field))
             citation_text = _normalize_text(previous.get("citation_text"))
             row_citation = _normalize_text(row.get("citation_text") or row.get("claim_text"))
             if row_citation and row_citation not in citation_text:
-                previous["citation_text"] = f"{citation_text} | {row_citation}" if citation_text else row_citation
+                features.set(
+                    previous,
+                    "citation_text",
+                    f"{citation_text} | {row_citation}" if citation_text else row_citation,
+                )
             removed += 1
             continue
         out.append(row)
@@ -1436,6 +1621,25 @@ def _grobid_available() -> bool:
     return installed and bool(_grobid_endpoint())
 
 
+def _grobid_backend_version() -> str:
+    server_version = str(os.getenv("AIWF_GROBID_VERSION") or "").strip() or "unversioned"
+    return f"{_grobid_endpoint()}|{server_version}|{_GROBID_REQUEST_PROFILE}"
+
+
+def _azure_backend_version() -> str:
+    return f"{_azure_endpoint()}|{_AZURE_LAYOUT_MODEL}@{_AZURE_LAYOUT_API_VERSION}"
+
+
+def _document_backend_options(spec: Dict[str, Any], backend: str, version: str) -> Dict[str, Any]:
+    cache: Optional[DocumentBackendCache] = None
+    if bool(spec.get("document_backend_cache", True)):
+        cache = DocumentBackendCache(document_backend_cache_root(), backend, version)
+    return {
+        "cache": cache,
+        "max_concurrency": int(_spec_number(spec, "document_backend_max_concurrency", DEFAULT_MAX_CONCURRENCY, 1)),
+    }
+
+
 def _has_citation_dense_signals(rows: List[Dict[str, Any]]) -> bool:
     candidate_rows = sum(
         1
@@ -1642,12 +1846,56 @@ def _poll_azure_analyze(operation_location: str, headers: Dict[str, str], timeou
     except Exception as exc:
         return {"ok": False, "error": str(exc)}
     status = str(payload.get("status") or "").strip().lower()
+    if status in _AZURE_PENDING_STATUSES:
+        return {"ok": False, "pending": True, "error": f"azure analyze status={status}"}
     if status != "succeeded":
         return {"ok": False, "error": f"azure analyze status={status or 'unknown'}"}
     return {"ok": True, "payload": payload}
 
 
-def _fetch_azure_layout(source_path: str, timeout_seconds: float = 20.0) -> Dict[str, Any]:
+def _poll_azure_operations(
+    operations: Dict[str, Dict[str, Any]],
+    timeout_seconds: float = 20.0,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Dict[str, Any]]:
+    """Poll every pending analyze operation each round until all settle or the deadline passes."""
+    deadline = time.monotonic() + timeout_seconds
+    results: Dict[str, Dict[str, Any]] = {}
+    pending = dict(operations)
+
+    def _poll(operation: Dict[str, Any]) -> Dict[str, Any]:
+        return _poll_azure_analyze(
+            str(operation.get("operation_location") or ""),
+            dict(operation.get("headers") or {}),
+            timeout_seconds=timeout_seconds,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(int(max_concurrency), len(pending) or 1))) as pool:
+        while pending:
+            polled = dict(zip(pending, pool.map(_poll, pending.values())))
+            for key, result in polled.items():
+                last = pending[key]
+                if result.get("pending"):
+                    pending[key] = dict(last, last_status=result.get("error"))
+                    continue
+                results[key] = result
+                pending.pop(key)
+            if not pending:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(_AZURE_POLL_INTERVAL_SECONDS, remaining))
+    for key, operation in pending.items():
+        results[key] = {
+            "ok": False,
+            "error": f"azure analyze timed out ({operation.get('last_status') or 'pending'})",
+        }
+    return results
+
+
+def _fetch_azure_layout(source_path: str, timeout_seconds: float = 20.0, *, wait: bool = True) -> Dict[str, Any]:
+    """Submit `source_path` for layout analysis; with wait=False return the pending operation instead of polling."""
     endpoint = _azure_endpoint()
     key = _azure_key()
     if not endpoint or not key:
@@ -1659,7 +1907,10 @@ def _fetch_azure_layout(source_path: str, timeout_seconds: float = 20.0) -> Dict
     if suffix not in _AZURE_FILE_SUFFIXES:
         return {"ok": False, "error": "unsupported file type for azure layout"}
     content_type = "application/pdf" if suffix == ".pdf" else "application/octet-stream"
-    url = f"{endpoint}/documentintelligence/documentModels/prebuilt-layout:analyze?api-version=2024-11-30"
+    url = (
+        f"{endpoint}/documentintelligence/documentModels/{_AZURE_LAYOUT_MODEL}:analyze"
+        f"?api-version={_AZURE_LAYOUT_API_VERSION}"
+    )
     headers = {"Ocp-Apim-Subscription-Key": key, "Content-Type": content_type}
     try:
         response = requests.post(url, headers=headers, data=source_file.read_bytes(), timeout=timeout_seconds)
@@ -1669,7 +1920,15 @@ def _fetch_azure_layout(source_path: str, timeout_seconds: float = 20.0) -> Dict
             return {"ok": False, "error": "azure analyze missing operation-location"}
     except Exception as exc:
         return {"ok": False, "error": str(exc)}
-    return _poll_azure_analyze(operation_location, {"Ocp-Apim-Subscription-Key": key}, timeout_seconds=timeout_seconds)
+    operation = {
+        "ok": False,
+        "pending": True,
+        "operation_location": operation_location,
+        "headers": {"Ocp-Apim-Subscription-Key": key},
+    }
+    if not wait:
+        return operation
+    return _poll_azure_operations({source_path: operation}, timeout_seconds=timeout_seconds)[source_path]
 
 
 def _apply_local_source_and_citation_rules(rows: List[Dict[str, Any]]) -> Dict[str, int]:
@@ -1867,7 +2126,10 @@ def _apply_local_source_and_citation_rules(rows: List[Dict[str, Any]]) -> Dict[s
     }
 
 
-def _apply_grobid_citation_backend(rows: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+def _apply_grobid_citation_backend(
+    rows: List[Dict[str, Any]],
+    spec: Optional[Dict[str, Any]] = None,
+) -> Tuple[int, List[Dict[str, Any]]]:
     success_rows = 0
     traces: List[Dict[str, Any]] = []
     grouped_sources: Dict[str, List[int]] = {}
@@ -1876,6 +2138,11 @@ def _apply_grobid_citation_backend(rows: List[Dict[str, Any]]) -> Tuple[int, Lis
         if not source_path or Path(source_path).suffix.lower() not in _GROBID_FILE_SUFFIXES:
             continue
         grouped_sources.setdefault(source_path, []).append(index)
+    results, _ = run_document_backend(
+        list(grouped_sources),
+        lambda path: _fetch_grobid_citations(path),
+        **_document_backend_options(spec or {}, "grobid", _grobid_backend_version()),
+    )
     for source_path, indexes in grouped_sources.items():
         trace: Dict[str, Any] = {
             "engine": "grobid",
@@ -1884,7 +2151,7 @@ def _apply_grobid_citation_backend(rows: List[Dict[str, Any]]) -> Tuple[int, Lis
             "ok": False,
             "fallback": "regex",
         }
-        result = _fetch_grobid_citations(source_path)
+        result = results.get(source_path) or {}
         if not bool(result.get("ok")):
             trace["warning"] = str(result.get("error") or "grobid request failed")
             traces.append(trace)
@@ -1951,7 +2218,10 @@ def _apply_grobid_citation_backend(rows: List[Dict[str, Any]]) -> Tuple[int, Lis
     return success_rows, traces
 
 
-def _apply_azure_document_backend(rows: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+def _apply_azure_document_backend(
+    rows: List[Dict[str, Any]],
+    spec: Optional[Dict[str, Any]] = None,
+) -> Tuple[int, List[Dict[str, Any]]]:
     success_rows = 0
     traces: List[Dict[str, Any]] = []
     grouped_sources: Dict[str, List[int]] = {}
@@ -1960,6 +2230,13 @@ def _apply_azure_document_backend(rows: List[Dict[str, Any]]) -> Tuple[int, List
         if not source_path or Path(source_path).suffix.lower() not in _AZURE_FILE_SUFFIXES:
             continue
         grouped_sources.setdefault(source_path, []).append(index)
+    options = _document_backend_options(spec or {}, "azure_docintelligence", _azure_backend_version())
+    results, _ = run_document_backend(
+        list(grouped_sources),
+        lambda path: _fetch_azure_layout(path, wait=False),
+        poll=lambda operations: _poll_azure_operations(operations, max_concurrency=options["max_concurrency"]),
+        **options,
+    )
     for source_path, indexes in grouped_sources.items():
         trace: Dict[str, Any] = {
             "engine": "azure_docintelligence",
@@ -1968,7 +2245,7 @@ def _apply_azure_document_backend(rows: List[Dict[str, Any]]) -> Tuple[int, List
             "ok": False,
             "fallback": "local",
         }
-        result = _fetch_azure_layout(source_path)
+        result = results.get(source_path) or {}
         if not bool(result.get("ok")):
             trace["warning"] = str(result.get("error") or "azure layout request failed")
             traces.append(trace)
@@ -2053,7 +2330,12 @@ def _apply_azure_document_backend(rows: List[Dict[str, Any]]) -> Tuple[int, List
     return success_rows, traces
 
 
-def _apply_url_metadata_enrichment(rows: List[Dict[str, Any]], enabled: bool, external_mode: str) -> Dict[str, Any]:
+def _apply_url_metadata_enrichment(
+    rows: List[Dict[str, Any]],
+    enabled: bool,
+    external_mode: str,
+    spec: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     trace: Dict[str, Any] = {
         "engine": "trafilatura",
         "requested": enabled,
@@ -2070,7 +2352,7 @@ def _apply_url_metadata_enrichment(rows: List[Dict[str, Any]], enabled: bool, ex
 
     url_groups: Dict[str, List[int]] = {}
     for index, row in enumerate(rows):
-        url = _normalize_text(row.get("source_url"))
+        url = _normalize_source_url(_normalize_text(row.get("source_url")))
         if not url:
             continue
         if _normalize_text(row.get("source_title")) and _normalize_text(row.get("published_at")):
@@ -2087,8 +2369,15 @@ def _apply_url_metadata_enrichment(rows: List[Dict[str, Any]], enabled: bool, ex
         trace["warning"] = "trafilatura unavailable"
         return {"candidate_rows": trace["candidate_rows"], "enriched_rows": 0, "engine_trace": [trace]}
 
+    results, fetch_stats = fetch_url_metadata_batch(
+        list(url_groups),
+        lambda url: _fetch_url_metadata_with_trafilatura(url),
+        _source_domain,
+        **_url_metadata_fetch_options(spec or {}),
+    )
+    trace.update(fetch_stats)
     for url, indexes in url_groups.items():
-        metadata = _fetch_url_metadata_with_trafilatura(url)
+        metadata = results.get(url) or {}
         if not bool(metadata.get("ok")):
             continue
         for index in indexes:
@@ -2172,7 +2461,7 @@ def enrich_standardized_evidence_rows(
 
     document_success_rows = 0
     if effective_doc_backend == "azure_docintelligence":
-        matched_rows, traces = _apply_azure_document_backend(out)
+        matched_rows, traces = _apply_azure_document_backend(out, spec)
         document_success_rows += matched_rows
         engine_trace.extend(traces)
     else:
@@ -2213,32 +2502,33 @@ def enrich_standardized_evidence_rows(
 
     citation_backend_success_rows = 0
     if effective_citation_backend == "grobid":
-        matched_rows, traces = _apply_grobid_citation_backend(out)
+        matched_rows, traces = _apply_grobid_citation_backend(out, spec)
         citation_backend_success_rows += matched_rows
         engine_trace.extend(traces)
 
-    url_stats = _apply_url_metadata_enrichment(out, url_metadata_enabled, external_mode)
+    url_stats = _apply_url_metadata_enrichment(out, url_metadata_enabled, external_mode, spec)
     engine_trace.extend(url_stats["engine_trace"])
 
     out, structural_duplicate_rows_removed = _deduplicate_structural_rows(out)
     out, wrapped_claim_rows_merged = _merge_wrapped_claim_rows(out)
+    features = _RowFeatures()
     (
         section_topic_rows_propagated,
         metadata_topic_rows_propagated,
         metadata_stance_rows_propagated,
         metadata_speaker_role_rows_propagated,
         heading_argument_role_rows_propagated,
-    ) = _propagate_debate_context(out)
-    block_source_context_backfilled_rows = _backfill_source_context_by_block(out)
+    ) = _propagate_debate_context(out, features)
+    block_source_context_backfilled_rows = _backfill_source_context_by_block(out, features)
     source_context_backfilled_rows = block_source_context_backfilled_rows
-    out, adjacent_citation_url_rows_collapsed = _collapse_adjacent_citation_url_rows(out)
-    structural_source_context_backfilled_rows = _backfill_source_context_from_structural_attributions(out)
+    out, adjacent_citation_url_rows_collapsed = _collapse_adjacent_citation_url_rows(out, features)
+    structural_source_context_backfilled_rows = _backfill_source_context_from_structural_attributions(out, features)
     source_context_backfilled_rows += structural_source_context_backfilled_rows
-    adjacent_page_source_context_backfilled_rows = _backfill_source_context_across_adjacent_page_breaks(out)
+    adjacent_page_source_context_backfilled_rows = _backfill_source_context_across_adjacent_page_breaks(out, features)
     source_context_backfilled_rows += adjacent_page_source_context_backfilled_rows
-    leading_source_context_backfilled_rows = _backfill_source_context_from_leading_source_cards(out)
+    leading_source_context_backfilled_rows = _backfill_source_context_from_leading_source_cards(out, features)
     source_context_backfilled_rows += leading_source_context_backfilled_rows
-    citation_token_source_backfilled_rows = _backfill_source_context_by_citation_token(out)
+    citation_token_source_backfilled_rows = _backfill_source_context_by_citation_token(out, features)
     source_context_backfilled_rows += citation_token_source_backfilled_rows
     multi_source_citation_appended_rows = _consume_internal_flag_count(out, "_multi_source_citation_appended")
     engine_trace.append(
@@ -56,6 +56,8 @@ def run_preprocess_pipeline_impl(
         name = str(stage.get("name") or "").strip().lower()
         registration = get_pipeline_stage(name)
         cfg = dict(stage.get("config") if isinstance(stage.get("config"), dict) else {})
+        if cfg.get("extract_handoff_dir"):
+            cfg["extract_handoff_dir"] = resolve_path_within_root(job_root, str(cfg["extract_handoff_dir"]))
         context = pipeline_stage_context_type(
             stage_index=i,
             stage_name=name,
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiwf.paths import resolve_bus_root
+
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_DOMAIN_INTERVAL_SECONDS = 0.5
+DEFAULT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_NEGATIVE_CACHE_TTL_SECONDS = 30 * 60
+
+
+def url_metadata_cache_root() -> str:
+    override = str(os.getenv("AIWF_URL_METADATA_CACHE_DIR") or "").strip()
+    if override:
+        return os.path.normpath(override)
+    return os.path.join(resolve_bus_root(), "cache", "url_metadata")
+
+
+class UrlMetadataCache:
+    """One JSON file per normalized URL; successes and failures expire separately."""
+
+    def __init__(
+        self,
+        root: str,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.root = root
+        self.ttl_seconds = float(ttl_seconds)
+        self.negative_ttl_seconds = float(negative_ttl_seconds)
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], f"{digest}.json")
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(url), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url or not isinstance(entry.get("metadata"), dict):
+            return None
+        metadata = entry["metadata"]
+        ttl = self.ttl_seconds if metadata.get("ok") else self.negative_ttl_seconds
+        age = (time.time() if now is None else now) - float(entry.get("fetched_at") or 0)
+        if age < 0 or age >= ttl:
+            return None
+        return metadata
+
+    def put(self, url: str, metadata: Dict[str, Any], now: Optional[float] = None) -> None:
+        path = self._path(url)
+        entry = {"url": url, "fetched_at": time.time() if now is None else now, "metadata": metadata}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+
+
+class DomainRateLimiter:
+    """Spaces request starts to the same domain at least `min_interval_seconds` apart."""
+
+    def __init__(self, min_interval_seconds: float) -> None:
+        self.min_interval_seconds = max(0.0, float(min_interval_seconds))
+        self._lock = threading.Lock()
+        self._next_start: Dict[str, float] = {}
+
+    def wait(self, domain: str) -> None:
+        if self.min_interval_seconds <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(domain, now))
+            self._next_start[domain] = start + self.min_interval_seconds
+        if start > now:
+            time.sleep(start - now)
+
+
+def fetch_url_metadata_batch(
+    urls: List[str],
+    fetch: Callable[[str], Dict[str, Any]],
+    domain_of: Callable[[str], str],
+    *,
+    cache: Optional[UrlMetadataCache] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    domain_interval_seconds: float = DEFAULT_DOMAIN_INTERVAL_SECONDS,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    pending: List[str] = []
+    for url in urls:
+        cached = cache.get(url) if cache is not None else None
+        if cached is not None:
+            results[url] = cached
+        else:
+            pending.append(url)
+    stats = {"cache_hits": len(results), "fetched": len(pending), "failed": 0}
+    if not pending:
+        return results, stats
+
+    limiter = DomainRateLimiter(domain_interval_seconds)
+
+    def _fetch_one(url: str) -> Dict[str, Any]:
+        limiter.wait(domain_of(url))
+        try:
+            metadata = fetch(url)
+        except Exception as exc:
+            metadata = {"ok": False, "error": str(exc)}
+        if not isinstance(metadata, dict):
+            metadata = {"ok": False, "error": "metadata fetch returned non-object"}
+        if cache is not None:
+            cache.put(url, metadata)
+        return metadata
+
+    workers = max(1, min(int(max_workers), len(pending)))
+    if workers == 1:
+        fetched = [_fetch_one(url) for url in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aiwf-url-metadata") as pool:
+            fetched = list(pool.map(_fetch_one, pending))
+    for url, metadata in zip(pending, fetched):
+        results[url] = metadata
+        if not metadata.get("ok"):
+            stats["failed"] += 1
+    return results, stats
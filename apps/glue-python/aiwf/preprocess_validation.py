@@ -92,8 +92,33 @@ def validate_preprocess_spec_impl(
         val = str(spec.get("citation_parse_backend") or "").strip().lower()
         if val and val not in {"auto", "regex", "grobid"}:
             errors.append("citation_parse_backend must be auto|regex|grobid")
+    if "extract_handoff_dir" in spec and not isinstance(spec.get("extract_handoff_dir"), str):
+        errors.append("extract_handoff_dir must be string")
+    if "document_backend_cache" in spec and not isinstance(spec.get("document_backend_cache"), bool):
+        errors.append("document_backend_cache must be boolean")
+    if "document_backend_max_concurrency" in spec:
+        try:
+            if int(spec.get("document_backend_max_concurrency")) <= 0:
+                errors.append("document_backend_max_concurrency must be > 0")
+        except Exception:
+            errors.append("document_backend_max_concurrency must be integer")
     if "url_metadata_enrichment" in spec and not isinstance(spec.get("url_metadata_enrichment"), bool):
         errors.append("url_metadata_enrichment must be boolean")
+    if "url_metadata_cache" in spec and not isinstance(spec.get("url_metadata_cache"), bool):
+        errors.append("url_metadata_cache must be boolean")
+    if "url_metadata_max_workers" in spec:
+        try:
+            if int(spec.get("url_metadata_max_workers")) <= 0:
+                errors.append("url_metadata_max_workers must be > 0")
+        except Exception:
+            errors.append("url_metadata_max_workers must be integer")
+    for key in ("url_metadata_domain_interval_ms", "url_metadata_cache_ttl_hours", "url_metadata_negative_cache_ttl_minutes"):
+        if key in spec:
+            try:
+                if float(spec.get(key)) < 0:
+                    errors.append(f"{key} must be >= 0")
+            except Exception:
+                errors.append(f"{key} must be number")
     if "pdf_text_fast_path" in spec and not isinstance(spec.get("pdf_text_fast_path"), bool):
         errors.append("pdf_text_fast_path must be boolean")
     for key in ("pdf_text_fast_path_min_rows", "pdf_text_fast_path_min_chars"):
@@ -215,7 +240,15 @@ def validate_preprocess_spec_impl(
         "external_enrichment_mode",
         "document_parse_backend",
         "citation_parse_backend",
+        "document_backend_cache",
+        "document_backend_max_concurrency",
+        "extract_handoff_dir",
         "url_metadata_enrichment",
+        "url_metadata_cache",
+        "url_metadata_max_workers",
+        "url_metadata_domain_interval_ms",
+        "url_metadata_cache_ttl_hours",
+        "url_metadata_negative_cache_ttl_minutes",
         "pdf_text_fast_path",
         "pdf_text_fast_path_min_rows",
         "pdf_text_fast_path_min_chars",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 import math
 import re
 import unicodedata
@@ -523,21 +524,14 @@ def _token_display(token: str) -> str:
     return str(token or "").replace("_", " ").strip()
 
 
-def _header_value_affinity(
-    field: str,
-    sample_values: Sequence[Any],
+def _field_value_affinity(
+    field_key: str,
+    kind: str,
+    sample: Sequence[Any],
     *,
     raw_header: str,
-    profile_name: str,
-    value_affinity_available: bool,
 ) -> tuple[float, float]:
-    non_empty = [item for item in sample_values if item not in {None, ""} and str(item).strip()]
-    if not non_empty:
-        return 0.0, 0.0
-    _required_fields, numeric_fields, date_fields, _field_union = _profile_field_sets(profile_name)
-    field_key = str(field or "").strip()
-    sample = non_empty[:10]
-    if field_key in numeric_fields and value_affinity_available:
+    if kind == "numeric":
         parsed = 0
         for value in sample:
             normalized = normalize_value_for_field(value, field_key, raw_header=raw_header)
@@ -548,7 +542,7 @@ def _header_value_affinity(
                 continue
         rate = parsed / max(1, len(sample))
         return (0.05, rate) if rate >= 0.7 else (0.0, rate)
-    if field_key in date_fields and value_affinity_available:
+    if kind == "date":
         parsed = 0
         for value in sample:
             normalized = normalize_value_for_field(value, field_key, raw_header=raw_header)
@@ -559,36 +553,112 @@ def _header_value_affinity(
     return 0.0, 0.0
 
 
-def analyze_header_mapping(
-    name: str,
-    spec: Optional[Mapping[str, Any]] = None,
+def _affinity_kind(field_key: str, numeric_fields: Any, date_fields: Any, value_affinity_available: bool) -> str:
+    if not value_affinity_available:
+        return ""
+    if field_key in numeric_fields:
+        return "numeric"
+    if field_key in date_fields:
+        return "date"
+    return ""
+
+
+def _non_empty_sample(sample_values: Sequence[Any]) -> list[Any]:
+    return [item for item in sample_values if item not in {None, ""} and str(item).strip()][:10]
+
+
+def _header_value_affinity(
+    field: str,
+    sample_values: Sequence[Any],
     *,
-    sample_values: Optional[Sequence[Any]] = None,
-) -> dict[str, Any]:
-    spec_obj = dict(spec or {})
-    normalized = _normalize_token(name)
-    if not normalized:
-        return {
-            "canonical_field": "",
-            "confidence": 0.0,
-            "matched_token": "",
-            "match_strategy": "unresolved",
-            "alternatives": [],
-            "resolved": False,
-            "normalized": "",
-        }
+    raw_header: str,
+    profile_name: str,
+    value_affinity_available: bool,
+) -> tuple[float, float]:
+    sample = _non_empty_sample(sample_values)
+    if not sample:
+        return 0.0, 0.0
+    _required_fields, numeric_fields, date_fields, _field_union = _profile_field_sets(profile_name)
+    field_key = str(field or "").strip()
+    kind = _affinity_kind(field_key, numeric_fields, date_fields, value_affinity_available)
+    return _field_value_affinity(field_key, kind, sample, raw_header=raw_header)
+
+
+class _HeaderAliasIndex:
+    """Alias lookups for one (profile, effective mode, alias set), with every alias token normalized once."""
+
+    __slots__ = ("profile_name", "required_fields", "numeric_fields", "date_fields", "exact", "substring", "fuzzy", "strict_choices")
+
+    def __init__(self, profile_name: str, aliases: tuple[tuple[str, tuple[str, ...]], ...]) -> None:
+        required_fields, numeric_fields, date_fields, _field_union = _profile_field_sets(profile_name)
+        self.profile_name = profile_name
+        self.required_fields = frozenset(required_fields)
+        self.numeric_fields = frozenset(numeric_fields)
+        self.date_fields = frozenset(date_fields)
+        exact: dict[str, list[str]] = {}
+        substring: list[tuple[str, str]] = []
+        fuzzy: list[tuple[str, str, str, bool]] = []
+        strict_choices: list[tuple[str, str]] = []
+        for field, candidates in aliases:
+            field_token = _normalize_token(field)
+            candidate_tokens = [_normalize_token(item) for item in candidates]
+            for token in {field_token, *candidate_tokens}:
+                exact.setdefault(token, []).append(field)
+            for candidate_token in [field_token, *candidate_tokens]:
+                strict_choices.append((field, candidate_token))
+                if not candidate_token:
+                    continue
+                fuzzy.append((field, candidate_token, _token_display(candidate_token), candidate_token != field_token))
+                if len(candidate_token) < 2 and candidate_token not in {"id", "url"}:
+                    continue
+                substring.append((field, candidate_token))
+        self.exact = {token: tuple(fields) for token, fields in exact.items()}
+        self.substring = tuple(substring)
+        self.fuzzy = tuple(fuzzy)
+        self.strict_choices = tuple(strict_choices)
 
-    runtime = header_mapping_runtime_info(spec_obj)
-    effective_mode = str(runtime.get("effective_mode") or "strict")
+
+@lru_cache(maxsize=64)
+def _cached_header_alias_index(profile_name: str, aliases: tuple[tuple[str, tuple[str, ...]], ...]) -> _HeaderAliasIndex:
+    return _HeaderAliasIndex(profile_name, aliases)
+
+
+def _header_alias_index(spec_obj: Mapping[str, Any], effective_mode: str) -> _HeaderAliasIndex:
     aliases = _header_aliases_for_mode(spec_obj, effective_mode)
-    profile_name = resolve_canonical_profile(spec_obj)
-    required_fields, _numeric_fields, _date_fields, _field_union = _profile_field_sets(profile_name)
-
-    exact_matches: list[str] = []
-    for field, candidates in aliases.items():
-        normalized_candidates = {_normalize_token(field), *[_normalize_token(item) for item in candidates]}
-        if normalized in normalized_candidates:
-            exact_matches.append(field)
+    key = tuple((str(field), tuple(str(item) for item in values)) for field, values in aliases.items())
+    return _cached_header_alias_index(resolve_canonical_profile(spec_obj), key)
+
+
+def _unresolved_header(normalized: str, alternatives: list[dict[str, Any]], *, confidence: float = 0.55) -> dict[str, Any]:
+    return {
+        "canonical_field": "",
+        "confidence": confidence,
+        "matched_token": normalized,
+        "match_strategy": "unresolved",
+        "alternatives": alternatives,
+        "resolved": False,
+        "normalized": normalized,
+    }
+
+
+def _analyze_normalized_header(
+    index: _HeaderAliasIndex,
+    normalized: str,
+    raw_header: str,
+    sample: Sequence[Any],
+    *,
+    effective_mode: str,
+    value_affinity_available: bool,
+    fuzzy_scores: dict[str, float],
+    affinities: dict[tuple[str, str], tuple[float, float]],
+) -> dict[str, Any]:
+    """Resolve one already-normalized header against one alias index.
+
+    `fuzzy_scores` (keyed by alias display token) and `affinities` (keyed by
+    field and affinity kind) only depend on the header and its sample values,
+    so callers scoring the same header against several profiles share them.
+    """
+    exact_matches = index.exact.get(normalized) or ()
     if exact_matches:
         unique_fields: list[str] = []
         for item in exact_matches:
@@ -606,26 +676,9 @@ def analyze_header_mapping(
                 "resolved": True,
                 "normalized": normalized,
             }
-        return {
-            "canonical_field": "",
-            "confidence": 0.55,
-            "matched_token": normalized,
-            "match_strategy": "unresolved",
-            "alternatives": [{"field": field, "confidence": 1.0} for field in unique_fields[:3]],
-            "resolved": False,
-            "normalized": normalized,
-        }
+        return _unresolved_header(normalized, [{"field": field, "confidence": 1.0} for field in unique_fields[:3]])
 
-    substring_matches: list[tuple[str, str]] = []
-    for field, candidates in aliases.items():
-        for candidate in [field, *candidates]:
-            candidate_token = _normalize_token(candidate)
-            if not candidate_token:
-                continue
-            if len(candidate_token) < 2 and candidate_token not in {"id", "url"}:
-                continue
-            if candidate_token in normalized:
-                substring_matches.append((field, candidate_token))
+    substring_matches = [(field, token) for field, token in index.substring if token in normalized]
     if substring_matches:
         ranked_matches = sorted(substring_matches, key=lambda item: (-len(item[1]), item[1], item[0]))
         unique_fields = []
@@ -643,52 +696,44 @@ def analyze_header_mapping(
                 "resolved": True,
                 "normalized": normalized,
             }
-        return {
-            "canonical_field": "",
-            "confidence": 0.55,
-            "matched_token": normalized,
-            "match_strategy": "unresolved",
-            "alternatives": [{"field": field, "confidence": 0.88} for field in unique_fields[:3]],
-            "resolved": False,
-            "normalized": normalized,
-        }
+        return _unresolved_header(normalized, [{"field": field, "confidence": 0.88} for field in unique_fields[:3]])
 
     fuzz, process = _load_rapidfuzz()
-    sample_values_list = [item for item in (sample_values or [])]
     if effective_mode == "auto" and fuzz is not None and process is not None:
         choice_best: dict[str, dict[str, Any]] = {}
         left = _token_display(normalized)
-        for field, candidates in aliases.items():
-            for candidate in [field, *candidates]:
-                candidate_token = _normalize_token(candidate)
-                if not candidate_token:
-                    continue
-                right = _token_display(candidate_token)
+        for field, candidate_token, right, is_alias in index.fuzzy:
+            base_score = fuzzy_scores.get(right)
+            if base_score is None:
                 base_score = (
                     float(fuzz.token_set_ratio(left, right)) * 0.5
                     + float(fuzz.token_sort_ratio(left, right)) * 0.3
                     + float(fuzz.partial_ratio(left, right)) * 0.2
                 )
-                alias_bonus = 6.0 if candidate_token != _normalize_token(field) else 0.0
-                required_bonus = 4.0 if field in required_fields else 0.0
-                affinity_bonus, affinity_rate = _header_value_affinity(
-                    field,
-                    sample_values_list,
-                    raw_header=str(name or ""),
-                    profile_name=profile_name,
-                    value_affinity_available=bool(runtime.get("value_affinity_available")),
-                )
-                score = min(100.0, base_score + alias_bonus + required_bonus + (affinity_bonus * 100.0))
-                strategy = "fuzzy+value_affinity" if affinity_bonus > 0.0 else "fuzzy"
-                existing = choice_best.get(field)
-                if existing is None or score > float(existing.get("score", 0.0)):
-                    choice_best[field] = {
-                        "field": field,
-                        "score": score,
-                        "matched_token": candidate_token,
-                        "match_strategy": strategy,
-                        "affinity_rate": affinity_rate,
-                    }
+                fuzzy_scores[right] = base_score
+            alias_bonus = 6.0 if is_alias else 0.0
+            required_bonus = 4.0 if field in index.required_fields else 0.0
+            if sample:
+                field_key = str(field or "").strip()
+                kind = _affinity_kind(field_key, index.numeric_fields, index.date_fields, value_affinity_available)
+                affinity = affinities.get((field_key, kind))
+                if affinity is None:
+                    affinity = _field_value_affinity(field_key, kind, sample, raw_header=raw_header)
+                    affinities[(field_key, kind)] = affinity
+                affinity_bonus, affinity_rate = affinity
+            else:
+                affinity_bonus, affinity_rate = 0.0, 0.0
+            score = min(100.0, base_score + alias_bonus + required_bonus + (affinity_bonus * 100.0))
+            strategy = "fuzzy+value_affinity" if affinity_bonus > 0.0 else "fuzzy"
+            existing = choice_best.get(field)
+            if existing is None or score > float(existing.get("score", 0.0)):
+                choice_best[field] = {
+                    "field": field,
+                    "score": score,
+                    "matched_token": candidate_token,
+                    "match_strategy": strategy,
+                    "affinity_rate": affinity_rate,
+                }
         alternatives = sorted(choice_best.values(), key=lambda item: (-float(item["score"]), item["field"]))
         alt_payload = [
             {"field": str(item["field"]), "confidence": round(float(item["score"]) / 100.0, 6)}
@@ -708,29 +753,17 @@ def analyze_header_mapping(
                     "resolved": True,
                     "normalized": normalized,
                 }
-        return {
-            "canonical_field": "",
-            "confidence": 0.55,
-            "matched_token": normalized,
-            "match_strategy": "unresolved",
-            "alternatives": alt_payload,
-            "resolved": False,
-            "normalized": normalized,
-        }
+        return _unresolved_header(normalized, alt_payload)
 
     if fuzz is not None and process is not None:
-        choices: list[tuple[str, str]] = []
-        for field, candidates in aliases.items():
-            choices.append((field, _normalize_token(field)))
-            choices.extend((field, _normalize_token(item)) for item in candidates)
-        search_space = [item[1] for item in choices if item[1]]
+        search_space = [token for _field, token in index.strict_choices if token]
         if search_space:
             matched = process.extractOne(normalized, search_space, scorer=fuzz.ratio)
             if matched:
                 matched_value = str(matched[0] or "")
                 matched_score = float(matched[1] or 0.0)
                 if matched_score >= 85:
-                    for field, candidate in choices:
+                    for field, candidate in index.strict_choices:
                         if candidate == matched_value:
                             return {
                                 "canonical_field": field,
@@ -742,15 +775,91 @@ def analyze_header_mapping(
                                 "normalized": normalized,
                             }
 
-    return {
-        "canonical_field": "",
-        "confidence": 0.55,
-        "matched_token": normalized,
-        "match_strategy": "unresolved",
-        "alternatives": [],
-        "resolved": False,
-        "normalized": normalized,
-    }
+    return _unresolved_header(normalized, [])
+
+
+def analyze_header_mapping(
+    name: str,
+    spec: Optional[Mapping[str, Any]] = None,
+    *,
+    sample_values: Optional[Sequence[Any]] = None,
+) -> dict[str, Any]:
+    spec_obj = dict(spec or {})
+    normalized = _normalize_token(name)
+    if not normalized:
+        return _unresolved_header("", [], confidence=0.0)
+
+    runtime = header_mapping_runtime_info(spec_obj)
+    effective_mode = str(runtime.get("effective_mode") or "strict")
+    return _analyze_normalized_header(
+        _header_alias_index(spec_obj, effective_mode),
+        normalized,
+        str(name or ""),
+        _non_empty_sample(list(sample_values or [])),
+        effective_mode=effective_mode,
+        value_affinity_available=bool(runtime.get("value_affinity_available")),
+        fuzzy_scores={},
+        affinities={},
+    )
+
+
+def analyze_header_mappings(
+    headers: Sequence[str],
+    profile_names: Sequence[str],
+    *,
+    sheet_profiles: Optional[Mapping[str, Any]] = None,
+    header_mapping_mode: str = _HEADER_MAPPING_MODE_DEFAULT,
+    sample_values_by_header: Optional[Mapping[str, Sequence[Any]]] = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """analyze_header_mapping for every (profile, header) pair, batched.
+
+    Equivalent to calling analyze_header_mapping(header, {"canonical_profile":
+    profile, "sheet_profiles": ..., "header_mapping_mode": ...}) for each pair,
+    but each header is normalized once, its fuzzy scores and value-affinity
+    features are computed once and reused across profiles, and per-profile
+    alias tables are cached.
+    """
+    runtime = header_mapping_runtime_info({"header_mapping_mode": header_mapping_mode})
+    effective_mode = str(runtime.get("effective_mode") or "strict")
+    value_affinity_available = bool(runtime.get("value_affinity_available"))
+    indexes = [
+        (
+            profile_name,
+            _header_alias_index(
+                {
+                    "canonical_profile": profile_name,
+                    "sheet_profiles": dict(sheet_profiles or {}),
+                    "header_mapping_mode": header_mapping_mode,
+                },
+                effective_mode,
+            ),
+        )
+        for profile_name in profile_names
+    ]
+    out: dict[str, list[dict[str, Any]]] = {profile_name: [] for profile_name, _index in indexes}
+    for header in headers:
+        normalized = _normalize_token(header)
+        if not normalized:
+            for profile_name, _index in indexes:
+                out[profile_name].append(_unresolved_header("", [], confidence=0.0))
+            continue
+        sample = _non_empty_sample(list((sample_values_by_header or {}).get(header) or []))
+        fuzzy_scores: dict[str, float] = {}
+        affinities: dict[tuple[str, str], tuple[float, float]] = {}
+        for profile_name, index in indexes:
+            out[profile_name].append(
+                _analyze_normalized_header(
+                    index,
+                    normalized,
+                    str(header or ""),
+                    sample,
+                    effective_mode=effective_mode,
+                    value_affinity_available=value_affinity_available,
+                    fuzzy_scores=fuzzy_scores,
+                    affinities=affinities,
+                )
+            )
+    return out
 
 
 def canonicalize_header(
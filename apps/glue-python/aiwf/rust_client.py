@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import time
 from typing import Any, Dict, Optional
+
+from aiwf.metrics import observe_operator_response
 from aiwf.rust_client_support import (
     json_or_ok as _json_or_ok_impl,
     operator_get as _operator_get_impl,
@@ -584,7 +587,13 @@ def workflow_reference_run_v1(
     import requests
 
     url = _url(base_url, "/operators/workflow_reference_run_v1")
-    response = requests.post(url, json=payload, timeout=timeout)
+    started = time.perf_counter()
+    try:
+        response = requests.post(url, json=payload, timeout=timeout)
+    except Exception:
+        observe_operator_response("/operators/workflow_reference_run_v1", started)
+        raise
+    observe_operator_response("/operators/workflow_reference_run_v1", started, response)
     return _json_or_ok(response, "POST /operators/workflow_reference_run_v1")
 
 
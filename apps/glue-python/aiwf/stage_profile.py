@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiwf.artifact_io import open_artifact_output
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+
+STAGE_PROFILE_SCHEMA = "stage_profile.v1"
+STAGE_PROFILE_ARTIFACT_ID = "stage_profile_json_001"
+STAGE_PROFILE_TOP_N = 25
+
+# A sizer receives (args, kwargs, result) of a stage call and returns any of
+# rows_in / rows_out / bytes_serialized it can tell.
+StageSizer = Callable[[Tuple[Any, ...], Dict[str, Any], Any], Dict[str, int]]
+
+# Overlapping profiled runs share tracemalloc: the first one in starts it, the
+# last one out stops it (unless something outside this module started it).
+_TRACEMALLOC_LOCK = threading.Lock()
+_TRACEMALLOC_USERS = 0
+_TRACEMALLOC_OWNED = False
+
+
+def _acquire_tracemalloc() -> None:
+    global _TRACEMALLOC_USERS, _TRACEMALLOC_OWNED
+    with _TRACEMALLOC_LOCK:
+        if _TRACEMALLOC_USERS == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _TRACEMALLOC_OWNED = True
+        _TRACEMALLOC_USERS += 1
+
+
+def _release_tracemalloc() -> Tuple[Optional[tracemalloc.Snapshot], int]:
+    """Snapshot and peak of the shared trace, then drop this run's hold on it."""
+    global _TRACEMALLOC_USERS, _TRACEMALLOC_OWNED
+    with _TRACEMALLOC_LOCK:
+        snapshot: Optional[tracemalloc.Snapshot] = None
+        peak = 0
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+        _TRACEMALLOC_USERS = max(0, _TRACEMALLOC_USERS - 1)
+        if _TRACEMALLOC_USERS == 0 and _TRACEMALLOC_OWNED:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            _TRACEMALLOC_OWNED = False
+        return snapshot, peak
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Process high-water RSS in bytes, or None where getrusage is unavailable."""
+    if resource is None:
+        return None
+    peak = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def row_count(value: Any) -> Optional[int]:
+    return len(value) if isinstance(value, (list, tuple)) else None
+
+
+def file_size(path: Any) -> Optional[int]:
+    if not isinstance(path, (str, os.PathLike)):
+        return None
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+class StageProfile:
+    """Per-run recorder of wall/CPU time, row counts, bytes written and RSS growth by stage.
+
+    Repeated calls of one stage fold into a single record, so callback stages
+    invoked per artifact stay one entry. CPU time is the calling thread's;
+    the RSS figure is how far the process peak rose during the stage, which is
+    0 once an earlier stage has already reached a higher peak.
+    """
+
+    def __init__(self, scope: str = "flow") -> None:
+        self.scope = scope
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def measure(self, stage: str, fn: Callable[..., Any], *args: Any, sizer: Optional[StageSizer] = None, **kwargs: Any) -> Any:
+        rss_before = peak_rss_bytes()
+        cpu_started = time.thread_time()
+        started = time.perf_counter()
+        ok = False
+        result: Any = None
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            wall = time.perf_counter() - started
+            cpu = time.thread_time() - cpu_started
+            rss_after = peak_rss_bytes()
+            sizes: Dict[str, int] = {}
+            if ok and sizer is not None:
+                try:
+                    sizes = {key: int(value) for key, value in sizer(args, kwargs, result).items() if value is not None}
+                except Exception:
+                    sizes = {}
+            rss_delta = None if rss_before is None or rss_after is None else max(0, rss_after - rss_before)
+            self._record(stage, wall, cpu, ok, sizes, rss_delta)
+
+    def wrap(self, stage: str, fn: Callable[..., Any], sizer: Optional[StageSizer] = None) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.measure(stage, fn, *args, sizer=sizer, **kwargs)
+
+        wrapper.__wrapped__ = fn  # type: ignore[attr-defined]
+        return wrapper
+
+    def _record(self, stage: str, wall: float, cpu: float, ok: bool, sizes: Dict[str, int], rss_delta: Optional[int]) -> None:
+        with self._lock:
+            record = self._records.get(stage)
+            if record is None:
+                record = {
+                    "stage": stage,
+                    "scope": self.scope,
+                    "calls": 0,
+                    "ok": True,
+                    "wall_seconds": 0.0,
+                    "cpu_seconds": 0.0,
+                    "rows_in": None,
+                    "rows_out": None,
+                    "bytes_serialized": None,
+                    "peak_rss_delta_bytes": None,
+                }
+                self._records[stage] = record
+            record["calls"] += 1
+            record["ok"] = record["ok"] and ok
+            record["wall_seconds"] += wall
+            record["cpu_seconds"] += cpu
+            for key, value in sizes.items():
+                record[key] = (record[key] or 0) + value
+            if rss_delta is not None:
+                record["peak_rss_delta_bytes"] = (record["peak_rss_delta_bytes"] or 0) + rss_delta
+
+    def records(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    **record,
+                    "wall_seconds": round(record["wall_seconds"], 6),
+                    "cpu_seconds": round(record["cpu_seconds"], 6),
+                }
+                for record in self._records.values()
+            ]
+
+    def merge_into(self, provenance: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fold measurements into matching provenance entries; unmatched stages are appended."""
+        measured = {record["stage"]: record for record in self.records()}
+        out: List[Dict[str, Any]] = []
+        for entry in provenance:
+            record = measured.pop(str(entry.get("stage") or ""), None)
+            if record is None:
+                out.append(dict(entry))
+            else:
+                out.append({**record, **entry})
+        out.extend(measured.values())
+        return out
+
+
+class RunProfiler:
+    """cProfile plus tracemalloc over one run, reported as the top-N of each."""
+
+    def __init__(self, top_n: int = STAGE_PROFILE_TOP_N) -> None:
+        self.top_n = max(1, int(top_n))
+        self._profiler: Optional[cProfile.Profile] = cProfile.Profile()
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak_traced = 0
+        self._seconds = 0.0
+        self._started = 0.0
+        self._running = False
+
+    def start(self) -> "RunProfiler":
+        _acquire_tracemalloc()
+        self._started = time.perf_counter()
+        try:
+            self._profiler.enable()
+        except ValueError:
+            # Another profiler already owns the interpreter; keep the allocation half.
+            self._profiler = None
+        self._running = True
+        return self
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        if self._profiler is not None:
+            self._profiler.disable()
+        self._seconds = time.perf_counter() - self._started
+        self._snapshot, self._peak_traced = _release_tracemalloc()
+
+    def report(self, stages: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        functions = []
+        raw_stats = pstats.Stats(self._profiler, stream=io.StringIO()).stats if self._profiler is not None else {}  # type: ignore[attr-defined]
+        for (filename, line, name), (_calls, ncalls, tottime, cumtime, _callers) in raw_stats.items():
+            functions.append(
+                {
+                    "function": f"{filename}:{line}({name})",
+                    "calls": int(ncalls),
+                    "self_seconds": round(tottime, 6),
+                    "cumulative_seconds": round(cumtime, 6),
+                }
+            )
+        functions.sort(key=lambda item: item["cumulative_seconds"], reverse=True)
+        allocations = []
+        if self._snapshot is not None:
+            for stat in self._snapshot.statistics("lineno")[: self.top_n]:
+                frame = stat.traceback[0]
+                allocations.append({"location": f"{frame.filename}:{frame.lineno}", "bytes": int(stat.size), "blocks": int(stat.count)})
+        return {
+            "schema": STAGE_PROFILE_SCHEMA,
+            "seconds": round(self._seconds, 6),
+            "traced_peak_bytes": int(self._peak_traced),
+            "stages": list(stages or []),
+            "cpu_top": functions[: self.top_n],
+            "allocation_top": allocations,
+        }
+
+    def write_artifact(self, path: str, sha256_file: Callable[[str], str], stages: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open_artifact_output(path, "w", encoding="utf-8") as handle:
+            json.dump(self.report(stages), handle, ensure_ascii=False, indent=2)
+        return {
+            "artifact_id": STAGE_PROFILE_ARTIFACT_ID,
+            "kind": "json",
+            "path": path,
+            "sha256": sha256_file(path),
+        }
+
+    def finish(self, path: str, sha256_file: Callable[[str], str], stages: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Stop profiling and write the artifact; the profile is diagnostic, so a failure is returned, not raised."""
+        try:
+            self.stop()
+            return {"artifact": self.write_artifact(path, sha256_file, stages)}
+        except Exception as exc:
+            return {"artifact": None, "error": f"{type(exc).__name__}: {exc}"}
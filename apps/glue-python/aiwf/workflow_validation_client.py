@@ -1,15 +1,31 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from aiwf.accel_transport import DEFAULT_ACCEL_BASE_URL, operator_url
+from aiwf.immutable import freeze, thaw
+from aiwf.metrics import observe_operator_response
+from aiwf.node_config_contract_runtime import (
+    resolve_node_config_contract_path,
+    resolve_rust_operator_manifest_path,
+)
 
 
 WORKFLOW_GRAPH_ERROR_CODE = "workflow_graph_invalid"
 WORKFLOW_VALIDATION_UNAVAILABLE_CODE = "workflow_validation_unavailable"
 WORKFLOW_GRAPH_CONTRACT_AUTHORITY = "contracts/workflow/workflow.schema.json"
 NODE_CONFIG_VALIDATION_ERROR_CONTRACT_AUTHORITY = "contracts/desktop/node_config_validation_errors.v1.json"
+DEFAULT_VALIDATION_CACHE_ENTRIES = 512
+DEFAULT_VALIDATION_CACHE_TTL_SECONDS = 300.0
+CONTRACT_RECHECK_SECONDS = 1.0
+VALIDATION_ENDPOINT = "/operators/workflow_contract_v1/validate"
 
 
 @dataclass
@@ -43,6 +59,185 @@ def _validation_error_message(payload: Dict[str, Any]) -> str:
     return str(payload.get("error") or "workflow contract invalid").strip() or "workflow contract invalid"
 
 
+def _env_float(key: str, default: float) -> float:
+    raw = str(os.getenv(key) or "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def validation_cache_enabled() -> bool:
+    return str(os.getenv("AIWF_WORKFLOW_VALIDATION_CACHE") or "true").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _definition_digest(workflow_definition: Dict[str, Any]) -> str:
+    canonical = json.dumps(workflow_definition, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _local_contract_fingerprint() -> Tuple[Any, ...]:
+    # The sidecar loads the same manifest and node contracts; a rewrite of
+    # either on disk means earlier verdicts may no longer hold.
+    parts: List[Any] = []
+    for path in (resolve_rust_operator_manifest_path(), resolve_node_config_contract_path()):
+        try:
+            stat = os.stat(path)
+            parts.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            parts.append((str(path), None, None))
+    return tuple(parts)
+
+
+def _sidecar_contract_identity(body: Dict[str, Any]) -> str:
+    inventory = body.get("node_type_inventory")
+    return "|".join(
+        [
+            str(body.get("schema_version") or ""),
+            str(body.get("graph_contract") or ""),
+            str(body.get("error_item_contract") or ""),
+            _definition_digest(inventory) if isinstance(inventory, dict) else "",
+        ]
+    )
+
+
+def _failure_fields(exc: WorkflowValidationFailure) -> Dict[str, Any]:
+    return {
+        "message": exc.message,
+        "error_items": exc.error_items,
+        "notes": exc.notes,
+        "normalized_workflow_definition": exc.normalized_workflow_definition,
+        "graph_contract": exc.graph_contract,
+        "error_item_contract": exc.error_item_contract,
+    }
+
+
+class WorkflowValidationCache:
+    """Authoritative validation verdicts keyed by what determines them.
+
+    The key is the canonical definition hash, the validation flags and scope,
+    the sidecar's contract identity (schema version, contract authorities and
+    node type inventory, learned from its responses) and the on-disk operator
+    manifest and node contract files. Invalid verdicts are cached too and
+    re-raised as fresh WorkflowValidationFailure instances; "unavailable"
+    outcomes never are. Entries expire after `ttl_seconds` so a sidecar
+    upgraded in place is re-consulted even if no response has revealed it yet.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_VALIDATION_CACHE_ENTRIES,
+        ttl_seconds: Optional[float] = None,
+        contract_recheck_seconds: float = CONTRACT_RECHECK_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.contract_recheck_seconds = contract_recheck_seconds
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else _env_float("AIWF_WORKFLOW_VALIDATION_CACHE_TTL_SECONDS", DEFAULT_VALIDATION_CACHE_TTL_SECONDS)
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[float, bool, Any]]" = OrderedDict()
+        self._sidecar_identity: Dict[str, str] = {}
+        self._local_fingerprint: Optional[Tuple[Any, ...]] = None
+        self._local_checked_at: Optional[float] = None
+        self._stats = {"hits": 0, "negative_hits": 0, "misses": 0, "invalidations": 0}
+
+    def _check_local_contracts(self) -> None:
+        now = self._clock()
+        if self._local_checked_at is not None and now - self._local_checked_at < self.contract_recheck_seconds:
+            return
+        fingerprint = _local_contract_fingerprint()
+        with self._lock:
+            self._local_checked_at = now
+            if fingerprint != self._local_fingerprint:
+                if self._local_fingerprint is not None:
+                    self._entries.clear()
+                    self._stats["invalidations"] += 1
+                self._local_fingerprint = fingerprint
+
+    def key(self, base_url: str, workflow_definition: Dict[str, Any], flags: Tuple[bool, bool, str]) -> Tuple[Any, ...]:
+        self._check_local_contracts()
+        with self._lock:
+            identity = self._sidecar_identity.get(base_url, "")
+        return (base_url, identity, flags, _definition_digest(workflow_definition))
+
+    def lookup(self, key: Tuple[Any, ...]) -> Optional[Tuple[bool, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            stored_at, valid, value = entry
+            if self._clock() - stored_at >= self.ttl_seconds:
+                del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits" if valid else "negative_hits"] += 1
+            return valid, value
+
+    def store(self, key: Tuple[Any, ...], body: Dict[str, Any], *, valid: bool, value: Dict[str, Any]) -> None:
+        base_url = key[0]
+        identity = _sidecar_contract_identity(body)
+        with self._lock:
+            if self._sidecar_identity.get(base_url, "") != identity:
+                # The sidecar's contract moved: verdicts filed under the old identity are stale.
+                for stale in [k for k in self._entries if k[0] == base_url]:
+                    del self._entries[stale]
+                if base_url in self._sidecar_identity:
+                    self._stats["invalidations"] += 1
+                self._sidecar_identity[base_url] = identity
+            key = (base_url, identity) + tuple(key[2:])
+            self._entries[key] = (self._clock(), valid, freeze(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sidecar_identity.clear()
+            self._local_fingerprint = None
+            self._local_checked_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": validation_cache_enabled(),
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                **self._stats,
+            }
+
+
+_VALIDATION_CACHE = WorkflowValidationCache()
+_SESSIONS = threading.local()
+
+
+def workflow_validation_cache_stats() -> Dict[str, Any]:
+    return _VALIDATION_CACHE.stats()
+
+
+def clear_workflow_validation_cache() -> None:
+    _VALIDATION_CACHE.clear()
+
+
+def _session() -> Any:
+    import requests
+
+    session = getattr(_SESSIONS, "session", None)
+    if session is None:
+        session = requests.Session()
+        _SESSIONS.session = session
+    return session
+
+
 def validate_workflow_definition_authoritatively(
     workflow_definition: Dict[str, Any],
     *,
@@ -52,27 +247,50 @@ def validate_workflow_definition_authoritatively(
     require_non_empty_nodes: bool = False,
     validation_scope: str = "governance_write",
 ) -> Dict[str, Any]:
-    import requests
-
     payload = workflow_definition if isinstance(workflow_definition, dict) else {}
     base_url = str(accel_url or DEFAULT_ACCEL_BASE_URL).rstrip("/")
-    url = operator_url(base_url, "/operators/workflow_contract_v1/validate")
+    flags = (bool(allow_version_migration), bool(require_non_empty_nodes), str(validation_scope or "governance_write"))
+    cache_key = _VALIDATION_CACHE.key(base_url, payload, flags) if validation_cache_enabled() else None
+    cached = _VALIDATION_CACHE.lookup(cache_key) if cache_key is not None else None
+    if cached is not None:
+        valid, value = cached
+        if not valid:
+            raise WorkflowValidationFailure(**thaw(value))
+        return thaw(value)
+
+    body = _post_validation(base_url, payload, flags, timeout)
+    if body.get("valid") is False or str(body.get("status") or "").strip().lower() == "invalid":
+        failure = _validation_failure(body, payload)
+        if cache_key is not None:
+            _VALIDATION_CACHE.store(cache_key, body, valid=False, value=_failure_fields(failure))
+        raise failure
+    if cache_key is not None:
+        _VALIDATION_CACHE.store(cache_key, body, valid=True, value=body)
+    return body
+
+
+def _post_validation(base_url: str, payload: Dict[str, Any], flags: Tuple[bool, bool, str], timeout: float) -> Dict[str, Any]:
+    url = operator_url(base_url, VALIDATION_ENDPOINT)
+    allow_version_migration, require_non_empty_nodes, validation_scope = flags
 
+    started = time.perf_counter()
     try:
-        response = requests.post(
+        response = _session().post(
             url,
             json={
                 "workflow_definition": payload,
-                "allow_version_migration": bool(allow_version_migration),
-                "require_non_empty_nodes": bool(require_non_empty_nodes),
-                "validation_scope": str(validation_scope or "governance_write"),
+                "allow_version_migration": allow_version_migration,
+                "require_non_empty_nodes": require_non_empty_nodes,
+                "validation_scope": validation_scope,
             },
             timeout=timeout,
         )
     except Exception as exc:
+        observe_operator_response(VALIDATION_ENDPOINT, started)
         raise WorkflowValidationUnavailable(
             f"workflow validation unavailable: {str(exc)}"
         ) from exc
+    observe_operator_response(VALIDATION_ENDPOINT, started, response)
 
     try:
         body = response.json()
@@ -86,16 +304,17 @@ def validate_workflow_definition_authoritatively(
             str(body.get("error") or f"workflow validation unavailable: http {response.status_code}")
         )
 
-    if body.get("valid") is False or str(body.get("status") or "").strip().lower() == "invalid":
-        raise WorkflowValidationFailure(
-            _validation_error_message(body),
-            error_items=body.get("error_items") if isinstance(body.get("error_items"), list) else [],
-            notes=body.get("notes") if isinstance(body.get("notes"), list) else [],
-            normalized_workflow_definition=body.get("normalized_workflow_definition")
-            if isinstance(body.get("normalized_workflow_definition"), dict)
-            else dict(payload),
-            graph_contract=str(body.get("graph_contract") or WORKFLOW_GRAPH_CONTRACT_AUTHORITY),
-            error_item_contract=str(body.get("error_item_contract") or NODE_CONFIG_VALIDATION_ERROR_CONTRACT_AUTHORITY),
-        )
-
     return body if isinstance(body, dict) else {}
+
+
+def _validation_failure(body: Dict[str, Any], payload: Dict[str, Any]) -> WorkflowValidationFailure:
+    return WorkflowValidationFailure(
+        _validation_error_message(body),
+        error_items=body.get("error_items") if isinstance(body.get("error_items"), list) else [],
+        notes=body.get("notes") if isinstance(body.get("notes"), list) else [],
+        normalized_workflow_definition=body.get("normalized_workflow_definition")
+        if isinstance(body.get("normalized_workflow_definition"), dict)
+        else dict(payload),
+        graph_contract=str(body.get("graph_contract") or WORKFLOW_GRAPH_CONTRACT_AUTHORITY),
+        error_item_contract=str(body.get("error_item_contract") or NODE_CONFIG_VALIDATION_ERROR_CONTRACT_AUTHORITY),
+    )
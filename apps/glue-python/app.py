@@ -9,7 +9,7 @@ import inspect
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
 from aiwf import ingest
@@ -28,6 +28,12 @@ from aiwf.preprocess_evidence import analyze_debate_row_signals, analyze_debate_
 from aiwf.quality_contract import header_mapping_runtime_info, normalize_value_for_field
 from aiwf.runtime_catalog import get_runtime_catalog
 from aiwf.dependency_status import dependency_status
+from aiwf.office_resources import office_resource_cache_stats
+from aiwf.accel_breaker import sidecar_breaker_stats
+from aiwf.callback_outbox import callback_outbox_stats
+from aiwf.metrics import PROMETHEUS_CONTENT_TYPE, flow_run, observe_http_request, render_metrics
+from aiwf.artifact_io import artifact_digest, open_artifact_output
+from aiwf.extract_handoff import extract_handoff_dir, write_extract_handoff
 from aiwf.flow_context import LegacyFlowPathParamsError, attach_job_context, normalize_job_context
 from aiwf.paths import resolve_jobs_root
 from aiwf.governance_quality_rule_sets import (
@@ -79,9 +85,8 @@ from aiwf.governance_manual_reviews import (
     MANUAL_REVIEW_QUEUE_STORE_SCHEMA_VERSION,
     MANUAL_REVIEW_SCHEMA_VERSION,
     enqueue_manual_reviews,
-    filter_manual_review_history,
-    list_manual_review_history,
     list_manual_reviews,
+    query_manual_review_history,
     submit_manual_review,
 )
 from aiwf.governance_run_baselines import (
@@ -113,6 +118,7 @@ from aiwf.workflow_validation_client import (
     WorkflowValidationFailure,
     WorkflowValidationUnavailable,
     validate_workflow_definition_authoritatively,
+    workflow_validation_cache_stats,
 )
 from aiwf.rust_client import workflow_reference_run_v1
 from aiwf.flows.cleaning_flow_materialization import materialize_accel_outputs
@@ -149,6 +155,9 @@ runtime_catalog = get_runtime_catalog()
 
 WORKFLOW_GRAPH_CONTRACT_AUTHORITY = "contracts/workflow/workflow.schema.json"
 INGEST_EXTRACT_CONTRACT_AUTHORITY = "contracts/glue/ingest_extract.schema.json"
+INGEST_EXTRACT_RESPONSE_MODES = ("json", "ndjson")
+INGEST_EXTRACT_ROWS_MODES = ("inline", "reference")
+INGEST_EXTRACT_ROWS_FILENAME = "ingest_extract_rows.jsonl"
 CLEANING_PRECHECK_CONTRACT_AUTHORITY = "contracts/glue/cleaning_precheck.schema.json"
 WORKFLOW_GRAPH_ERROR_CODE = "workflow_graph_invalid"
 GOVERNANCE_VALIDATION_ERROR_CODE = "governance_validation_invalid"
@@ -458,6 +467,11 @@ class IngestExtractReq(BaseModel):
     sheet_profiles: Dict[str, Any] = Field(default_factory=dict)
     canonical_profile: str = ""
     on_file_error: str = "raise"
+    response_mode: str = "json"
+    rows_mode: str = "inline"
+    job_id: str = ""
+    job_context: Dict[str, Any] = Field(default_factory=dict)
+    extract_handoff: bool = False
 
 
 class CleaningPrecheckReq(BaseModel):
@@ -484,6 +498,8 @@ class CleaningPrecheckReq(BaseModel):
     include_hidden_sheets: bool = False
     sheet_allowlist: list[str] = Field(default_factory=list)
     on_file_error: str = "raise"
+    job_id: str = ""
+    job_context: Dict[str, Any] = Field(default_factory=dict)
 
 
 def _call_compatible(callable_obj, candidates):
@@ -824,6 +840,43 @@ def _run_workflow_reference(job_id: str, req: RunReferenceReq):
 app = FastAPI(title="AIWF glue-python", version="0.1.0")
 
 
+@app.middleware("http")
+async def record_request_metrics(request, call_next):
+    started = time.perf_counter()
+
+    def observe(status: int) -> None:
+        # Label by route template, not raw path, so job ids do not explode the series count.
+        route = request.scope.get("route")
+        observe_http_request(request.method, str(getattr(route, "path", "") or "unmatched"), status, time.perf_counter() - started)
+
+    try:
+        response = await call_next(request)
+    except BaseException:
+        observe(500)
+        raise
+    body_iterator = getattr(response, "body_iterator", None)
+    if body_iterator is None:
+        observe(response.status_code)
+        return response
+
+    # Headers go out before a streamed (NDJSON) body is produced; stop the clock
+    # only once the last chunk has been sent.
+    async def timed_body():
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            observe(response.status_code)
+
+    response.body_iterator = timed_body()
+    return response
+
+
+@app.get("/metrics")
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.get("/health")
 def health():
     return {
@@ -834,6 +887,10 @@ def health():
             "contract": INGEST_EXTRACT_CONTRACT_AUTHORITY,
             "supported_modalities": ["txt", "docx", "pdf", "image", "xlsx"],
         },
+        "office_resources": office_resource_cache_stats(),
+        "accel_sidecar": sidecar_breaker_stats(),
+        "base_callback_outbox": callback_outbox_stats(),
+        "workflow_validation_cache": workflow_validation_cache_stats(),
     }
 
 
@@ -848,6 +905,8 @@ def capabilities():
         "default_header_mapping_mode": DEFAULT_HEADER_MAPPING_MODE,
         "auto_header_mapping_inputs": ["xlsx", "csv", "jsonl", "image", "pdf"],
         "ocr_auto_profile_policy": "tabular_or_debate_text",
+        "response_modes": list(INGEST_EXTRACT_RESPONSE_MODES),
+        "rows_modes": list(INGEST_EXTRACT_ROWS_MODES),
     }
     caps["cleaning_spec_v2"] = {
         "contract": CLEANING_SPEC_V2_CONTRACT,
@@ -1554,112 +1613,157 @@ def _ingest_extract_metadata(rows: list[dict[str, Any]], meta: Dict[str, Any], r
     }
 
 
-@app.post("/ingest/extract")
-def ingest_extract(req: IngestExtractReq):
-    raw_paths = []
-    if str(req.input_path or "").strip():
-        raw_paths.append(str(req.input_path).strip())
-    raw_paths.extend([str(item).strip() for item in req.input_files if str(item).strip()])
-    paths = list(dict.fromkeys(raw_paths))
-    if not paths:
-        return JSONResponse(status_code=400, content={"ok": False, "error": "input_path or input_files is required"})
+_INGEST_EXTRACT_SAMPLE_ROWS = 5
+_INGEST_EXTRACT_BULK_KEYS = {"rows", "image_blocks", "table_cells", "sheet_frames"}
 
-    options = req.model_dump()
-    file_results = []
-    all_rows: list[dict[str, Any]] = []
-    blocked_inputs: list[dict[str, Any]] = []
-    all_image_blocks: list[dict[str, Any]] = []
-    all_table_cells: list[dict[str, Any]] = []
-    all_sheet_frames: list[dict[str, Any]] = []
-    engine_trace: list[dict[str, Any]] = []
-    for path in paths:
+
+def _ingest_extract_failed_file_result(path: str, exc: Exception) -> Dict[str, Any]:
+    return {
+        "path": path,
+        "ok": False,
+        "error": str(exc),
+        "input_format": "",
+        "rows": [],
+        "row_count": 0,
+        "quality_blocked": False,
+        "quality_report": None,
+        "quality_metrics": None,
+        "image_blocks": [],
+        "table_cells": [],
+        "sheet_frames": [],
+        "engine_trace": [],
+        "header_mapping": [],
+        "candidate_profiles": [],
+        "quality_decisions": [],
+        "blocked_reason_codes": [],
+        "sample_rows": [],
+        "detected_structure": "unknown",
+    }
+
+
+def _ingest_extract_file_result(path: str, req: IngestExtractReq, options: Dict[str, Any]) -> Dict[str, Any]:
+    load_kwargs = {
+        "text_by_line": req.text_split_by_line,
+        "ocr_enabled": req.ocr_enabled,
+        "ocr_lang": req.ocr_lang,
+        "ocr_config": req.ocr_config,
+        "ocr_preprocess": req.ocr_preprocess,
+        "xlsx_all_sheets": req.xlsx_all_sheets,
+        "extra_options": options,
+    }
+    rows, meta = ingest.load_rows_from_file(path, **load_kwargs)
+    metadata = _ingest_extract_metadata(rows, meta, req)
+    handoff_dir = str(options.get("extract_handoff_dir") or "")
+    if handoff_dir and not isinstance(meta.get("extract_handoff"), dict) and os.path.isfile(path):
         try:
-            rows, meta = ingest.load_rows_from_file(
+            record = write_extract_handoff(
+                handoff_dir,
                 path,
-                text_by_line=req.text_split_by_line,
-                ocr_enabled=req.ocr_enabled,
-                ocr_lang=req.ocr_lang,
-                ocr_config=req.ocr_config,
-                ocr_preprocess=req.ocr_preprocess,
-                xlsx_all_sheets=req.xlsx_all_sheets,
-                extra_options=options,
+                ingest.effective_load_options(**load_kwargs),
+                rows,
+                meta,
             )
+        except OSError as exc:
+            log.warning("extract handoff write failed for %s: %s", path, exc)
+        else:
+            meta = dict(meta)
+            meta["extract_handoff"] = {"reused": False, **record}
+    quality_metrics = dict(meta.get("quality_metrics") or {}) if isinstance(meta.get("quality_metrics"), dict) else {}
+    if isinstance(metadata.get("derived_quality_metrics"), dict):
+        for key, value in metadata["derived_quality_metrics"].items():
+            quality_metrics[key] = value
+    result = {
+        "path": path,
+        "ok": True,
+        "rows": rows,
+        "row_count": len(rows),
+        "input_format": meta.get("input_format"),
+        "quality_blocked": bool(meta.get("quality_blocked")),
+        "quality_report": meta.get("quality_report"),
+        "quality_metrics": quality_metrics,
+        "image_blocks": meta.get("image_blocks") if isinstance(meta.get("image_blocks"), list) else [],
+        "table_cells": list(metadata.get("effective_table_cells") or []),
+        "sheet_frames": meta.get("sheet_frames") if isinstance(meta.get("sheet_frames"), list) else [],
+        **metadata,
+        "engine_trace": (
+            list(meta.get("engine_trace") or [])
+            + list(metadata.get("header_mapping_trace") or [])
+        ),
+    }
+    if isinstance(meta.get("extract_handoff"), dict):
+        result["extract_handoff"] = meta["extract_handoff"]
+    if bool(meta.get("quality_blocked")):
+        result["_blocked_input"] = {
+            "path": path,
+            "error": str(meta.get("quality_error") or "quality blocked"),
+            "quality_report": meta.get("quality_report"),
+        }
+    return result
+
+
+def _iter_ingest_extract_file_results(paths: list[str], req: IngestExtractReq, handoff_dir: str = ""):
+    """Yield one file result per input as soon as it is extracted.
+
+    With on_file_error=raise a failing input yields its failed result flagged
+    `_raise` and ends the iteration.
+    """
+    options = req.model_dump()
+    if handoff_dir:
+        options["extract_handoff_dir"] = handoff_dir
+    skip_errors = str(req.on_file_error or "raise").strip().lower() != "raise"
+    for path in paths:
+        try:
+            yield _ingest_extract_file_result(path, req, options)
         except Exception as exc:
-            if str(req.on_file_error or "raise").strip().lower() == "raise":
-                return JSONResponse(
-                    status_code=400,
-                    content={"ok": False, "error": str(exc), "path": path},
-                )
-            file_results.append(
-                {
-                    "path": path,
-                    "ok": False,
-                    "error": str(exc),
-                    "input_format": "",
-                    "rows": [],
-                    "row_count": 0,
-                    "quality_blocked": False,
-                    "quality_report": None,
-                    "quality_metrics": None,
-                    "image_blocks": [],
-                    "table_cells": [],
-                    "sheet_frames": [],
-                    "engine_trace": [],
-                    "header_mapping": [],
-                    "candidate_profiles": [],
-                    "quality_decisions": [],
-                    "blocked_reason_codes": [],
-                    "sample_rows": [],
-                    "detected_structure": "unknown",
-                }
-            )
-            continue
-        metadata = _ingest_extract_metadata(rows, meta, req)
-        quality_metrics = dict(meta.get("quality_metrics") or {}) if isinstance(meta.get("quality_metrics"), dict) else {}
-        if isinstance(metadata.get("derived_quality_metrics"), dict):
-            for key, value in metadata["derived_quality_metrics"].items():
-                quality_metrics[key] = value
-        file_results.append(
-            {
-                "path": path,
-                "ok": True,
-                "rows": rows,
-                "row_count": len(rows),
-                "input_format": meta.get("input_format"),
-                "quality_blocked": bool(meta.get("quality_blocked")),
-                "quality_report": meta.get("quality_report"),
-                "quality_metrics": quality_metrics,
-                "image_blocks": meta.get("image_blocks") if isinstance(meta.get("image_blocks"), list) else [],
-                "table_cells": list(metadata.get("effective_table_cells") or []),
-                "sheet_frames": meta.get("sheet_frames") if isinstance(meta.get("sheet_frames"), list) else [],
-                **metadata,
-                "engine_trace": (
-                    list(meta.get("engine_trace") or [])
-                    + list(metadata.get("header_mapping_trace") or [])
-                ),
+            failed = _ingest_extract_failed_file_result(path, exc)
+            if not skip_errors:
+                failed["_raise"] = True
+                yield failed
+                return
+            yield failed
+
+
+class _IngestExtractRowsRef:
+    """Appends every file's rows to one JSONL file under the job stage dir."""
+
+    def __init__(self, req: IngestExtractReq) -> None:
+        context = normalize_job_context(req.job_id, job_context=req.job_context)
+        os.makedirs(context["stage_dir"], exist_ok=True)
+        self.path = os.path.join(context["stage_dir"], INGEST_EXTRACT_ROWS_FILENAME)
+        self.row_count = 0
+        self._info: Optional[Dict[str, Any]] = None
+        self._handle = open_artifact_output(self.path, "w", encoding="utf-8", newline="\n")
+
+    def write(self, file_result: Dict[str, Any]) -> None:
+        rows = file_result.get("rows") or []
+        file_result["rows_offset"] = self.row_count
+        for row in rows:
+            self._handle.write(json.dumps(row, ensure_ascii=False, default=str))
+            self._handle.write("\n")
+        self.row_count += len(rows)
+        file_result["rows"] = []
+
+    def close(self) -> Dict[str, Any]:
+        if self._info is None:
+            self._handle.close()
+            digest = artifact_digest(self.path)
+            self._info = {
+                "path": self.path,
+                "format": "jsonl",
+                "row_count": self.row_count,
+                "size": digest.size,
+                "sha256": digest.sha256,
             }
-        )
-        all_rows.extend(rows)
-        all_image_blocks.extend(meta.get("image_blocks") if isinstance(meta.get("image_blocks"), list) else [])
-        all_table_cells.extend(list(metadata.get("effective_table_cells") or []))
-        all_sheet_frames.extend(meta.get("sheet_frames") if isinstance(meta.get("sheet_frames"), list) else [])
-        engine_trace.extend(file_results[-1].get("engine_trace") if isinstance(file_results[-1].get("engine_trace"), list) else [])
-        if bool(meta.get("quality_blocked")):
-            blocked_inputs.append(
-                {
-                    "path": path,
-                    "error": str(meta.get("quality_error") or "quality blocked"),
-                    "quality_report": meta.get("quality_report"),
-                }
-            )
+        return self._info
+
 
+def _ingest_extract_summary(
+    file_results: list[Dict[str, Any]],
+    blocked_inputs: list[Dict[str, Any]],
+    engine_trace: list[Dict[str, Any]],
+    sample_rows: list[Dict[str, Any]],
+) -> Dict[str, Any]:
     return {
-        "ok": True,
-        "rows": all_rows,
-        "file_results": file_results,
-        "image_blocks": all_image_blocks,
-        "table_cells": all_table_cells,
-        "sheet_frames": all_sheet_frames,
         "quality_metrics": [item.get("quality_metrics") for item in file_results if item.get("quality_metrics")],
         "engine_trace": engine_trace,
         "quality_blocked": len(blocked_inputs) > 0,
@@ -1681,12 +1785,141 @@ def ingest_extract(req: IngestExtractReq):
                 if str(code).strip()
             }
         ),
-        "sample_rows": all_rows[: min(5, len(all_rows))],
+        "sample_rows": sample_rows[:_INGEST_EXTRACT_SAMPLE_ROWS],
         "detected_structure": _merge_detected_structures(file_results),
         "contract": INGEST_EXTRACT_CONTRACT_AUTHORITY,
     }
 
 
+def _stream_ingest_extract(
+    paths: list[str],
+    req: IngestExtractReq,
+    rows_ref: Optional[_IngestExtractRowsRef],
+    handoff_dir: str = "",
+):
+    """NDJSON events: one `file_result` per input, then `summary` (or `error` when an input fails with on_file_error=raise)."""
+    light_results: list[Dict[str, Any]] = []
+    blocked_inputs: list[Dict[str, Any]] = []
+    engine_trace: list[Dict[str, Any]] = []
+    sample_rows: list[Dict[str, Any]] = []
+    row_count = 0
+    try:
+        for index, result in enumerate(_iter_ingest_extract_file_results(paths, req, handoff_dir)):
+            if result.pop("_raise", False):
+                yield json.dumps({"event": "error", "ok": False, "error": result["error"], "path": result["path"]}, ensure_ascii=False) + "\n"
+                return
+            blocked = result.pop("_blocked_input", None)
+            if blocked is not None:
+                blocked_inputs.append(blocked)
+            rows = result.get("rows") or []
+            if len(sample_rows) < _INGEST_EXTRACT_SAMPLE_ROWS:
+                sample_rows.extend(rows[: _INGEST_EXTRACT_SAMPLE_ROWS - len(sample_rows)])
+            row_count += len(rows)
+            if rows_ref is not None:
+                rows_ref.write(result)
+            engine_trace.extend(result.get("engine_trace") if isinstance(result.get("engine_trace"), list) else [])
+            yield json.dumps({"event": "file_result", "index": index, "file_result": result}, ensure_ascii=False, default=str) + "\n"
+            light_results.append({key: value for key, value in result.items() if key not in _INGEST_EXTRACT_BULK_KEYS})
+        summary = {
+            "event": "summary",
+            "ok": True,
+            "file_count": len(light_results),
+            "row_count": row_count,
+            **_ingest_extract_summary(light_results, blocked_inputs, engine_trace, sample_rows),
+        }
+        if rows_ref is not None:
+            summary["rows_ref"] = rows_ref.close()
+        yield json.dumps(summary, ensure_ascii=False, default=str) + "\n"
+    finally:
+        if rows_ref is not None:
+            rows_ref.close()
+
+
+@app.post("/ingest/extract")
+def ingest_extract(req: IngestExtractReq):
+    raw_paths = []
+    if str(req.input_path or "").strip():
+        raw_paths.append(str(req.input_path).strip())
+    raw_paths.extend([str(item).strip() for item in req.input_files if str(item).strip()])
+    paths = list(dict.fromkeys(raw_paths))
+    if not paths:
+        return JSONResponse(status_code=400, content={"ok": False, "error": "input_path or input_files is required"})
+    response_mode = str(req.response_mode or "json").strip().lower()
+    if response_mode not in INGEST_EXTRACT_RESPONSE_MODES:
+        return JSONResponse(status_code=400, content={"ok": False, "error": "response_mode must be json|ndjson"})
+    rows_mode = str(req.rows_mode or "inline").strip().lower()
+    if rows_mode not in INGEST_EXTRACT_ROWS_MODES:
+        return JSONResponse(status_code=400, content={"ok": False, "error": "rows_mode must be inline|reference"})
+    handoff_dir = ""
+    if req.extract_handoff:
+        if not str(req.job_id or "").strip():
+            return JSONResponse(status_code=400, content={"ok": False, "error": "job_id is required for extract_handoff"})
+        try:
+            handoff_dir = extract_handoff_dir(normalize_job_context(req.job_id, job_context=req.job_context)["stage_dir"])
+        except ValueError as exc:
+            return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    rows_ref: Optional[_IngestExtractRowsRef] = None
+    if rows_mode == "reference":
+        if not str(req.job_id or "").strip():
+            return JSONResponse(status_code=400, content={"ok": False, "error": "job_id is required for rows_mode=reference"})
+        try:
+            rows_ref = _IngestExtractRowsRef(req)
+        except ValueError as exc:
+            return JSONResponse(status_code=400, content={"ok": False, "error": str(exc)})
+    if response_mode == "ndjson":
+        return StreamingResponse(_stream_ingest_extract(paths, req, rows_ref, handoff_dir), media_type="application/x-ndjson")
+
+    file_results = []
+    all_rows: list[dict[str, Any]] = []
+    blocked_inputs: list[dict[str, Any]] = []
+    all_image_blocks: list[dict[str, Any]] = []
+    all_table_cells: list[dict[str, Any]] = []
+    all_sheet_frames: list[dict[str, Any]] = []
+    engine_trace: list[dict[str, Any]] = []
+    sample_rows: list[dict[str, Any]] = []
+    try:
+        for result in _iter_ingest_extract_file_results(paths, req, handoff_dir):
+            if result.pop("_raise", False):
+                return JSONResponse(
+                    status_code=400,
+                    content={"ok": False, "error": result["error"], "path": result["path"]},
+                )
+            blocked = result.pop("_blocked_input", None)
+            if blocked is not None:
+                blocked_inputs.append(blocked)
+            file_results.append(result)
+            if not result.get("ok"):
+                continue
+            if rows_ref is not None:
+                rows = result.get("rows") or []
+                if len(sample_rows) < _INGEST_EXTRACT_SAMPLE_ROWS:
+                    sample_rows.extend(rows[: _INGEST_EXTRACT_SAMPLE_ROWS - len(sample_rows)])
+                rows_ref.write(result)
+            else:
+                all_rows.extend(result["rows"])
+            all_image_blocks.extend(result["image_blocks"])
+            all_table_cells.extend(result["table_cells"])
+            all_sheet_frames.extend(result["sheet_frames"])
+            engine_trace.extend(result.get("engine_trace") if isinstance(result.get("engine_trace"), list) else [])
+        rows_ref_info = rows_ref.close() if rows_ref is not None else None
+    finally:
+        if rows_ref is not None:
+            rows_ref.close()
+
+    response = {
+        "ok": True,
+        "rows": all_rows,
+        "file_results": file_results,
+        "image_blocks": all_image_blocks,
+        "table_cells": all_table_cells,
+        "sheet_frames": all_sheet_frames,
+        **_ingest_extract_summary(file_results, blocked_inputs, engine_trace, sample_rows if rows_ref is not None else all_rows),
+    }
+    if rows_ref_info is not None:
+        response["rows_ref"] = rows_ref_info
+    return response
+
+
 def _json_response_content(resp: JSONResponse) -> Dict[str, Any]:
     try:
         payload = json.loads(resp.body.decode("utf-8"))
@@ -1714,6 +1947,9 @@ def _build_ingest_extract_request_from_precheck(req: CleaningPrecheckReq) -> Ing
         sheet_profiles=dict(req.sheet_profiles or {}),
         canonical_profile=str(req.canonical_profile or ""),
         on_file_error=str(req.on_file_error or "raise"),
+        job_id=str(req.job_id or ""),
+        job_context=dict(req.job_context or {}),
+        extract_handoff=bool(str(req.job_id or "").strip()),
     )
 
 
@@ -1749,6 +1985,13 @@ def cleaning_precheck(req: CleaningPrecheckReq):
         params=_build_cleaning_precheck_params(req),
         extract_payload=extract_payload,
     )
+    handoffs = [
+        item["extract_handoff"]
+        for item in extract_payload.get("file_results") or []
+        if isinstance(item, dict) and isinstance(item.get("extract_handoff"), dict)
+    ]
+    if handoffs:
+        payload["extract_handoff"] = handoffs
     payload["contract"] = CLEANING_PRECHECK_CONTRACT_AUTHORITY
     return payload
 
@@ -2069,8 +2312,7 @@ def list_governance_manual_review_history(
     date_from: str = "",
     date_to: str = "",
 ):
-    items = list_manual_review_history(limit)
-    filtered = filter_manual_review_history(items, {
+    filtered = query_manual_review_history(limit, {
         "run_id": run_id,
         "reviewer": reviewer,
         "status": status,
@@ -2183,7 +2425,8 @@ def run_flow(job_id: str, flow: str, req: RunReq):
             content={"ok": False, "error": f"unknown flow: {flow}", "available_flows": runtime_catalog.list_flows()},
         )
     try:
-        result = _run_flow_with_runner(job_id, req, runner)
+        with flow_run(flow):
+            result = _run_flow_with_runner(job_id, req, runner)
     except CleaningGuardrailError as exc:
         return JSONResponse(
             status_code=400,
@@ -2219,7 +2462,8 @@ def run_reference(job_id: str, req: RunReferenceReq):
     t0 = time.time()
     try:
         version_id, _version_item = _resolve_reference_version_item(req)
-        result = _run_workflow_definition_reference(job_id, req, _version_item)
+        with flow_run("workflow_reference"):
+            result = _run_workflow_definition_reference(job_id, req, _version_item)
     except WorkflowValidationFailure as exc:
         return _workflow_graph_validation_failure_response("glue-python", "workflow_reference_run", exc)
     except WorkflowValidationUnavailable as exc:
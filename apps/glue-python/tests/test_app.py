@@ -1,7 +1,9 @@
 import importlib.util
+import json
 from pathlib import Path
 import os
 import tempfile
+import time
 import unittest
 import logging
 from unittest.mock import patch
@@ -9,9 +11,10 @@ import sys
 
 from fastapi.testclient import TestClient
 
-from aiwf import extensions
+from aiwf import accel_transport, extensions
 from aiwf.flows.cleaning_errors import CleaningGuardrailError
 from aiwf.flows.registry import get_flow_registration, get_flow_runner, register_flow, unregister_flow
+from aiwf.metrics import reset_metrics
 from aiwf.governance_surface import (
     GOVERNANCE_CONTROL_PLANE_ROLE,
     GOVERNANCE_SURFACE_META_ROUTE,
@@ -66,6 +69,46 @@ class AppRouteTests(unittest.TestCase):
         self.assertIn("ingest_sidecar", payload)
         self.assertEqual(payload["ingest_sidecar"]["contract"], "contracts/glue/ingest_extract.schema.json")
         self.assertEqual(payload["ingest_sidecar"]["supported_modalities"], ["txt", "docx", "pdf", "image", "xlsx"])
+        self.assertEqual(set(payload["office_resources"]), {"presets", "font_paths", "fonts"})
+        self.assertIn("sidecars", payload["accel_sidecar"])
+
+    def test_metrics_exposes_prometheus_histograms_by_route_template(self):
+        reset_metrics()
+        self.client.get("/health")
+        self.client.get("/governance/workflow-versions/ver_missing_for_metrics")
+        with patch("requests.post", side_effect=ConnectionError("sidecar down")):
+            with self.assertRaises(ConnectionError):
+                accel_transport.post_json("/operators/compute_metrics", {"text": "x"})
+
+        resp = self.client.get("/metrics")
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        body = resp.text
+        self.assertIn("# TYPE aiwf_glue_http_request_duration_seconds histogram", body)
+        self.assertIn('aiwf_glue_http_request_duration_seconds_count{method="GET",route="/health",status="2xx"} 1', body)
+        self.assertIn('route="/governance/workflow-versions/{version_id}"', body)
+        self.assertNotIn("ver_missing_for_metrics", body)
+        self.assertIn(
+            'aiwf_glue_operator_call_duration_seconds_bucket{endpoint="/operators/compute_metrics",outcome="error",le="+Inf"} 1',
+            body,
+        )
+        self.assertIn('aiwf_glue_cache_requests_total{cache="workflow_validation",result="hit"}', body)
+        self.assertIn('aiwf_glue_queue_depth{queue="base_callback_outbox"} 0', body)
+
+    def test_metrics_time_streamed_responses_until_the_body_finishes(self):
+        def _load(path, **kwargs):
+            time.sleep(0.1)
+            return ([{"text": "row"}], {"input_format": "txt", "quality_blocked": False, "engine_trace": []})
+
+        reset_metrics()
+        with patch.object(glue_app.ingest, "load_rows_from_file", side_effect=_load):
+            resp = self.client.post("/ingest/extract", json={"input_files": ["a.txt", "b.txt"], "response_mode": "ndjson"})
+        self.assertEqual(resp.status_code, 200)
+
+        prefix = 'aiwf_glue_http_request_duration_seconds_sum{method="POST",route="/ingest/extract",status="2xx"} '
+        line = next(line for line in self.client.get("/metrics").text.splitlines() if line.startswith(prefix))
+        self.assertGreaterEqual(float(line[len(prefix) :]), 0.2)
 
     def test_ingest_extract_route_returns_rows_and_quality_state(self):
         with patch.object(glue_app.ingest, "load_rows_from_file") as load_rows:
@@ -105,6 +148,67 @@ class AppRouteTests(unittest.TestCase):
         self.assertIn("blocked_reason_codes", payload)
         self.assertIn("sample_rows", payload)
 
+    def test_ingest_extract_streams_ndjson_events_and_writes_rows_by_reference(self):
+        def _load(path, **kwargs):
+            if path.endswith("broken.txt"):
+                raise ValueError("unreadable input")
+            return (
+                [{"text": f"{os.path.basename(path)} row {idx}"} for idx in range(3)],
+                {"input_format": "txt", "quality_blocked": False, "engine_trace": [{"engine": "txt", "ok": True}]},
+            )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.dict(os.environ, {"AIWF_JOBS_ROOT": tmp}), patch.object(
+                glue_app.ingest, "load_rows_from_file", side_effect=_load
+            ):
+                resp = self.client.post(
+                    "/ingest/extract",
+                    json={
+                        "input_files": ["a.txt", "broken.txt", "b.txt"],
+                        "on_file_error": "skip",
+                        "response_mode": "ndjson",
+                    },
+                )
+                self.assertEqual(resp.status_code, 200)
+                self.assertTrue(resp.headers["content-type"].startswith("application/x-ndjson"))
+                events = [json.loads(line) for line in resp.text.splitlines() if line.strip()]
+                self.assertEqual([event["event"] for event in events], ["file_result"] * 3 + ["summary"])
+                self.assertEqual(events[0]["file_result"]["rows"][0]["text"], "a.txt row 0")
+                self.assertFalse(events[1]["file_result"]["ok"])
+                summary = events[-1]
+                self.assertEqual((summary["file_count"], summary["row_count"]), (3, 6))
+                self.assertEqual(len(summary["sample_rows"]), 5)
+                self.assertNotIn("rows", summary)
+                self.assertEqual(summary["contract"], "contracts/glue/ingest_extract.schema.json")
+
+                raised = self.client.post(
+                    "/ingest/extract",
+                    json={"input_files": ["broken.txt", "a.txt"], "response_mode": "ndjson"},
+                )
+                events = [json.loads(line) for line in raised.text.splitlines() if line.strip()]
+                self.assertEqual(events, [{"event": "error", "ok": False, "error": "unreadable input", "path": "broken.txt"}])
+
+                missing_job = self.client.post("/ingest/extract", json={"input_path": "a.txt", "rows_mode": "reference"})
+                self.assertEqual(missing_job.status_code, 400)
+
+                resp = self.client.post(
+                    "/ingest/extract",
+                    json={"input_files": ["a.txt", "b.txt"], "rows_mode": "reference", "job_id": "job_ref"},
+                )
+            self.assertEqual(resp.status_code, 200)
+            payload = resp.json()
+            self.assertEqual(payload["rows"], [])
+            self.assertEqual([item["rows"] for item in payload["file_results"]], [[], []])
+            self.assertEqual([item["rows_offset"] for item in payload["file_results"]], [0, 3])
+            self.assertEqual(len(payload["sample_rows"]), 5)
+            rows_ref = payload["rows_ref"]
+            self.assertEqual(rows_ref["path"], os.path.join(tmp, "job_ref", "stage", "ingest_extract_rows.jsonl"))
+            self.assertEqual(rows_ref["row_count"], 6)
+            with open(rows_ref["path"], "r", encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual(lines[3], {"text": "b.txt row 0"})
+            self.assertEqual(rows_ref["size"], os.path.getsize(rows_ref["path"]))
+
     def test_capabilities_route_reports_registered_components(self):
         resp = self.client.get("/capabilities")
         self.assertEqual(resp.status_code, 200)
@@ -367,6 +471,54 @@ class AppRouteTests(unittest.TestCase):
         self.assertFalse(payload["review_required"])
         self.assertEqual(payload["contract"], "contracts/glue/cleaning_precheck.schema.json")
 
+    def test_cleaning_precheck_persists_extract_handoff_reused_by_cleaning_preprocess(self):
+        from aiwf.flows import cleaning
+
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs_root = os.path.join(tmp, "jobs")
+            src = os.path.join(tmp, "notes.txt")
+            with open(src, "w", encoding="utf-8") as f:
+                f.write("Alice: Transit games improve recall.\n\nBob: Costs rose in 2024.\n")
+            with patch.dict(os.environ, {"AIWF_JOBS_ROOT": jobs_root}):
+                resp = self.client.post(
+                    "/cleaning/precheck",
+                    json={"input_files": [src], "cleaning_template": "debate_evidence_v1", "job_id": "job_handoff"},
+                )
+                self.assertEqual(resp.status_code, 200)
+                handoffs = resp.json()["extract_handoff"]
+                self.assertEqual(len(handoffs), 1)
+                self.assertFalse(handoffs[0]["reused"])
+                with open(handoffs[0]["path"], "r", encoding="utf-8") as f:
+                    persisted = json.load(f)
+                self.assertEqual(persisted["source_sha256"], handoffs[0]["source_sha256"])
+                self.assertNotIn("analysis", persisted)
+
+                job_root = os.path.join(jobs_root, "job_handoff")
+                stage_dir = os.path.join(job_root, "stage")
+                params = {
+                    "preprocess": {
+                        "enabled": True,
+                        "input_path": src,
+                        "input_files": [src],
+                        "output_format": "jsonl",
+                        "output_path": os.path.join(stage_dir, "preprocessed.jsonl"),
+                    }
+                }
+                with patch.object(glue_app.ingest, "get_input_reader", side_effect=AssertionError("re-extracted")):
+                    _, result = cleaning._maybe_preprocess_input(params, job_root, stage_dir)
+                self.assertGreater(int(result["summary"]["output_rows"]), 0)
+                self.assertTrue(result["file_results"][0]["meta"]["extract_handoff"]["reused"])
+
+                with open(src, "a", encoding="utf-8") as f:
+                    f.write("Carol: A new paragraph.\n")
+                with patch.object(glue_app.ingest, "get_input_reader", side_effect=AssertionError("re-extracted")):
+                    _, result = cleaning._maybe_preprocess_input(params, job_root, stage_dir)
+                self.assertEqual(result["failed_files"], [{"path": src, "error": "re-extracted"}])
+
+                escaping = {"preprocess": {**params["preprocess"], "extract_handoff_dir": tmp}}
+                with self.assertRaisesRegex(ValueError, "path escapes root"):
+                    cleaning._maybe_preprocess_input(escaping, job_root, stage_dir)
+
     def test_cleaning_precheck_blocks_mismatched_template_from_extract_recommendation(self):
         with patch.object(glue_app.ingest, "load_rows_from_file") as load_rows:
             load_rows.return_value = (
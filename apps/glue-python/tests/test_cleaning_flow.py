@@ -26,6 +26,7 @@ from aiwf.flows.office_artifacts import (
 )
 from aiwf.governance_manual_reviews import list_manual_reviews
 from aiwf.governance_quality_rule_sets import save_quality_rule_set
+from aiwf.metrics import FLOW_STAGE_SECONDS, reset_metrics
 
 
 def make_job_context(job_root: str) -> dict[str, str]:
@@ -44,6 +45,15 @@ def with_job_context(job_root: str, **params):
     return out
 
 
+def _write_office_stub(path, *args, **kwargs):
+    with open(path, "wb") as f:
+        f.write(os.path.basename(path).encode("utf-8"))
+
+
+def _fail_office_stub(path, *args, **kwargs):
+    raise KeyError("docx boom")
+
+
 class CleaningFlowTests(unittest.TestCase):
     def test_evaluate_advanced_quality_supports_report_only_and_block_modes(self):
         rows = [
@@ -190,6 +200,329 @@ class CleaningFlowTests(unittest.TestCase):
         self.assertEqual(profile["max_amount"], 10.0)
         self.assertEqual(profile["avg_amount"], 10.0)
 
+    def test_build_profile_mixed_native_and_text_values_keep_decimal_rounding(self):
+        profile = cleaning._build_profile(
+            [
+                {"amount": 0.1, "score": True},
+                {"amount": "0.2", "score": "n/a"},
+                {"amount": "¥1,000.005", "score": 3},
+                {"amount": 0.1, "tags": ["a"]},
+                {"amount": None},
+            ],
+            {"input_rows": 5, "output_rows": 5},
+            "unit.test",
+        )
+
+        self.assertEqual(profile["cols"], 3)
+        self.assertEqual(profile["fields"], ["amount", "score", "tags"])
+        self.assertEqual(profile["sum_amount"], 1000.41)
+        self.assertEqual(profile["min_amount"], 0.1)
+        self.assertEqual(profile["max_amount"], 1000.01)
+        self.assertEqual(profile["avg_amount"], 250.1)
+        self.assertEqual(profile["numeric_stats"]["score"], {"sum": 3.0, "min": 3.0, "max": 3.0, "avg": 3.0})
+        self.assertNotIn("tags", profile["numeric_stats"])
+
+    def test_materialize_office_outputs_reuses_run_profile(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            rows = [{"id": 1, "amount": 10.0}, {"id": 2, "amount": 5.5}]
+            quality = {"input_rows": 2, "output_rows": 2}
+            run_profile = cleaning._build_profile(rows, quality, "python")
+            run_profile["quality_gate"] = {"passed": True}
+            seen_profiles = []
+
+            def write_bin(path, *args, **kwargs):
+                seen_profiles.append(kwargs.get("profile"))
+                with open(path, "wb") as f:
+                    f.write(b"BIN")
+                return True
+
+            out = cleaning_flow_materialization.materialize_office_outputs(
+                job_id="job-profile-reuse",
+                artifacts_dir=tmp,
+                params_effective={"enabled_office_artifacts": ["xlsx"]},
+                rows=rows,
+                quality=quality,
+                profile_source="python",
+                office_rows_subset=cleaning._office_rows_subset,
+                build_profile=Mock(side_effect=AssertionError("profile should be reused")),
+                write_profile_illustration_png=write_bin,
+                write_fin_xlsx=write_bin,
+                write_audit_docx=write_bin,
+                write_deck_pptx=write_bin,
+                sha256_file=lambda _path: "sha",
+                profile=run_profile,
+            )
+
+        office_profile = out["office_profile"]
+        self.assertEqual(office_profile["sum_amount"], 15.5)
+        self.assertNotIn("quality_gate", office_profile)
+        self.assertIs(seen_profiles[-1], office_profile)
+
+    def test_write_cleaned_parquet_uses_declared_casts_and_row_groups(self):
+        import pyarrow.parquet as pq  # type: ignore
+
+        with tempfile.TemporaryDirectory() as tmp:
+            parquet_path = os.path.join(tmp, "cleaned.parquet")
+            rows = [
+                {"id": 1, "amount": 10, "name": "alice", "tags": ["a"]},
+                {"id": 2, "amount": 2.5, "name": None, "extra": True},
+                {"id": 3, "amount": None, "name": "carol"},
+            ]
+            metadata = cleaning._write_cleaned_parquet(
+                parquet_path,
+                rows,
+                params={
+                    "rules": {
+                        "casts": {"id": "int", "amount": "float", "name": "string"},
+                        "parquet_row_group_size": 2,
+                        "parquet_compression": "zstd",
+                        "parquet_dictionary": ["name"],
+                    }
+                },
+            )
+
+            parquet_file = pq.ParquetFile(parquet_path)
+            schema = {field.name: str(field.type) for field in parquet_file.schema_arrow}
+            table = parquet_file.read()
+
+        self.assertEqual(schema, {"id": "int64", "amount": "double", "name": "string", "tags": "string", "extra": "bool"})
+        self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+        self.assertEqual(table.column("amount").to_pylist(), [10.0, 2.5, None])
+        self.assertEqual(table.column("tags").to_pylist(), ['["a"]', None, None])
+        self.assertEqual(metadata["writer"], "pyarrow")
+        self.assertEqual(metadata["rows"], 3)
+        self.assertEqual(metadata["row_groups"], 2)
+        self.assertEqual(metadata["compression"], "zstd")
+        self.assertGreater(metadata["bytes"], 0)
+        self.assertIn("rows_per_second", metadata)
+
+    def test_write_cleaned_parquet_reports_failure_instead_of_silent_placeholder(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            parquet_path = os.path.join(tmp, "cleaned.parquet")
+            rows = [{"id": 1, "amount": 1.0}]
+            with patch(
+                "aiwf.flows.cleaning_outputs.build_parquet_schema",
+                side_effect=RuntimeError("schema boom"),
+            ):
+                with self.assertRaisesRegex(RuntimeError, "local parquet write failed: schema boom"):
+                    cleaning._write_cleaned_parquet(parquet_path, rows, params={"local_parquet_strict": True})
+                metadata = cleaning._write_cleaned_parquet(parquet_path, rows, params={"local_parquet_strict": False})
+
+            self.assertFalse(cleaning._is_valid_parquet_file(parquet_path))
+
+        self.assertEqual(metadata["writer"], "placeholder")
+        self.assertEqual(metadata["error"], "schema boom")
+
+    def test_write_cleaned_parquet_reads_flow_params_and_honors_strict_for_bad_codec(self):
+        from aiwf.flows.cleaning_outputs import parquet_write_params
+
+        with tempfile.TemporaryDirectory() as tmp:
+            parquet_path = os.path.join(tmp, "cleaned.parquet")
+            rows = [{"id": 1}, {"id": 2}, {"id": 3}]
+            with parquet_write_params({"rules": {"parquet_row_group_size": 2}}):
+                grouped = cleaning._write_cleaned_parquet(parquet_path, rows)
+            with parquet_write_params({"rules": {"parquet_compression": "lzma"}, "local_parquet_strict": False}):
+                fallback = cleaning._write_cleaned_parquet(parquet_path, rows)
+            with parquet_write_params({"rules": {"parquet_compression": "lzma"}, "local_parquet_strict": True}):
+                with self.assertRaisesRegex(RuntimeError, "unsupported parquet_compression: lzma"):
+                    cleaning._write_cleaned_parquet(parquet_path, rows)
+
+        self.assertEqual(grouped["row_groups"], 2)
+        self.assertEqual(fallback["writer"], "placeholder")
+        self.assertEqual(fallback["error"], "unsupported parquet_compression: lzma")
+
+    def test_materialize_office_outputs_isolates_writer_failures_in_a_bounded_pool(self):
+        from aiwf.flows.cleaning_orchestrator_support import build_success_result
+
+        def materialize(tmp, write_fin_xlsx, write_audit_docx, write_deck_pptx, **params):
+            return cleaning_flow_materialization.materialize_office_outputs(
+                job_id="job-office-pool",
+                artifacts_dir=tmp,
+                params_effective=params,
+                rows=[{"id": 1, "amount": 1.0}],
+                quality={"input_rows": 1, "output_rows": 1},
+                profile_source="python",
+                office_rows_subset=cleaning._office_rows_subset,
+                build_profile=cleaning._build_profile,
+                write_profile_illustration_png=lambda *_args, **_kwargs: True,
+                write_fin_xlsx=write_fin_xlsx,
+                write_audit_docx=write_audit_docx,
+                write_deck_pptx=write_deck_pptx,
+                sha256_file=os.path.basename,
+            )
+
+        def closure_writer(path, *args, **kwargs):
+            _write_office_stub(path)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            in_process = materialize(tmp, _write_office_stub, _fail_office_stub, _write_office_stub, office_max_workers=3)
+            threaded = materialize(tmp, closure_writer, _fail_office_stub, closure_writer, office_max_workers="2")
+            inline = materialize(tmp, closure_writer, _fail_office_stub, closure_writer, office_max_workers="bad")
+            with patch.dict(os.environ, {"AIWF_OFFICE_MAX_WORKERS": "1"}):
+                single = materialize(tmp, _write_office_stub, _fail_office_stub, _write_office_stub)
+
+        self.assertEqual(
+            [in_process["office_executor"], threaded["office_executor"], inline["office_executor"], single["office_executor"]],
+            ["process", "thread", "thread", "inline"],
+        )
+        for out in (in_process, threaded, inline, single):
+            self.assertEqual([item["sha256"] for item in out["office_artifacts"]], ["fin.xlsx", "deck.pptx"])
+            self.assertEqual(list(out["office_artifact_errors"]), ["docx_audit"])
+            self.assertIn("KeyError", out["office_artifact_errors"]["docx_audit"])
+            self.assertIn("docx boom", out["office_artifact_errors"]["docx_audit"])
+            timings = {item["artifact_id"]: item for item in out["office_timings"]}
+            self.assertFalse(timings["docx_audit_001"]["ok"])
+            self.assertTrue(timings["xlsx_fin_001"]["ok"])
+            self.assertEqual(out["office_timings"][0]["name"], "summary_visual")
+        result = build_success_result(
+            job_id="job-office-pool",
+            materialized={"sha_parquet": "", "profile": {}, **in_process},
+            artifacts=[],
+            accel_result={"accel": {}, "use_accel_outputs": False, "accel_validation_error": None, "accel_resp": None},
+            started_at=0.0,
+        )
+        self.assertEqual(result["office_artifact_errors"], in_process["office_artifact_errors"])
+
+    def test_artifact_writers_record_sha256_while_writing(self):
+        import hashlib
+
+        from aiwf.artifact_io import recorded_artifact_digest
+
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "cleaned.csv")
+            parquet_path = os.path.join(tmp, "cleaned.parquet")
+            xlsx_path = os.path.join(tmp, "fin.xlsx")
+            rows = [{"id": 1, "amount": 10.5}, {"id": 2, "amount": 3.0}]
+            cleaning._write_cleaned_csv(csv_path, rows)
+            cleaning._write_cleaned_parquet(parquet_path, rows)
+            cleaning._write_fin_xlsx(xlsx_path, rows)
+
+            for path in (csv_path, parquet_path, xlsx_path):
+                with open(path, "rb") as handle:
+                    payload = handle.read()
+                digest = recorded_artifact_digest(path)
+                self.assertIsNotNone(digest)
+                self.assertEqual(digest.size, len(payload))
+                self.assertEqual(digest.sha256, hashlib.sha256(payload).hexdigest())
+                self.assertEqual(cleaning._sha256_file(path), digest.sha256)
+
+            with open(csv_path, "a", encoding="utf-8") as handle:
+                handle.write("3,1.0\n")
+            self.assertIsNone(recorded_artifact_digest(csv_path))
+            with open(csv_path, "rb") as handle:
+                self.assertEqual(cleaning._sha256_file(csv_path), hashlib.sha256(handle.read()).hexdigest())
+
+    def test_artifact_digest_rehashes_same_size_rewrites_with_pinned_mtime(self):
+        import hashlib
+
+        from aiwf import artifact_io
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.json")
+            artifact_io.write_artifact_bytes(path, b'{"v": 1}')
+            stat = os.stat(path)
+            with open(path, "wb") as f:
+                f.write(b'{"v": 2}')
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(os.stat(path).st_mtime_ns, stat.st_mtime_ns)
+            rewritten = artifact_io.artifact_digest(path)
+
+            # On a coarse-resolution filesystem the write-time digest is not kept at all.
+            with patch.object(artifact_io, "_COARSE_MTIME_NS", 1):
+                artifact_io.write_artifact_bytes(path, b'{"v": 3}')
+                coarse = artifact_io.recorded_artifact_digest(path)
+
+        self.assertEqual(rewritten.sha256, hashlib.sha256(b'{"v": 2}').hexdigest())
+        self.assertIsNone(coarse)
+
+    def test_fin_xlsx_streams_rows_with_shared_styles(self):
+        from openpyxl import load_workbook  # type: ignore
+
+        with tempfile.TemporaryDirectory() as tmp:
+            xlsx_path = os.path.join(tmp, "fin.xlsx")
+            rows = [{"id": i, "amount": i * 1.5, "name": f"n{i}"} for i in range(1, 6)]
+            rows.append({"id": 6, "amount": "7.25", "memo": "late column"})
+            cleaning._write_fin_xlsx(xlsx_path, rows, None, {"office_quality_mode": "high"})
+
+            wb = load_workbook(xlsx_path)
+            ws = wb["detail"]
+            self.assertEqual([str(r) for r in ws.merged_cells.ranges], ["A1:D1"])
+            self.assertEqual(ws.freeze_panes, "A3")
+            self.assertEqual(ws.auto_filter.ref, "A2:D8")
+            self.assertEqual(ws.row_dimensions[1].height, 24)
+            self.assertEqual([c.value for c in ws[2]], ["id", "amount", "name", "memo"])
+            self.assertTrue(ws["A2"].font.b)
+            self.assertEqual(ws["A2"].alignment.horizontal, "center")
+            self.assertEqual(ws["B3"].number_format, "#,##0.00")
+            self.assertEqual(ws["C3"].number_format, "General")
+            self.assertEqual(ws["A3"].fill.fgColor.rgb, "00F4F7FB")
+            self.assertIsNone(ws["A4"].fill.fill_type)
+            self.assertEqual(ws["D8"].value, "late column")
+            self.assertEqual(ws.column_dimensions["D"].width, len("late column") + 2)
+            self.assertIn("aiwf_body_alt", wb.named_styles)
+            summary = wb["summary"]
+            self.assertEqual(summary["B4"].value, 6)
+            wb.close()
+
+    def test_office_presets_and_fonts_are_cached_until_files_change(self):
+        from aiwf import office_resources
+        from aiwf.office_style import load_theme_presets, office_theme_settings, pil_font
+
+        office_resources.clear_office_resource_caches()
+        with tempfile.TemporaryDirectory() as tmp:
+            theme_path = os.path.join(tmp, "themes.json")
+            presets = {"zh": {"professional": {"report_title": "v1"}}, "en": {}}
+            with open(theme_path, "w", encoding="utf-8") as f:
+                json.dump(presets, f)
+            with patch.dict(os.environ, {"AIWF_OFFICE_THEME_FILE": theme_path}):
+                self.assertEqual(office_theme_settings()["report_title"], "v1")
+                self.assertEqual(office_theme_settings()["report_title"], "v1")
+                load_theme_presets()["zh"]["professional"]["report_title"] = "mutated"
+                self.assertEqual(office_theme_settings()["report_title"], "v1")
+                stats = office_resources.office_resource_cache_stats()["presets"]
+                self.assertEqual(stats["misses"], 1)
+                self.assertEqual(stats["hits"], 3)
+
+                presets["zh"]["professional"]["report_title"] = "v2"
+                with open(theme_path, "w", encoding="utf-8") as f:
+                    json.dump(presets, f)
+                os.utime(theme_path, ns=(1, 1))
+                self.assertEqual(office_theme_settings()["report_title"], "v2")
+                self.assertEqual(office_resources.office_resource_cache_stats()["presets"]["invalidations"], 1)
+
+        first = pil_font(20, {"office_lang": "en"})
+        second = pil_font(20, {"office_lang": "en"})
+        stats = office_resources.office_resource_cache_stats()
+        self.assertEqual(stats["font_paths"]["hits"], 1)
+        if first is not None:
+            self.assertIs(first, second)
+            self.assertEqual(stats["fonts"]["hits"], 1)
+        office_resources.clear_office_resource_caches()
+
+    def test_docx_bulk_table_matches_python_docx_markup(self):
+        from docx import Document  # type: ignore
+
+        from aiwf.office_style import docx_apply_font
+        from aiwf.office_writer_docx import add_bulk_table
+
+        rows = [("字段", "Value"), (" padded ", "a\tb\nc"), ("x&<y>", None), ("short",)]
+        expected = Document()
+        table = expected.add_table(rows=1, cols=2)
+        table.style = "Light Grid Accent 1"
+        for idx, row in enumerate(rows):
+            cells = table.rows[0].cells if idx == 0 else table.add_row().cells
+            for col_idx in range(2):
+                cells[col_idx].text = str(row[col_idx]) if col_idx < len(row) else ""
+        docx_apply_font(expected, "Microsoft YaHei")
+
+        actual = Document()
+        built = add_bulk_table(actual, rows, style="Light Grid Accent 1", font_name="Microsoft YaHei")
+        docx_apply_font(actual, "Microsoft YaHei")
+
+        self.assertEqual(built._tbl.xml, table._tbl.xml)
+        self.assertEqual(built.cell(1, 1).text, "a\tb\nc")
+        self.assertEqual(built.cell(3, 1).text, "")
+
     def test_office_writers_produce_rich_outputs(self):
         with tempfile.TemporaryDirectory() as tmp:
             xlsx_path = os.path.join(tmp, "fin.xlsx")
@@ -398,6 +731,96 @@ class CleaningFlowTests(unittest.TestCase):
             artifact_kinds = {a["kind"] for a in out["artifacts"]}
             self.assertFalse({"xlsx", "docx", "pptx"} & artifact_kinds)
 
+    def test_run_cleaning_flow_result_cache_replays_artifacts_and_callbacks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            calls = {"parquet": 0}
+
+            def write_valid_parquet(path, rows):
+                calls["parquet"] += 1
+                with open(path, "wb") as f:
+                    f.write(b"PAR1dataPAR1")
+
+            def run(job_id, rows):
+                with patch("aiwf.flows.cleaning._base_step_start"), patch(
+                    "aiwf.flows.cleaning._base_artifact_upsert"
+                ) as upsert, patch("aiwf.flows.cleaning._base_step_done") as step_done, patch(
+                    "aiwf.flows.cleaning._base_step_fail"
+                ), patch(
+                    "aiwf.flows.cleaning._try_accel_cleaning",
+                    return_value={"attempted": True, "ok": False, "error": "accel unavailable"},
+                ), patch(
+                    "aiwf.flows.cleaning._write_cleaned_parquet", side_effect=write_valid_parquet
+                ):
+                    out = cleaning.run_cleaning(
+                        job_id=job_id,
+                        actor="test",
+                        params=with_job_context(
+                            os.path.join(tmp, job_id),
+                            flow_result_cache=True,
+                            office_outputs_enabled=False,
+                            rows=rows,
+                        ),
+                    )
+                return out, upsert, step_done
+
+            with patch.dict(os.environ, {"AIWF_FLOW_RESULT_CACHE_DIR": os.path.join(tmp, "cache")}):
+                first, _, _ = run("job-cache-a", [{"id": 1, "amount": 10.0}])
+                second, upsert, step_done = run("job-cache-b", [{"id": 1, "amount": 10.0}])
+                third, _, _ = run("job-cache-c", [{"id": 2, "amount": 11.0}])
+
+                self.assertEqual(first["flow_cache"]["hit"], False)
+                self.assertTrue(first["flow_cache"]["stored"])
+                self.assertTrue(second["flow_cache"]["hit"])
+                self.assertEqual(second["flow_cache"]["source_job_id"], "job-cache-a")
+                self.assertEqual(second["flow_cache"]["key"], first["flow_cache"]["key"])
+                self.assertEqual(second["job_id"], "job-cache-b")
+                self.assertEqual(second["output_hash"], first["output_hash"])
+                self.assertFalse(third["flow_cache"]["hit"])
+                self.assertEqual(calls["parquet"], 2)
+
+                job_b_root = os.path.join(tmp, "job-cache-b")
+                self.assertEqual(upsert.call_count, len(second["artifacts"]))
+                for artifact in second["artifacts"]:
+                    self.assertTrue(artifact["path"].startswith(job_b_root))
+                    self.assertTrue(os.path.isfile(artifact["path"]))
+                self.assertEqual(step_done.call_args.kwargs["output_hash"], first["output_hash"])
+                self.assertEqual(second["flow_cache"]["link_mode"], "copy")
+                first_paths = {os.path.basename(a["path"]): a["path"] for a in first["artifacts"]}
+                for artifact in second["artifacts"]:
+                    source = first_paths[os.path.basename(artifact["path"])]
+                    self.assertFalse(os.path.samefile(source, artifact["path"]))
+
+                # Rewriting a source artifact in place must not leak into the cache.
+                parquet_a = next(a["path"] for a in first["artifacts"] if a["path"].endswith(".parquet"))
+                with open(parquet_a, "wb") as f:
+                    f.write(b"PAR1tamperedPAR1")
+                again, _, _ = run("job-cache-b2", [{"id": 1, "amount": 10.0}])
+                self.assertTrue(again["flow_cache"]["hit"])
+                parquet_b2 = next(a["path"] for a in again["artifacts"] if a["path"].endswith(".parquet"))
+                with open(parquet_b2, "rb") as f:
+                    self.assertEqual(f.read(), b"PAR1dataPAR1")
+
+                # A cached file whose bytes no longer match its recorded sha256 is a miss.
+                cached_parquet = next(
+                    os.path.join(root, name)
+                    for root, _, names in os.walk(os.path.join(tmp, "cache"))
+                    if first["flow_cache"]["key"] in root
+                    for name in names
+                    if name.endswith(".parquet")
+                )
+                with open(cached_parquet, "wb") as f:
+                    f.write(b"PAR1datXPAR1")
+                corrupt, _, _ = run("job-cache-b3", [{"id": 1, "amount": 10.0}])
+                self.assertFalse(corrupt["flow_cache"]["hit"])
+                self.assertEqual(calls["parquet"], 3)
+
+                with patch.dict(os.environ, {"AIWF_FLOW_RESULT_CACHE_MAX_BYTES": "1"}):
+                    fourth, _, _ = run("job-cache-d", [{"id": 3, "amount": 12.0}])
+                self.assertTrue(fourth["flow_cache"]["stored"])
+                self.assertEqual(fourth["flow_cache"]["evicted"], 2)
+                replay, _, _ = run("job-cache-e", [{"id": 1, "amount": 10.0}])
+                self.assertFalse(replay["flow_cache"]["hit"])
+
     def test_run_cleaning_can_disable_optional_core_artifacts(self):
         with tempfile.TemporaryDirectory() as tmp:
             local_job_root = os.path.join(tmp, "job")
@@ -589,6 +1012,101 @@ class CleaningFlowTests(unittest.TestCase):
             self.assertEqual(len(queued), 1)
             self.assertEqual(queued[0]["review_key"], "cleaning::duplicate_key_risk::1")
 
+    def test_run_cleaning_records_per_stage_duration_histograms(self):
+        reset_metrics()
+        with tempfile.TemporaryDirectory() as tmp:
+            local_job_root = os.path.join(tmp, "job")
+
+            def write_valid_parquet(path, rows):
+                with open(path, "wb") as f:
+                    f.write(b"PAR1dataPAR1")
+
+            with patch.dict("os.environ", {"AIWF_GOVERNANCE_ROOT": tmp}, clear=False), patch(
+                "aiwf.flows.cleaning._write_cleaned_parquet", side_effect=write_valid_parquet
+            ):
+                cleaning.run_cleaning(
+                    job_id="job-stage-metrics",
+                    actor="test",
+                    params=with_job_context(
+                        local_job_root,
+                        local_standalone=True,
+                        office_outputs_enabled=False,
+                        rules={"use_rust_v2": False, "platform_mode": "generic"},
+                        rows=[{"id": 1, "amount": "10.5"}, {"id": 2, "amount": "3"}],
+                    ),
+                )
+
+        counts = {
+            labels["stage"]: value
+            for name, labels, value in FLOW_STAGE_SECONDS.samples()
+            if name.endswith("_count") and labels["flow"] == "cleaning" and labels["outcome"] == "ok"
+        }
+        for stage in ("preprocess", "load", "clean", "quality_gate", "write_csv", "write_parquet"):
+            self.assertGreaterEqual(counts.get(stage, 0), 1, stage)
+        self.assertNotIn("callback_step_start", counts)
+
+    def test_run_cleaning_appends_stage_measurements_and_writes_profile_artifact(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            local_job_root = os.path.join(tmp, "job")
+
+            def write_valid_parquet(path, rows):
+                with open(path, "wb") as f:
+                    f.write(b"PAR1dataPAR1")
+
+            with patch.dict("os.environ", {"AIWF_GOVERNANCE_ROOT": tmp}, clear=False), patch(
+                "aiwf.flows.cleaning._write_cleaned_parquet", side_effect=write_valid_parquet
+            ):
+                out = cleaning.run_cleaning(
+                    job_id="job-stage-profile",
+                    actor="test",
+                    params=with_job_context(
+                        local_job_root,
+                        local_standalone=True,
+                        office_outputs_enabled=False,
+                        stage_profile=True,
+                        stage_profile_top_n=5,
+                        rules={"use_rust_v2": False, "platform_mode": "generic"},
+                        rows=[{"id": 1, "amount": "10.5"}, {"id": 2, "amount": "3"}],
+                    ),
+                )
+            profile_artifact = next(item for item in out["artifacts"] if item["artifact_id"] == "stage_profile_json_001")
+            with open(profile_artifact["path"], "r", encoding="utf-8") as f:
+                report = json.load(f)
+
+        provenance = out["execution"]["stage_provenance"]
+        self.assertEqual([item["stage"] for item in provenance[:3]], ["row_transform", "quality_gate", "materialize"])
+        flow_stages = {item["stage"]: item for item in provenance if item.get("scope") == "flow"}
+        self.assertEqual((flow_stages["clean"]["rows_in"], flow_stages["clean"]["rows_out"]), (2, 2))
+        self.assertEqual(flow_stages["load"]["rows_out"], 2)
+        self.assertEqual(flow_stages["write_parquet"]["bytes_serialized"], len(b"PAR1dataPAR1"))
+        self.assertGreater(flow_stages["write_csv"]["bytes_serialized"], 0)
+        self.assertGreaterEqual(flow_stages["clean"]["cpu_seconds"], 0.0)
+        self.assertEqual(out["quality_summary"]["engine_path"]["stage_provenance"], provenance)
+        self.assertEqual(report["schema"], "stage_profile.v1")
+        self.assertLessEqual(len(report["cpu_top"]), 5)
+        self.assertTrue(report["cpu_top"])
+        self.assertIn("clean", [item["stage"] for item in report["stages"]])
+
+    def test_overlapping_run_profilers_share_tracemalloc_until_the_last_one_stops(self):
+        import tracemalloc
+
+        from aiwf.artifact_io import recorded_artifact_digest
+        from aiwf.stage_profile import RunProfiler
+
+        self.assertFalse(tracemalloc.is_tracing())
+        first = RunProfiler().start()
+        second = RunProfiler().start()
+        first.stop()
+        self.assertTrue(tracemalloc.is_tracing())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "stage_profile.json")
+            finished = second.finish(path, lambda p: recorded_artifact_digest(p).sha256)
+            self.assertNotIn("error", finished)
+            self.assertEqual(finished["artifact"]["path"], path)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(first.report()["traced_peak_bytes"], 0)
+        second.stop()
+
     def test_run_cleaning_enqueues_manual_review_when_risky_duplicate_is_outside_sample(self):
         with tempfile.TemporaryDirectory() as tmp:
             local_job_root = os.path.join(tmp, "job")
@@ -1935,6 +2453,62 @@ class CleaningFlowTests(unittest.TestCase):
         self.assertEqual(cleaned["rows"][0]["name"], "alice")
         self.assertEqual(cleaned["rows"][0]["amount"], 12.4)
 
+    def test_clean_rows_generic_incremental_matches_full_run_and_rebuilds_on_change(self):
+        day1 = [
+            {"ref": "T1", "amt": "10.0", "note": "a"},
+            {"ref": "T2", "amt": "bad", "note": "b"},
+            {"ref": "T1", "amt": "12.5", "note": "c"},
+            {"ref": "T3", "amt": "1.0", "note": "d"},
+        ]
+        day2 = day1 + [
+            {"ref": "T2", "amt": "8.0", "note": "e"},
+            {"ref": "T1", "amt": "30.0", "note": "f"},
+            "not-a-row",
+        ]
+        rule_variants = [
+            {"deduplicate_by": ["ref"], "deduplicate_keep": "last"},
+            {"deduplicate_by": ["ref"], "deduplicate_keep": "first"},
+            {"survivorship": {"keys": ["ref"], "score_fields": ["amount"]}},
+            {},
+        ]
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(os.environ, {"AIWF_INCREMENTAL_CHECKPOINT_DIR": tmp}):
+            for index, extra_rules in enumerate(rule_variants):
+                rules = {
+                    "platform_mode": "generic",
+                    "rename_map": {"amt": "amount"},
+                    "casts": {"amount": "float"},
+                    "sort_by": [{"field": "amount", "order": "desc"}],
+                    **extra_rules,
+                }
+                params = {"rules": rules, "incremental": {"enabled": True, "checkpoint_key": f"ledger-{index}"}}
+
+                first = cleaning._clean_rows_generic(day1, params)
+                second = cleaning._clean_rows_generic(day2, params)
+                full = cleaning._clean_rows_generic(day2, {"rules": rules})
+
+                self.assertEqual(first["incremental"]["reason"], "no_checkpoint")
+                self.assertEqual(second["incremental"]["mode"], "incremental")
+                self.assertEqual(second["incremental"]["reused_rows"], len(day1))
+                self.assertEqual(second["incremental"]["processed_rows"], 3)
+                self.assertEqual(second["rows"], full["rows"])
+                self.assertEqual(second["quality"], full["quality"])
+                self.assertEqual(second["reason_samples"], full["reason_samples"])
+                self.assertNotIn("incremental", full)
+
+            rebuilt = cleaning._clean_rows_generic(
+                day2,
+                {
+                    "rules": {"platform_mode": "generic", "deduplicate_by": ["note"]},
+                    "incremental": {"enabled": True, "checkpoint_key": "ledger-0"},
+                },
+            )
+            self.assertEqual(rebuilt["incremental"]["reason"], "rules_changed")
+            edited = [dict(day1[0], amt="11.0")] + day2[1:]
+            params = {"rules": rules, "incremental": {"enabled": True, "checkpoint_key": "ledger-3"}}
+            changed = cleaning._clean_rows_generic(edited, params)
+            self.assertEqual(changed["incremental"]["reason"], "prefix_changed")
+            self.assertEqual(changed["rows"], cleaning._clean_rows_generic(edited, {"rules": rules})["rows"])
+
     def test_clean_rows_generic_rules_supports_bank_statement_computed_amount(self):
         raw_rows = [
             {
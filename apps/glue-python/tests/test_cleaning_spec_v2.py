@@ -1,15 +1,29 @@
+import copy
+import json
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 from aiwf.cleaning_spec_v2 import (
     CLEANING_SPEC_V2_VERSION,
     build_header_mapping,
     candidate_profiles_from_headers,
     cleaning_spec_to_transform_components,
+    clear_compiled_cleaning_spec_cache,
     compile_cleaning_params_to_spec,
     compile_preprocess_spec_to_spec,
+    compiled_cleaning_spec,
+    compiled_cleaning_spec_cache_stats,
     get_canonical_profile_registry,
     reason_codes_from_quality_errors,
 )
+from aiwf.cleaning_templates import (
+    cleaning_template_cache_stats,
+    clear_cleaning_template_cache,
+    load_cleaning_template,
+    resolve_cleaning_template_params,
+)
 
 
 class CleaningSpecV2Tests(unittest.TestCase):
@@ -27,6 +41,55 @@ class CleaningSpecV2Tests(unittest.TestCase):
         self.assertTrue(any(item["op"] == "gte" for item in spec["transform"]["filters"]))
         self.assertEqual(spec["quality"]["gates"]["max_invalid_rows"], 0)
 
+    def test_compiled_cleaning_spec_is_memoized_by_params_and_read_only(self):
+        clear_compiled_cleaning_spec_cache()
+        params = {"rules": {"platform_mode": "generic", "casts": {"amount": "float"}}, "rows": [{"amount": "1"}]}
+        first = compiled_cleaning_spec(params)
+        second = compiled_cleaning_spec({**params, "rows": [{"amount": "2"}]})
+        self.assertIs(first, second)
+        self.assertEqual(first, compile_cleaning_params_to_spec(params))
+        self.assertEqual(compiled_cleaning_spec_cache_stats()["hits"], 1)
+        with self.assertRaises(TypeError):
+            first["transform"]["casts"]["amount"] = "int"
+        with self.assertRaises(TypeError):
+            first["transform"]["filters"].append({})
+        thawed = copy.deepcopy(first)
+        thawed["transform"]["casts"]["amount"] = "int"
+        self.assertEqual(first["transform"]["casts"]["amount"], "float")
+        changed = compiled_cleaning_spec({"rules": {"platform_mode": "generic", "casts": {"amount": "int"}}})
+        self.assertEqual(changed["transform"]["casts"]["amount"], "int")
+        self.assertEqual(json.loads(json.dumps(first)), compile_cleaning_params_to_spec(params))
+
+    def test_cleaning_template_loading_is_cached_until_files_change(self):
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(os.environ, {"AIWF_CLEANING_TEMPLATE_DIR": tmp}):
+            template_path = os.path.join(tmp, "ledger.json")
+
+            def write_template(required_fields):
+                with open(template_path, "w", encoding="utf-8") as f:
+                    json.dump({"rules": {"platform_mode": "generic", "required_fields": required_fields}}, f)
+
+            with open(os.path.join(tmp, "cleaning_templates_desktop.json"), "w", encoding="utf-8") as f:
+                json.dump({"templates": [{"id": "ledger", "file": "ledger.json"}]}, f)
+            write_template(["id"])
+            clear_cleaning_template_cache()
+
+            first = resolve_cleaning_template_params({"cleaning_template": "ledger"})
+            second = resolve_cleaning_template_params({"cleaning_template": "ledger"})
+            self.assertEqual(first, second)
+            self.assertEqual(cleaning_template_cache_stats()["misses"], 1)
+            self.assertEqual(cleaning_template_cache_stats()["hits"], 1)
+
+            loaded = load_cleaning_template("ledger")
+            loaded["rules"]["required_fields"].append("mutated")
+            self.assertEqual(load_cleaning_template("ledger")["rules"]["required_fields"], ["id"])
+
+            write_template(["id", "amount"])
+            stat = os.stat(template_path)
+            os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            reloaded = resolve_cleaning_template_params({"cleaning_template": "ledger"})
+            self.assertEqual(reloaded["rules"]["required_fields"], ["id", "amount"])
+            self.assertEqual(cleaning_template_cache_stats()["invalidations"], 1)
+
     def test_compile_preprocess_spec_to_spec_preserves_transform_ops(self):
         spec = compile_preprocess_spec_to_spec(
             {
@@ -0,0 +1,148 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from aiwf import (
+    governance_manual_reviews,
+    governance_quality_rule_sets,
+    governance_workflow_apps,
+    governance_workflow_sandbox_rules,
+    governance_workflow_versions,
+)
+from aiwf.governance_store import main, migrate_governance_files_to_sqlite, sqlite_governance_store
+
+
+def _workflow(name, node_config):
+    return {
+        "workflow_id": f"wf_{name}",
+        "name": name,
+        "nodes": [{"id": "n1", "type": "clean_md", "config": node_config}],
+        "edges": [],
+    }
+
+
+def _seed_json_stores():
+    governance_quality_rule_sets.save_quality_rule_set({"id": "finance", "name": "Finance", "rules": {"required_columns": ["amount"]}})
+    for index, name in enumerate(["alpha", "beta", "alpha"]):
+        governance_workflow_versions.save_workflow_version(
+            {
+                "version_id": f"ver_{index}",
+                "ts": f"2026-03-0{index + 1}T00:00:00Z",
+                "workflow_definition": _workflow(name, {"step": index}),
+            }
+        )
+    governance_workflow_apps.save_workflow_app({"app_id": "app_alpha", "published_version_id": "ver_2"})
+    governance_manual_reviews.enqueue_manual_reviews(
+        [{"run_id": "run_1", "review_key": "gate"}, {"run_id": "run_2", "review_key": "gate"}]
+    )
+    governance_manual_reviews.submit_manual_review("run_1", "gate", approved=True, reviewer="Alice", comment="ok")
+    governance_workflow_sandbox_rules.set_workflow_sandbox_rules({"whitelist_codes": ["W1"]})
+
+
+class GovernanceSqliteStoreTests(unittest.TestCase):
+    def test_migrated_sqlite_backend_serves_the_same_shapes_as_json_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.dict(os.environ, {"AIWF_GOVERNANCE_ROOT": tmp, "AIWF_GOVERNANCE_BACKEND": "json"}, clear=False):
+                _seed_json_stores()
+                expected = {
+                    "rule_sets": governance_quality_rule_sets.list_quality_rule_sets(),
+                    "versions": governance_workflow_versions.list_workflow_versions(),
+                    "alpha": governance_workflow_versions.list_workflow_versions(workflow_name="alpha"),
+                    "apps": governance_workflow_apps.list_workflow_apps(),
+                    "queue": governance_manual_reviews.list_manual_reviews(),
+                    "history": governance_manual_reviews.list_manual_review_history(),
+                    "rules": governance_workflow_sandbox_rules.get_workflow_sandbox_rules(),
+                    "rule_versions": governance_workflow_sandbox_rules.list_workflow_sandbox_rule_versions(),
+                }
+                migrated = migrate_governance_files_to_sqlite()
+                again = migrate_governance_files_to_sqlite()
+
+            with patch.dict(os.environ, {"AIWF_GOVERNANCE_ROOT": tmp, "AIWF_GOVERNANCE_BACKEND": "sqlite"}, clear=False):
+                actual = {
+                    "rule_sets": governance_quality_rule_sets.list_quality_rule_sets(),
+                    "versions": governance_workflow_versions.list_workflow_versions(),
+                    "alpha": governance_workflow_versions.list_workflow_versions(workflow_name="alpha"),
+                    "apps": governance_workflow_apps.list_workflow_apps(),
+                    "queue": governance_manual_reviews.list_manual_reviews(),
+                    "history": governance_manual_reviews.list_manual_review_history(),
+                    "rules": governance_workflow_sandbox_rules.get_workflow_sandbox_rules(),
+                    "rule_versions": governance_workflow_sandbox_rules.list_workflow_sandbox_rule_versions(),
+                }
+                alice = governance_manual_reviews.query_manual_review_history(10, {"reviewer": "ali", "status": "approved"})
+                submitted = governance_manual_reviews.submit_manual_review("run_2", "gate", approved=False, reviewer="bob", comment="")
+                with self.assertRaisesRegex(ValueError, "review task not found"):
+                    governance_manual_reviews.submit_manual_review("run_2", "gate", approved=False, reviewer="bob", comment="")
+                rolled_back = governance_workflow_sandbox_rules.rollback_workflow_sandbox_rule_version(
+                    expected["rule_versions"][0]["version_id"]
+                )
+                with open(os.path.join(tmp, "manual_review_queue.v1.json"), "r", encoding="utf-8") as handle:
+                    json_files_untouched = json.load(handle)
+            sqlite_governance_store(os.path.join(tmp, "governance.v1.sqlite3")).close()
+
+        self.assertTrue(migrated["migrated"])
+        self.assertEqual(migrated["counts"]["workflow_versions"], 3)
+        self.assertEqual(migrated["counts"]["manual_review_history"], 1)
+        self.assertFalse(again["migrated"])
+        for name in ("rule_sets", "versions", "alpha", "apps", "queue", "history", "rule_versions"):
+            self.assertEqual(actual[name], expected[name], name)
+        self.assertEqual([item["version_id"] for item in actual["alpha"]], ["ver_2", "ver_0"])
+        self.assertEqual([item["app_id"] for item in actual["apps"]], ["app_alpha"])
+        self.assertEqual(actual["rules"]["whitelist_codes"], expected["rules"]["whitelist_codes"])
+        self.assertEqual([item["run_id"] for item in alice], ["run_1"])
+        self.assertEqual(submitted["remaining"], 0)
+        self.assertEqual(submitted["item"]["status"], "rejected")
+        self.assertEqual(rolled_back["rules"]["whitelist_codes"], ["w1"])
+        self.assertEqual([item["run_id"] for item in json_files_untouched["items"]], ["run_2"])
+
+    def test_migrate_cli_reports_counts_and_force_reimports_history_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "db", "governance.sqlite3")
+            with patch.dict(os.environ, {"AIWF_GOVERNANCE_ROOT": tmp, "AIWF_GOVERNANCE_BACKEND": "json"}, clear=False):
+                _seed_json_stores()
+                with patch("builtins.print") as printed:
+                    self.assertEqual(main(["migrate", "--path", db_path]), 0)
+                forced = migrate_governance_files_to_sqlite(path=db_path, force=True)
+            store = sqlite_governance_store(db_path)
+            history = store.history(governance_manual_reviews.MANUAL_REVIEW_HISTORY_COLLECTION, 100)
+            store.close()
+
+        self.assertTrue(json.loads(printed.call_args[0][0])["migrated"])
+        self.assertTrue(forced["migrated"])
+        self.assertEqual(len(history), 1)
+
+
+class WorkflowVersionIndexTests(unittest.TestCase):
+    def test_index_serves_lists_and_compares_without_rereading_and_sees_external_writes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch.dict(os.environ, {"AIWF_GOVERNANCE_ROOT": tmp, "AIWF_GOVERNANCE_BACKEND": "json"}, clear=False):
+                _seed_json_stores()
+                with patch.object(governance_workflow_versions, "_read_store", side_effect=AssertionError("store re-read")):
+                    alpha = governance_workflow_versions.list_workflow_versions(workflow_name="alpha")
+                    alpha[0]["workflow_definition"]["nodes"] = []
+                    latest = governance_workflow_versions.get_workflow_version("ver_2")
+                    compare = governance_workflow_versions.compare_workflow_versions("ver_0", "ver_2")
+                    same = governance_workflow_versions.compare_workflow_versions("ver_2", "ver_2")
+
+                store_path = governance_workflow_versions.workflow_version_store_path()
+                with open(store_path, "r", encoding="utf-8") as handle:
+                    stored = json.load(handle)
+                stored["items"] = [item for item in stored["items"] if item["version_id"] != "ver_0"]
+                stored["items"][0]["unrelated"] = "x" * 64
+                with open(store_path, "w", encoding="utf-8") as handle:
+                    json.dump(stored, handle)
+                after_external_write = governance_workflow_versions.list_workflow_versions(workflow_name="alpha")
+
+        self.assertEqual([item["version_id"] for item in alpha], ["ver_2", "ver_0"])
+        self.assertEqual(len(latest["workflow_definition"]["nodes"]), 1)
+        self.assertNotIn("node_config_digests", latest)
+        self.assertTrue(all(isinstance(item["node_config_digests"]["n1"], str) for item in stored["items"]))
+        self.assertEqual(compare["summary"]["changed_nodes"], 1)
+        self.assertTrue(compare["node_diff"][0]["config_changed"])
+        self.assertEqual(same["summary"]["changed_nodes"], 0)
+        self.assertEqual([item["version_id"] for item in after_external_write], ["ver_2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
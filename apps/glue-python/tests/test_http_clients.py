@@ -1,10 +1,24 @@
+import copy
+import json
+import os
+import tempfile
+import time
 import unittest
 from unittest.mock import patch
 
 from aiwf import accel_client
+from aiwf import callback_outbox
 from aiwf.base_client import BaseClient
-from aiwf.flows.cleaning_transport import headers_from_params_impl
+from aiwf.callback_outbox import CallbackOutbox
+from aiwf.flows.cleaning_transport import (
+    base_artifact_upsert_impl,
+    base_step_done_impl,
+    base_step_start_impl,
+    headers_from_params_impl,
+)
 from aiwf import rust_client
+from aiwf import workflow_validation_client
+from aiwf.workflow_validation_client import WorkflowValidationFailure
 
 
 class HttpClientTests(unittest.TestCase):
@@ -212,10 +226,557 @@ class HttpClientTests(unittest.TestCase):
         self.assertFalse(result["ok"])
         self.assertIn("invalid response shape", result["error"])
 
+    def test_transform_rows_v3_dispatch_plan_picks_mode_by_size_and_rules(self):
+        from aiwf.accel_transform_dispatch import plan_transform_dispatch
+
+        params = {"rust_v3_inline_max_rows": 10, "rust_v3_chunk_rows": 4, "rust_v3_async_min_rows": 100}
+        small = plan_transform_dispatch([{}] * 10, params, rules={"casts": {"id": "int"}})
+        chunked = plan_transform_dispatch([{}] * 11, params, rules={"casts": {"id": "int"}, "sort_by": []})
+        not_row_local = plan_transform_dispatch([{}] * 11, params, rules={"deduplicate_by": ["id"]})
+        huge = plan_transform_dispatch([{}] * 100, params, rules={})
+        v3_extras = plan_transform_dispatch([{}] * 11, params, rules={"sort_by": ["id"]}, filter_expr_v3={"op": "gt"})
+
+        self.assertEqual(small.mode, "inline")
+        self.assertEqual((chunked.mode, chunked.chunks, chunked.workers), ("chunked", 3, 3))
+        self.assertEqual(not_row_local.mode, "async_task")
+        self.assertEqual(huge.mode, "async_task")
+        self.assertEqual((v3_extras.mode, v3_extras.reason), ("inline", "no_eligible_large_input_mode"))
+
+    def test_accel_client_transform_rows_v3_chunked_merges_rows_audit_and_gates_in_order(self):
+        posted = []
+
+        class Resp:
+            status_code = 200
+            text = ""
+
+            def __init__(self, body):
+                self._body = body
+
+            def json(self):
+                return self._body
+
+        def fake_post(url, json=None, timeout=None):
+            posted.append(json)
+            rows = json["rows"]
+            kept = [row for row in rows if row.get("id") is not None]
+            return Resp(
+                {
+                    "operator": "transform_rows_v3",
+                    "trace_id": f"t{rows[0]['id'] if rows[0].get('id') is not None else 'x'}",
+                    "rows": kept,
+                    "quality": {
+                        "input_rows": len(rows),
+                        "output_rows": len(kept),
+                        "invalid_rows": len(rows) - len(kept),
+                        "filtered_rows": 0,
+                        "duplicate_rows_removed": 0,
+                        "required_fields": ["id"],
+                        "required_missing_cells": 0,
+                        "required_missing_ratio": 0.0,
+                    },
+                    "audit": {
+                        "reason_counts": {"required_missing": len(rows) - len(kept)},
+                        "reason_samples": {
+                            "required_missing": [
+                                {"row_index": idx + 1} for idx, row in enumerate(rows) if row.get("id") is None
+                            ]
+                        },
+                        "limits": {"sample_limit": 5},
+                    },
+                }
+            )
+
+        raw_rows = [{"id": idx} for idx in range(7)] + [{"id": None}, {"id": 8}]
+        with patch("requests.post", side_effect=fake_post):
+            result = accel_client.transform_rows_v3_operator(
+                raw_rows=raw_rows,
+                params={"rust_v3_dispatch": "chunked", "rust_v3_chunk_rows": 3, "rust_v3_chunk_workers": 2},
+                rules={"casts": {"id": "int"}},
+                quality_gates={"required_fields": ["id"], "min_output_rows": 8},
+                schema_hint={},
+            )
+            failed = accel_client.transform_rows_v3_operator(
+                raw_rows=raw_rows,
+                params={"rust_v3_dispatch": "chunked", "rust_v3_chunk_rows": 3},
+                rules={},
+                quality_gates={"max_invalid_rows": 0},
+                schema_hint={},
+            )
+
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["dispatch"]["mode"], "chunked")
+        self.assertEqual(posted[0]["quality_gates"], {"required_fields": ["id"]})
+        self.assertEqual([row["id"] for row in result["rows"]], [0, 1, 2, 3, 4, 5, 6, 8])
+        self.assertEqual(result["quality"]["input_rows"], 9)
+        self.assertEqual(result["quality"]["invalid_rows"], 1)
+        self.assertEqual(result["audit"]["reason_counts"], {"required_missing": 1})
+        self.assertEqual(result["audit"]["reason_samples"]["required_missing"], [{"row_index": 8}])
+        self.assertEqual(result["quality"]["rust_v3_dispatch"], "chunked")
+        self.assertFalse(failed["ok"])
+        self.assertIn("invalid_rows=1 exceeds max_invalid_rows=0", failed["error"])
+
+    def test_accel_client_transform_rows_v3_async_task_polls_and_resumes_after_timeout(self):
+        class Resp:
+            status_code = 200
+            text = ""
+
+            def __init__(self, body):
+                self._body = body
+
+            def json(self):
+                return self._body
+
+        done_body = {"rows": [{"id": 1}], "quality": {"input_rows": 1, "output_rows": 1}, "trace_id": "t1"}
+        statuses = iter([{"status": "running"}, {"status": "done", "result": done_body}])
+        posts = []
+
+        def fake_post(url, json=None, timeout=None):
+            posts.append((url, json))
+            return Resp({"ok": True, "task_id": "task-1", "status": "queued"})
+
+        params = {"rust_v3_dispatch": "async_task", "rust_v3_async_poll_seconds": 0.01, "job_id": "job-1"}
+        with patch("requests.post", side_effect=fake_post), patch("requests.get", side_effect=lambda url, timeout=None: Resp(next(statuses))):
+            result = accel_client.transform_rows_v3_operator(
+                raw_rows=[{"id": "1"}], params=params, rules={}, quality_gates={}, schema_hint={}
+            )
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["task_id"], "task-1")
+        self.assertEqual(result["rows"], [{"id": 1}])
+        self.assertEqual(result["quality"]["rust_transform_operator"], "transform_rows_v3")
+        self.assertTrue(posts[0][0].endswith("/operators/transform_rows_v2/submit"))
+        self.assertTrue(posts[0][1]["idempotency_key"].startswith("glue-v3:job-1:"))
+        self.assertEqual(len(posts), 1)
+
+        posts.clear()
+        with patch("requests.post", side_effect=fake_post), patch("requests.get", return_value=Resp({"status": "running"})):
+            timed_out = accel_client.transform_rows_v3_operator(
+                raw_rows=[{"id": "1"}],
+                params={**params, "rust_v3_async_timeout_seconds": 0.03},
+                rules={},
+                quality_gates={},
+                schema_hint={},
+            )
+        self.assertFalse(timed_out["ok"])
+        self.assertIn("timed out", timed_out["error"])
+        self.assertEqual(timed_out["task_id"], "task-1")
+        self.assertEqual(len(posts), 1)
+
+        # The task was left running, so a retry re-attaches through the same idempotency key.
+        first_key = posts[0][1]["idempotency_key"]
+        posts.clear()
+        with patch("requests.post", side_effect=fake_post), patch(
+            "requests.get", return_value=Resp({"status": "done", "result": done_body})
+        ):
+            resumed = accel_client.transform_rows_v3_operator(
+                raw_rows=[{"id": "1"}], params=params, rules={}, quality_gates={}, schema_hint={}
+            )
+        self.assertTrue(resumed["ok"])
+        self.assertEqual(posts[0][1]["idempotency_key"], first_key)
+        self.assertEqual(len(posts), 1)
+
+    def test_accel_client_transform_rows_v3_dispatch_falls_back_on_unparseable_settings(self):
+        posted = []
+
+        class Resp:
+            status_code = 200
+            text = ""
+
+            def json(self):
+                return {"ok": True, "operator": "transform_rows_v3", "rows": [], "quality": {}, "audit": {}}
+
+        def fake_post(url, json=None, timeout=None):
+            posted.append(url)
+            return Resp()
+
+        with patch("requests.post", side_effect=fake_post), patch.dict(os.environ, {"AIWF_RUST_V3_CHUNK_ROWS": "10k"}):
+            result = accel_client.transform_rows_v3_operator(
+                raw_rows=[{"id": idx} for idx in range(5)],
+                params={"rust_v3_dispatch": "chunked", "rust_v3_chunk_workers": "1e4"},
+                rules={},
+                quality_gates={},
+                schema_hint={},
+            )
+        self.assertEqual(result["dispatch"]["chunk_rows"], 10000)
+        self.assertEqual(result["dispatch"]["workers"], 1)
+        self.assertEqual(len(posted), 1)
+
+    def test_sidecar_breaker_trips_skips_and_half_opens_after_health_probe(self):
+        from aiwf.accel_breaker import SidecarBreaker
+
+        now = [100.0]
+        probes = []
+
+        def probe(base_url, timeout):
+            probes.append(now[0])
+            return len(probes) > 1, "" if len(probes) > 1 else "connection refused"
+
+        breaker = SidecarBreaker(
+            "http://accel",
+            failure_threshold=2,
+            open_seconds=10.0,
+            health_ttl_seconds=5.0,
+            probe=probe,
+            clock=lambda: now[0],
+        )
+        breaker.record_success("transform_rows_v3", 100.0)
+        breaker.record_success("transform_rows_v3", 200.0)
+        breaker.record_failure("transform_rows_v3", "timeout")
+        self.assertEqual(breaker.allow("transform_rows_v3"), (True, ""))
+        breaker.record_failure("transform_rows_v3", "timeout")
+        self.assertEqual(breaker.snapshot()["state"], "open")
+        self.assertEqual(breaker.allow("quality_check_v2"), (False, "accel_breaker_open"))
+
+        now[0] += 10.0
+        self.assertEqual(breaker.allow("quality_check_v2"), (False, "accel_breaker_open"))
+        now[0] += 10.0
+        self.assertEqual(breaker.allow("quality_check_v2"), (True, ""))
+        self.assertEqual(breaker.snapshot()["state"], "half_open")
+        self.assertEqual(breaker.allow("transform_rows_v3"), (False, "accel_breaker_open"))
+        breaker.record_success("quality_check_v2", 50.0)
+
+        snapshot = breaker.snapshot()
+        self.assertEqual(snapshot["state"], "closed")
+        self.assertEqual(snapshot["times_opened"], 1)
+        self.assertEqual(len(probes), 2)
+        self.assertEqual(snapshot["operators"]["transform_rows_v3"]["latency_ewma_ms"], 120.0)
+        self.assertEqual(snapshot["operators"]["quality_check_v2"]["skipped"], 2)
+
+    def test_accel_client_skips_sidecar_while_breaker_is_open(self):
+        from aiwf.accel_breaker import reset_sidecar_breakers, sidecar_breaker_stats
+
+        reset_sidecar_breakers()
+        self.addCleanup(reset_sidecar_breakers)
+        params = {"accel_url": "http://accel-breaker-test"}
+        with patch.dict("os.environ", {"AIWF_ACCEL_BREAKER_FAILURES": "2"}), patch(
+            "requests.post", side_effect=ConnectionError("connection refused")
+        ) as post:
+            first = accel_client.quality_check_v2_operator(rows=[], params=params, rules={})
+            second = accel_client.transform_rows_v3_operator(
+                raw_rows=[{"id": 1}], params=params, rules={}, quality_gates={}, schema_hint={}
+            )
+            skipped = accel_client.quality_check_v4_operator(rows=[], params=params, rules={})
+
+        self.assertTrue(first["attempted"])
+        self.assertIn("connection refused", second["error"])
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(skipped, {"attempted": False, "ok": False, "url": "http://accel-breaker-test/operators/quality_check_v4", "error": "accel_breaker_open"})
+        sidecar = sidecar_breaker_stats()["sidecars"]["http://accel-breaker-test"]
+        self.assertEqual(sidecar["state"], "open")
+        self.assertEqual(sidecar["operators"]["quality_check_v4"]["skipped"], 1)
+
     def test_callback_headers_ignore_user_supplied_api_key(self):
         headers = headers_from_params_impl({"api_key": "user-key"}, env_api_key="service-key")
         self.assertEqual(headers, {"X-API-Key": "service-key"})
 
+    def test_callback_outbox_defers_base_callbacks_and_delivers_them_in_job_order(self):
+        class FakeResponse:
+            def __init__(self, status_code):
+                self.status_code = status_code
+                self.text = "missing" if status_code == 404 else ""
+
+        class FakeSession:
+            def __init__(self):
+                self.calls = []
+
+            def post(self, url, json=None, headers=None, timeout=None):
+                self.calls.append((url, json, dict(headers or {})))
+                return FakeResponse(404 if "/artifacts/upsert" in url or url.split("?")[0].endswith("/artifacts") else 200)
+
+        session = FakeSession()
+        artifact = {"actor": "glue", "kind": "parquet", "path": "out.parquet", "sha256": "abc", "extra_json": None}
+        with tempfile.TemporaryDirectory() as tmp:
+            outbox = CallbackOutbox(tmp, session_factory=lambda: session, backoff_base_seconds=0.0)
+            with patch.dict(os.environ, {"AIWF_BASE_CALLBACK_OUTBOX": "true", "AIWF_API_KEY": "service-key"}), patch.object(
+                callback_outbox, "callback_outbox", return_value=outbox
+            ), patch("requests.post") as inline_post:
+                with outbox._cond:
+                    # Hold the sender so every callback is queued before delivery starts.
+                    base_step_start_impl(
+                        base_url="http://base",
+                        job_id="job-1",
+                        step_id="cleaning",
+                        actor="glue",
+                        ruleset_version="v1",
+                        input_uri=None,
+                        output_uri=None,
+                        params={},
+                        headers={"X-API-Key": "service-key"},
+                        post_json=inline_post,
+                    )
+                    for artifact_id in ("a1", "a2", "a1"):
+                        base_artifact_upsert_impl(base_url="http://base", job_id="job-1", artifact_id=artifact_id, headers={}, **artifact)
+                    base_step_done_impl(
+                        base_url="http://base",
+                        job_id="job-1",
+                        step_id="cleaning",
+                        actor="glue",
+                        output_hash="h",
+                        headers={"X-API-Key": "service-key"},
+                        post_json=inline_post,
+                    )
+                self.assertTrue(outbox.flush(timeout=5))
+                inline_post.assert_not_called()
+            with open(outbox._segment.path, "r", encoding="utf-8") as handle:
+                self.assertNotIn("service-key", handle.read())
+            stats = outbox.stats()
+            outbox.close(timeout=1)
+
+        delivered = [(url.split("/api/v1/jobs/job-1/")[1].split("?")[0], (body or {}).get("artifact_id")) for url, body, _ in session.calls]
+        self.assertEqual(
+            delivered,
+            [
+                ("steps/cleaning/start", None),
+                ("artifacts/upsert", "a2"),
+                ("artifacts", "a2"),
+                ("artifacts/register", "a2"),
+                ("artifacts/register", "a1"),
+                ("steps/cleaning/done", None),
+            ],
+        )
+        self.assertTrue(all(headers.get("X-API-Key") == "service-key" for _, _, headers in session.calls))
+        self.assertEqual((stats["sent"], stats["coalesced"], stats["pending"], stats["dead"]), (4, 1, 0, 0))
+
+    def test_callback_outbox_retries_dead_letters_and_replays_stale_segments(self):
+        class FakeResponse:
+            def __init__(self, status_code):
+                self.status_code = status_code
+                self.text = "boom"
+
+        class FlakySession:
+            def __init__(self):
+                self.calls = []
+
+            def post(self, url, json=None, headers=None, timeout=None):
+                self.calls.append(url)
+                if "job-bad" in url:
+                    return FakeResponse(409)
+                if url.endswith("job-flaky/steps/s/start") and self.calls.count(url) < 3:
+                    raise ConnectionError("connection reset")
+                return FakeResponse(200)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stale_path = os.path.join(tmp, "callbacks-1-dead.jsonl")
+            with open(stale_path, "w", encoding="utf-8") as handle:
+                for record in (
+                    {"op": "enqueue", "seq": 1, "job_id": "job-old", "kind": "step_done", "urls": ["http://base/api/v1/jobs/job-old/steps/s/done"], "body": {}, "headers": {}},
+                    {"op": "enqueue", "seq": 2, "job_id": "job-old", "kind": "step_done", "urls": ["http://base/api/v1/jobs/job-old/steps/t/done"], "body": {}, "headers": {}},
+                    {"op": "ack", "seq": 1, "status": "sent"},
+                ):
+                    handle.write(json.dumps(record) + "\n")
+                handle.write('{"op": "enq')
+            old = time.time() - 3600
+            os.utime(stale_path, (old, old))
+
+            session = FlakySession()
+            outbox = CallbackOutbox(tmp, session_factory=lambda: session, backoff_base_seconds=0.01, max_attempts=5)
+            outbox.enqueue(job_id="job-flaky", kind="step_start", urls=["http://base/api/v1/jobs/job-flaky/steps/s/start"], body={})
+            outbox.enqueue(job_id="job-bad", kind="step_start", urls=["http://base/api/v1/jobs/job-bad/steps/s/start"], body={})
+            outbox.enqueue(job_id="job-flaky", kind="step_done", urls=["http://base/api/v1/jobs/job-flaky/steps/s/done"], body={})
+            self.assertTrue(outbox.flush(timeout=5))
+            stats = outbox.stats()
+            with open(os.path.join(tmp, "dead_letter.jsonl"), "r", encoding="utf-8") as handle:
+                dead = [json.loads(line) for line in handle]
+            self.assertFalse(os.path.exists(stale_path))
+            outbox.close(timeout=1)
+
+        self.assertIn("http://base/api/v1/jobs/job-old/steps/t/done", session.calls)
+        self.assertNotIn("http://base/api/v1/jobs/job-old/steps/s/done", session.calls)
+        flaky = [url for url in session.calls if "job-flaky" in url]
+        self.assertEqual([url.rsplit("/", 1)[1] for url in flaky], ["start", "start", "start", "done"])
+        self.assertEqual([(item["job_id"], item["attempts"]) for item in dead], [("job-bad", 1)])
+        self.assertIn("409", dead[0]["error"])
+        self.assertEqual((stats["adopted"], stats["retries"], stats["dead"], stats["pending"]), (1, 2, 1, 0))
+
+    def test_callback_outbox_adopts_segments_that_go_stale_after_start(self):
+        class FakeResponse:
+            status_code = 200
+            text = ""
+
+        class FakeSession:
+            def __init__(self):
+                self.calls = []
+
+            def post(self, url, json=None, headers=None, timeout=None):
+                self.calls.append(url)
+                return FakeResponse()
+
+        session = FakeSession()
+        with tempfile.TemporaryDirectory() as tmp:
+            outbox = CallbackOutbox(tmp, session_factory=lambda: session, stale_segment_seconds=0.2)
+            # A sibling worker's segment that only goes stale after this outbox started.
+            stale_path = os.path.join(tmp, "callbacks-2-sibling.jsonl")
+            with open(stale_path, "w", encoding="utf-8") as handle:
+                handle.write(
+                    json.dumps(
+                        {"op": "enqueue", "seq": 1, "job_id": "job-sib", "kind": "step_done", "urls": ["http://base/api/v1/jobs/job-sib/steps/s/done"], "body": {}, "headers": {}}
+                    )
+                    + "\n"
+                )
+            old = time.time() - 3600
+            os.utime(stale_path, (old, old))
+            deadline = time.monotonic() + 5
+            while not session.calls and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(outbox.flush(timeout=5))
+            stats = outbox.stats()
+            self.assertFalse(os.path.exists(stale_path))
+            outbox.close(timeout=1)
+
+        self.assertEqual(session.calls, ["http://base/api/v1/jobs/job-sib/steps/s/done"])
+        self.assertEqual(stats["adopted"], 1)
+
+    def test_callback_outbox_keeps_its_segment_while_a_delivery_outlasts_the_stale_threshold(self):
+        import threading
+
+        class FakeResponse:
+            status_code = 200
+            text = ""
+
+        release = threading.Event()
+
+        class BlockedSession:
+            def __init__(self):
+                self.calls = []
+
+            def post(self, url, json=None, headers=None, timeout=None):
+                self.calls.append(url)
+                release.wait(5)
+                return FakeResponse()
+
+        owner_session = BlockedSession()
+        sibling_session = BlockedSession()
+        with tempfile.TemporaryDirectory() as tmp:
+            owner = CallbackOutbox(tmp, session_factory=lambda: owner_session, stale_segment_seconds=0.2)
+            owner.enqueue(job_id="job-1", kind="step_start", urls=["http://base/api/v1/jobs/job-1/steps/s/start"], body={})
+            deadline = time.monotonic() + 5
+            while not owner_session.calls and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # The first delivery is stuck for several stale thresholds.
+            time.sleep(0.8)
+            sibling = CallbackOutbox(tmp, session_factory=lambda: sibling_session, stale_segment_seconds=0.2)
+            time.sleep(0.3)
+            self.assertTrue(os.path.exists(owner._segment.path))
+            owner.enqueue(job_id="job-1", kind="step_done", urls=["http://base/api/v1/jobs/job-1/steps/s/done"], body={})
+            release.set()
+            self.assertTrue(owner.flush(timeout=5))
+            with open(owner._segment.path, "r", encoding="utf-8") as handle:
+                self.assertIn("steps/s/done", handle.read())
+            sibling_stats = sibling.stats()
+            owner.close(timeout=1)
+            sibling.close(timeout=1)
+
+        self.assertEqual(sibling_stats["adopted"], 0)
+        self.assertEqual(sibling_session.calls, [])
+        self.assertEqual([url.rsplit("/", 1)[1] for url in owner_session.calls], ["start", "done"])
+
+    def test_base_client_routes_callbacks_through_outbox_when_enabled(self):
+        class FakeResponse:
+            status_code = 200
+            text = ""
+
+        class FakeSession:
+            def __init__(self):
+                self.calls = []
+
+            def post(self, url, json=None, headers=None, timeout=None):
+                self.calls.append((url, json))
+                return FakeResponse()
+
+        session = FakeSession()
+        with tempfile.TemporaryDirectory() as tmp:
+            outbox = CallbackOutbox(tmp, session_factory=lambda: session)
+            client = BaseClient("http://base/", api_key="service-key")
+            with patch.dict(os.environ, {"AIWF_BASE_CALLBACK_OUTBOX": "true"}), patch.object(
+                callback_outbox, "callback_outbox", return_value=outbox
+            ), patch("requests.post") as inline_post:
+                started = client.step_start("job-1", "cleaning", "glue user", {"params": {}})
+                client.register_artifact("job-1", "glue user", {"artifact_id": "a1", "kind": "json"})
+                client.step_done("job-1", "cleaning", "glue user", {"output_hash": "h"})
+                self.assertTrue(outbox.flush(timeout=5))
+                inline_post.assert_not_called()
+            with open(outbox._segment.path, "r", encoding="utf-8") as handle:
+                self.assertNotIn("service-key", handle.read())
+            outbox.close(timeout=1)
+
+        self.assertTrue(started["queued"])
+        self.assertEqual(
+            [url for url, _ in session.calls],
+            [
+                "http://base/api/v1/jobs/job-1/steps/cleaning/start?actor=glue+user",
+                "http://base/api/v1/jobs/job-1/artifacts/register?actor=glue+user",
+                "http://base/api/v1/jobs/job-1/steps/cleaning/done?actor=glue+user",
+            ],
+        )
+        self.assertEqual(session.calls[1][1], {"artifact_id": "a1", "kind": "json"})
+
+    def test_workflow_validation_caches_verdicts_until_contracts_change(self):
+        class FakeResponse:
+            status_code = 200
+
+            def __init__(self, body):
+                self._body = body
+
+            def json(self):
+                return self._body
+
+        class FakeSession:
+            def __init__(self):
+                self.calls = []
+                self.schema_version = "workflow_contract.v1"
+
+            def post(self, url, json=None, timeout=None):
+                self.calls.append(json)
+                nodes = json["workflow_definition"].get("nodes") or []
+                body = {
+                    "ok": True,
+                    "schema_version": self.schema_version,
+                    "node_type_inventory": {"known_node_types": ["clean_md"]},
+                    "normalized_workflow_definition": copy.deepcopy(json["workflow_definition"]),
+                    "notes": [],
+                    "error_items": [],
+                }
+                if any(node.get("type") != "clean_md" for node in nodes):
+                    body.update({"valid": False, "status": "invalid", "error_items": [{"path": "workflow.nodes[0].type", "message": "unknown node type"}]})
+                else:
+                    body.update({"valid": True, "status": "valid"})
+                return FakeResponse(body)
+
+        good = {"workflow_id": "wf", "version": "workflow.v1", "nodes": [{"id": "n1", "type": "clean_md"}], "edges": []}
+        bad = {"workflow_id": "wf", "version": "workflow.v1", "nodes": [{"id": "n1", "type": "mystery"}], "edges": []}
+        session = FakeSession()
+        validate = workflow_validation_client.validate_workflow_definition_authoritatively
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = os.path.join(tmp, "operators_manifest.v1.json")
+            with open(manifest, "w", encoding="utf-8") as handle:
+                handle.write('{"operators": []}')
+            workflow_validation_client.clear_workflow_validation_cache()
+            with patch.dict(os.environ, {"AIWF_RUST_OPERATOR_MANIFEST_PATH": manifest}), patch.object(
+                workflow_validation_client, "_session", return_value=session
+            ), patch.object(workflow_validation_client._VALIDATION_CACHE, "contract_recheck_seconds", 0.0):
+                first = validate(good, accel_url="http://accel-validate-test")
+                first["normalized_workflow_definition"]["nodes"].append({"id": "mutated"})
+                second = validate(dict(good), accel_url="http://accel-validate-test")
+                validate(good, accel_url="http://accel-validate-test", validation_scope="run")
+                for _ in range(2):
+                    with self.assertRaises(WorkflowValidationFailure) as raised:
+                        validate(bad, accel_url="http://accel-validate-test")
+                    self.assertEqual(raised.exception.error_items[0]["path"], "workflow.nodes[0].type")
+                self.assertEqual(len(session.calls), 3)
+
+                os.utime(manifest, ns=(0, 0))
+                validate(good, accel_url="http://accel-validate-test")
+                self.assertEqual(len(session.calls), 4)
+
+                session.schema_version = "workflow_contract.v2"
+                validate(good, accel_url="http://accel-validate-test", validation_scope="run")
+                validate(good, accel_url="http://accel-validate-test")
+                self.assertEqual(len(session.calls), 6)
+                stats = workflow_validation_client.workflow_validation_cache_stats()
+            workflow_validation_client.clear_workflow_validation_cache()
+
+        self.assertEqual(second["normalized_workflow_definition"]["nodes"], [{"id": "n1", "type": "clean_md"}])
+        self.assertEqual((stats["hits"], stats["negative_hits"], stats["invalidations"]), (1, 1, 2))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from aiwf import governance_manual_reviews
+from aiwf.jsonl_history import JsonlHistoryStore, reverse_lines
+
+
+def _fields(record):
+    return {"kind": str(record.get("kind") or "")}
+
+
+class JsonlHistoryStoreTests(unittest.TestCase):
+    def test_reverse_lines_reads_newest_first_across_blocks_and_skips_torn_tail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.jsonl")
+            with open(path, "wb") as handle:
+                for i in range(50):
+                    handle.write(json.dumps({"i": i, "pad": "x" * (i % 7)}).encode("utf-8") + b"\n")
+                handle.write(b'{"i": 50, "pa')
+
+            lines = [json.loads(line)["i"] for line in reverse_lines(path, block_bytes=16)]
+
+        self.assertEqual(lines, list(range(49, -1, -1)))
+
+    def test_store_rotates_indexes_and_compacts_segments(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.v1.jsonl")
+            store = JsonlHistoryStore(path, index_fields=_fields, index_version="t1", segment_max_bytes=250)
+            for i in range(40):
+                store.append({"i": i, "kind": "even" if i % 2 == 0 else "odd"})
+            sealed = store.sealed_segments()
+            self.assertGreater(len(sealed), 2)
+            self.assertTrue(all(os.path.exists(item[2] + ".idx.json") for item in sealed))
+
+            self.assertEqual([item["i"] for item in store.newest(5)], [39, 38, 37, 36, 35])
+            odd = store.newest(100, where={"kind": lambda value: value == "odd"})
+            self.assertEqual([item["i"] for item in odd], list(range(39, 0, -2)))
+
+            # A leftover original next to a merged segment covering it is discarded, not duplicated.
+            first, last, first_path = sealed[0]
+            with open(first_path, "rb") as handle:
+                original = handle.read()
+            wider = JsonlHistoryStore(path, index_fields=_fields, index_version="t1", segment_max_bytes=4096)
+            self.assertEqual(wider.compact(), len(sealed) - 1)
+            self.assertEqual(len(wider.sealed_segments()), 1)
+            with open(first_path, "wb") as handle:
+                handle.write(original)
+            self.assertEqual([item["i"] for item in wider.newest(100)], list(range(39, -1, -1)))
+            self.assertFalse(os.path.exists(first_path))
+
+    def test_rotate_claims_a_fresh_segment_when_another_writer_sealed_the_same_number(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.v1.jsonl")
+            store = JsonlHistoryStore(path, index_fields=_fields, index_version="t1", segment_max_bytes=4096)
+            store.append({"i": 0, "kind": "even"})
+            store.rotate()
+            listed = store.sealed_segments()
+            # Another process seals segment 2 after this one has listed the directory.
+            with open(os.path.join(tmp, "history.v1.000002-000002.jsonl"), "w", encoding="utf-8") as handle:
+                handle.write(json.dumps({"i": 1, "kind": "odd"}) + "\n")
+            store.append({"i": 2, "kind": "even"})
+            with patch.object(store, "sealed_segments", side_effect=[listed, store.sealed_segments()]):
+                target = store.rotate()
+
+            self.assertTrue(target.endswith("history.v1.000003-000003.jsonl"))
+            self.assertEqual([item["i"] for item in store.newest(10)], [2, 1, 0])
+
+    def test_manual_review_history_query_counts_matches_and_migrates_large_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            history = os.path.join(tmp, "manual_review_history.v1.jsonl")
+            with open(history, "w", encoding="utf-8") as handle:
+                for i in range(300):
+                    handle.write(
+                        json.dumps(
+                            {
+                                "run_id": f"run_{i % 10}",
+                                "review_key": "gate",
+                                "reviewer": "Alice" if i % 3 == 0 else "bob",
+                                "status": "approved" if i % 2 == 0 else "rejected",
+                                "decided_at": f"2026-03-{1 + i // 20:02d}T00:00:{i % 60:02d}Z",
+                            }
+                        )
+                        + "\n"
+                    )
+                handle.write("not json\n")
+            with patch.dict(
+                os.environ,
+                {"AIWF_GOVERNANCE_ROOT": tmp, "AIWF_HISTORY_SEGMENT_MAX_BYTES": "8192"},
+                clear=False,
+            ):
+                latest = governance_manual_reviews.list_manual_review_history(3)
+                hits = governance_manual_reviews.query_manual_review_history(
+                    200,
+                    {"run_id": "run_3", "reviewer": "ali", "date_from": "2026-03-02", "date_to": "2026-03-12"},
+                )
+                legacy = governance_manual_reviews.filter_manual_review_history(
+                    governance_manual_reviews.list_manual_review_history(5000),
+                    {"run_id": "run_3", "reviewer": "ali", "date_from": "2026-03-02", "date_to": "2026-03-12"},
+                )
+                segments = [name for name in os.listdir(tmp) if name.endswith(".jsonl") and name != "manual_review_history.v1.jsonl"]
+
+        self.assertEqual([item["decided_at"] for item in latest], ["2026-03-15T00:00:59Z", "2026-03-15T00:00:58Z", "2026-03-15T00:00:57Z"])
+        self.assertEqual(hits, legacy)
+        self.assertEqual([item["run_id"] for item in hits], ["run_3"] * len(hits))
+        self.assertGreater(len(hits), 1)
+        self.assertEqual(segments, ["manual_review_history.v1.000001-000001.jsonl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
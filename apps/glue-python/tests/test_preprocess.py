@@ -206,6 +206,39 @@ class PreprocessTests(unittest.TestCase):
             self.assertNotIn("https://", rows[0]["text"])
             self.assertEqual(rows[0]["score"], 10.0)
 
+    def test_preprocess_stage_provenance_records_timing_rows_and_bytes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "raw.jsonl")
+            dst = os.path.join(tmp, "cooked.jsonl")
+            with open(src, "w", encoding="utf-8") as f:
+                for score in ("9.6", "3.1", "7"):
+                    f.write(json.dumps({"speaker": "alice", "score": score}) + "\n")
+
+            res = preprocess.preprocess_file(
+                src,
+                dst,
+                {
+                    "input_format": "jsonl",
+                    "output_format": "jsonl",
+                    "field_transforms": [{"field": "score", "op": "parse_number"}],
+                    "row_filters": [{"field": "score", "op": "gte", "value": 5}],
+                },
+            )
+            written = os.path.getsize(dst)
+
+        stages = {item["stage"]: item for item in res["summary"]["stage_provenance"]}
+        self.assertEqual(stages["row_transform"]["engine"], "python")
+        self.assertEqual((stages["row_transform"]["rows_in"], stages["row_transform"]["rows_out"]), (3, 2))
+        self.assertEqual(stages["materialize"]["rows_in"], 2)
+        self.assertEqual(stages["materialize"]["bytes_serialized"], written)
+        self.assertEqual(stages["read"]["rows_out"], 3)
+        for stage in ("row_transform", "materialize", "read"):
+            self.assertGreaterEqual(stages[stage]["wall_seconds"], 0.0)
+            self.assertGreaterEqual(stages[stage]["cpu_seconds"], 0.0)
+            self.assertIn("peak_rss_delta_bytes", stages[stage])
+            self.assertTrue(stages[stage]["ok"])
+        self.assertNotIn("wall_seconds", stages["quality_check"])
+
     def test_preprocess_can_use_rust_v2_for_supported_transforms(self):
         with tempfile.TemporaryDirectory() as tmp:
             src = os.path.join(tmp, "raw.jsonl")
@@ -843,7 +876,9 @@ class PreprocessTests(unittest.TestCase):
                     return True, object()
                 return False, None
 
-            with patch("aiwf.preprocess_enrichment._module_status", side_effect=_fake_module_status):
+            with patch.dict(os.environ, {"AIWF_URL_METADATA_CACHE_DIR": os.path.join(tmp, "url_cache")}), patch(
+                "aiwf.preprocess_enrichment._module_status", side_effect=_fake_module_status
+            ):
                 with patch(
                     "aiwf.preprocess_enrichment._fetch_url_metadata_with_trafilatura",
                     return_value={
@@ -876,6 +911,202 @@ class PreprocessTests(unittest.TestCase):
                 report = json.load(f)
             self.assertEqual(report["metrics"]["url_metadata_resolution_rate"], 1.0)
 
+    def test_url_metadata_fetches_concurrently_and_caches_results_on_disk(self):
+        import re
+        import threading
+        import time
+        import types
+        import urllib.error
+        import urllib.request
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from aiwf import preprocess_enrichment as enrichment
+
+        state = {"lock": threading.Lock(), "in_flight": 0, "max_in_flight": 0, "hits": [], "starts": []}
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with state["lock"]:
+                    state["in_flight"] += 1
+                    state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+                    state["hits"].append(self.path)
+                    state["starts"].append(time.monotonic())
+                time.sleep(0.15)
+                with state["lock"]:
+                    state["in_flight"] -= 1
+                if self.path == "/missing":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = f"<html><head><title>Report {self.path.strip('/')}</title></head></html>".encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                return
+
+        def _fetch_url(url, timeout=8.0):
+            try:
+                with urllib.request.urlopen(url, timeout=timeout) as resp:
+                    return resp.read().decode("utf-8")
+            except urllib.error.HTTPError:
+                return None
+
+        def _bare_extraction(html, url=None, with_metadata=True):
+            match = re.search(r"<title>(.*?)</title>", html)
+            return {"title": match.group(1) if match else "", "date": "2024-05-06", "sitename": ""}
+
+        fake_trafilatura = types.SimpleNamespace(fetch_url=_fetch_url, bare_extraction=_bare_extraction)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+
+        def _rows(paths):
+            return [{"claim_text": f"Claim {path}", "source_url": f"{base}/{path}"} for path in paths]
+
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                with patch.dict(os.environ, {"AIWF_URL_METADATA_CACHE_DIR": os.path.join(tmp, "url_cache")}), patch.object(
+                    enrichment, "_module_status", return_value=(True, fake_trafilatura)
+                ):
+                    spec = {"url_metadata_max_workers": 4, "url_metadata_domain_interval_ms": 0}
+                    rows = _rows(["a", "b", "c", "missing"])
+                    stats = enrichment._apply_url_metadata_enrichment(rows, True, "private", spec)
+                    trace = stats["engine_trace"][0]
+                    self.assertEqual(stats["enriched_rows"], 3)
+                    self.assertEqual(rows[0]["source_title"], "Report a")
+                    self.assertEqual(rows[0]["published_at"], "2024-05-06")
+                    self.assertEqual((trace["cache_hits"], trace["fetched"], trace["failed"]), (0, 4, 1))
+                    self.assertGreater(state["max_in_flight"], 1)
+
+                    rows = _rows(["a", "b", "c", "missing"])
+                    stats = enrichment._apply_url_metadata_enrichment(rows, True, "private", spec)
+                    self.assertEqual(stats["enriched_rows"], 3)
+                    self.assertEqual(stats["engine_trace"][0]["cache_hits"], 4)
+                    self.assertEqual(len(state["hits"]), 4)
+
+                    expired_failures = dict(spec, url_metadata_negative_cache_ttl_minutes=0)
+                    stats = enrichment._apply_url_metadata_enrichment(_rows(["a", "missing"]), True, "private", expired_failures)
+                    self.assertEqual((stats["engine_trace"][0]["cache_hits"], stats["engine_trace"][0]["fetched"]), (1, 1))
+                    self.assertEqual(state["hits"][-1], "/missing")
+
+                    state["starts"].clear()
+                    throttled = {"url_metadata_max_workers": 3, "url_metadata_domain_interval_ms": 100, "url_metadata_cache": False}
+                    enrichment._apply_url_metadata_enrichment(_rows(["d", "e", "f"]), True, "private", throttled)
+                    starts = sorted(state["starts"])
+                    self.assertGreaterEqual(starts[-1] - starts[0], 0.18)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_document_backends_submit_concurrently_and_skip_unchanged_files(self):
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from aiwf import preprocess_enrichment as enrichment
+
+        state = {"lock": threading.Lock(), "in_flight": 0, "max_in_flight": 0, "requests": [], "polls": {}}
+        tei = (
+            "<TEI xmlns='http://www.tei-c.org/ns/1.0'><text><back><listBibl><biblStruct>"
+            "<note type='raw_reference'>[1] City Mobility Lab 2026 https://city.example/report</note>"
+            "</biblStruct></listBibl></back></text></TEI>"
+        )
+
+        class _Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, body=b"", headers=None):
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                with state["lock"]:
+                    state["requests"].append(("POST", self.path))
+                    state["in_flight"] += 1
+                    state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+                    op_id = str(len(state["requests"]))
+                time.sleep(0.15)
+                with state["lock"]:
+                    state["in_flight"] -= 1
+                if self.path.startswith("/api/processFulltextDocument"):
+                    self._reply(200, tei.encode("utf-8"), {"Content-Type": "application/xml"})
+                    return
+                location = f"http://127.0.0.1:{self.server.server_address[1]}/operations/{op_id}"
+                self._reply(202, headers={"operation-location": location})
+
+            def do_GET(self):
+                with state["lock"]:
+                    state["requests"].append(("GET", self.path))
+                    seen = state["polls"].get(self.path, 0)
+                    state["polls"][self.path] = seen + 1
+                payload = {"status": "running"}
+                if seen:
+                    payload = {
+                        "status": "succeeded",
+                        "analyzeResult": {"paragraphs": [{"content": "Evidence Pack", "role": "sectionHeading"}]},
+                    }
+                self._reply(200, json.dumps(payload).encode("utf-8"), {"Content-Type": "application/json"})
+
+            def log_message(self, *args):
+                return
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = [os.path.join(tmp, name) for name in ("a.pdf", "b.pdf", "copy_of_a.pdf")]
+                for path, content in zip(paths, (b"%PDF-a", b"%PDF-b", b"%PDF-a")):
+                    with open(path, "wb") as f:
+                        f.write(content)
+
+                def _rows():
+                    return [{"claim_text": "Alice: Transit games improve recall.", "source_path": path} for path in paths]
+
+                env = {
+                    "AIWF_DOCUMENT_BACKEND_CACHE_DIR": os.path.join(tmp, "backend_cache"),
+                    "AIWF_GROBID_URL": base,
+                    "AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT": base,
+                    "AZURE_DOCUMENT_INTELLIGENCE_KEY": "local-key",
+                }
+                spec = {"document_backend_max_concurrency": 4}
+                with patch.dict(os.environ, env), patch.object(enrichment, "_AZURE_POLL_INTERVAL_SECONDS", 0.05):
+                    success_rows, traces = enrichment._apply_grobid_citation_backend(_rows(), spec)
+                    self.assertEqual(success_rows, 3)
+                    self.assertTrue(all(trace["ok"] for trace in traces))
+                    self.assertEqual(len(state["requests"]), 2)
+                    self.assertEqual(state["max_in_flight"], 2)
+
+                    state["requests"].clear()
+                    state["max_in_flight"] = 0
+                    success_rows, traces = enrichment._apply_azure_document_backend(_rows(), spec)
+                    self.assertTrue(all(trace["ok"] for trace in traces))
+                    self.assertEqual([method for method, _ in state["requests"]].count("POST"), 2)
+                    self.assertEqual(state["max_in_flight"], 2)
+                    self.assertEqual(sorted(state["polls"].values()), [2, 2])
+
+                    state["requests"].clear()
+                    cached_grobid = enrichment._apply_grobid_citation_backend(_rows(), spec)
+                    cached_azure = enrichment._apply_azure_document_backend(_rows(), spec)
+                    self.assertEqual(state["requests"], [])
+                    self.assertEqual(cached_grobid[0], 3)
+                    self.assertTrue(all(trace["ok"] for trace in cached_azure[1]))
+
+                    with open(paths[1], "wb") as f:
+                        f.write(b"%PDF-b-revised")
+                    enrichment._apply_grobid_citation_backend(_rows(), spec)
+                    self.assertEqual(state["requests"], [("POST", "/api/processFulltextDocument")])
+        finally:
+            server.shutdown()
+            server.server_close()
+
     def test_preprocess_grobid_fallback_warns_without_blocking(self):
         with tempfile.TemporaryDirectory() as tmp:
             src = os.path.join(tmp, "raw.jsonl")
@@ -2952,6 +3183,25 @@ class PreprocessTests(unittest.TestCase):
             rows, _ = preprocess._read_csv(out_csv)
             self.assertGreaterEqual(len(rows), 2)
 
+    def test_enrichment_row_features_refresh_only_after_field_writes(self):
+        from aiwf import preprocess_enrichment as enrichment
+
+        features = enrichment._RowFeatures()
+        row = {"claim_text": "Costs rose [1]", "argument_role": "claim", "source_path": "a.txt"}
+        self.assertEqual(features.citation_tokens(row), ("[1]",))
+        self.assertEqual(features.citation_tokens(row), ("[1]",))
+        self.assertTrue(features.claim_like(row))
+        self.assertEqual(features.source_context(row), {})
+        self.assertEqual((features.hits, features.misses), (1, 3))
+
+        features.set(row, "citation_text", "[2] Annual report")
+        self.assertEqual(features.citation_tokens(row), ("[2]",))
+        self.assertEqual(features.source_context(row), {"citation_text": "[2] Annual report"})
+        self.assertTrue(features.claim_like(row))
+        features.set(row, "argument_role", "citation")
+        self.assertFalse(features.claim_like(row))
+        self.assertEqual(features.role(row), "citation")
+
     def test_validate_preprocess_pipeline_rejects_unknown_stage(self):
         vr = preprocess.validate_preprocess_pipeline({"stages": [{"name": "missing_stage", "config": {}}]})
         self.assertFalse(vr["ok"])
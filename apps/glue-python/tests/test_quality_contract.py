@@ -2,7 +2,12 @@ import unittest
 
 from aiwf.canonical_profiles import get_profile_registry
 from aiwf.flows.cleaning_config import to_int
-from aiwf.quality_contract import analyze_header_mapping, canonicalize_header, normalize_value_for_field
+from aiwf.quality_contract import (
+    analyze_header_mapping,
+    analyze_header_mappings,
+    canonicalize_header,
+    normalize_value_for_field,
+)
 
 
 class QualityContractTests(unittest.TestCase):
@@ -73,6 +78,34 @@ class QualityContractTests(unittest.TestCase):
         self.assertEqual(details["canonical_field"], "txn_date")
         self.assertIn(details["match_strategy"], {"exact", "fuzzy+value_affinity"})
 
+    def test_analyze_header_mappings_matches_per_profile_analysis(self):
+        headers = ["Acct No", "Posting Dt", "\u91d1\u989d", "Value", "Amt Total", "customer nm", "ref", "", "\u4ea4\u6613\u65e5\u671f"]
+        samples = {
+            "Posting Dt": ["2026/03/01", "2026-03-02"],
+            "Amt Total": ["1,200", "(35.00)", "n/a"],
+            "Value": ["abc", ""],
+        }
+        sheet_profiles = {"custom": {"aliases": {"amount": ["amt total"]}}}
+        profiles = sorted(get_profile_registry())
+        for mode in ("strict", "auto"):
+            batched = analyze_header_mappings(
+                headers,
+                profiles,
+                sheet_profiles=sheet_profiles,
+                header_mapping_mode=mode,
+                sample_values_by_header=samples,
+            )
+            for profile_name in profiles:
+                expected = [
+                    analyze_header_mapping(
+                        header,
+                        {"canonical_profile": profile_name, "sheet_profiles": sheet_profiles, "header_mapping_mode": mode},
+                        sample_values=samples.get(header, []),
+                    )
+                    for header in headers
+                ]
+                self.assertEqual(batched[profile_name], expected, f"{mode}/{profile_name}")
+
     def test_normalize_value_for_field_handles_bank_statement_numeric_and_date_fields(self):
         self.assertEqual(normalize_value_for_field("1,234.50", "debit_amount"), 1234.5)
         self.assertEqual(normalize_value_for_field("5.6", "balance", raw_header="\u4f59\u989d\uff08\u4e07\u5143\uff09"), 56000.0)
@@ -0,0 +1,155 @@
+param(
+  [int]$Columns = 120,
+  [int]$Sheets = 20,
+  [int]$Runs = 5,
+  [int]$Warmup = 1,
+  [string]$Mode = "auto",
+  [string]$OutDir = ""
+)
+
+Set-StrictMode -Version Latest
+$ErrorActionPreference = "Stop"
+
+function Info($m){ Write-Host "[INFO] $m" -ForegroundColor Cyan }
+function Ok($m){ Write-Host "[ OK ] $m" -ForegroundColor Green }
+
+$root = Split-Path -Parent (Split-Path -Parent $PSScriptRoot)
+if (-not $OutDir) { $OutDir = Join-Path $root "ops\logs\bench\header_profile_classifier" }
+New-Item -ItemType Directory -Path $OutDir -Force | Out-Null
+$stamp = Get-Date -Format "yyyyMMdd_HHmmss"
+$runDir = Join-Path $OutDir $stamp
+New-Item -ItemType Directory -Path $runDir -Force | Out-Null
+
+$tmp = Join-Path ([System.IO.Path]::GetTempPath()) "aiwf_bench_header_profile_classifier.py"
+$py = @'
+import json
+import random
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+from aiwf import cleaning_spec_v2, quality_contract
+from aiwf.cleaning_spec_v2 import CANONICAL_PROFILE_REGISTRY, candidate_profiles_from_headers
+
+columns = int(sys.argv[1])
+sheets = int(sys.argv[2])
+runs = int(sys.argv[3])
+warmup = int(sys.argv[4])
+mode = sys.argv[5]
+out_json = sys.argv[6]
+
+# Wide synthetic sheets: real aliases, lightly mangled aliases that fall
+# through to fuzzy matching, and filler columns that match nothing.
+rng = random.Random(20260301)
+aliases = sorted({str(item) for values in quality_contract._DEFAULT_HEADER_ALIASES.values() for item in values})
+samples_pool = [["2026-03-01", "2026/03/02"], ["1,200.50", "(35.00)"], ["acme", "globex"], []]
+workloads = []
+for sheet_idx in range(sheets):
+    headers = []
+    samples = {}
+    for col_idx in range(columns):
+        roll = rng.random()
+        if roll < 0.35:
+            header = rng.choice(aliases)
+        elif roll < 0.7:
+            header = rng.choice(aliases).replace("_", " ").title() + rng.choice(["", " Dt", " No", " Total", "s"])
+        else:
+            header = f"col {sheet_idx}_{col_idx} misc"
+        headers.append(header)
+        samples[header] = rng.choice(samples_pool)
+    workloads.append((headers, samples))
+
+def legacy_analyze_header_mappings(headers, profile_names, *, sheet_profiles=None, header_mapping_mode="strict", sample_values_by_header=None):
+    return {
+        profile_name: [
+            quality_contract.analyze_header_mapping(
+                header,
+                {
+                    "canonical_profile": profile_name,
+                    "sheet_profiles": dict(sheet_profiles or {}),
+                    "header_mapping_mode": header_mapping_mode,
+                },
+                sample_values=list((sample_values_by_header or {}).get(header) or []),
+            )
+            for header in headers
+        ]
+        for profile_name in profile_names
+    }
+
+def classify_all():
+    return [
+        candidate_profiles_from_headers(headers, header_mapping_mode=mode, sample_values_by_header=samples, limit=len(CANONICAL_PROFILE_REGISTRY))
+        for headers, samples in workloads
+    ]
+
+def measure(legacy):
+    seconds = []
+    outputs = None
+    for run_idx in range(warmup + runs):
+        t0 = time.perf_counter()
+        if legacy:
+            with patch.object(quality_contract, "analyze_header_mappings", legacy_analyze_header_mappings):
+                outputs = classify_all()
+        else:
+            outputs = classify_all()
+        elapsed = time.perf_counter() - t0
+        if run_idx >= warmup:
+            seconds.append(elapsed)
+    return {
+        "seconds_min": round(min(seconds), 4),
+        "seconds_median": round(statistics.median(seconds), 4),
+    }, outputs
+
+legacy, legacy_out = measure(legacy=True)
+batched, batched_out = measure(legacy=False)
+same_output = json.dumps(legacy_out, sort_keys=True, default=str) == json.dumps(batched_out, sort_keys=True, default=str)
+out = {
+    "ok": same_output,
+    "mode": mode,
+    "sheets": sheets,
+    "columns": columns,
+    "profiles": len(CANONICAL_PROFILE_REGISTRY),
+    "runs": runs,
+    "warmup": warmup,
+    "per_profile_loop": legacy,
+    "batched_matrix": batched,
+    "speedup_x": round(legacy["seconds_median"] / batched["seconds_median"], 3) if batched["seconds_median"] > 0 else None,
+    "identical_output": same_output,
+}
+with open(out_json, "w", encoding="utf-8") as f:
+    json.dump(out, f, ensure_ascii=False, indent=2)
+print(json.dumps(out, ensure_ascii=False))
+'@
+
+Set-Content -Path $tmp -Encoding UTF8 -Value $py
+$oldPythonPath = $env:PYTHONPATH
+try {
+  $env:PYTHONPATH = Join-Path $root "apps\glue-python"
+  $jsonPath = Join-Path $runDir "benchmark.json"
+  Info "running header profile classifier benchmark sheets=$Sheets columns=$Columns mode=$Mode runs=$Runs warmup=$Warmup"
+  $raw = & python $tmp $Columns $Sheets $Runs $Warmup $Mode $jsonPath
+  if ($LASTEXITCODE -ne 0) { throw "benchmark failed" }
+  $res = $raw | ConvertFrom-Json
+  if (-not $res.ok) { throw "batched classifier changed profile candidates" }
+
+  $md = Join-Path $runDir "benchmark.md"
+  $lines = @()
+  $lines += "# Header Profile Classifier Benchmark"
+  $lines += ""
+  $lines += "- mode: $($res.mode)"
+  $lines += "- sheets x columns: $($res.sheets) x $($res.columns) (profiles=$($res.profiles))"
+  $lines += "- per_profile_loop seconds_median: $($res.per_profile_loop.seconds_median)"
+  $lines += "- batched_matrix seconds_median: $($res.batched_matrix.seconds_median)"
+  $lines += "- speedup_x: $($res.speedup_x)"
+  Set-Content -Path $md -Value ($lines -join [Environment]::NewLine) -Encoding UTF8
+  Copy-Item $jsonPath (Join-Path $OutDir "latest.json") -Force
+  Copy-Item $md (Join-Path $OutDir "latest.md") -Force
+  Add-Content -Path (Join-Path $OutDir "history.jsonl") -Encoding UTF8 -Value ($res | ConvertTo-Json -Depth 6 -Compress)
+  Ok ("benchmark passed: per_profile={0}s batched={1}s speedup={2}x" -f $res.per_profile_loop.seconds_median, $res.batched_matrix.seconds_median, $res.speedup_x)
+  Write-Host "report: $md"
+}
+finally {
+  $env:PYTHONPATH = $oldPythonPath
+  Remove-Item -Path $tmp -ErrorAction SilentlyContinue
+}
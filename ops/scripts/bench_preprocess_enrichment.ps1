@@ -0,0 +1,166 @@
+param(
+  [int]$Copies = 200,
+  [int]$Runs = 5,
+  [int]$Warmup = 1,
+  [string]$DatasetDir = "",
+  [string]$OutDir = ""
+)
+
+Set-StrictMode -Version Latest
+$ErrorActionPreference = "Stop"
+
+function Info($m){ Write-Host "[INFO] $m" -ForegroundColor Cyan }
+function Ok($m){ Write-Host "[ OK ] $m" -ForegroundColor Green }
+
+$root = Split-Path -Parent (Split-Path -Parent $PSScriptRoot)
+if (-not $DatasetDir) { $DatasetDir = Join-Path $root "lake\datasets\preprocess_debate_gold" }
+if (-not $OutDir) { $OutDir = Join-Path $root "ops\logs\bench\preprocess_enrichment" }
+New-Item -ItemType Directory -Path $OutDir -Force | Out-Null
+$stamp = Get-Date -Format "yyyyMMdd_HHmmss"
+$runDir = Join-Path $OutDir $stamp
+New-Item -ItemType Directory -Path $runDir -Force | Out-Null
+
+$tmp = Join-Path ([System.IO.Path]::GetTempPath()) "aiwf_bench_preprocess_enrichment.py"
+$py = @'
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from aiwf import preprocess, preprocess_runtime
+from aiwf import preprocess_enrichment as enrichment
+
+dataset_dir = Path(sys.argv[1])
+copies = int(sys.argv[2])
+runs = int(sys.argv[3])
+warmup = int(sys.argv[4])
+out_json = sys.argv[5]
+
+# Capture the rows each gold scenario hands to the enrichment stage.
+captured = []
+original = preprocess_runtime.enrich_standardized_evidence_rows
+
+def capture(rows, spec):
+    captured.append(([dict(row) for row in rows], dict(spec)))
+    return original(rows, spec)
+
+manifest = json.loads((dataset_dir / "manifest.json").read_text(encoding="utf-8"))
+with patch.object(preprocess_runtime, "enrich_standardized_evidence_rows", capture):
+    for item in manifest.get("scenarios") or []:
+        scenario_dir = dataset_dir / str(item.get("dir") or item.get("id") or "")
+        scenario = json.loads((scenario_dir / "scenario.json").read_text(encoding="utf-8"))
+        input_files = [str((scenario_dir / rel).resolve()) for rel in scenario.get("input_files", [])]
+        spec = dict(scenario.get("preprocess_spec") or {})
+        spec["input_files"] = input_files
+        with tempfile.TemporaryDirectory() as tmp:
+            preprocess.preprocess_file(input_files[0], str(Path(tmp) / "out.jsonl"), spec)
+
+def scaled(rows):
+    out = []
+    for copy_idx in range(copies):
+        for row in rows:
+            item = dict(row)
+            item["source_path"] = f"{item.get('source_path')}#{copy_idx}"
+            out.append(item)
+    return out
+
+# Stage each workload at the point where the source-context passes start.
+workloads = []
+original_propagate = enrichment._propagate_debate_context
+
+def stage(rows, features=None):
+    workloads.append([dict(row) for row in rows])
+    return original_propagate(rows, features)
+
+with patch.object(enrichment, "_propagate_debate_context", stage):
+    for rows, spec in captured:
+        enrichment.enrich_standardized_evidence_rows(scaled(rows), spec)
+
+def source_context_passes(rows, features):
+    enrichment._propagate_debate_context(rows, features)
+    enrichment._backfill_source_context_by_block(rows, features)
+    rows, _ = enrichment._collapse_adjacent_citation_url_rows(rows, features)
+    enrichment._backfill_source_context_from_structural_attributions(rows, features)
+    enrichment._backfill_source_context_across_adjacent_page_breaks(rows, features)
+    enrichment._backfill_source_context_from_leading_source_cards(rows, features)
+    enrichment._backfill_source_context_by_citation_token(rows, features)
+    return rows
+
+def measure(shared):
+    seconds = []
+    outputs = None
+    hits = misses = 0
+    for run_idx in range(warmup + runs):
+        batches = [[dict(row) for row in rows] for rows in workloads]
+        features = [enrichment._RowFeatures() if shared else None for _ in batches]
+        t0 = time.perf_counter()
+        results = [source_context_passes(rows, feats) for rows, feats in zip(batches, features)]
+        elapsed = time.perf_counter() - t0
+        if run_idx >= warmup:
+            seconds.append(elapsed)
+        outputs = results
+        if shared:
+            hits = sum(item.hits for item in features)
+            misses = sum(item.misses for item in features)
+    return {
+        "seconds_min": round(min(seconds), 4),
+        "seconds_median": round(statistics.median(seconds), 4),
+        "feature_hits": hits,
+        "feature_misses": misses,
+    }, outputs
+
+per_pass, per_pass_rows = measure(shared=False)
+shared, shared_rows = measure(shared=True)
+same_output = json.dumps(per_pass_rows, sort_keys=True, default=str) == json.dumps(shared_rows, sort_keys=True, default=str)
+out = {
+    "ok": same_output,
+    "scenarios": len(captured),
+    "copies": copies,
+    "rows": sum(len(rows) for rows in workloads),
+    "runs": runs,
+    "warmup": warmup,
+    "per_pass_features": per_pass,
+    "shared_features": shared,
+    "speedup_x": round(per_pass["seconds_median"] / shared["seconds_median"], 3) if shared["seconds_median"] > 0 else None,
+    "identical_output": same_output,
+}
+with open(out_json, "w", encoding="utf-8") as f:
+    json.dump(out, f, ensure_ascii=False, indent=2)
+print(json.dumps(out, ensure_ascii=False))
+'@
+
+Set-Content -Path $tmp -Encoding UTF8 -Value $py
+$oldPythonPath = $env:PYTHONPATH
+try {
+  $env:PYTHONPATH = Join-Path $root "apps\glue-python"
+  $jsonPath = Join-Path $runDir "benchmark.json"
+  Info "running preprocess enrichment benchmark copies=$Copies runs=$Runs warmup=$Warmup"
+  $raw = & python $tmp $DatasetDir $Copies $Runs $Warmup $jsonPath
+  if ($LASTEXITCODE -ne 0) { throw "benchmark failed" }
+  $res = $raw | ConvertFrom-Json
+  if (-not $res.ok) { throw "shared feature cache changed enrichment output" }
+
+  $md = Join-Path $runDir "benchmark.md"
+  $lines = @()
+  $lines += "# Preprocess Enrichment Benchmark"
+  $lines += ""
+  $lines += "- scenarios: $($res.scenarios)"
+  $lines += "- rows: $($res.rows) (copies=$($res.copies))"
+  $lines += "- per_pass seconds_median: $($res.per_pass_features.seconds_median)"
+  $lines += "- shared seconds_median: $($res.shared_features.seconds_median)"
+  $lines += "- speedup_x: $($res.speedup_x)"
+  $lines += "- feature hits/misses: $($res.shared_features.feature_hits)/$($res.shared_features.feature_misses)"
+  Set-Content -Path $md -Value ($lines -join [Environment]::NewLine) -Encoding UTF8
+  Copy-Item $jsonPath (Join-Path $OutDir "latest.json") -Force
+  Copy-Item $md (Join-Path $OutDir "latest.md") -Force
+  Add-Content -Path (Join-Path $OutDir "history.jsonl") -Encoding UTF8 -Value ($res | ConvertTo-Json -Depth 6 -Compress)
+  Ok ("benchmark passed: per_pass={0}s shared={1}s speedup={2}x" -f $res.per_pass_features.seconds_median, $res.shared_features.seconds_median, $res.speedup_x)
+  Write-Host "report: $md"
+}
+finally {
+  $env:PYTHONPATH = $oldPythonPath
+  Remove-Item -Path $tmp -ErrorAction SilentlyContinue
+}